@@ -27,11 +27,14 @@ BIS_KEYS = {
 }
 
 
-def _fetch_bis_latest(key: str) -> Optional[float]:
+def _fetch_bis_latest(
+    key: str, session: Optional[requests.Session] = None,
+) -> Optional[float]:
     """Fetch latest notional outstanding value from BIS CSV endpoint.
 
     Args:
         key: BIS SDMX timeseries key
+        session: Optional shared session (default: one-off request)
 
     Returns:
         Latest notional in millions USD, or None on failure
@@ -40,7 +43,7 @@ def _fetch_bis_latest(key: str) -> Optional[float]:
     params = {"file_format": "csv", "format": "long"}
 
     try:
-        resp = requests.get(url, params=params, timeout=20)
+        resp = (session or requests).get(url, params=params, timeout=20)
         resp.raise_for_status()
 
         # BIS CSV has metadata header rows followed by data rows
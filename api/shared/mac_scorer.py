@@ -1,8 +1,17 @@
 """MAC scoring logic with calibrated thresholds."""
 
+from functools import lru_cache
 from typing import Any
 import logging
 
+# Copy of grri_mac/mac/threshold_kernel.py: the Functions app ships
+# without grri_mac.  Handle both Azure Functions context and standalone
+# execution.
+try:
+    from shared.threshold_kernel import ThresholdCurve, score_steps
+except ImportError:
+    from api.shared.threshold_kernel import ThresholdCurve, score_steps
+
 logger = logging.getLogger(__name__)
 
 # Calibrated thresholds from backtesting
@@ -44,6 +53,33 @@ THRESHOLDS: dict[str, Any] = {
 }
 
 
+@lru_cache(maxsize=256)
+def _simple_curve(
+    ample: float, thin: float, breach: float, lower_is_better: bool,
+) -> ThresholdCurve:
+    return ThresholdCurve.one_sided(ample, thin, breach, lower_is_better)
+
+
+@lru_cache(maxsize=64)
+def _range_curve(
+    ample_low: float, ample_high: float, thin_high: float, breach_high: float,
+) -> ThresholdCurve:
+    # Below the ample band the score falls linearly to a 0.5 floor at
+    # half of ample_low
+    return ThresholdCurve(
+        [ample_low / 2, ample_low, ample_high, thin_high, breach_high],
+        [0.5, 1.0, 1.0, 0.5, 0.0],
+    )
+
+
+# Continuous ladders that flatten at a floor above zero
+VVIX_CURVE = ThresholdCurve([85, 100, 120], [1.0, 0.5, 0.2])
+BTC_SPY_CORRELATION_CURVE = ThresholdCurve([0.3, 0.5, 0.7], [1.0, 0.5, 0.2])
+EQUITY_DERIV_NOTIONAL_CURVE = ThresholdCurve([8, 12, 15], [1.0, 0.5, 0.2])
+CRYPTO_FUTURES_OI_CURVE = ThresholdCurve([20, 35, 50], [1.0, 0.5, 0.2])
+HF_LEVERAGE_CURVE = ThresholdCurve([12, 18, 25], [1.0, 0.5, 0.2])
+
+
 def score_indicator_simple(
     value: float,
     ample_threshold: float,
@@ -64,35 +100,9 @@ def score_indicator_simple(
     Returns:
         Score between 0 and 1
     """
-    if lower_is_better:
-        if value <= ample_threshold:
-            return 1.0
-        elif value <= thin_threshold:
-            # Linear interpolation between ample and thin
-            range_size = thin_threshold - ample_threshold
-            position = value - ample_threshold
-            return 1.0 - (position / range_size) * 0.5
-        elif value <= breach_threshold:
-            # Linear interpolation between thin and breach
-            range_size = breach_threshold - thin_threshold
-            position = value - thin_threshold
-            return 0.5 - (position / range_size) * 0.5
-        else:
-            return 0.0
-    else:
-        # Higher is better - flip the logic
-        if value >= ample_threshold:
-            return 1.0
-        elif value >= thin_threshold:
-            range_size = ample_threshold - thin_threshold
-            position = ample_threshold - value
-            return 1.0 - (position / range_size) * 0.5
-        elif value >= breach_threshold:
-            range_size = thin_threshold - breach_threshold
-            position = thin_threshold - value
-            return 0.5 - (position / range_size) * 0.5
-        else:
-            return 0.0
+    return _simple_curve(
+        ample_threshold, thin_threshold, breach_threshold, lower_is_better,
+    )(value)
 
 
 def score_indicator_range(
@@ -103,21 +113,7 @@ def score_indicator_range(
     breach_high: float,
 ) -> float:
     """Score indicator where middle range is optimal (like VIX)."""
-    if ample_low <= value <= ample_high:
-        return 1.0
-    elif value < ample_low:
-        # Too low - unusual, score based on distance
-        return max(0.5, 1.0 - (ample_low - value) / ample_low)
-    elif value <= thin_high:
-        range_size = thin_high - ample_high
-        position = value - ample_high
-        return 1.0 - (position / range_size) * 0.5
-    elif value <= breach_high:
-        range_size = breach_high - thin_high
-        position = value - thin_high
-        return 0.5 - (position / range_size) * 0.5
-    else:
-        return 0.0
+    return _range_curve(ample_low, ample_high, thin_high, breach_high)(value)
 
 
 def score_liquidity(indicators: dict) -> tuple[float, str]:
@@ -292,16 +288,8 @@ def score_volatility(indicators: dict) -> tuple[float, str]:
 
     # VVIX (vol-of-vol) — high VVIX means dealers hedging gamma aggressively
     if "vvix" in indicators:
-        vvix = indicators["vvix"]
         # Thresholds: <85 calm, 85-100 elevated, 100-120 stressed, >120 extreme
-        if vvix <= 85:
-            scores.append(1.0)
-        elif vvix <= 100:
-            scores.append(1.0 - (vvix - 85) / 15 * 0.5)
-        elif vvix <= 120:
-            scores.append(0.5 - (vvix - 100) / 20 * 0.3)
-        else:
-            scores.append(0.2)
+        scores.append(VVIX_CURVE(indicators["vvix"]))
 
     # Term structure slope (VIX/VIX3M) — backwardation = near-term stress
     if "term_slope" in indicators:
@@ -329,16 +317,12 @@ def score_policy(indicators: dict) -> tuple[float, str]:
 
     if "policy_room_bps" in indicators:
         t = THRESHOLDS["policy"]["policy_room"]
-        room = indicators["policy_room_bps"]
         # Higher is better (more room to cut)
-        if room >= t["ample"]:
-            scores.append(1.0)
-        elif room >= t["thin"]:
-            scores.append(0.5 + 0.5 * (room - t["thin"]) / (t["ample"] - t["thin"]))
-        elif room >= t["breach"]:
-            scores.append(0.5 * (room - t["breach"]) / (t["thin"] - t["breach"]))
-        else:
-            scores.append(0.0)
+        scores.append(score_indicator_simple(
+            indicators["policy_room_bps"],
+            t["ample"], t["thin"], t["breach"],
+            lower_is_better=False,
+        ))
 
     if "fed_balance_sheet_gdp_pct" in indicators:
         t = THRESHOLDS["policy"]["balance_sheet_gdp"]
@@ -394,18 +378,10 @@ def score_contagion(indicators: dict) -> tuple[float, str]:
             t = THRESHOLDS["contagion"]["ig_hy_spread_ratio"]
             # Lower ratio = tighter spreads = more complacency risk
             # Higher ratio = flight to quality = stress
-            if ratio <= t["ample"]:
-                scores.append(1.0)
-            elif ratio <= t["thin"]:
-                range_size = t["thin"] - t["ample"]
-                position = ratio - t["ample"]
-                scores.append(1.0 - (position / range_size) * 0.5)
-            elif ratio <= t["breach"]:
-                range_size = t["breach"] - t["thin"]
-                position = ratio - t["thin"]
-                scores.append(0.5 - (position / range_size) * 0.5)
-            else:
-                scores.append(0.0)
+            scores.append(score_indicator_simple(
+                ratio, t["ample"], t["thin"], t["breach"],
+                lower_is_better=True,
+            ))
 
     # Financial sector OAS (G-SIB stress proxy)
     if "financial_oas_bps" in indicators:
@@ -418,59 +394,34 @@ def score_contagion(indicators: dict) -> tuple[float, str]:
 
     # BTC-SPY correlation (crypto-equity contagion channel)
     if "btc_spy_correlation" in indicators:
-        corr = indicators["btc_spy_correlation"]
         # Thresholds: <0.3 decoupled (good), 0.3-0.5 moderate, >0.7 contagion risk
-        if corr <= 0.3:
-            scores.append(1.0)
-        elif corr <= 0.5:
-            scores.append(1.0 - (corr - 0.3) / 0.2 * 0.5)
-        elif corr <= 0.7:
-            scores.append(0.5 - (corr - 0.5) / 0.2 * 0.3)
-        else:
-            scores.append(0.2)
+        scores.append(
+            BTC_SPY_CORRELATION_CURVE(indicators["btc_spy_correlation"])
+        )
 
     # Equity derivatives notional (BIS — TRS/hidden leverage proxy)
     if "equity_deriv_notional_trillions" in indicators:
-        eq_deriv = indicators["equity_deriv_notional_trillions"]
         # Thresholds: <$8T normal, $8-12T elevated, $12-15T crowded, >$15T extreme
-        if eq_deriv <= 8:
-            scores.append(1.0)
-        elif eq_deriv <= 12:
-            scores.append(1.0 - (eq_deriv - 8) / 4 * 0.5)
-        elif eq_deriv <= 15:
-            scores.append(0.5 - (eq_deriv - 12) / 3 * 0.3)
-        else:
-            scores.append(0.2)
+        scores.append(EQUITY_DERIV_NOTIONAL_CURVE(
+            indicators["equity_deriv_notional_trillions"]
+        ))
 
     # Crypto futures OI (leveraged positioning in crypto derivatives)
     if "crypto_futures_oi_billions" in indicators:
-        oi = indicators["crypto_futures_oi_billions"]
         # Thresholds: <$20B normal, $20-35B elevated, $35-50B crowded, >$50B extreme
-        if oi <= 20:
-            scores.append(1.0)
-        elif oi <= 35:
-            scores.append(1.0 - (oi - 20) / 15 * 0.5)
-        elif oi <= 50:
-            scores.append(0.5 - (oi - 35) / 15 * 0.3)
-        else:
-            scores.append(0.2)
+        scores.append(
+            CRYPTO_FUTURES_OI_CURVE(indicators["crypto_futures_oi_billions"])
+        )
 
     # Default: derive from available spreads
     if not scores:
         # Use IG OAS as proxy for financial stress
         if "ig_oas_bps" in indicators:
-            ig_oas = indicators["ig_oas_bps"]
             # Approximate financial sector stress from IG spreads
-            if ig_oas <= 80:
-                scores.append(1.0)
-            elif ig_oas <= 120:
-                scores.append(0.75)
-            elif ig_oas <= 180:
-                scores.append(0.5)
-            elif ig_oas <= 250:
-                scores.append(0.25)
-            else:
-                scores.append(0.0)
+            scores.append(float(score_steps(
+                indicators["ig_oas_bps"],
+                [80, 120, 180, 250], [1.0, 0.75, 0.5, 0.25, 0.0],
+            )))
 
     if not scores:
         return 0.5, "NO_DATA"
@@ -509,19 +460,12 @@ def score_private_credit(indicators: dict) -> tuple[float, str]:
 
     # HY spread as leveraged loan proxy
     if "hy_oas_bps" in indicators:
-        hy_oas = indicators["hy_oas_bps"]
         # Private credit trades ~100-200bps over syndicated leveraged loans
         # HY OAS thresholds: <350 normal, 350-500 elevated, >500 stressed
-        if hy_oas <= 300:
-            scores.append(1.0)
-        elif hy_oas <= 400:
-            scores.append(0.75)
-        elif hy_oas <= 500:
-            scores.append(0.5)
-        elif hy_oas <= 650:
-            scores.append(0.25)
-        else:
-            scores.append(0.0)
+        scores.append(float(score_steps(
+            indicators["hy_oas_bps"],
+            [300, 400, 500, 650], [1.0, 0.75, 0.5, 0.25, 0.0],
+        )))
 
     # IG-HY ratio as credit stress indicator
     if "ig_oas_bps" in indicators and "hy_oas_bps" in indicators:
@@ -530,27 +474,14 @@ def score_private_credit(indicators: dict) -> tuple[float, str]:
         if ig_oas > 0:
             ratio = hy_oas / ig_oas
             # Ratio thresholds: <3 normal, 3-4 elevated, >4 stressed
-            if ratio <= 2.5:
-                scores.append(1.0)
-            elif ratio <= 3.5:
-                scores.append(0.6)
-            elif ratio <= 4.5:
-                scores.append(0.3)
-            else:
-                scores.append(0.0)
+            scores.append(float(score_steps(
+                ratio, [2.5, 3.5, 4.5], [1.0, 0.6, 0.3, 0.0],
+            )))
 
     # HF leverage ratio (OFR Form PF — prime brokerage channel)
     if "hf_leverage_ratio" in indicators:
-        lev = indicators["hf_leverage_ratio"]
         # Thresholds: <12x ample, 12-18x thin, 18-25x stretched, >25x breach
-        if lev <= 12:
-            scores.append(1.0)
-        elif lev <= 18:
-            scores.append(1.0 - (lev - 12) / 6 * 0.5)
-        elif lev <= 25:
-            scores.append(0.5 - (lev - 18) / 7 * 0.3)
-        else:
-            scores.append(0.2)
+        scores.append(HF_LEVERAGE_CURVE(indicators["hf_leverage_ratio"]))
 
     if not scores:
         return 0.5, "NO_DATA"
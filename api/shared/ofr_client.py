@@ -22,17 +22,20 @@ OFR_HFM_URL = "https://data.financialresearch.gov/hf/v1/series/timeseries/"
 LEVERAGE_MNEMONIC = "FPF-ALLQHF_GAVN10_LEVERAGERATIO_AVERAGE"
 
 
-def _fetch_ofr_series(mnemonic: str) -> list:
+def _fetch_ofr_series(
+    mnemonic: str, session: Optional[requests.Session] = None,
+) -> list:
     """Fetch time series from OFR Hedge Fund Monitor API.
 
     Args:
         mnemonic: OFR series mnemonic code
+        session: Optional shared session (default: one-off request)
 
     Returns:
         List of [date_str, value] pairs, or empty list on failure
     """
     try:
-        resp = requests.get(
+        resp = (session or requests).get(
             OFR_HFM_URL,
             params={"mnemonic": mnemonic},
             timeout=15,
@@ -47,16 +50,21 @@ def _fetch_ofr_series(mnemonic: str) -> list:
         return []
 
 
-def get_hf_leverage_ratio() -> Optional[float]:
+def get_hf_leverage_ratio(
+    session: Optional[requests.Session] = None,
+) -> Optional[float]:
     """Get latest aggregate hedge fund leverage ratio from OFR.
 
     Returns the GAV-weighted mean leverage ratio for large qualifying
     hedge funds (>$500M NAV). Sourced from SEC Form PF aggregates.
 
+    Args:
+        session: Optional shared session (default: one-off request)
+
     Returns:
         Leverage ratio (e.g. 18.0 = 18x), or None on failure
     """
-    series = _fetch_ofr_series(LEVERAGE_MNEMONIC)
+    series = _fetch_ofr_series(LEVERAGE_MNEMONIC, session=session)
     if not series:
         return None
 
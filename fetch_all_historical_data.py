@@ -463,11 +463,9 @@ def download_measuringworth_gdp():
         return True
 
     # Try FRED GDPA from our cache
-    import pickle
-    cache_path = PROJECT_ROOT / "data" / "fred_cache" / "fred_series_cache.pkl"
-    if cache_path.exists():
-        with open(cache_path, "rb") as f:
-            cache = pickle.load(f)
+    from grri_mac.data.fred import load_disk_cache
+    cache = load_disk_cache(PROJECT_ROOT / "data" / "fred_cache")
+    if cache:
         gdpa = cache.get("GDPA")
         if gdpa is not None and len(gdpa) > 0:
             # FRED GDPA is in billions, annual
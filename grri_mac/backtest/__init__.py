@@ -34,6 +34,7 @@ from .thematic_holdout import (
 from .precision_recall import (
     PrecisionRecallReport,
     PRPoint,
+    PRCurveBands,
     OperatingPointReport,
     FPClassification,
     FPCategory,
@@ -92,6 +93,7 @@ __all__ = [
     # Precision-recall framework (§15.6–15.7)
     "PrecisionRecallReport",
     "PRPoint",
+    "PRCurveBands",
     "OperatingPointReport",
     "FPClassification",
     "FPCategory",
@@ -3,11 +3,20 @@
 This module defines major financial crisis events from 1962-2025
 for validating the MAC framework's predictive power across multiple
 monetary policy regimes.
+
+Membership queries go through CrisisCalendar, a sorted index of the
+elementary intervals between window boundaries: a point lookup is one
+binary search, and a whole date array is labelled in one vectorized
+call.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
 
 
 @dataclass
@@ -1198,6 +1207,164 @@ CRISIS_EVENTS = [
 ]
 
 
+# One microsecond: closes [start, end] windows as half-open intervals
+_TICK = np.timedelta64(1, "us")
+
+
+class CrisisCalendar:
+    """
+    Interval index over crisis windows with optional lead windows.
+
+    Windows are kept sorted by start alongside a running maximum of
+    their ends, so the windows meeting any range are found with two
+    binary searches: those starting before the range ends, minus the
+    prefix whose running maximum end falls before the range begins.
+    Membership and lead-window flags are a single search per date.  The
+    first window (input order) covering each elementary interval between
+    window boundaries is precomputed from the same arrays, so point
+    lookups are one search over the boundaries.
+
+    Windows are ``(start, end, name)`` tuples, closed at both ends.
+    The lead window of each is ``[start - lead_time, start)``.
+
+    Usage:
+        calendar = CrisisCalendar.from_events(lead_time=timedelta(weeks=8))
+        calendar.window_at(datetime(2008, 10, 1))   # index of GFC window
+        labels = calendar.label(dates)  # crisis, in_window, in_lead
+    """
+
+    def __init__(
+        self,
+        windows: Sequence[Tuple[datetime, datetime, str]],
+        lead_time: timedelta = timedelta(0),
+    ):
+        self.windows = list(windows)
+        self.lead_time = lead_time
+        self.names = [name for _, _, name in self.windows]
+
+        starts = np.array(
+            [w[0] for w in self.windows], dtype="datetime64[us]",
+        )
+        stops = np.array(
+            [w[1] for w in self.windows], dtype="datetime64[us]",
+        ) + _TICK
+        lead_starts = starts - np.timedelta64(lead_time, "us")
+
+        # Windows as half-open [start, stop), sorted by start
+        self._order = np.argsort(starts, kind="stable")
+        self._starts = starts[self._order]
+        self._stops = stops[self._order]
+        self._max_stops = np.maximum.accumulate(self._stops)
+        # Lead windows [lead start, start), sorted by lead start
+        lead_order = np.argsort(lead_starts, kind="stable")
+        self._lead_starts = lead_starts[lead_order]
+        self._lead_max_stops = np.maximum.accumulate(starts[lead_order])
+
+        # Elementary interval i >= 1 is [bounds[i - 1], bounds[i]);
+        # interval 0 is everything before the first boundary
+        self._bounds = np.unique(np.concatenate([starts, stops]))
+        self._first = np.full(len(self._bounds) + 1, -1, dtype=np.intp)
+        for i, left in enumerate(self._bounds, start=1):
+            hit = self._overlap(left, left + _TICK)
+            if len(hit):
+                self._first[i] = self._order[hit].min()
+
+    def _overlap(self, start, stop) -> np.ndarray:
+        """Sorted positions of windows meeting ``[start, stop)``."""
+        lo = np.searchsorted(self._max_stops, start, side="right")
+        hi = np.searchsorted(self._starts, stop, side="left")
+        pos = np.arange(lo, max(lo, hi))
+        return pos[self._stops[pos] > start]
+
+    @staticmethod
+    def _covered(starts, max_stops, values) -> np.ndarray:
+        """Whether each value lies in any ``[start, stop)`` interval."""
+        k = np.searchsorted(starts, values, side="right")
+        reach = np.concatenate([
+            np.array(["NaT"], dtype="datetime64[us]"), max_stops,
+        ])[k]
+        return reach > values
+
+    @classmethod
+    def from_events(
+        cls,
+        events: Optional[Sequence[CrisisEvent]] = None,
+        lead_time: timedelta = timedelta(0),
+    ) -> "CrisisCalendar":
+        """Calendar over CrisisEvent periods (default: CRISIS_EVENTS)."""
+        events = CRISIS_EVENTS if events is None else events
+        return cls(
+            [(e.start_date, e.end_date, e.name) for e in events], lead_time,
+        )
+
+    def _segments(self, dates) -> np.ndarray:
+        """Elementary interval index per date."""
+        values = np.asarray(dates, dtype="datetime64[us]")
+        return np.searchsorted(self._bounds, values, side="right")
+
+    def _flags(self, dates) -> Tuple[np.ndarray, np.ndarray]:
+        """(in any window, in any lead window) per date."""
+        values = np.asarray(dates, dtype="datetime64[us]")
+        return (
+            self._covered(self._starts, self._max_stops, values),
+            self._covered(self._lead_starts, self._lead_max_stops, values),
+        )
+
+    def window_at(self, date: datetime) -> Optional[int]:
+        """Index of the first window containing ``date``, or None."""
+        first = int(self._first[self._segments(date)])
+        return None if first < 0 else first
+
+    def contains(self, date: datetime, include_lead: bool = False) -> bool:
+        """Whether ``date`` is in any window (or lead window)."""
+        in_window, in_lead = self._flags([date])
+        return bool(in_window[0] or (include_lead and in_lead[0]))
+
+    def overlapping(self, start_date: datetime, end_date: datetime) -> List[int]:
+        """Indices (input order) of windows overlapping [start, end]."""
+        if end_date < start_date or not self.windows:
+            return []
+        start, end = np.array([start_date, end_date], dtype="datetime64[us]")
+        hit = self._overlap(start, end + _TICK)
+        return np.sort(self._order[hit]).tolist()
+
+    def label(self, dates) -> pd.DataFrame:
+        """
+        Label many dates at once.
+
+        Args:
+            dates: Array-like of datetimes
+
+        Returns:
+            DataFrame indexed by position with columns window (index of
+            the first containing window, -1 outside), crisis (its name,
+            None outside), in_window and in_lead
+        """
+        first = self._first[self._segments(dates)]
+        in_window, in_lead = self._flags(dates)
+        names = np.array(self.names + [None], dtype=object)
+        return pd.DataFrame({
+            "window": first,
+            "crisis": pd.Series(names[first], dtype=object),
+            "in_window": in_window,
+            "in_lead": in_lead,
+        })
+
+    def mask(self, dates, include_lead: bool = False) -> np.ndarray:
+        """Boolean in-window (or lead window) flag per date."""
+        labels = self.label(dates)
+        flags = labels["in_window"].to_numpy()
+        if include_lead:
+            flags = flags | labels["in_lead"].to_numpy()
+        return flags
+
+
+@lru_cache(maxsize=1)
+def _catalogue_calendar() -> CrisisCalendar:
+    """Calendar over CRISIS_EVENTS, built on first use."""
+    return CrisisCalendar.from_events()
+
+
 def get_crisis_for_date(date: datetime) -> Optional[CrisisEvent]:
     """
     Find if a date falls within a crisis period.
@@ -1208,10 +1375,14 @@ def get_crisis_for_date(date: datetime) -> Optional[CrisisEvent]:
     Returns:
         CrisisEvent if date is in crisis period, None otherwise
     """
-    for crisis in CRISIS_EVENTS:
-        if crisis.start_date <= date <= crisis.end_date:
-            return crisis
-    return None
+    index = _catalogue_calendar().window_at(date)
+    return None if index is None else CRISIS_EVENTS[index]
+
+
+def get_crises_for_dates(dates) -> List[Optional[CrisisEvent]]:
+    """Vector form of ``get_crisis_for_date``."""
+    first = _catalogue_calendar().label(dates)["window"]
+    return [None if i < 0 else CRISIS_EVENTS[i] for i in first]
 
 
 def get_crises_in_range(
@@ -1228,12 +1399,10 @@ def get_crises_in_range(
     Returns:
         List of overlapping crisis events
     """
-    overlapping = []
-    for crisis in CRISIS_EVENTS:
-        # Crisis overlaps if it starts before range ends and ends after range starts
-        if crisis.start_date <= end_date and crisis.end_date >= start_date:
-            overlapping.append(crisis)
-    return overlapping
+    return [
+        CRISIS_EVENTS[i]
+        for i in _catalogue_calendar().overlapping(start_date, end_date)
+    ]
 
 
 def get_pre_gfc_crises() -> List[CrisisEvent]:
@@ -26,6 +26,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+from .crisis_events import CrisisCalendar
 
 logger = logging.getLogger(__name__)
 
@@ -153,11 +154,11 @@ class FPCostAnalyser:
         self.config
 
         # Build crisis windows
-        windows = self._build_windows(crisis_events)
+        calendar = CrisisCalendar(self._build_windows(crisis_events))
 
         # Classify all FPs at default tau (0.50)
         classified_fps = self._classify_fps(
-            weekly_data, crisis_events, windows,
+            weekly_data, crisis_events, calendar,
             tau=0.50,
             near_miss_periods=near_miss_periods,
         )
@@ -177,7 +178,7 @@ class FPCostAnalyser:
 
         # Compute cost curve across all tau values
         cost_curve = self._compute_cost_curve(
-            weekly_data, crisis_events, windows,
+            weekly_data, crisis_events, calendar,
         )
 
         # Find max EV point
@@ -221,21 +222,11 @@ class FPCostAnalyser:
             windows.append((start, end, name))
         return windows
 
-    def _is_in_window(
-        self,
-        date: datetime,
-        windows: List[Tuple[datetime, datetime, str]],
-    ) -> bool:
-        for start, end, _ in windows:
-            if start <= date <= end:
-                return True
-        return False
-
     def _classify_fps(
         self,
         weekly_data: List[Dict],
         crisis_events: List[Tuple[str, datetime]],
-        windows: List[Tuple[datetime, datetime, str]],
+        calendar: CrisisCalendar,
         tau: float,
         near_miss_periods: Optional[
             List[Tuple[datetime, datetime, str]]
@@ -250,7 +241,7 @@ class FPCostAnalyser:
             mac = week["mac_score"]
 
             # Skip if in crisis window
-            if self._is_in_window(date, windows):
+            if calendar.contains(date):
                 continue
 
             # Check if signal fires
@@ -348,7 +339,7 @@ class FPCostAnalyser:
         self,
         weekly_data: List[Dict],
         crisis_events: List[Tuple[str, datetime]],
-        windows: List[Tuple[datetime, datetime, str]],
+        calendar: CrisisCalendar,
     ) -> List[EconomicCostPoint]:
         """Compute cost curve across all tau values."""
         cfg = self.config
@@ -361,6 +352,8 @@ class FPCostAnalyser:
             if dates else 1.0
         )
 
+        in_window = calendar.mask(dates)
+
         curve: List[EconomicCostPoint] = []
 
         for tau in cfg.tau_values:
@@ -393,8 +386,8 @@ class FPCostAnalyser:
             fn = total_crises - tp
 
             # FP: signals in non-crisis weeks
-            for week in weekly_data:
-                if self._is_in_window(week["date"], windows):
+            for week, crisis_week in zip(weekly_data, in_window):
+                if crisis_week:
                     continue
                 signal = (
                     week["mac_score"] < tau
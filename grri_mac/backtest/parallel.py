@@ -0,0 +1,261 @@
+"""Date-sharded parallel backtest engine.
+
+Almost everything ``calculate_mac_for_date`` does depends only on the
+date and the FRED cache, so the date grid is split into contiguous
+shards and scored in a process pool.  Three steps read earlier dates:
+
+- valuation adaptive bands (rolling percentiles over the trailing
+  ``lookback_weeks`` valuation observations),
+- momentum (1w/2w/4w lagged MAC), and
+- the HMM regime overlay (a forward filter, fitted on the first 52
+  pillar vectors).
+
+Valuation is handled in two parallel phases: workers first fetch only
+the valuation indicators for their shard, the parent derives each
+shard's trailing-window seed from the merged observations, and workers
+then score their shard with the valuation pillar's history seeded.
+Momentum and the HMM run afterwards in one cheap sequential pass over
+the merged, date-ordered results via ``BacktestRunner._finish_point``.
+The output matches ``run_backtest(engine="iterative")`` on a fresh
+runner row for row.
+
+Workers never download anything.  The parent prefetches once and
+flushes the per-series disk cache; each worker then builds its own
+runner on the same cache directory in backtest mode, memory-mapping
+only the series its dates actually touch.
+
+A worker runner is rebuilt from the parent's constructor arguments plus
+every pillar's current ``THRESHOLDS``, so threshold changes made on the
+parent after construction are scored by the workers too.  Any other
+state changed on the parent's pillars or breach model after
+construction is not carried over.
+
+Usage:
+    runner = BacktestRunner()
+    df = runner.run_backtest(start, end, "daily", engine="parallel",
+                             workers=16)
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from .runner import BacktestRunner
+
+# Shards per worker: smaller shards balance eras whose dates cost more
+# (e.g. pre-1934 proxy lookups) across the pool
+SHARDS_PER_WORKER = 4
+
+# (term premium, IG OAS, HY OAS) for one date; None where unavailable
+ValuationObservation = Tuple[Optional[float], Optional[float], Optional[float]]
+# Trailing valuation histories in the same order
+ValuationSeed = Tuple[List[float], List[float], List[float]]
+
+# Runner attributes holding the pillars whose THRESHOLDS workers mirror
+RUNNER_PILLARS = (
+    "liquidity", "valuation", "volatility", "policy",
+    "positioning", "contagion", "private_credit", "sentiment",
+)
+
+# Runner built once per worker process by _init_worker
+_WORKER_RUNNER: Optional["BacktestRunner"] = None
+
+
+def _init_worker(runner_kwargs: dict, thresholds: Dict[str, dict]) -> None:
+    """Build this worker's runner on the shared FRED disk cache."""
+    global _WORKER_RUNNER
+    from .runner import BacktestRunner
+
+    _WORKER_RUNNER = BacktestRunner(**runner_kwargs)
+    _WORKER_RUNNER.fred.set_backtest_mode(True)
+    for name, pillar_thresholds in thresholds.items():
+        getattr(_WORKER_RUNNER, name).THRESHOLDS = pillar_thresholds
+
+
+def _fetch_valuation_shard(
+    dates: List[datetime],
+) -> List[ValuationObservation]:
+    """Valuation indicators (term premium, IG, HY) for each date."""
+    runner = _WORKER_RUNNER
+    assert runner is not None, "worker not initialised"
+    out: List[ValuationObservation] = []
+    for date in dates:
+        try:
+            ind = runner._fetch_valuation_indicators(date)
+        except Exception:
+            out.append((None, None, None))
+            continue
+        out.append(
+            (ind.term_premium_10y_bps, ind.ig_oas_bps, ind.hy_oas_bps)
+        )
+    return out
+
+
+def _score_shard(
+    task: Tuple[List[datetime], ValuationSeed],
+) -> List[Optional[Tuple[Any, ...]]]:
+    """Score one shard; None marks a date the iterative loop would skip."""
+    runner = _WORKER_RUNNER
+    assert runner is not None, "worker not initialised"
+    dates, seed = task
+
+    # Workers are reused across shards, so always replace the history
+    valuation = runner.valuation
+    valuation._tp_history = list(seed[0])
+    valuation._ig_oas_history = list(seed[1])
+    valuation._hy_oas_history = list(seed[2])
+
+    out: List[Optional[Tuple[Any, ...]]] = []
+    for date in dates:
+        try:
+            out.append(runner._score_date(date))
+        except Exception:
+            out.append(None)
+    return out
+
+
+def shard_dates(
+    dates: List[datetime], n_shards: int,
+) -> List[List[datetime]]:
+    """Split dates into at most ``n_shards`` contiguous, ordered shards."""
+    n_shards = max(1, min(n_shards, len(dates)))
+    size, extra = divmod(len(dates), n_shards)
+    shards = []
+    start = 0
+    for i in range(n_shards):
+        stop = start + size + (1 if i < extra else 0)
+        shards.append(dates[start:stop])
+        start = stop
+    return [s for s in shards if s]
+
+
+def valuation_seeds(
+    observations: List[ValuationObservation],
+    shards: List[List[datetime]],
+    window: int,
+) -> List[ValuationSeed]:
+    """
+    Valuation history each shard would have inherited in a serial run.
+
+    Only the trailing ``window`` non-missing values of each indicator
+    affect adaptive scoring, so that is all a shard needs.
+    """
+    trailing: List[Deque[float]] = [deque(maxlen=window) for _ in range(3)]
+    seeds: List[ValuationSeed] = []
+    start = 0
+    for shard in shards:
+        seeds.append((
+            list(trailing[0]), list(trailing[1]), list(trailing[2]),
+        ))
+        for row in observations[start:start + len(shard)]:
+            for history, value in zip(trailing, row):
+                if value is not None:
+                    history.append(value)
+        start += len(shard)
+    return seeds
+
+
+class ParallelBacktestEngine:
+    """Run a BacktestRunner's date grid across a process pool."""
+
+    def __init__(
+        self,
+        runner: "BacktestRunner",
+        workers: Optional[int] = None,
+    ):
+        self.runner = runner
+        self.workers = workers or os.cpu_count() or 1
+
+    def _runner_kwargs(self) -> dict:
+        """Constructor arguments that reproduce the runner in a worker."""
+        fred = self.runner.fred
+        return {
+            "fred_api_key": getattr(fred.fred, "api_key", None),
+            "use_era_weights": self.runner.use_era_weights,
+            "calibration_factor": self.runner.calibration_factor,
+            "fred_cache_dir": fred._cache_dir,
+        }
+
+    def _pillar_thresholds(self) -> Dict[str, dict]:
+        """Current THRESHOLDS of each parent pillar, for the workers."""
+        thresholds = {}
+        for name in RUNNER_PILLARS:
+            pillar_thresholds = getattr(
+                getattr(self.runner, name), "THRESHOLDS", None,
+            )
+            if pillar_thresholds is not None:
+                thresholds[name] = pillar_thresholds
+        return thresholds
+
+    def run(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        frequency: str = "weekly",
+    ) -> pd.DataFrame:
+        """
+        Run the backtest with date-sharded workers.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+            frequency: daily, weekly, or monthly
+
+        Returns:
+            DataFrame with the same rows and columns as the iterative
+            engine
+        """
+        runner = self.runner
+        dates = runner._date_grid(start_date, end_date, frequency)
+
+        runner._reset_history()
+
+        # Fetch once in the parent and make sure every series is on disk
+        # before workers open the cache
+        runner._prefetch_fred_data(start_date, end_date)
+        runner.fred._save_cache_to_disk()
+
+        shards = shard_dates(dates, self.workers * SHARDS_PER_WORKER)
+        bands = runner.valuation._adaptive_bands
+        # compute_bands also requires >= 52 values, so keep at least that
+        window = max(bands.lookback_weeks, 52) if bands is not None else 0
+
+        scored: List[Optional[Tuple[Any, ...]]] = []
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(shards)) or 1,
+            initializer=_init_worker,
+            initargs=(self._runner_kwargs(), self._pillar_thresholds()),
+        ) as pool:
+            if window:
+                observations: List[ValuationObservation] = []
+                for shard_obs in pool.map(_fetch_valuation_shard, shards):
+                    observations.extend(shard_obs)
+                seeds = valuation_seeds(observations, shards, window)
+            else:
+                seeds = [([], [], [])] * len(shards)
+
+            for done, shard_result in enumerate(
+                pool.map(_score_shard, zip(shards, seeds)), start=1,
+            ):
+                scored.extend(shard_result)
+                print(
+                    f"\rScored shard {done}/{len(shards)}",
+                    end="", flush=True,
+                )
+        print()
+
+        # Sequential pass: momentum and HMM need prior dates
+        results = []
+        for date, item in zip(dates, scored):
+            if item is None:
+                continue
+            try:
+                results.append(runner._finish_point(date, *item))
+            except Exception:
+                pass  # Same skip rule as the iterative loop
+        return runner._points_to_frame(results)
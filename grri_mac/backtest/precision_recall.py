@@ -3,13 +3,20 @@
 Quantifies false positive behaviour with the same rigour applied to true
 positives.  Implements:
 
-* Full precision-recall curve (τ = 0.10 … 0.80, step 0.01 → 71 points)
+* Full precision-recall curve (τ = 0.10 … 0.80, step 0.01 → 71 points,
+  or any τ grid) with optional bootstrap confidence bands
 * Fβ objective with four client archetypes (SWF, central bank, HF, pension)
 * False-positive taxonomy (near-miss, regime-artefact, genuine)
 * Per-era FPR computation
 * Five standard operating points (Conservative … Maximum-recall)
 * Client-configurable alert threshold
 * JSON artefact export
+
+The τ sweep is a single pass: every week reduces to the lowest τ at
+which it signals (−∞ for momentum signals, its MAC otherwise) and every
+crisis window to the minimum of that over its weeks.  TP, FP and signal
+counts for the whole grid then come from binary searches on those sorted
+values, so a finer grid costs almost nothing extra.
 """
 
 from __future__ import annotations
@@ -18,7 +25,11 @@ import json
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .crisis_events import CrisisCalendar
 
 
 # ---------------------------------------------------------------------------
@@ -32,6 +43,9 @@ TAU_MAX = 0.80
 TAU_STEP = 0.01
 TOTAL_CRISIS_EVENTS = 56         # Full event catalogue 1907–2025 (v7)
 
+# mac_status values that count as a signal regardless of τ
+MOMENTUM_SIGNAL_STATUSES = ("DETERIORATING", "STRETCHED", "CRITICAL")
+
 # Standard operating points (v6 §15.6.9)
 STANDARD_OPERATING_POINTS: Dict[str, float] = {
     "Conservative": 0.30,
@@ -144,6 +158,20 @@ class EraFPR:
     fpr: float
 
 
+@dataclass
+class PRCurveBands:
+    """Bootstrap confidence bands on the PR curve (one entry per τ)."""
+    taus: List[float]
+    confidence: float
+    n_bootstrap: int
+    precision_low: List[float]
+    precision_high: List[float]
+    recall_low: List[float]
+    recall_high: List[float]
+    fp_per_year_low: List[float]
+    fp_per_year_high: List[float]
+
+
 @dataclass
 class PrecisionRecallReport:
     """Complete precision-recall analysis output."""
@@ -157,6 +185,7 @@ class PrecisionRecallReport:
     non_crisis_weeks: int
     total_crises: int
     sample_years: float
+    bands: Optional[PRCurveBands] = None
 
 
 # ---------------------------------------------------------------------------
@@ -196,6 +225,29 @@ def build_crisis_windows(
     return windows
 
 
+def _window_bounds(
+    sorted_dates: np.ndarray,
+    windows: List[CrisisWindow],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Index range [lo, hi) of each lead+crisis window in sorted dates."""
+    starts = np.array([w.lead_start for w in windows], dtype="datetime64[us]")
+    ends = np.array([w.window_end for w in windows], dtype="datetime64[us]")
+    lo = np.searchsorted(sorted_dates, starts, side="left")
+    hi = np.searchsorted(sorted_dates, ends, side="right")
+    return lo, hi
+
+
+def _crisis_flags(
+    dates: List[datetime],
+    windows: List[CrisisWindow],
+) -> np.ndarray:
+    """Vector form of ``_is_in_any_window`` over many dates."""
+    calendar = CrisisCalendar(
+        [(w.lead_start, w.window_end, w.event_name) for w in windows],
+    )
+    return calendar.mask(np.array(dates, dtype="datetime64[us]"))
+
+
 def _is_in_any_window(
     date: datetime,
     windows: List[CrisisWindow],
@@ -280,6 +332,10 @@ def compute_precision_recall_curve(
     tau_min: float = TAU_MIN,
     tau_max: float = TAU_MAX,
     tau_step: float = TAU_STEP,
+    taus: Optional[Sequence[float]] = None,
+    n_bootstrap: int = 0,
+    confidence: float = 0.90,
+    seed: int = 42,
 ) -> PrecisionRecallReport:
     """Compute the full precision-recall curve and associated analytics.
 
@@ -291,6 +347,12 @@ def compute_precision_recall_curve(
             41 catalogue events.
         near_miss_dates: Optional near-miss stress periods for FP taxonomy.
         tau_min/tau_max/tau_step: Threshold sweep parameters.
+        taus: Explicit τ grid (any resolution, sorted ascending);
+            overrides tau_min/tau_max/tau_step.
+        n_bootstrap: Bootstrap replicates for confidence bands on the
+            curve (0 = no bands).
+        confidence: Two-sided coverage of the bands.
+        seed: Random seed for the bootstrap.
 
     Returns:
         PrecisionRecallReport with full curve, operating points, and taxonomy.
@@ -307,50 +369,22 @@ def compute_precision_recall_curve(
     sample_years = (max_date - min_date).days / 365.25
 
     # Pre-classify weeks as crisis/non-crisis
-    crisis_week_flags = [
-        _is_in_any_window(d["date"], windows)
-        for d in weekly_data
-    ]
+    profile = _signal_profile(weekly_data, windows)
     total_weeks = len(weekly_data)
-    crisis_weeks = sum(crisis_week_flags)
+    crisis_weeks = int(profile.crisis_flags.sum())
     non_crisis_weeks = total_weeks - crisis_weeks
 
-    # --- Sweep τ and build PR curve ---
-    curve: List[PRPoint] = []
+    # --- Sweep τ and build PR curve (one pass over the sorted profile) ---
+    if taus is None:
+        taus = _tau_grid(tau_min, tau_max, tau_step)
+    tau_grid = np.sort(np.asarray(taus, dtype=float))
+    tp_arr, fp_arr, signal_arr = profile.counts(tau_grid)
 
-    tau = tau_min
-    while tau <= tau_max + 1e-9:
-        tau_r = round(tau, 2)
-
-        # Signal definition: MAC < τ  OR  momentum DETERIORATING+
-        signal_flags = []
-        for d in weekly_data:
-            below_tau = d["mac_score"] < tau_r
-            momentum_signal = d.get("is_deteriorating", False) or d.get(
-                "mac_status", ""
-            ) in ("DETERIORATING", "STRETCHED", "CRITICAL")
-            signal_flags.append(below_tau or momentum_signal)
-
-        # Count TP: crisis events with at least one signal in their window
-        tp = 0
-        for w in windows:
-            for d, sig in zip(weekly_data, signal_flags):
-                if not sig:
-                    continue
-                # TP if signal fires within window or within lead-time
-                if w.lead_start <= d["date"] <= w.window_end:
-                    tp += 1
-                    break  # one TP per crisis event
-
-        fn = total_crises - tp
-
-        # Count FP: signals in non-crisis weeks
-        fp = sum(
-            1 for f_c, f_s in zip(crisis_week_flags, signal_flags)
-            if not f_c and f_s
-        )
-
-        signal_weeks = sum(signal_flags)
+    curve: List[PRPoint] = []
+    for tau_r, tp, fp, signal_weeks in zip(
+        tau_grid.tolist(), tp_arr.tolist(), fp_arr.tolist(),
+        signal_arr.tolist(),
+    ):
         precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
         recall = tp / total_crises if total_crises > 0 else 0.0
         fp_per_year = fp / sample_years if sample_years > 0 else 0.0
@@ -359,7 +393,7 @@ def compute_precision_recall_curve(
             tau=tau_r,
             tp=tp,
             fp=fp,
-            fn=fn,
+            fn=total_crises - tp,
             precision=precision,
             recall=recall,
             f1=_f_beta(precision, recall, 1.0),
@@ -369,7 +403,12 @@ def compute_precision_recall_curve(
             fp_per_year=fp_per_year,
         ))
 
-        tau += tau_step
+    bands = None
+    if n_bootstrap > 0:
+        bands = _bootstrap_bands(
+            profile, tau_grid, sample_years,
+            n_bootstrap=n_bootstrap, confidence=confidence, seed=seed,
+        )
 
     # --- Standard operating points ---
     ops: List[OperatingPointReport] = []
@@ -401,11 +440,14 @@ def compute_precision_recall_curve(
         optimal_by_beta[arch.label] = (best_tau, round(best_fb, 4))
 
     # --- Per-era FPR (at default τ = 0.50) ---
-    era_fpr = _compute_era_fpr(weekly_data, windows, tau=0.50)
+    era_fpr = _compute_era_fpr(
+        weekly_data, windows, tau=0.50, crisis_flags=profile.crisis_flags,
+    )
 
     # --- FP taxonomy (at default τ = 0.50) ---
     fp_classifications = _classify_all_fps(
         weekly_data, windows, tau=0.50, near_miss_dates=near_miss_dates,
+        crisis_flags=profile.crisis_flags,
     )
 
     return PrecisionRecallReport(
@@ -419,6 +461,139 @@ def compute_precision_recall_curve(
         non_crisis_weeks=non_crisis_weeks,
         total_crises=total_crises,
         sample_years=sample_years,
+        bands=bands,
+    )
+
+
+def _tau_grid(tau_min: float, tau_max: float, tau_step: float) -> List[float]:
+    """The default sweep: τ_min … τ_max in tau_step increments (2 dp)."""
+    grid = []
+    tau = tau_min
+    while tau <= tau_max + 1e-9:
+        grid.append(round(tau, 2))
+        tau += tau_step
+    return grid
+
+
+def _is_momentum_signal(d: Dict) -> bool:
+    """Momentum signal (fires at any τ)."""
+    return bool(
+        d.get("is_deteriorating", False)
+        or d.get("mac_status", "") in MOMENTUM_SIGNAL_STATUSES
+    )
+
+
+@dataclass
+class _SignalProfile:
+    """Lowest signalling τ per week and per crisis window.
+
+    A week signals at τ iff its ``trigger`` < τ, where trigger is −∞ for
+    momentum signals and the MAC score otherwise (+∞ for a missing
+    score).  A window is detected iff its minimum trigger < τ.
+    """
+    crisis_flags: np.ndarray
+    window_min: np.ndarray        # per window, sorted
+    non_crisis_trigger: np.ndarray  # per non-crisis week, sorted
+    all_trigger: np.ndarray         # per week, sorted
+
+    def counts(
+        self, taus: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(TP, FP, signal weeks) at each τ."""
+        return (
+            np.searchsorted(self.window_min, taus, side="left"),
+            np.searchsorted(self.non_crisis_trigger, taus, side="left"),
+            np.searchsorted(self.all_trigger, taus, side="left"),
+        )
+
+
+def _signal_profile(
+    weekly_data: List[Dict],
+    windows: List[CrisisWindow],
+) -> _SignalProfile:
+    """Reduce weekly data to sorted signal triggers (one pass)."""
+    mac = np.array(
+        [d["mac_score"] for d in weekly_data], dtype=float,
+    )
+    trigger = np.where(np.isnan(mac), np.inf, mac)
+    momentum = np.array([_is_momentum_signal(d) for d in weekly_data])
+    trigger[momentum] = -np.inf
+
+    dates = [d["date"] for d in weekly_data]
+    values = np.array(dates, dtype="datetime64[us]")
+    order = np.argsort(values, kind="stable")
+    sorted_trigger = trigger[order]
+
+    window_min = np.full(len(windows), np.inf)
+    if windows:
+        lo, hi = _window_bounds(values[order], windows)
+        for k, (a, b) in enumerate(zip(lo, hi)):
+            if b > a:
+                window_min[k] = sorted_trigger[a:b].min()
+    crisis_flags = _crisis_flags(dates, windows)
+
+    return _SignalProfile(
+        crisis_flags=crisis_flags,
+        window_min=np.sort(window_min),
+        non_crisis_trigger=np.sort(trigger[~crisis_flags]),
+        all_trigger=np.sort(trigger),
+    )
+
+
+def _bootstrap_bands(
+    profile: _SignalProfile,
+    taus: np.ndarray,
+    sample_years: float,
+    *,
+    n_bootstrap: int,
+    confidence: float,
+    seed: int,
+) -> PRCurveBands:
+    """Percentile bands from resampling crisis windows and non-crisis weeks.
+
+    Windows and non-crisis weeks are resampled independently with
+    replacement.  Each item only matters through the first τ at which it
+    signals, so a replicate is a multinomial draw over those τ bins and
+    its whole curve is a cumulative sum, O(n_bootstrap × len(taus)).
+    Weeks are treated as exchangeable (no block structure).
+    """
+    rng = np.random.default_rng(seed)
+    n_bins = len(taus) + 1
+
+    def replicate_counts(triggers: np.ndarray) -> np.ndarray:
+        # Item counted at τ_j for every j >= its bin
+        bins = np.searchsorted(taus, triggers, side="right")
+        n = len(triggers)
+        if n == 0:
+            return np.zeros((n_bootstrap, len(taus)))
+        probs = np.bincount(bins, minlength=n_bins) / n
+        draws = rng.multinomial(n, probs, size=n_bootstrap)
+        return np.cumsum(draws, axis=1)[:, :-1].astype(float)
+
+    tp = replicate_counts(profile.window_min)
+    fp = replicate_counts(profile.non_crisis_trigger)
+    n_windows = len(profile.window_min)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 0.0)
+    recall = tp / n_windows if n_windows else np.zeros_like(tp)
+    fp_per_year = fp / sample_years if sample_years > 0 else np.zeros_like(fp)
+
+    alpha = (1.0 - confidence) / 2.0 * 100
+    q = [alpha, 100 - alpha]
+    p_lo, p_hi = np.percentile(precision, q, axis=0)
+    r_lo, r_hi = np.percentile(recall, q, axis=0)
+    f_lo, f_hi = np.percentile(fp_per_year, q, axis=0)
+    return PRCurveBands(
+        taus=taus.tolist(),
+        confidence=confidence,
+        n_bootstrap=n_bootstrap,
+        precision_low=p_lo.tolist(),
+        precision_high=p_hi.tolist(),
+        recall_low=r_lo.tolist(),
+        recall_high=r_hi.tolist(),
+        fp_per_year_low=f_lo.tolist(),
+        fp_per_year_high=f_hi.tolist(),
     )
 
 
@@ -442,29 +617,25 @@ def _compute_era_fpr(
     weekly_data: List[Dict],
     windows: List[CrisisWindow],
     tau: float,
+    crisis_flags: Optional[np.ndarray] = None,
 ) -> List[EraFPR]:
     """Compute FPR separately for each era (v6 §15.6.4)."""
+    if crisis_flags is None:
+        crisis_flags = _crisis_flags([d["date"] for d in weekly_data], windows)
     results: List[EraFPR] = []
     for era_name, start_year, end_year in ERA_BOUNDARIES:
         era_start = datetime(start_year, 1, 1)
         era_end = datetime(end_year, 1, 1)
         non_crisis = 0
         false_signals = 0
-        for d in weekly_data:
+        for d, in_window in zip(weekly_data, crisis_flags):
             date = d["date"]
             if not (era_start <= date < era_end):
                 continue
-            in_window = _is_in_any_window(date, windows)
             if in_window:
                 continue  # crisis week — skip
             non_crisis += 1
-            signal = (
-                d["mac_score"] < tau
-                or d.get("is_deteriorating", False)
-                or d.get("mac_status", "") in (
-                    "DETERIORATING", "STRETCHED", "CRITICAL",
-                )
-            )
+            signal = d["mac_score"] < tau or _is_momentum_signal(d)
             if signal:
                 false_signals += 1
         fpr = false_signals / non_crisis if non_crisis > 0 else 0.0
@@ -488,21 +659,17 @@ def _classify_all_fps(
     windows: List[CrisisWindow],
     tau: float,
     near_miss_dates: Optional[List[Tuple[datetime, datetime, str]]] = None,
+    crisis_flags: Optional[np.ndarray] = None,
 ) -> List[FPClassification]:
     """Classify every false-positive week at the given τ."""
+    if crisis_flags is None:
+        crisis_flags = _crisis_flags([d["date"] for d in weekly_data], windows)
     fps: List[FPClassification] = []
-    for d in weekly_data:
+    for d, in_window in zip(weekly_data, crisis_flags):
         date = d["date"]
-        in_window = _is_in_any_window(date, windows)
         if in_window:
             continue
-        signal = (
-            d["mac_score"] < tau
-            or d.get("is_deteriorating", False)
-            or d.get("mac_status", "") in (
-                "DETERIORATING", "STRETCHED", "CRITICAL",
-            )
-        )
+        signal = d["mac_score"] < tau or _is_momentum_signal(d)
         if not signal:
             continue
         fps.append(_classify_fp(date, d["mac_score"], near_miss_dates))
@@ -641,7 +808,7 @@ def export_precision_recall_json(
     Returns:
         JSON string.
     """
-    payload = {
+    payload: Dict = {
         "meta": {
             "total_weeks": report.total_weeks,
             "crisis_weeks": report.crisis_weeks,
@@ -701,6 +868,25 @@ def export_precision_recall_json(
             for cat in FPCategory
         },
     }
+    if report.bands is not None:
+        b = report.bands
+        payload["bands"] = {
+            "confidence": b.confidence,
+            "n_bootstrap": b.n_bootstrap,
+            "tau": b.taus,
+            "precision": [
+                [round(lo, 4), round(hi, 4)]
+                for lo, hi in zip(b.precision_low, b.precision_high)
+            ],
+            "recall": [
+                [round(lo, 4), round(hi, 4)]
+                for lo, hi in zip(b.recall_low, b.recall_high)
+            ],
+            "fp_per_year": [
+                [round(lo, 2), round(hi, 2)]
+                for lo, hi in zip(b.fp_per_year_low, b.fp_per_year_high)
+            ],
+        }
     json_str = json.dumps(payload, indent=2)
     if filepath:
         with open(filepath, "w") as fh:
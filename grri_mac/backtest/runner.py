@@ -24,7 +24,8 @@ Methodological Fixes (v6 §14, carried forward):
 
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, List, Tuple
 from dataclasses import dataclass
 import pandas as pd
 
@@ -42,13 +43,16 @@ from ..pillars.private_credit import (
 from ..pillars.sentiment import SentimentPillar
 from ..data.fomc_text import FOMCTextSource
 from ..mac.composite import (
-    calculate_mac_with_ci, get_mac_interpretation, ML_OPTIMIZED_WEIGHTS,
-    ML_OPTIMIZED_WEIGHTS_8,
+    MACResult, calculate_mac_with_ci, get_mac_interpretation,
+    ML_OPTIMIZED_WEIGHTS, ML_OPTIMIZED_WEIGHTS_8,
 )
-from ..mac.momentum import calculate_momentum
+from ..mac.momentum import MomentumTracker
 from .crisis_events import CRISIS_EVENTS, get_crisis_for_date
 from .era_configs import get_era_weights
 
+if TYPE_CHECKING:
+    from .vectorized import VectorizedBacktestEngine
+
 logger = logging.getLogger(__name__)
 
 # v7: Optional modules — graceful fallback if unavailable
@@ -88,7 +92,9 @@ class BacktestPoint:
     ci_90_low: Optional[float] = None
     ci_90_high: Optional[float] = None
     bootstrap_std: Optional[float] = None
-    # v7: HMM regime overlay
+    # v7: HMM regime overlay — filtered P(fragile | pillar history to
+    # date) from the streaming forward filter, not a posterior over a
+    # trailing 12-week window
     hmm_fragile_prob: Optional[float] = None
     hmm_regime: Optional[str] = None
 
@@ -101,6 +107,7 @@ class BacktestRunner:
         fred_api_key: Optional[str] = None,
         use_era_weights: bool = False,
         calibration_factor: float = 0.78,
+        fred_cache_dir: Optional[Path] = None,
     ):
         """
         Initialize backtest runner.
@@ -113,8 +120,10 @@ class BacktestRunner:
             calibration_factor: Multiplicative adjustment
                 for MAC scores (default 0.78, derived
                 from cross-validation)
+            fred_cache_dir: FRED disk cache directory
+                (default: data/fred_cache)
         """
-        self.fred = FREDClient(fred_api_key)
+        self.fred = FREDClient(fred_api_key, cache_dir=fred_cache_dir)
         self.use_era_weights = use_era_weights
         self.calibration_factor = calibration_factor
 
@@ -133,6 +142,7 @@ class BacktestRunner:
 
         # Historical MAC scores for momentum calculation
         self._historical_macs: List[dict] = []
+        self._momentum_tracker = MomentumTracker()
 
         # v7: Breach model (data-driven interaction penalties)
         self._breach_model = None
@@ -147,10 +157,16 @@ class BacktestRunner:
 
         # v7: HMM regime overlay
         self._hmm = None
-        self._pillar_history: List[dict] = []
         if _HMM_AVAILABLE:
             self._hmm = RegimeHMM()
 
+        # Warning keys already logged in the current run
+        self._warnings_shown: set[str] = set()
+
+        # Vectorized engine, held so its indicator-frame cache survives
+        # between run_backtest calls
+        self._vectorized_engine: Optional["VectorizedBacktestEngine"] = None
+
     def _prefetch_fred_data(
         self,
         start_date: datetime,
@@ -222,6 +238,25 @@ class BacktestRunner:
         Returns:
             BacktestPoint with MAC score and metadata
         """
+        return self._finish_point(date, *self._score_date(date))
+
+    def _score_date(
+        self, date: datetime,
+    ) -> Tuple[dict, MACResult, float]:
+        """
+        Pillar scores, composite and calibrated MAC for one date.
+
+        Reads no MAC history, so momentum and the HMM overlay are left
+        to _finish_point.  It is not stateless, though: the valuation
+        pillar appends each date's indicators to its adaptive-band
+        history, so scores depend on the dates scored before on this
+        runner.  The parallel engine seeds each worker's valuation
+        history with the trailing window a serial run would have
+        accumulated before the shard.
+
+        Returns:
+            (all pillar scores, composite MACResult, calibrated MAC)
+        """
         # Fetch indicators for this date
         liquidity_indicators = self._fetch_liquidity_indicators(date)
         valuation_indicators = self._fetch_valuation_indicators(date)
@@ -335,35 +370,39 @@ class BacktestRunner:
             cal = 1.0                            # No calibration
         calibrated_mac = mac_result.mac_score * cal
         calibrated_mac = max(0.0, min(1.0, calibrated_mac))
+        return all_scores, mac_result, calibrated_mac
 
-        # Calculate momentum from historical data
-        momentum = calculate_momentum(
-            current_mac=calibrated_mac,
-            historical_macs=self._historical_macs,
-            current_date=date,
-        )
+    def _finish_point(
+        self,
+        date: datetime,
+        all_scores: dict,
+        mac_result: MACResult,
+        calibrated_mac: float,
+    ) -> BacktestPoint:
+        """
+        Apply the sequential overlays (momentum, HMM) to a scored date.
+
+        Must be called in date order: both overlays read the history
+        accumulated by earlier calls.
+        """
+        # Calculate momentum against prior dates, then record this one
+        momentum = self._momentum_tracker.update(date, calibrated_mac)
 
-        # Store for future momentum calculations
         self._historical_macs.append({
             "date": date.strftime("%Y-%m-%d"),
             "mac_score": calibrated_mac,
         })
 
-        # v7: Accumulate pillar scores for HMM regime overlay
-        self._pillar_history.append(all_scores)
-
-        # v7: HMM regime prediction
+        # v7: HMM regime overlay — forward filter over the pillar
+        # history (fits itself once 52 observations have accumulated).
+        # hmm_fragile_prob is the filtered posterior given every date so
+        # far, not the old 12-week window posterior.
         hmm_fragile_prob = None
         hmm_regime = None
-        if self._hmm is not None and len(self._pillar_history) >= 52:
+        if self._hmm is not None:
             try:
-                if not self._hmm.is_fitted:
-                    self._hmm.fit(self._pillar_history)
-                if self._hmm.is_fitted:
-                    recent = self._pillar_history[-12:]
-                    regime_result = self._hmm.predict(
-                        all_scores, recent_history=recent,
-                    )
+                regime_result = self._hmm.update(all_scores)
+                if regime_result is not None:
                     hmm_fragile_prob = regime_result.fragile_prob
                     hmm_regime = regime_result.regime
             except Exception:
@@ -408,7 +447,9 @@ class BacktestRunner:
         self,
         start_date: datetime,
         end_date: datetime,
-        frequency: str = "weekly"  # daily, weekly, monthly
+        frequency: str = "weekly",  # daily, weekly, monthly
+        engine: str = "iterative",  # iterative, vectorized, parallel
+        workers: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Run backtest over a date range.
@@ -417,40 +458,48 @@ class BacktestRunner:
             start_date: Start date
             end_date: End date
             frequency: Calculation frequency
+            engine: "iterative" scores one date at a time via
+                calculate_mac_for_date; "vectorized" scores the whole
+                date grid as columns (see backtest.vectorized);
+                "parallel" shards the date grid across worker processes
+                (see backtest.parallel)
+            workers: Worker processes for the parallel engine
+                (default: CPU count)
 
         Returns:
             DataFrame with backtest results
         """
-        results = []
+        if engine == "vectorized":
+            from .vectorized import VectorizedBacktestEngine
 
-        # Clear historical MACs for fresh momentum calculation
-        self._historical_macs = []
+            if self._vectorized_engine is None:
+                self._vectorized_engine = VectorizedBacktestEngine(self)
+            return self._vectorized_engine.run(
+                start_date, end_date, frequency,
+            )
+        elif engine == "parallel":
+            from .parallel import ParallelBacktestEngine
 
-        # Track which warnings have been shown to avoid spam
-        self._warnings_shown: set[str] = set()
+            return ParallelBacktestEngine(self, workers=workers).run(
+                start_date, end_date, frequency,
+            )
+        elif engine != "iterative":
+            raise ValueError(f"Unknown engine: {engine}")
 
-        # Pre-fetch all required FRED series for efficiency
-        self._prefetch_fred_data(start_date, end_date)
+        results = []
 
-        # Generate date range based on frequency
-        if frequency == "daily":
-            delta = timedelta(days=1)
-        elif frequency == "weekly":
-            delta = timedelta(days=7)
-        elif frequency == "monthly":
-            delta = timedelta(days=30)
-        else:
-            raise ValueError(f"Unknown frequency: {frequency}")
+        # Fresh momentum, HMM and warning state for this run
+        self._reset_history()
 
-        # Calculate total points for progress tracking
-        total_days = (end_date - start_date).days
-        total_points = total_days // delta.days + 1
+        # Pre-fetch all required FRED series for efficiency
+        self._prefetch_fred_data(start_date, end_date)
 
-        current_date = start_date
+        dates = self._date_grid(start_date, end_date, frequency)
+        total_points = len(dates)
         point_count = 0
         last_progress = -1
 
-        while current_date <= end_date:
+        for current_date in dates:
             try:
                 point = self.calculate_mac_for_date(current_date)
                 results.append(point)
@@ -475,11 +524,51 @@ class BacktestRunner:
                 if "Error" not in str(e):
                     pass  # Silently skip expected missing data
 
-            current_date += delta
-
         print()  # New line after progress bar
 
-        # Convert to DataFrame
+        return self._points_to_frame(results)
+
+    def _reset_history(self) -> None:
+        """
+        Clear per-run state: MAC history, momentum lags, valuation
+        history, the HMM filter and the shown-warnings set.
+
+        Every engine calls this first, so a run never depends on earlier
+        runs of the same runner.
+        """
+        self._historical_macs = []
+        self._momentum_tracker.reset()
+        self.valuation.reset_history()
+        self._warnings_shown = set()
+        if self._hmm is not None:
+            self._hmm.reset_filter()
+
+    @staticmethod
+    def _date_grid(
+        start_date: datetime,
+        end_date: datetime,
+        frequency: str,
+    ) -> List[datetime]:
+        """Backtest dates from start to end (inclusive) at a frequency."""
+        if frequency == "daily":
+            delta = timedelta(days=1)
+        elif frequency == "weekly":
+            delta = timedelta(days=7)
+        elif frequency == "monthly":
+            delta = timedelta(days=30)
+        else:
+            raise ValueError(f"Unknown frequency: {frequency}")
+
+        dates = []
+        current_date = start_date
+        while current_date <= end_date:
+            dates.append(current_date)
+            current_date += delta
+        return dates
+
+    @staticmethod
+    def _points_to_frame(results: List[BacktestPoint]) -> pd.DataFrame:
+        """Backtest points as a date-indexed DataFrame."""
         df = pd.DataFrame([
             {
                 "date": p.date,
@@ -518,8 +607,6 @@ class BacktestRunner:
 
     def _warn_once(self, warning_key: str, message: str) -> None:
         """Print a warning only once per backtest run."""
-        if not hasattr(self, '_warnings_shown'):
-            self._warnings_shown = set()
         if warning_key not in self._warnings_shown:
             self._warnings_shown.add(warning_key)
             # Silently skip - warnings clutter output during long backtests
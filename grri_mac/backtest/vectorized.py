@@ -0,0 +1,716 @@
+"""Columnar backtest engine for MAC framework.
+
+Scores every date of a backtest in one pass instead of calling
+``BacktestRunner.calculate_mac_for_date`` once per date:
+
+    1. Align every prefetched FRED series to the date grid once
+       (``FREDClient.get_values_for_dates``).
+    2. Rebuild the FRED proxy chains (SOFR-IORB → TED → FF-TBill →
+       discount-TBill, ICE OAS → Moody's, VIX → VXO → realised vol)
+       as masked array operations.
+    3. Score each pillar as a NumPy column with the pillar's own
+       ``calculate_batch`` (the same scoring core as ``calculate``), then
+       apply Fix A (active-pillar mask), Fix D (weight selection), breach
+       interaction penalties and Fix E (era-aware calibration) as matrix
+       operations.
+
+Bootstrap CIs for all dates come from one bootstrap_mac_ci_batch call,
+and momentum columns from one calculate_momentum_series call.  Only the
+genuinely sequential or proxy-provider work remains per date: the HMM
+overlay (a filtered posterior over all dates so far), and pre-1934
+NBER/Schwert lookups for cells the FRED chains leave empty.  Those cells go through the same scalar
+FREDClient methods the iterative runner uses, so the output matches
+``run_backtest(engine="iterative")`` column for column.
+
+The aligned indicator frame is kept on the engine (and the runner keeps
+its engine), keyed by date grid and ``FREDClient.data_version``, so
+re-scoring the same date range after a threshold change skips the data
+step entirely until new FRED data arrives.
+
+Usage:
+    runner = BacktestRunner()
+    df = runner.run_backtest(start, end, engine="vectorized")
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data.fomc_text import CALIBRATION_FOMC_DATES
+from ..mac.composite import (
+    BREACH_INTERACTION_PENALTY,
+    ML_OPTIMIZED_WEIGHTS,
+    ML_OPTIMIZED_WEIGHTS_8,
+    get_mac_interpretation,
+)
+from ..mac.confidence import bootstrap_mac_ci_batch
+from ..mac.momentum import calculate_momentum_series
+from .crisis_events import get_crises_for_dates
+from .era_configs import get_era, get_era_weights
+
+if TYPE_CHECKING:
+    from .runner import BacktestRunner
+
+# Column order of the pillar score matrix
+PILLARS = (
+    "liquidity", "valuation", "positioning", "volatility",
+    "policy", "contagion", "private_credit", "sentiment",
+)
+
+FREQUENCY_DAYS = {"daily": 1, "weekly": 7, "monthly": 30}
+
+MODERN_WEIGHTS_START = datetime(2006, 1, 1)
+POST_BRETTON_WOODS_START = datetime(1971, 2, 5)
+SHILLER_START = datetime(1871, 1, 1)
+CP_MODERN_START = datetime(1997, 1, 2)
+
+
+def _first_valid(*arrays: np.ndarray) -> np.ndarray:
+    """Element-wise first non-NaN value across arrays (proxy chain)."""
+    out = arrays[0].copy()
+    for arr in arrays[1:]:
+        missing = np.isnan(out)
+        out[missing] = arr[missing]
+    return out
+
+
+class VectorizedBacktestEngine:
+    """Whole-history columnar scoring on top of a BacktestRunner.
+
+    The runner supplies the FRED client, pillar instances (and their
+    THRESHOLDS), breach model, HMM and calibration settings, so the two
+    execution modes cannot drift apart in configuration.
+    """
+
+    def __init__(self, runner: "BacktestRunner"):
+        self.runner = runner
+        self.fred = runner.fred
+        self._indicator_cache: dict[tuple, pd.DataFrame] = {}
+
+    # ── Date grid ────────────────────────────────────────────────────────
+
+    @staticmethod
+    def build_date_grid(
+        start_date: datetime,
+        end_date: datetime,
+        frequency: str = "weekly",
+    ) -> pd.DatetimeIndex:
+        """Return the same date sequence the iterative runner walks."""
+        if frequency not in FREQUENCY_DAYS:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        return pd.date_range(
+            start_date, end_date, freq=f"{FREQUENCY_DAYS[frequency]}D",
+        )
+
+    # ── Series alignment ─────────────────────────────────────────────────
+
+    def asof(
+        self,
+        series_id: str,
+        dates: np.ndarray,
+        lookback_days: int = 5,
+    ) -> np.ndarray:
+        """Aligned values for one series (NaN where missing)."""
+        return self.fred.get_values_for_dates(series_id, dates, lookback_days)
+
+    def _fill_from_scalar(
+        self,
+        values: np.ndarray,
+        dates: pd.DatetimeIndex,
+        mask: np.ndarray,
+        getter: Callable[[datetime], Optional[float]],
+    ) -> np.ndarray:
+        """Fill still-missing cells via the scalar FREDClient method.
+
+        Used for proxy-provider branches (NBER, Schwert, Shiller) that
+        only exist as per-date lookups.
+        """
+        todo = np.flatnonzero(mask & np.isnan(values))
+        if todo.size == 0:
+            return values
+        py_dates = dates.to_pydatetime()
+        for i in todo:
+            try:
+                value = getter(py_dates[i])
+            except Exception:
+                continue
+            if value is not None:
+                values[i] = value
+        return values
+
+    # ── Indicator columns (FRED proxy chains) ────────────────────────────
+
+    def _liquidity_spread(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``FREDClient.get_liquidity_spread``."""
+        fc = self.fred
+        d = dates.values
+        out = np.full(len(d), np.nan)
+
+        # 2018+: SOFR minus IORB (IOER before July 2021)
+        sofr = self.asof("SOFR", d, 10)
+        iorb_era = d >= np.datetime64(fc.IORB_START_DATE)
+        ioer_era = (d >= np.datetime64(fc.SOFR_START_DATE)) & ~iorb_era
+        out[iorb_era] = ((sofr - self.asof("IORB", d, 10)) * 100)[iorb_era]
+        out[ioer_era] = ((sofr - self.asof("IOER", d, 10)) * 100)[ioer_era]
+
+        # 1986–2018: TED spread, else FF − T-Bill
+        ted_era = (d >= np.datetime64(fc.VXO_START)) & (
+            d < np.datetime64(fc.SOFR_START_DATE)
+        )
+        ff = _first_valid(self.asof("DFF", d, 10), self.asof("FEDFUNDS", d, 35))
+        tb = _first_valid(self.asof("DTB3", d, 10), self.asof("TB3MS", d, 35))
+        ted = _first_valid(self.asof("TEDRATE", d, 10) * 100, (ff - tb) * 100)
+        out[ted_era] = ted[ted_era]
+
+        # 1954–1986: FF − T-Bill with monthly lookback
+        ff_era = (d >= np.datetime64(fc.FED_FUNDS_START)) & (
+            d < np.datetime64(fc.VXO_START)
+        )
+        ff35 = _first_valid(
+            self.asof("DFF", d, 35), self.asof("FEDFUNDS", d, 35),
+        )
+        tb35 = _first_valid(
+            self.asof("DTB3", d, 35), self.asof("TB3MS", d, 35),
+        )
+        out[ff_era] = ((ff35 - tb35) * 100)[ff_era]
+
+        # 1934–1954: discount rate − T-Bill, else discount level
+        disc_era = (d >= np.datetime64(fc.TB3MS_START)) & (
+            d < np.datetime64(fc.FED_FUNDS_START)
+        )
+        discount = self.asof("INTDSRUSM193N", d, 35)
+        tbill = self.asof("TB3MS", d, 35)
+        disc = np.where(
+            np.isnan(tbill), discount * 20, (discount - tbill) * 100,
+        )
+        out[disc_era] = disc[disc_era]
+
+        # 1907–1934: NBER call money − govt rate
+        nber_era = (d >= np.datetime64(fc.NBER_DATA_START)) & (
+            d < np.datetime64(fc.TB3MS_START)
+        )
+        return self._fill_from_scalar(
+            out, dates, nber_era, fc.get_liquidity_spread,
+        )
+
+    def _cp_spread(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``FREDClient.get_cp_treasury_spread``."""
+        d = dates.values
+        out = np.full(len(d), np.nan)
+        modern = d >= np.datetime64(CP_MODERN_START)
+        cp = (self.asof("DCPN3M", d, 10) - self.asof("DTB3", d, 10)) * 100
+        out[modern] = cp[modern]
+        return self._fill_from_scalar(
+            out, dates,
+            d >= np.datetime64(self.fred.NBER_DATA_START),
+            self.fred.get_cp_treasury_spread,
+        )
+
+    def _ig_oas(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``FREDClient.get_ig_oas``."""
+        fc = self.fred
+        d = dates.values
+        ice = np.where(
+            d >= np.datetime64(fc.ICE_CREDIT_START),
+            self.asof("IG_OAS", d, 10) * 100, np.nan,
+        )
+        baa = self.asof("BAA", d, 35)
+        dgs10_proxy = np.maximum(
+            (baa - self.asof("DGS10", d, 35)) * 100 - 40, 50,
+        )
+        lt_proxy = np.maximum(
+            (baa - self.asof("IRLTLT01USM156N", d, 35)) * 100 - 40, 50,
+        )
+        out = _first_valid(ice, dgs10_proxy, lt_proxy)
+        return self._fill_from_scalar(
+            out, dates, d >= np.datetime64(fc.NBER_DATA_START), fc.get_ig_oas,
+        )
+
+    def _hy_oas(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``FREDClient.get_hy_oas``."""
+        fc = self.fred
+        d = dates.values
+        ice = np.where(
+            d >= np.datetime64(fc.ICE_CREDIT_START),
+            self.asof("HY_OAS", d, 10) * 100, np.nan,
+        )
+        moodys = np.maximum(
+            (self.asof("BAA", d, 35) - self.asof("AAA", d, 35)) * 100 * 4.5,
+            250,
+        )
+        out = _first_valid(ice, moodys)
+        return self._fill_from_scalar(
+            out, dates, d >= np.datetime64(fc.NBER_DATA_START), fc.get_hy_oas,
+        )
+
+    def _realized_vol(
+        self,
+        dates: np.ndarray,
+        window_days: int = 21,
+    ) -> np.ndarray:
+        """Array form of ``FREDClient._compute_realized_volatility``."""
+        out = np.full(len(dates), np.nan)
+        data = self.fred._bulk_cache.get("NASDAQCOM")
+        if data is None or len(data) < window_days + 1:
+            return out
+
+        data = data.sort_index()
+        times = data.index.values.astype("datetime64[ns]").view("int64")
+        returns = data.pct_change(fill_method=None).dropna()
+        if returns.empty:
+            return out
+        ret_times = returns.index.values.astype("datetime64[ns]").view("int64")
+        vol = returns.rolling(
+            window_days, min_periods=window_days // 2,
+        ).std().to_numpy() * np.sqrt(252) * 100 * 1.2
+
+        targets = np.asarray(dates, dtype="datetime64[ns]").view("int64")
+        n_obs = np.searchsorted(times, targets, side="right")
+        pos = np.searchsorted(ret_times, targets, side="right") - 1
+        ok = (n_obs >= window_days + 1) & (pos >= 0)
+        out[ok] = vol[pos[ok]]
+        return out
+
+    def _vix(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``FREDClient.get_vix``."""
+        fc = self.fred
+        d = dates.values
+        vix = np.where(
+            d >= np.datetime64(fc.VIX_START), self.asof("VIX", d, 10), np.nan,
+        )
+        vxo = np.where(
+            d >= np.datetime64(fc.VXO_START),
+            self.asof("VXOCLS", d, 10) * 0.95, np.nan,
+        )
+        rv = np.where(
+            d >= np.datetime64(fc.NASDAQ_START), self._realized_vol(d), np.nan,
+        )
+        out = _first_valid(vix, vxo, rv)
+        return self._fill_from_scalar(
+            out, dates, d >= np.datetime64(SHILLER_START), fc.get_vix,
+        )
+
+    def _fed_funds(self, dates: np.ndarray) -> np.ndarray:
+        """Array form of ``FREDClient.get_fed_funds``."""
+        fc = self.fred
+        d = np.asarray(dates, dtype="datetime64[ns]")
+        discount = np.where(
+            d >= np.datetime64(fc.DISCOUNT_RATE_START),
+            self.asof("INTDSRUSM193N", d, 35), np.nan,
+        )
+        pre_fed = np.where(d >= np.datetime64(fc.NBER_DATA_START), 0.25, np.nan)
+        return _first_valid(
+            self.asof("FED_FUNDS_TARGET", d, 10),
+            self.asof("FEDFUNDS", d, 35),
+            discount,
+            pre_fed,
+        )
+
+    def build_indicator_frame(self, dates: pd.DatetimeIndex) -> pd.DataFrame:
+        """Align every raw indicator the runner fetches onto the date grid.
+
+        Column names match the indicator dataclass fields; NaN means the
+        iterative runner would have left the field as None.
+        """
+        d = dates.values
+        return pd.DataFrame(
+            {
+                "sofr_iorb_spread_bps": self._liquidity_spread(dates),
+                "cp_treasury_spread_bps": self._cp_spread(dates),
+                "term_premium_10y_bps": (
+                    self.asof("TERM_PREMIUM_10Y", d, 10) * 100
+                ),
+                "ig_oas_bps": self._ig_oas(dates),
+                "hy_oas_bps": self._hy_oas(dates),
+                "vix_level": self._vix(dates),
+                "policy_room_bps": self._fed_funds(d) * 100,
+                "financial_oas_bps": self.asof("BAA10Y", d, 35) * 100,
+                "ci_standards_small": self.asof("DRTSCIS", d, 100),
+                "spreads_small": self.asof("DRISCFS", d, 100),
+                "ci_standards_large": self.asof("DRTSCILM", d, 100),
+            },
+            index=dates,
+        )
+
+    # ── Sentiment (rate-change proxy) ────────────────────────────────────
+
+    def _sentiment_proxy(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``FOMCTextSource.get_rate_proxy_sentiment``."""
+        d = dates.values
+
+        # Signal 1: 6-month fed funds change (sigmoid, k = 1.5)
+        ff_now = self._fed_funds(d)
+        ff_prior = self._fed_funds(d - np.timedelta64(180, "D"))
+        with np.errstate(over="ignore"):
+            ff_score = 1.0 / (1.0 + np.exp(1.5 * (ff_now - ff_prior)))
+        ff_score = np.where(np.isnan(ff_score), 0.5, ff_score)
+
+        # Signal 2: 10Y − 2Y slope (10Y − FF when 2Y missing)
+        dgs10 = self.asof("DGS10", d, 14)
+        slope = _first_valid(dgs10 - self.asof("DGS2", d, 14), dgs10 - ff_now)
+        yc_score = np.where(
+            np.isnan(slope), 0.5, np.clip(0.5 + slope * 0.15, 0.10, 0.90),
+        )
+
+        # Signal 3: 3-month Baa − Aaa momentum (sigmoid, k = 3)
+        prior = d - np.timedelta64(91, "D")
+        delta = (
+            (self.asof("BAA", d, 35) - self.asof("AAA", d, 35))
+            - (self.asof("BAA", prior, 35) - self.asof("AAA", prior, 35))
+        )
+        with np.errstate(over="ignore"):
+            cs_score = 1.0 / (1.0 + np.exp(-3.0 * delta))
+        cs_score = np.where(np.isnan(cs_score), 0.5, cs_score)
+
+        sentiment = np.clip(
+            0.50 * ff_score + 0.25 * yc_score + 0.25 * cs_score, 0.05, 0.95,
+        )
+
+        # Calibration anchors within 14 days override (first match wins)
+        day = np.timedelta64(1, "D")
+        for anchor_date, info in reversed(list(CALIBRATION_FOMC_DATES.items())):
+            diff = np.abs((d - np.datetime64(anchor_date)) // day)
+            sentiment[diff <= 14] = info["tone_score"]
+
+        return np.where(dates.year.to_numpy() < 1960, 0.5, sentiment)
+
+    def _score_sentiment(
+        self, dates: pd.DatetimeIndex,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Sentiment composite and has-data flag per date.
+
+        Dates on or after the oldest available FOMC text go through the
+        runner's text-first scorer; everything else uses the proxy.
+        """
+        batch = self.runner.sentiment.calculate_batch(pd.DataFrame(
+            {
+                "proxy_score": self._sentiment_proxy(dates),
+                "observation_date": dates,
+            },
+            index=dates,
+        ))
+        scores = batch["composite_score"].to_numpy(copy=True)
+        active = ~batch["method"].isin(["pre_data", "no_texts"]).to_numpy()
+
+        earliest = self.runner.fomc_source.earliest_text_date()
+        if earliest is not None:
+            py_dates = dates.to_pydatetime()
+            for i in np.flatnonzero(dates.values >= np.datetime64(earliest)):
+                result = self.runner._score_sentiment(py_dates[i])
+                scores[i] = result.composite_score
+                active[i] = result.method not in ("pre_data", "no_texts")
+        return scores, active
+
+    # ── Pillar scoring ───────────────────────────────────────────────────
+
+    def score_pillars(
+        self,
+        ind: pd.DataFrame,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Score all eight pillars as columns.
+
+        Returns:
+            (scores, has_data): two (n_dates × 8) arrays in PILLARS order
+        """
+        runner = self.runner
+        dates = ind.index
+        n = len(ind)
+
+        # Each pillar's own array scorer, so thresholds and fallbacks
+        # cannot drift from the per-date path.  No CFTC data in backtest,
+        # and no VIX history, so no VRP/persistence adjustment.
+        liq = runner.liquidity.calculate_batch(ind)["composite"].to_numpy()
+        val = runner.valuation.calculate_batch(ind)["composite"].to_numpy()
+        pos = runner.positioning.calculate_batch(ind)["composite"].to_numpy()
+        vol = runner.volatility.calculate_batch(ind)["composite"].to_numpy()
+        pol = runner.policy.calculate_batch(ind)["composite"].to_numpy()
+        # Contagion picks G-SIB thresholds by regulatory regime (date)
+        con = runner.contagion.calculate_batch(
+            ind.assign(indicator_date=dates),
+        )["composite"].to_numpy()
+        prc = runner.private_credit.calculate_batch(ind)["composite"].to_numpy()
+        sent, sent_active = self._score_sentiment(dates)
+
+        scores = np.column_stack([liq, val, pos, vol, pol, con, prc, sent])
+
+        # Fix A: which pillars received real indicator data
+        def present(*cols: str) -> np.ndarray:
+            return ind[list(cols)].notna().any(axis=1).to_numpy()
+
+        has_data = np.column_stack([
+            present("sofr_iorb_spread_bps", "cp_treasury_spread_bps"),
+            present("term_premium_10y_bps", "ig_oas_bps", "hy_oas_bps"),
+            np.zeros(n, dtype=bool),
+            present("vix_level"),
+            present("policy_room_bps"),
+            present("financial_oas_bps"),
+            present("ci_standards_small"),
+            sent_active,
+        ])
+        return scores, has_data
+
+    # ── Composite ────────────────────────────────────────────────────────
+
+    def _weight_matrix(
+        self,
+        dates: pd.DatetimeIndex,
+        sentiment_active: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray, list[Optional[dict]]]:
+        """Fix D weight selection per date.
+
+        Returns:
+            (weights, equal_rows, weight_dicts) where ``weights`` is
+            (n_dates × 8), ``equal_rows`` flags dates using equal weights
+            and ``weight_dicts`` holds the dict each date would pass to
+            calculate_mac_with_ci (None for equal weights).
+        """
+        n = len(dates)
+        modern = dates.values >= np.datetime64(MODERN_WEIGHTS_START)
+        weight_dicts: list[Optional[dict]] = [None] * n
+
+        era_weights: dict[str, dict] = {}
+        py_dates = dates.to_pydatetime()
+        for i in range(n):
+            if modern[i]:
+                weight_dicts[i] = (
+                    ML_OPTIMIZED_WEIGHTS_8 if sentiment_active[i]
+                    else ML_OPTIMIZED_WEIGHTS
+                )
+            elif self.runner.use_era_weights:
+                era = get_era(py_dates[i])
+                if era not in era_weights:
+                    era_weights[era] = get_era_weights(py_dates[i])
+                weight_dicts[i] = era_weights[era]
+
+        matrix = np.zeros((n, len(PILLARS)))
+        equal = np.array([w is None for w in weight_dicts])
+        for i, w in enumerate(weight_dicts):
+            if w is not None:
+                matrix[i] = [w.get(p, 0.0) for p in PILLARS]
+        return matrix, equal, weight_dicts
+
+    def _penalty_table(self) -> np.ndarray:
+        """Interaction penalty indexed by breach count 0–7."""
+        model = self.runner._breach_model
+        if model is not None:
+            return np.array([
+                model.get_penalty_for_breach_count(k) for k in range(8)
+            ])
+        return np.array([
+            BREACH_INTERACTION_PENALTY.get(k, 0.15) for k in range(8)
+        ])
+
+    def _calibration(self, dates: pd.DatetimeIndex) -> np.ndarray:
+        """Fix E: era-aware calibration factor per date."""
+        cf = self.runner.calibration_factor
+        d = dates.values
+        return np.select(
+            [
+                d >= np.datetime64(MODERN_WEIGHTS_START),
+                d >= np.datetime64(POST_BRETTON_WOODS_START),
+            ],
+            [cf, min(cf + 0.12, 1.0)],
+            default=1.0,
+        )
+
+    def composite(
+        self,
+        dates: pd.DatetimeIndex,
+        scores: np.ndarray,
+        has_data: np.ndarray,
+        compute_ci: bool = True,
+    ) -> dict[str, np.ndarray]:
+        """Weighted composite, breach penalty, calibration and CIs."""
+        n = len(dates)
+        active = has_data.copy()
+        active[~active.any(axis=1)] = True  # Fallback: use all pillars
+
+        sentiment_active = has_data[:, PILLARS.index("sentiment")]
+        weights, equal, weight_dicts = self._weight_matrix(
+            dates, sentiment_active,
+        )
+
+        # Weight normalisation over active pillars (calculate_mac)
+        w = np.where(active, weights, 0.0)
+        w_sum = w.sum(axis=1)
+        n_active = active.sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            renorm = ~equal & (np.abs(w_sum - 1.0) > 0.01)
+            w[renorm] /= w_sum[renorm, None]
+            w[equal] = active[equal] / n_active[equal, None]
+
+        raw = (scores * w).sum(axis=1)
+        breaches = np.minimum(((scores < 0.3) & active).sum(axis=1), 7)
+        penalty = self._penalty_table()[breaches]
+        mac = np.maximum(0.0, raw - penalty)
+        calibrated = np.clip(mac * self._calibration(dates), 0.0, 1.0)
+
+        result = {
+            "mac_score": calibrated,
+            "interaction_penalty": penalty,
+            "valid": np.isfinite(calibrated),
+        }
+
+        ci = np.full((n, 5), np.nan)
+        valid = result["valid"]
+        if compute_ci and valid.any():
+            # Bootstrap over active pillars with the un-normalised weight
+            # dict (missing keys → 1/k), as calculate_mac_with_ci does
+            base = np.full((n, len(PILLARS)), np.nan)
+            for i, weight_dict in enumerate(weight_dicts):
+                if weight_dict is not None:
+                    base[i] = [weight_dict.get(p, np.nan) for p in PILLARS]
+            batch = bootstrap_mac_ci_batch(
+                np.where(active, scores, np.nan)[valid],
+                base[valid],
+                pillar_names=PILLARS,
+                interaction_penalty=penalty[valid],
+            )
+            ci[valid] = np.column_stack([
+                batch.ci_80, batch.ci_90, batch.bootstrap_std,
+            ])
+        result["ci"] = ci
+        return result
+
+    # ── Sequential overlays ──────────────────────────────────────────────
+
+    def _hmm_overlay(
+        self, scores: np.ndarray,
+    ) -> tuple[list, list]:
+        """Replay the runner's HMM overlay over the scored history.
+
+        Each probability is the forward filter's P(fragile | scores to
+        date), not a posterior over a trailing 12-week window.
+        """
+        runner = self.runner
+        probs: list = [None] * len(scores)
+        regimes: list = [None] * len(scores)
+        if runner._hmm is None:
+            return probs, regimes
+
+        for i, row in enumerate(scores):
+            all_scores = dict(zip(PILLARS, (float(v) for v in row)))
+            try:
+                regime = runner._hmm.update(all_scores)
+            except Exception:
+                continue
+            if regime is not None:
+                probs[i] = regime.fragile_prob
+                regimes[i] = regime.regime
+        return probs, regimes
+
+    @staticmethod
+    def _data_quality(dates: pd.DatetimeIndex) -> np.ndarray:
+        """Array form of ``BacktestRunner._assess_data_quality``."""
+        d = dates.values
+        return np.select(
+            [
+                d >= np.datetime64(datetime(2018, 4, 3)),
+                d >= np.datetime64(datetime(2011, 10, 3)),
+                d >= np.datetime64(datetime(1990, 1, 2)),
+            ],
+            ["excellent", "good", "fair"],
+            default="poor",
+        )
+
+    # ── Entry point ──────────────────────────────────────────────────────
+
+    def run(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        frequency: str = "weekly",
+        compute_ci: bool = True,
+        prefetch: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Run a whole-history backtest in columnar mode.
+
+        Args:
+            start_date: Start date
+            end_date: End date
+            frequency: "daily", "weekly" or "monthly"
+            compute_ci: Populate bootstrap CI columns
+            prefetch: Prefetch FRED series first (set False when the
+                bulk cache is already warm)
+
+        Returns:
+            DataFrame with the same schema as BacktestRunner.run_backtest
+        """
+        self.runner._reset_history()
+        dates = self.build_date_grid(start_date, end_date, frequency)
+
+        grid = (dates[0], dates[-1], len(dates)) if len(dates) else ()
+        indicators = self._indicator_cache.get(
+            (grid, frequency, self.fred.data_version),
+        )
+        if indicators is None:
+            if prefetch:
+                self.runner._prefetch_fred_data(start_date, end_date)
+            indicators = self.build_indicator_frame(dates)
+            # Frames built from an older bulk cache can never hit again
+            version = self.fred.data_version
+            self._indicator_cache = {
+                key: frame for key, frame in self._indicator_cache.items()
+                if key[-1] == version
+            }
+            self._indicator_cache[(grid, frequency, version)] = indicators
+
+        scores, has_data = self.score_pillars(indicators)
+        comp = self.composite(dates, scores, has_data, compute_ci=compute_ci)
+
+        keep = comp["valid"]
+        dates = dates[keep]
+        scores = scores[keep]
+        mac = comp["mac_score"][keep]
+        ci = comp["ci"][keep]
+
+        momentum = calculate_momentum_series(dates, mac)
+        hmm_probs, hmm_regimes = self._hmm_overlay(scores)
+
+        self.runner._historical_macs = [
+            {"date": dt.strftime("%Y-%m-%d"), "mac_score": float(m)}
+            for dt, m in zip(dates.to_pydatetime(), mac)
+        ]
+
+        def ci_col(j: int) -> list:
+            return [None if np.isnan(v) else float(v) for v in ci[:, j]]
+
+        df = pd.DataFrame({
+            "date": dates.to_pydatetime(),
+            "mac_score": mac,
+            "liquidity": scores[:, 0],
+            "valuation": scores[:, 1],
+            "positioning": scores[:, 2],
+            "volatility": scores[:, 3],
+            "policy": scores[:, 4],
+            "contagion": scores[:, 5],
+            "private_credit": scores[:, 6],
+            "sentiment": scores[:, 7],
+            "interpretation": [get_mac_interpretation(m) for m in mac],
+            "crisis_event": [
+                c.name if c else None
+                for c in get_crises_for_dates(dates.values)
+            ],
+            "data_quality": self._data_quality(dates),
+            "momentum_1w": momentum["momentum_1w"].to_numpy(),
+            "momentum_4w": momentum["momentum_4w"].to_numpy(),
+            "trend_direction": momentum["trend_direction"].to_numpy(),
+            "mac_status": momentum["mac_status"].to_numpy(),
+            "is_deteriorating": momentum["is_deteriorating"].to_numpy(),
+            # v7: Bootstrap CIs
+            "ci_80_low": ci_col(0),
+            "ci_80_high": ci_col(1),
+            "ci_90_low": ci_col(2),
+            "ci_90_high": ci_col(3),
+            "bootstrap_std": ci_col(4),
+            # v7: HMM regime
+            "hmm_fragile_prob": hmm_probs,
+            "hmm_regime": hmm_regimes,
+        })
+        df.set_index("date", inplace=True)
+        return df
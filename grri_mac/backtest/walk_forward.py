@@ -26,6 +26,8 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
+from .crisis_events import CrisisCalendar
+
 logger = logging.getLogger(__name__)
 
 
@@ -204,6 +206,9 @@ class WalkForwardEngine:
 
         # Build crisis windows
         crisis_windows = self._build_crisis_windows(crisis_events)
+        in_crisis_flags = CrisisCalendar(crisis_windows).mask(
+            [d["date"] for d in weekly_data],
+        )
 
         # Initialise state
         predictions: List[WeeklyPrediction] = []
@@ -275,9 +280,7 @@ class WalkForwardEngine:
             ))
 
             # Update rolling metrics at each tau
-            in_crisis = self._is_in_crisis_window(
-                current_date, crisis_windows,
-            )
+            in_crisis = bool(in_crisis_flags[t])
             for tau in cfg.tau_values:
                 signal = mac_score < tau
                 rolling_state[tau].update(
@@ -338,17 +341,6 @@ class WalkForwardEngine:
             windows.append((start, end, name))
         return windows
 
-    def _is_in_crisis_window(
-        self,
-        date: datetime,
-        windows: List[Tuple[datetime, datetime, str]],
-    ) -> bool:
-        """Check if date falls within any crisis window."""
-        for start, end, _ in windows:
-            if start <= date <= end:
-                return True
-        return False
-
     def _get_pillar_scores(
         self,
         week_data: Dict,
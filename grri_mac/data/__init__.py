@@ -22,12 +22,14 @@ from .blob_store import (
     get_blob_store,
     RAW_CONTAINER,
     CLEANED_CONTAINER,
+    LATEST,
 )
 from .pipeline import (
     DataPipeline,
     IngestResult,
     BatchIngestResult,
     SourceDescriptor,
+    SourcePolicy,
     FRED_MAC_SERIES,
 )
 
@@ -55,10 +57,12 @@ __all__ = [
     "get_blob_store",
     "RAW_CONTAINER",
     "CLEANED_CONTAINER",
+    "LATEST",
     # Ingestion pipeline
     "DataPipeline",
     "IngestResult",
     "BatchIngestResult",
     "SourceDescriptor",
+    "SourcePolicy",
     "FRED_MAC_SERIES",
 ]
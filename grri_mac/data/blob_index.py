@@ -0,0 +1,397 @@
+"""Persistent listing index for the BlobStore data lake.
+
+Listing the lake used to mean walking every file under a tier (or
+enumerating a whole Azure prefix) and opening each ``.meta.json``
+sidecar.  BlobStore now records every write and delete in an index and
+answers ``list_blobs``, ``exists`` and the source manifest from it:
+
+- **LocalBlobIndex** — one SQLite file under the local root with a
+  ``(tier, name)`` primary key, so a prefix listing is a B-tree range
+  scan and an existence check a single lookup.  Each upload or delete
+  commits its row in its own transaction.
+- **AzureBlobIndex** — one JSON shard per source at
+  ``_index/{source}.json`` in each container.  Each upload or delete
+  saves its shard straight away with an ETag precondition; a
+  concurrent writer's changes are re-read and ours re-applied on top.
+  Shards are cached in memory and revalidated on every read with a
+  conditional (If-None-Match) download, so another process's writes
+  are seen without re-reading unchanged shards.
+
+An index that has never been built for a tier is filled once from a
+full scan, and ``BlobStore.reindex()`` repeats that scan after files
+were changed behind the store's back.
+
+Entries use the ``list_blobs`` shape: ``name``, ``size``,
+``last_modified`` (aware datetime) and ``metadata``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from azure.core import MatchConditions
+    from azure.core.exceptions import (
+        ResourceExistsError,
+        ResourceModifiedError,
+        ResourceNotFoundError,
+        ResourceNotModifiedError,
+    )
+except ImportError:  # only AzureBlobIndex needs these
+    pass
+
+# SQLite file under the local data lake root
+LOCAL_INDEX_FILE = "_index.sqlite"
+# Azure shard prefix and the marker written once a container is indexed
+AZURE_INDEX_PREFIX = "_index/"
+AZURE_INDEX_MARKER = "_index/_built"
+
+# Upper bound for prefix range scans (sorts after any real name)
+_PREFIX_END = "\U0010ffff"
+
+Entry = Dict[str, Any]
+Scanner = Callable[[], Iterable[Entry]]
+
+
+def _entry(
+    name: str, size: int, last_modified: str, metadata: str,
+) -> Entry:
+    return {
+        "name": name,
+        "size": size,
+        "last_modified": datetime.fromisoformat(last_modified),
+        "metadata": json.loads(metadata),
+    }
+
+
+class LocalBlobIndex:
+    """SQLite index of the local-filesystem tiers."""
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS blobs (
+            tier TEXT NOT NULL,
+            name TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            last_modified TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            PRIMARY KEY (tier, name)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS built_tiers (
+            tier TEXT PRIMARY KEY
+        );
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Pipeline workers upload from several threads
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._lock = threading.Lock()
+        # Serialises first builds so a scan never wipes concurrent puts
+        self._build_lock = threading.Lock()
+        self._built: set = set()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.executescript(self._SCHEMA)
+            self._conn.commit()
+
+    def ensure_built(self, tier: str, scan: Scanner) -> None:
+        """Fill the tier from ``scan`` unless it was built before."""
+        if tier in self._built:
+            return
+        with self._build_lock:
+            if tier in self._built:
+                return
+            with self._lock:
+                built = self._conn.execute(
+                    "SELECT 1 FROM built_tiers WHERE tier = ?", (tier,),
+                ).fetchone()
+            if built:
+                self._built.add(tier)
+            else:
+                self.rebuild(tier, scan())
+
+    def rebuild(self, tier: str, entries: Iterable[Entry]) -> int:
+        """Replace the tier's rows with ``entries``; returns the count."""
+        rows = [
+            (
+                tier, e["name"], int(e["size"]),
+                e["last_modified"].isoformat(), json.dumps(e["metadata"]),
+            )
+            for e in entries
+        ]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM blobs WHERE tier = ?", (tier,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)", rows,
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO built_tiers VALUES (?)", (tier,),
+            )
+        self._built.add(tier)
+        return len(rows)
+
+    def put(
+        self,
+        tier: str,
+        name: str,
+        size: int,
+        last_modified: datetime,
+        metadata: Dict[str, str],
+    ) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?)",
+                (
+                    tier, name, size, last_modified.isoformat(),
+                    json.dumps(metadata),
+                ),
+            )
+
+    def delete(self, tier: str, name: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM blobs WHERE tier = ? AND name = ?", (tier, name),
+            )
+
+    def get(self, tier: str, name: str) -> Optional[Entry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, size, last_modified, metadata FROM blobs "
+                "WHERE tier = ? AND name = ?",
+                (tier, name),
+            ).fetchone()
+        return None if row is None else _entry(*row)
+
+    def list(self, tier: str, prefix: Optional[str] = None) -> List[Entry]:
+        lo = prefix or ""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name, size, last_modified, metadata FROM blobs "
+                "WHERE tier = ? AND name >= ? AND name < ? ORDER BY name",
+                (tier, lo, lo + _PREFIX_END),
+            ).fetchall()
+        return [_entry(*row) for row in rows]
+
+    def flush(self) -> None:
+        """Nothing to do: every change is committed as it happens."""
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class AzureBlobIndex:
+    """Per-source JSON shards stored in each Azure container."""
+
+    def __init__(self, containers: Callable[[str], Any]):
+        """
+        Args:
+            containers: Maps a tier to its ContainerClient.
+        """
+        self._container = containers
+        self._lock = threading.Lock()
+        # (tier, source) -> {name: record}, ETag, pending changes
+        self._shards: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._etags: Dict[Tuple[str, str], Optional[str]] = {}
+        self._pending: Dict[Tuple[str, str], Dict[str, Optional[Any]]] = {}
+        self._built: set = set()
+        self._build_lock = threading.Lock()
+
+    @staticmethod
+    def _source(name: str) -> str:
+        return name.split("/", 1)[0]
+
+    @staticmethod
+    def _record(
+        size: int, last_modified: datetime, metadata: Dict[str, str],
+    ) -> Dict[str, Any]:
+        return {
+            "size": size,
+            "last_modified": last_modified.isoformat(),
+            "metadata": metadata,
+        }
+
+    def _load(
+        self, tier: str, source: str, revalidate: bool = False,
+    ) -> Dict[str, Any]:
+        """The cached shard, downloaded on first use.
+
+        With ``revalidate`` a cached shard is re-downloaded only if its
+        ETag changed (or it has appeared since); unsaved changes are
+        re-applied to the new copy.
+        """
+        key = (tier, source)
+        cached = key in self._shards
+        if cached and not revalidate:
+            return self._shards[key]
+        container = self._container(tier)
+        etag = self._etags.get(key)
+        conditions: Dict[str, Any] = (
+            {"etag": etag, "match_condition": MatchConditions.IfModified}
+            if cached and etag else {}
+        )
+        try:
+            blob = container.download_blob(
+                f"{AZURE_INDEX_PREFIX}{source}.json", **conditions,
+            )
+            self._shards[key] = json.loads(blob.readall())
+            self._etags[key] = blob.properties.etag
+        except ResourceNotModifiedError:
+            return self._shards[key]
+        except ResourceNotFoundError:
+            self._shards[key] = {}
+            self._etags[key] = None
+        self._reapply(key)
+        return self._shards[key]
+
+    def _reapply(self, key: Tuple[str, str]) -> None:
+        """Replay unsaved changes onto a freshly read shard."""
+        shard = self._shards[key]
+        for name, record in self._pending.get(key, {}).items():
+            if record is None:
+                shard.pop(name, None)
+            else:
+                shard[name] = record
+
+    def ensure_built(self, tier: str, scan: Scanner) -> None:
+        if tier in self._built:
+            return
+        with self._build_lock:
+            if tier in self._built:
+                return
+            container = self._container(tier)
+            try:
+                container.get_blob_properties(AZURE_INDEX_MARKER)
+            except ResourceNotFoundError:
+                self.rebuild(tier, scan())
+            self._built.add(tier)
+
+    def rebuild(self, tier: str, entries: Iterable[Entry]) -> int:
+        shards: Dict[str, Dict[str, Any]] = {}
+        count = 0
+        for e in entries:
+            shards.setdefault(self._source(e["name"]), {})[e["name"]] = (
+                self._record(e["size"], e["last_modified"], e["metadata"])
+            )
+            count += 1
+        container = self._container(tier)
+        with self._lock:
+            for source, shard in shards.items():
+                result = container.upload_blob(
+                    f"{AZURE_INDEX_PREFIX}{source}.json",
+                    json.dumps(shard), overwrite=True,
+                )
+                self._shards[(tier, source)] = shard
+                self._etags[(tier, source)] = result.get("etag")
+                self._pending.pop((tier, source), None)
+            container.upload_blob(AZURE_INDEX_MARKER, b"", overwrite=True)
+        self._built.add(tier)
+        return count
+
+    def put(
+        self,
+        tier: str,
+        name: str,
+        size: int,
+        last_modified: datetime,
+        metadata: Dict[str, str],
+    ) -> None:
+        record = self._record(size, last_modified, metadata)
+        key = (tier, self._source(name))
+        with self._lock:
+            self._load(*key)[name] = record
+            self._pending.setdefault(key, {})[name] = record
+            self._flush_shard(key, max_attempts=5)
+
+    def delete(self, tier: str, name: str) -> None:
+        key = (tier, self._source(name))
+        with self._lock:
+            self._load(*key).pop(name, None)
+            self._pending.setdefault(key, {})[name] = None
+            self._flush_shard(key, max_attempts=5)
+
+    def get(self, tier: str, name: str) -> Optional[Entry]:
+        with self._lock:
+            record = self._load(
+                tier, self._source(name), revalidate=True,
+            ).get(name)
+        if record is None:
+            return None
+        return _entry(
+            name, record["size"], record["last_modified"],
+            json.dumps(record["metadata"]),
+        )
+
+    def list(self, tier: str, prefix: Optional[str] = None) -> List[Entry]:
+        if prefix and "/" in prefix:
+            sources = [self._source(prefix)]
+        else:
+            container = self._container(tier)
+            sources = [
+                b.name[len(AZURE_INDEX_PREFIX):-len(".json")]
+                for b in container.list_blobs(
+                    name_starts_with=AZURE_INDEX_PREFIX,
+                )
+                if b.name.endswith(".json")
+            ]
+            if prefix:
+                sources = [s for s in sources if s.startswith(prefix)]
+        out: List[Entry] = []
+        with self._lock:
+            for source in sources:
+                shard = self._load(tier, source, revalidate=True)
+                for name, rec in shard.items():
+                    if prefix is None or name.startswith(prefix):
+                        out.append(_entry(
+                            name, rec["size"], rec["last_modified"],
+                            json.dumps(rec["metadata"]),
+                        ))
+        return sorted(out, key=lambda e: e["name"])
+
+    def flush(self, max_attempts: int = 5) -> None:
+        """Retry shards a write could not save under contention."""
+        with self._lock:
+            for key in list(self._pending):
+                self._flush_shard(key, max_attempts)
+
+    def _flush_shard(self, key: Tuple[str, str], max_attempts: int) -> None:
+        tier, source = key
+        container = self._container(tier)
+        for _ in range(max_attempts):
+            etag = self._etags.get(key)
+            # Overwrite only the version we read; create only if absent
+            conditions: Dict[str, Any] = (
+                {
+                    "overwrite": True,
+                    "etag": etag,
+                    "match_condition": MatchConditions.IfNotModified,
+                }
+                if etag else {"overwrite": False}
+            )
+            try:
+                result = container.upload_blob(
+                    f"{AZURE_INDEX_PREFIX}{source}.json",
+                    json.dumps(self._shards[key]),
+                    **conditions,
+                )
+            except (ResourceModifiedError, ResourceExistsError):
+                # Someone else saved the shard: re-read, re-apply ours
+                del self._shards[key]
+                self._load(tier, source)
+                continue
+            self._etags[key] = result.get("etag")
+            del self._pending[key]
+            return
+        logger.warning("Index shard %s/%s not saved: contention", *key)
+
+    def close(self) -> None:
+        self.flush()
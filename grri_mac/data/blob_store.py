@@ -12,6 +12,24 @@ Example:
     raw   → fred/VIXCLS/2026-02-18.json
     clean → fred/VIXCLS/2026-02-18.parquet
 
+Incrementally ingested series keep a compacted base plus small delta
+files in the cleaned tier instead of daily snapshots::
+
+    fred/VIXCLS/_base.parquet
+    fred/VIXCLS/_delta/000001.parquet
+    fred/VIXCLS/_state.json          (watermark + live delta list)
+
+Dated uploads are content-addressed: each blob's SHA-256 goes into its
+metadata, and each series keeps a ``_latest.json`` pointer per tier
+naming its newest blob and digest.  An upload whose bytes match the
+latest blob is skipped and recorded as an alias date on the pointer,
+so ``fred/VIXCLS/2026-02-19`` still resolves to the 2026-02-18 blob.
+Pass ``date_str=LATEST`` to read the newest version without listing.
+
+Listing, existence checks and the source manifest are answered from a
+persistent index (see ``blob_index``) that every write and delete
+updates, instead of walking the tier and reading every sidecar.
+
 Environment variables:
     AZURE_STORAGE_CONNECTION_STRING  — required for Azure
     MAC_DATALAKE_LOCAL_ROOT          — optional override for local fallback dir
@@ -22,16 +40,25 @@ under ``data/datalake/`` so development works without cloud credentials.
 
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 import logging
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
+from .blob_index import (
+    AZURE_INDEX_PREFIX,
+    LOCAL_INDEX_FILE,
+    AzureBlobIndex,
+    LocalBlobIndex,
+)
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -68,6 +95,16 @@ CONTENT_TYPES = {
     ".dat": "text/plain",
 }
 
+# Incremental series layout (names under {source}/{series_id}/)
+INCREMENTAL_BASE = "_base.parquet"
+INCREMENTAL_STATE = "_state.json"
+INCREMENTAL_DELTA_DIR = "_delta"
+
+# Per-series pointer to the newest dated blob (one per tier)
+LATEST_POINTER = "_latest.json"
+# date_str value that resolves through the pointer
+LATEST = "latest"
+
 # Default local root when Azure is unavailable
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 _DEFAULT_LOCAL_ROOT = _PROJECT_ROOT / "data" / "datalake"
@@ -103,7 +140,16 @@ class BlobStore:
         self,
         connection_string: Optional[str] = None,
         local_root: Optional[Path] = None,
+        dedup: bool = True,
     ) -> None:
+        """
+        Args:
+            connection_string: Azure connection string (default: env).
+            local_root: Local fallback directory; forces local mode
+                unless a connection string is also given.
+            dedup: Skip dated uploads whose bytes match the latest blob.
+        """
+        self.dedup = dedup
         prefer_local = local_root is not None
         self._conn_str = (
             connection_string
@@ -148,6 +194,9 @@ class BlobStore:
                 "BlobStore using local filesystem: %s",
                 self._local_root,
             )
+        # Listing index, opened on first use
+        self._index_handle: Any = None
+        self._index_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Container management
@@ -196,7 +245,7 @@ class BlobStore:
             Path string like ``fred/VIXCLS/2026-02-18.parquet``.
         """
         if date_str is None:
-            date_str = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            date_str = BlobStore._today()
         return f"{source}/{series_id}/{date_str}{ext}"
 
     @staticmethod
@@ -219,6 +268,11 @@ class BlobStore:
             meta.update(extra)
         return meta
 
+    @staticmethod
+    def content_digest(data: bytes) -> str:
+        """SHA-256 hex digest used for deduplication."""
+        return hashlib.sha256(data).hexdigest()
+
     # ------------------------------------------------------------------
     # Upload — Azure
     # ------------------------------------------------------------------
@@ -298,6 +352,55 @@ class BlobStore:
             return path.read_bytes()
         return None
 
+    # ------------------------------------------------------------------
+    # Backend dispatch by blob name
+    # ------------------------------------------------------------------
+
+    def _put_blob(
+        self,
+        tier: str,
+        blob_name: str,
+        data: bytes,
+        metadata: Dict[str, str],
+    ) -> bool:
+        ext = os.path.splitext(blob_name)[1]
+        if self.connected:
+            ct = CONTENT_TYPES.get(ext, "application/octet-stream")
+            ok = self._upload_azure(tier, blob_name, data, ct, metadata)
+        else:
+            ok = self._upload_local(tier, blob_name, data, metadata)
+        if ok:
+            self._indexed(tier).put(
+                tier, blob_name, len(data),
+                datetime.now(timezone.utc), metadata,
+            )
+        return ok
+
+    def _get_blob(self, tier: str, blob_name: str) -> Optional[bytes]:
+        if self.connected:
+            return self._download_azure(tier, blob_name)
+        return self._download_local(tier, blob_name)
+
+    def _delete_blob(self, tier: str, blob_name: str) -> bool:
+        if self.connected:
+            container = self._container(tier)
+            if container is None:
+                return False
+            try:
+                container.delete_blob(blob_name)
+            except Exception:
+                return False
+        else:
+            path = self._local_root / tier / blob_name
+            if not path.exists():
+                return False
+            path.unlink()
+            meta = path.with_suffix(path.suffix + ".meta.json")
+            if meta.exists():
+                meta.unlink()
+        self._indexed(tier).delete(tier, blob_name)
+        return True
+
     # ══════════════════════════════════════════════════════════════════════
     # Public API — raw data
     # ══════════════════════════════════════════════════════════════════════
@@ -325,13 +428,10 @@ class BlobStore:
         Returns:
             ``True`` on success.
         """
-        blob_name = self.blob_path(source, series_id, ext, date_str)
-        ct = CONTENT_TYPES.get(ext, "application/octet-stream")
         meta = self._metadata(source, series_id, extra=extra_metadata)
-
-        if self.connected:
-            return self._upload_azure(DataTier.RAW, blob_name, data, ct, meta)
-        return self._upload_local(DataTier.RAW, blob_name, data, meta)
+        return self._put_versioned(
+            DataTier.RAW, source, series_id, ext, data, meta, date_str,
+        )
 
     def upload_raw_json(
         self,
@@ -374,11 +474,13 @@ class BlobStore:
         ext: str = ".json",
         date_str: Optional[str] = None,
     ) -> Optional[bytes]:
-        """Retrieve raw bytes from the *raw* tier."""
-        blob_name = self.blob_path(source, series_id, ext, date_str)
-        if self.connected:
-            return self._download_azure(DataTier.RAW, blob_name)
-        return self._download_local(DataTier.RAW, blob_name)
+        """Retrieve raw bytes from the *raw* tier.
+
+        ``date_str`` may be an alias date or ``LATEST``.
+        """
+        return self._get_versioned(
+            DataTier.RAW, source, series_id, ext, date_str,
+        )
 
     def download_raw_json(
         self,
@@ -417,7 +519,7 @@ class BlobStore:
             extra_metadata: Additional metadata.
 
         Returns:
-            ``True`` on success.
+            ``True`` on success (including a deduplicated no-op).
         """
         if fmt == "parquet":
             buf = io.BytesIO()
@@ -428,20 +530,15 @@ class BlobStore:
             raw_bytes = df.to_csv(index=True).encode("utf-8")
             ext = ".csv"
 
-        blob_name = self.blob_path(source, series_id, ext, date_str)
-        ct = CONTENT_TYPES.get(ext, "application/octet-stream")
         meta = self._metadata(
             source, series_id,
             row_count=len(df),
             extra=extra_metadata,
         )
-
-        if self.connected:
-            return self._upload_azure(
-                DataTier.CLEANED, blob_name,
-                raw_bytes, ct, meta,
-            )
-        return self._upload_local(DataTier.CLEANED, blob_name, raw_bytes, meta)
+        return self._put_versioned(
+            DataTier.CLEANED, source, series_id, ext, raw_bytes, meta,
+            date_str,
+        )
 
     def download_dataframe(
         self,
@@ -457,19 +554,15 @@ class BlobStore:
             source: Source key.
             series_id: Series identifier.
             fmt: ``"parquet"`` (default) or ``"csv"``.
-            date_str: ISO date override.
+            date_str: ISO date override, alias date or ``LATEST``.
 
         Returns:
             DataFrame, or ``None`` if not found.
         """
         ext = ".parquet" if fmt == "parquet" else ".csv"
-        blob_name = self.blob_path(source, series_id, ext, date_str)
-
-        if self.connected:
-            data = self._download_azure(DataTier.CLEANED, blob_name)
-        else:
-            data = self._download_local(DataTier.CLEANED, blob_name)
-
+        data = self._get_versioned(
+            DataTier.CLEANED, source, series_id, ext, date_str,
+        )
         if data is None:
             return None
 
@@ -494,11 +587,61 @@ class BlobStore:
 
         Returns:
             List of dicts with ``name``, ``size``, ``last_modified``,
-            ``metadata`` keys.
+            ``metadata`` keys.  ``_latest.json`` pointers are omitted.
         """
+        return [
+            b for b in self._list_all(tier, prefix)
+            if not b["name"].endswith("/" + LATEST_POINTER)
+        ]
+
+    def _list_all(
+        self, tier: str, prefix: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        return self._indexed(tier).list(tier, prefix)
+
+    def _scan(self, tier: str) -> List[Dict[str, Any]]:
+        """Full listing from the backend itself (slow; rebuilds the index)."""
         if self.connected:
-            return self._list_azure(tier, prefix)
-        return self._list_local(tier, prefix)
+            return [
+                b for b in self._list_azure(tier, None)
+                if not b["name"].startswith(AZURE_INDEX_PREFIX)
+            ]
+        return self._list_local(tier, None)
+
+    @property
+    def _index(self) -> Any:
+        with self._index_lock:
+            if self._index_handle is None:
+                self._index_handle = (
+                    AzureBlobIndex(self._container) if self.connected
+                    else LocalBlobIndex(self._local_root / LOCAL_INDEX_FILE)
+                )
+        return self._index_handle
+
+    def _indexed(self, tier: str) -> Any:
+        """The index, built from a full scan the first time a tier is used."""
+        self._index.ensure_built(tier, lambda: self._scan(tier))
+        return self._index
+
+    def reindex(self, tier: Optional[str] = None) -> int:
+        """Rebuild the index from a full scan of one or both tiers.
+
+        Only needed when blobs were added or removed without going
+        through this class.
+
+        Returns:
+            Number of blobs indexed.
+        """
+        tiers = [tier] if tier else [DataTier.RAW, DataTier.CLEANED]
+        return sum(self._index.rebuild(t, self._scan(t)) for t in tiers)
+
+    def flush_index(self) -> None:
+        """Retry index changes a write could not save (Azure only).
+
+        Every write already saves its index entry; this only matters
+        after shard contention outlasted the per-write retries.
+        """
+        self._index.flush()
 
     def _list_azure(
         self, tier: str, prefix: Optional[str]
@@ -542,11 +685,12 @@ class BlobStore:
                     meta = json.loads(meta_path.read_text())
                 except Exception:
                     pass
+            st = f.stat()
             results.append({
                 "name": rel,
-                "size": f.stat().st_size,
+                "size": st.st_size,
                 "last_modified": datetime.fromtimestamp(
-                    f.stat().st_mtime, tz=timezone.utc
+                    st.st_mtime, tz=timezone.utc
                 ),
                 "metadata": meta,
             })
@@ -560,19 +704,16 @@ class BlobStore:
         ext: str = ".parquet",
         date_str: Optional[str] = None,
     ) -> bool:
-        """Check whether a specific blob exists."""
-        blob_name = self.blob_path(source, series_id, ext, date_str)
-        if self.connected:
-            container = self._container(tier)
-            if container is None:
-                return False
-            try:
-                container.get_blob_properties(blob_name)
-                return True
-            except Exception:
-                return False
-        path = self._local_root / tier / blob_name
-        return path.exists()
+        """Check whether a specific blob (or alias date) exists."""
+        if date_str != LATEST and self._blob_exists(
+            tier, self.blob_path(source, series_id, ext, date_str),
+        ):
+            return True
+        blob_name = self._resolve(tier, source, series_id, ext, date_str)
+        return blob_name is not None and self._blob_exists(tier, blob_name)
+
+    def _blob_exists(self, tier: str, blob_name: str) -> bool:
+        return self._indexed(tier).get(tier, blob_name) is not None
 
     def delete(
         self,
@@ -582,25 +723,325 @@ class BlobStore:
         ext: str = ".parquet",
         date_str: Optional[str] = None,
     ) -> bool:
-        """Delete a blob."""
-        blob_name = self.blob_path(source, series_id, ext, date_str)
-        if self.connected:
-            container = self._container(tier)
-            if container is None:
-                return False
-            try:
-                container.delete_blob(blob_name)
+        """Delete a blob, or drop an alias date.
+
+        Deleting the latest blob clears the pointer entry and its
+        aliases; the next upload starts a fresh one.
+        """
+        if date_str is None:
+            date_str = self._today()
+        deleted = self._delete_blob(
+            tier, self.blob_path(source, series_id, ext, date_str),
+        )
+        pointer = self._read_pointer(tier, source, series_id)
+        entry = pointer.get(ext)
+        if entry is None:
+            return deleted
+        aliases = entry["aliases"]
+        if date_str in aliases:
+            del aliases[date_str]
+            deleted = True
+        if deleted:
+            # Aliases of a deleted blob have nothing to resolve to
+            entry["aliases"] = {
+                d: target for d, target in aliases.items()
+                if target != date_str
+            }
+            if entry["date"] == date_str:
+                del pointer[ext]
+            self._write_pointer(tier, source, series_id, pointer)
+        return deleted
+
+    # ══════════════════════════════════════════════════════════════════════
+    # Content-addressed versions — latest pointer + alias dates
+    # ══════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _read_pointer(
+        self, tier: str, source: str, series_id: str,
+    ) -> Dict[str, Any]:
+        data = self._get_blob(
+            tier, self.series_blob_path(source, series_id, LATEST_POINTER),
+        )
+        return {} if data is None else json.loads(data.decode("utf-8"))
+
+    def _write_pointer(
+        self,
+        tier: str,
+        source: str,
+        series_id: str,
+        pointer: Dict[str, Any],
+    ) -> bool:
+        return self._put_blob(
+            tier,
+            self.series_blob_path(source, series_id, LATEST_POINTER),
+            json.dumps(pointer, indent=2, sort_keys=True).encode("utf-8"),
+            self._metadata(source, series_id),
+        )
+
+    def latest(
+        self,
+        source: str,
+        series_id: str,
+        tier: str = DataTier.CLEANED,
+        ext: str = ".parquet",
+    ) -> Optional[Dict[str, Any]]:
+        """Pointer entry for the newest dated blob of a series.
+
+        Returns:
+            Dict with ``blob`` (blob name), ``date``, ``sha256`` and
+            ``aliases`` (``{alias_date: stored_date}`` for skipped
+            identical uploads), or ``None`` if nothing was uploaded.
+        """
+        return self._read_pointer(tier, source, series_id).get(ext)
+
+    def _resolve(
+        self,
+        tier: str,
+        source: str,
+        series_id: str,
+        ext: str,
+        date_str: Optional[str],
+    ) -> Optional[str]:
+        """Blob name holding ``date_str``'s content via the pointer."""
+        entry = self.latest(source, series_id, tier, ext)
+        if entry is None:
+            return None
+        if date_str == LATEST:
+            return entry["blob"]
+        stored = entry["aliases"].get(date_str or self._today())
+        if stored is None:
+            return None
+        return self.blob_path(source, series_id, ext, stored)
+
+    def _get_versioned(
+        self,
+        tier: str,
+        source: str,
+        series_id: str,
+        ext: str,
+        date_str: Optional[str],
+    ) -> Optional[bytes]:
+        """Download by date, falling back to the pointer for aliases."""
+        if date_str != LATEST:
+            data = self._get_blob(
+                tier, self.blob_path(source, series_id, ext, date_str),
+            )
+            if data is not None:
+                return data
+        blob_name = self._resolve(tier, source, series_id, ext, date_str)
+        return None if blob_name is None else self._get_blob(tier, blob_name)
+
+    def _put_versioned(
+        self,
+        tier: str,
+        source: str,
+        series_id: str,
+        ext: str,
+        data: bytes,
+        metadata: Dict[str, str],
+        date_str: Optional[str],
+    ) -> bool:
+        """Write a dated blob unless it repeats the latest version.
+
+        The blob is written before the pointer moves, so the pointer
+        never names a blob that does not exist.  Uploads dated before
+        the latest version (backfills) are always written and leave the
+        pointer where it is.
+        """
+        if date_str is None:
+            date_str = self._today()
+        digest = self.content_digest(data)
+        metadata["content_sha256"] = digest
+
+        pointer = self._read_pointer(tier, source, series_id)
+        entry = pointer.get(ext)
+        current = entry is not None and date_str >= entry["date"]
+
+        if (
+            self.dedup and entry is not None and current
+            and entry["sha256"] == digest
+            and self._blob_exists(tier, entry["blob"])
+        ):
+            if date_str == entry["date"]:
                 return True
-            except Exception:
-                return False
-        path = self._local_root / tier / blob_name
-        if path.exists():
-            path.unlink()
-            meta = path.with_suffix(path.suffix + ".meta.json")
-            if meta.exists():
-                meta.unlink()
-            return True
-        return False
+            entry["aliases"][date_str] = entry["date"]
+            logger.info(
+                "Unchanged %s/%s%s on %s — aliased to %s",
+                source, series_id, ext, date_str, entry["date"],
+            )
+            return self._write_pointer(tier, source, series_id, pointer)
+
+        blob_name = self.blob_path(source, series_id, ext, date_str)
+        if not self._put_blob(tier, blob_name, data, metadata):
+            return False
+
+        if entry is None:
+            entry = pointer[ext] = {"aliases": {}}
+        entry["aliases"].pop(date_str, None)
+        if current or "blob" not in entry:
+            entry.update(blob=blob_name, date=date_str, sha256=digest)
+        return self._write_pointer(tier, source, series_id, pointer)
+
+    # ══════════════════════════════════════════════════════════════════════
+    # Incremental series — compacted base + Parquet deltas
+    # ══════════════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def series_blob_path(source: str, series_id: str, name: str) -> str:
+        """Path of a per-series file such as ``_base.parquet``."""
+        return f"{source}/{series_id}/{name}"
+
+    def delta_state(
+        self,
+        source: str,
+        series_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Incremental state of a series, or ``None`` if it has none.
+
+        Returns:
+            Dict with ``watermark`` (last stored index value, ISO
+            string or ``None``), ``base_rows``, ``deltas`` (live delta
+            blob names, oldest first) and ``next_delta``.
+        """
+        data = self._get_blob(
+            DataTier.CLEANED,
+            self.series_blob_path(source, series_id, INCREMENTAL_STATE),
+        )
+        if data is None:
+            return None
+        return json.loads(data.decode("utf-8"))
+
+    def _write_delta_state(
+        self, source: str, series_id: str, state: Dict[str, Any],
+    ) -> bool:
+        return self._put_blob(
+            DataTier.CLEANED,
+            self.series_blob_path(source, series_id, INCREMENTAL_STATE),
+            json.dumps(state, indent=2).encode("utf-8"),
+            self._metadata(source, series_id),
+        )
+
+    def _put_parquet(
+        self, source: str, series_id: str, name: str, df: pd.DataFrame,
+    ) -> bool:
+        buf = io.BytesIO()
+        df.to_parquet(buf, index=True, engine="pyarrow")
+        return self._put_blob(
+            DataTier.CLEANED,
+            self.series_blob_path(source, series_id, name),
+            buf.getvalue(),
+            self._metadata(source, series_id, row_count=len(df)),
+        )
+
+    def _get_parquet(
+        self, source: str, series_id: str, name: str,
+    ) -> Optional[pd.DataFrame]:
+        data = self._get_blob(
+            DataTier.CLEANED, self.series_blob_path(source, series_id, name),
+        )
+        return None if data is None else pd.read_parquet(io.BytesIO(data))
+
+    def append_delta(
+        self,
+        source: str,
+        series_id: str,
+        df: pd.DataFrame,
+    ) -> Optional[Dict[str, Any]]:
+        """Append rows past the watermark as a new delta file.
+
+        The first call for a series writes ``df`` as the base instead.
+        Rows must be newer than the current watermark (the caller
+        filters them); an empty ``df`` leaves the store untouched.
+
+        Returns:
+            The updated state, or ``None`` if a write failed.
+        """
+        state = self.delta_state(source, series_id)
+        watermark = str(df.index.max()) if len(df) else None
+        if state is None:
+            if not self._put_parquet(
+                source, series_id, INCREMENTAL_BASE, df,
+            ):
+                return None
+            state = {
+                "watermark": watermark,
+                "base_rows": len(df),
+                "deltas": [],
+                "next_delta": 1,
+            }
+        elif len(df) == 0:
+            return state
+        else:
+            name = (
+                f"{INCREMENTAL_DELTA_DIR}/{state['next_delta']:06d}.parquet"
+            )
+            if not self._put_parquet(source, series_id, name, df):
+                return None
+            state["deltas"].append(name)
+            state["next_delta"] += 1
+            state["watermark"] = watermark
+        if not self._write_delta_state(source, series_id, state):
+            return None
+        return state
+
+    def download_merged(
+        self,
+        source: str,
+        series_id: str,
+    ) -> Optional[pd.DataFrame]:
+        """Base plus all live deltas as one sorted DataFrame.
+
+        Returns:
+            DataFrame (later rows win on duplicate index values), or
+            ``None`` if the series has no incremental state.
+        """
+        state = self.delta_state(source, series_id)
+        if state is None:
+            return None
+        loaded = (
+            self._get_parquet(source, series_id, name)
+            for name in [INCREMENTAL_BASE] + state["deltas"]
+        )
+        frames = [f for f in loaded if f is not None]
+        if not frames:
+            return None
+        merged = pd.concat(frames) if len(frames) > 1 else frames[0]
+        if len(frames) > 1:
+            merged = merged[~merged.index.duplicated(keep="last")]
+        return merged.sort_index()
+
+    def compact_deltas(self, source: str, series_id: str) -> bool:
+        """Fold all live deltas into the base file.
+
+        The state is rewritten before the delta blobs are deleted, so an
+        interrupted compaction leaves orphaned deltas, never lost rows.
+
+        Returns:
+            ``True`` if there was something to compact and it succeeded.
+        """
+        state = self.delta_state(source, series_id)
+        if state is None or not state["deltas"]:
+            return False
+        merged = self.download_merged(source, series_id)
+        if merged is None or not self._put_parquet(
+            source, series_id, INCREMENTAL_BASE, merged,
+        ):
+            return False
+        stale = state["deltas"]
+        state["deltas"] = []
+        state["base_rows"] = len(merged)
+        if not self._write_delta_state(source, series_id, state):
+            return False
+        for name in stale:
+            self._delete_blob(
+                DataTier.CLEANED,
+                self.series_blob_path(source, series_id, name),
+            )
+        return True
 
     # ------------------------------------------------------------------
     # Convenience: bulk operations
@@ -615,16 +1056,35 @@ class BlobStore:
 
         Useful for discovering which series and dates are available.
         """
-        blobs = self.list_blobs(tier=tier, prefix=f"{source}/")
+        blobs = self._list_all(tier, f"{source}/")
         manifest: Dict[str, List[str]] = {}
         for b in blobs:
             parts = b["name"].split("/")
             if len(parts) >= 3:
                 sid = parts[1]
+                if parts[2] == LATEST_POINTER:
+                    # Dates whose identical upload was deduplicated
+                    pointer = self._read_pointer(tier, source, sid)
+                    manifest.setdefault(sid, []).extend(
+                        d for entry in pointer.values()
+                        for d in entry["aliases"]
+                    )
+                    continue
+                if parts[2].startswith("_"):
+                    # Incremental base/delta/state files: series only
+                    manifest.setdefault(sid, [])
+                    continue
                 date_part = parts[2].rsplit(".", 1)[0]  # strip extension
                 manifest.setdefault(sid, []).append(date_part)
+        for dates in manifest.values():
+            dates.sort()
         return manifest
 
+    def close(self) -> None:
+        """Flush and release the listing index."""
+        if self._index_handle is not None:
+            self._index.close()
+
     def __repr__(self) -> str:
         backend = (
             "Azure Blob Storage"
@@ -279,6 +279,25 @@ class FOMCTextSource:
                 for d in doc_list
             ]
 
+    def earliest_text_date(self) -> Optional[datetime]:
+        """Return the date of the oldest available text, or None.
+
+        Looks at the pre-loaded cache and the file names in the disk
+        cache (without reading file contents).  Backtest dates before
+        this can never be scored from text, so the columnar engine
+        sends them straight to the rate-change proxy.
+        """
+        dates = [dt for dt, docs in self._cache.items() if docs]
+
+        cache_path = Path(self.cache_dir)
+        if cache_path.exists():
+            for fpath in cache_path.glob("*.txt"):
+                match = re.match(r"(\d{8})_(\w+)\.txt", fpath.name)
+                if match:
+                    dates.append(datetime.strptime(match.group(1), "%Y%m%d"))
+
+        return min(dates) if dates else None
+
     # ── Public API: rate-change proxy for backtesting ────────────────────
 
     def get_rate_proxy_sentiment(
@@ -2,20 +2,35 @@
 
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import MutableMapping, Optional, Sequence, Union
+import numpy as np
 import pandas as pd
-import pickle
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from .rate_limit import TokenBucket, call_with_retry
+from .series_store import (
+    LazySeriesCache,
+    SeriesStore,
+    asof_lookup,
+    build_asof_arrays,
+)
 
 try:
     from fredapi import Fred
 except ImportError:
     Fred = None
 
-# Default cache file location
+# Default cache location: one .npy pair per series (see series_store)
 CACHE_DIR = Path(__file__).parent.parent.parent / "data" / "fred_cache"
+SERIES_CACHE_DIR = CACHE_DIR / "series"
+# Legacy monolithic pickle, migrated into SERIES_CACHE_DIR on first use
 CACHE_FILE = CACHE_DIR / "fred_series_cache.pkl"
 
+# FRED allows 120 requests/minute per API key. A burst of 40 plus a
+# refill of 80/minute keeps any 60-second window within that limit.
+FRED_REQUESTS_PER_MINUTE = 120
+FRED_REQUEST_BURST = 40
+
 
 class FREDClient:
     """Client for fetching data from FRED (Federal Reserve Economic Data)."""
@@ -87,12 +102,20 @@ class FREDClient:
     NBER_DATA_START = datetime(1907, 1, 1)     # NBER Macrohistory coverage
     TB3MS_START = datetime(1934, 1, 1)         # 3-month T-Bill monthly
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        api_root: Optional[str] = None,
+    ):
         """
         Initialize FRED client.
 
         Args:
             api_key: FRED API key. If not provided, uses FRED_API_KEY env var.
+            cache_dir: Directory holding the per-series disk cache
+                (default: data/fred_cache)
+            api_root: Override the FRED API root URL (e.g. a local stub)
         """
         if Fred is None:
             raise ImportError(
@@ -100,11 +123,26 @@ class FREDClient:
             )
 
         self.fred = Fred(api_key=api_key) if api_key else Fred()
+        if api_root:
+            self.fred.root_url = api_root.rstrip("/")
         self._cache: dict[str, pd.Series] = {}
-        # Prefetched full series for faster backtests
-        self._bulk_cache: dict[str, pd.Series] = {}
-        self._last_request_time = 0.0
-        self._min_request_interval = 0.5  # 0.5 seconds = 120 requests/minute
+        self._cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+        self._store = SeriesStore(self._cache_dir / SERIES_CACHE_DIR.name)
+        # Prefetched full series for faster backtests (loaded lazily)
+        self._bulk_cache: MutableMapping[str, pd.Series] = {}
+        # Bumped whenever the bulk cache gains or extends series
+        self._bulk_version = 0
+        # As-of index per bulk-cached series:
+        # actual_id -> (source series, int64 ns timestamps, values)
+        self._asof_index: dict[
+            str, tuple[pd.Series, np.ndarray, np.ndarray]
+        ] = {}
+        # Shared across prefetch worker threads and get_series
+        self._rate_limiter = TokenBucket.per_minute(
+            FRED_REQUESTS_PER_MINUTE, burst=FRED_REQUEST_BURST,
+        )
+        self._max_retries = 3
+        self._retry_base_delay = 1.0
         # When True, only use cached data (no API calls)
         self._backtest_mode = False
 
@@ -124,34 +162,48 @@ class FREDClient:
         """
         self._backtest_mode = enabled
 
+    @property
+    def data_version(self) -> int:
+        """
+        Counter of changes to the bulk cache.
+
+        Incremented when the disk cache is attached and whenever a
+        prefetch adds or extends series, so callers holding data derived
+        from the cache (e.g. aligned indicator frames) can tell when it
+        is stale.
+        """
+        return self._bulk_version
+
     def _load_cache_from_disk(self) -> None:
-        """Load cached series from disk if available."""
-        if CACHE_FILE.exists():
-            try:
-                with open(CACHE_FILE, "rb") as f:
-                    saved_cache = pickle.load(f)
-                    # Validate cache structure
-                    if isinstance(saved_cache, dict):
-                        valid_count = 0
-                        for key, value in saved_cache.items():
-                            if isinstance(value, pd.Series) and len(value) > 0:
-                                valid_count += 1
-                        self._bulk_cache = saved_cache
-                        print(f"Loaded {valid_count} cached series from disk")
-                    else:
-                        print("Warning: Invalid cache format, starting fresh")
-                        self._bulk_cache = {}
-            except Exception as e:
-                print(f"Warning: Could not load cache from disk: {e}")
-                self._bulk_cache = {}
+        """
+        Attach the per-series disk cache.
+
+        Nothing is read here: series are memory-mapped on first access.
+        An empty store next to a legacy pickle cache is migrated once.
+        """
+        legacy = self._cache_dir / CACHE_FILE.name
+        if not self._store.ids() and legacy.exists():
+            migrated = self._store.migrate_pickle(legacy)
+            print(f"Migrated {migrated} series from legacy pickle cache")
+
+        self._bulk_version += 1
+        try:
+            self._bulk_cache = LazySeriesCache(self._store)
+        except Exception as e:
+            print(f"Warning: Could not open disk cache: {e}")
+            self._bulk_cache = {}
+            return
+        if len(self._bulk_cache) > 0:
+            print(f"Found {len(self._bulk_cache)} cached series on disk")
 
     def _save_cache_to_disk(self) -> None:
-        """Persist cached series to disk."""
+        """Persist new or extended series (only those that changed)."""
         try:
-            CACHE_DIR.mkdir(parents=True, exist_ok=True)
-            with open(CACHE_FILE, "wb") as f:
-                pickle.dump(self._bulk_cache, f)
-            print(f"Saved {len(self._bulk_cache)} series to disk cache")
+            if isinstance(self._bulk_cache, LazySeriesCache):
+                written = self._bulk_cache.flush()
+            else:
+                written = self._store.write_many(dict(self._bulk_cache))
+            print(f"Saved {written} series to disk cache")
         except Exception as e:
             print(f"Warning: Could not save cache to disk: {e}")
 
@@ -177,65 +229,105 @@ class FREDClient:
         combined = combined.sort_index()
         return combined
 
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """
+        Whether a failed FRED request is worth retrying.
+
+        fredapi turns HTTP errors into ValueError carrying FRED's message;
+        "Bad Request" (unknown series, bad dates) and empty results are
+        permanent, while rate limiting, 5xx and network errors are not.
+        """
+        message = str(error)
+        return not (
+            message.startswith("Bad Request")
+            or message.startswith("No data exists")
+        )
+
+    def _fetch_series(
+        self,
+        actual_id: str,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> pd.Series:
+        """One rate-limited FRED request, retried with backoff."""
+        def request() -> pd.Series:
+            self._rate_limiter.acquire()
+            return self.fred.get_series(
+                actual_id,
+                observation_start=start_date,
+                observation_end=end_date,
+            )
+
+        return call_with_retry(
+            request,
+            retries=self._max_retries,
+            base_delay=self._retry_base_delay,
+            is_retryable=self._is_retryable,
+        )
+
+    def _missing_ranges(
+        self,
+        actual_id: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[tuple[datetime, datetime]]:
+        """Date ranges of [start, end] not covered by the bulk cache."""
+        cached = (
+            self._bulk_cache[actual_id]
+            if actual_id in self._bulk_cache else None
+        )
+        if cached is None or len(cached) == 0:
+            return [(start_date, end_date)]
+
+        # Compare calendar dates only
+        cached_start = cached.index.min().normalize().to_pydatetime()
+        cached_end = cached.index.max().normalize().to_pydatetime()
+        start_norm = datetime(start_date.year, start_date.month, start_date.day)
+        end_norm = datetime(end_date.year, end_date.month, end_date.day)
+
+        ranges = []
+        if start_norm < cached_start:
+            ranges.append((start_date, cached_start - timedelta(days=1)))
+        if end_norm > cached_end:
+            ranges.append((cached_end + timedelta(days=1), end_date))
+        return ranges
+
     def prefetch_series(
         self,
         series_ids: list[str],
         start_date: datetime,
         end_date: datetime,
+        max_workers: int = 8,
     ) -> None:
         """
         Pre-fetch multiple series for a date range into bulk cache.
         Merges with existing cached data to extend date coverage.
 
+        Requests run on a thread pool sharing one token bucket (FRED's
+        120 requests/minute), each retried with backoff. When the cache
+        already covers part of the range only the missing head and/or
+        tail is requested.
+
         Args:
             series_ids: List of FRED series IDs or aliases
             start_date: Start date for data
             end_date: End date for data
+            max_workers: Concurrent requests in flight
         """
-        # Normalize dates to remove time component for comparison
-        start_date_norm = datetime(start_date.year, start_date.month, start_date.day)
-        end_date_norm = datetime(end_date.year, end_date.month, end_date.day)
-
-        # Check which series need fetching or extending
-        # Use dict to avoid duplicates: actual_id -> (fetch_start, fetch_end)
-        series_to_fetch = {}
+        # actual_id -> missing (fetch_start, fetch_end) ranges
+        series_to_fetch: dict[str, list[tuple[datetime, datetime]]] = {}
         already_cached = 0
 
         for series_id in series_ids:
             actual_id = self.SERIES.get(series_id, series_id)
-
             if actual_id in series_to_fetch:
-                # Already queued for fetch
                 continue
-
-            if actual_id not in self._bulk_cache:
-                # Not cached at all
-                series_to_fetch[actual_id] = (start_date, end_date)
+            ranges = self._missing_ranges(actual_id, start_date, end_date)
+            if ranges:
+                series_to_fetch[actual_id] = ranges
             else:
-                # Check if we need to extend the date range
-                cached = self._bulk_cache[actual_id]
-                if len(cached) > 0:
-                    # Normalize cached dates for comparison
-                    cached_start = cached.index.min()
-                    cached_end = cached.index.max()
-                    cached_start_norm = datetime(
-                        cached_start.year, cached_start.month, cached_start.day
-                    )
-                    cached_end_norm = datetime(
-                        cached_end.year, cached_end.month, cached_end.day
-                    )
-
-                    # Only fetch if cache doesn't cover the requested range
-                    needs_earlier = start_date_norm < cached_start_norm
-                    needs_later = end_date_norm > cached_end_norm
-
-                    if needs_earlier or needs_later:
-                        # Fetch full range to fill gaps
-                        series_to_fetch[actual_id] = (start_date, end_date)
-                    else:
-                        already_cached += 1
-                else:
-                    series_to_fetch[actual_id] = (start_date, end_date)
+                already_cached += 1
 
         if not series_to_fetch:
             print(
@@ -253,40 +345,52 @@ class FREDClient:
         else:
             print(f"Fetching {len(series_to_fetch)} series from FRED...")
 
+        tasks = [
+            (actual_id, fetch_start, fetch_end)
+            for actual_id, ranges in series_to_fetch.items()
+            for fetch_start, fetch_end in ranges
+        ]
+        results: dict[str, list[pd.Series]] = {}
+        failed: set[str] = set()
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(tasks))),
+        ) as pool:
+            futures = {
+                pool.submit(self._fetch_series, *task): task[0]
+                for task in tasks
+            }
+            for future in as_completed(futures):
+                actual_id = futures[future]
+                try:
+                    results.setdefault(actual_id, []).append(future.result())
+                except Exception as e:
+                    failed.add(actual_id)
+                    print(f"  [FAIL] {actual_id}: {e}")
+
+        # Merge on this thread once all requests are back
         fetched_count = 0
-        for actual_id, (fetch_start, fetch_end) in series_to_fetch.items():
-            try:
-                # Rate limiting
-                current_time = time.time()
-                time_since_last = current_time - self._last_request_time
-                if time_since_last < self._min_request_interval:
-                    time.sleep(self._min_request_interval - time_since_last)
-
-                data = self.fred.get_series(
-                    actual_id,
-                    observation_start=fetch_start,
-                    observation_end=fetch_end,
+        for actual_id in series_to_fetch:
+            if actual_id in failed or actual_id not in results:
+                continue
+            if actual_id in self._bulk_cache:
+                merged = self._bulk_cache[actual_id]
+                for data in results[actual_id]:
+                    merged = self._merge_series(merged, data)
+                self._bulk_cache[actual_id] = merged
+                print(
+                    f"  [OK] {actual_id}: extended to "
+                    f"{len(merged)} observations"
                 )
-                self._last_request_time = time.time()
-
-                # Merge with existing data
-                if actual_id in self._bulk_cache:
-                    self._bulk_cache[actual_id] = self._merge_series(
-                        self._bulk_cache[actual_id], data
-                    )
-                    print(
-                        f"  [OK] {actual_id}: extended to "
-                        f"{len(self._bulk_cache[actual_id])} observations"
-                    )
-                else:
-                    self._bulk_cache[actual_id] = data
-                    print(f"  [OK] {actual_id}: {len(data)} observations")
-                fetched_count += 1
-            except Exception as e:
-                print(f"  [FAIL] {actual_id}: {e}")
+            else:
+                data = results[actual_id][0]
+                self._bulk_cache[actual_id] = data
+                print(f"  [OK] {actual_id}: {len(data)} observations")
+            fetched_count += 1
 
         # Save to disk after fetching
         if fetched_count > 0:
+            self._bulk_version += 1
             self._save_cache_to_disk()
 
         print(f"Pre-fetch complete. {len(self._bulk_cache)} series cached.")
@@ -317,19 +421,7 @@ class FREDClient:
         if use_cache and cache_key in self._cache:
             return self._cache[cache_key]
 
-        # Rate limiting: ensure minimum time between requests
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            time.sleep(self._min_request_interval - time_since_last)
-
-        data = self.fred.get_series(
-            actual_id,
-            observation_start=start_date,
-            observation_end=end_date,
-        )
-
-        self._last_request_time = time.time()
+        data = self._fetch_series(actual_id, start_date, end_date)
 
         if use_cache:
             self._cache[cache_key] = data
@@ -352,6 +444,29 @@ class FREDClient:
             raise ValueError(f"No data available for {series_id}")
         return data.index[-1], data.iloc[-1]
 
+    # Shared with HistoricalDataProvider (see series_store)
+    _build_asof_arrays = staticmethod(build_asof_arrays)
+    _asof_lookup = staticmethod(asof_lookup)
+
+    def _get_asof_arrays(
+        self, actual_id: str,
+    ) -> Optional[tuple[np.ndarray, np.ndarray]]:
+        """
+        As-of index for a bulk-cached series, built on first use.
+
+        The index is rebuilt whenever the cached Series object is replaced
+        (prefetch merges assign a new object), so it never goes stale.
+        """
+        data = self._bulk_cache.get(actual_id)
+        if data is None:
+            return None
+        entry = self._asof_index.get(actual_id)
+        if entry is None or entry[0] is not data:
+            times, values = self._build_asof_arrays(data)
+            entry = (data, times, values)
+            self._asof_index[actual_id] = entry
+        return entry[1], entry[2]
+
     def get_value_for_date(
         self,
         series_id: str,
@@ -362,6 +477,9 @@ class FREDClient:
         Get value for a specific date with forward-fill for weekends/holidays.
         Uses bulk cache if available (for backtesting), otherwise fetches from API.
 
+        Bulk-cached series are served from a sorted as-of index, so each
+        lookup is a binary search rather than a scan of the series.
+
         Args:
             series_id: FRED series ID or alias
             date: Target date
@@ -373,19 +491,11 @@ class FREDClient:
         actual_id = self.SERIES.get(series_id, series_id)
 
         # Check bulk cache first (for backtesting efficiency)
-        if actual_id in self._bulk_cache:
-            data = self._bulk_cache[actual_id]
-            data = data.dropna()
-            if not data.empty:
-                # Filter to lookback window
-                start = date - timedelta(days=lookback_days)
-                mask = (data.index >= start) & (data.index <= date)
-                filtered = data[mask]
-                if not filtered.empty:
-                    valid_dates = filtered.index[filtered.index <= date]
-                    if len(valid_dates) > 0:
-                        return filtered.loc[valid_dates[-1]]
-            return None
+        arrays = self._get_asof_arrays(actual_id)
+        if arrays is not None:
+            target = np.array([np.datetime64(date, "ns").astype("int64")])
+            value = self._asof_lookup(*arrays, target, lookback_days)[0]
+            return None if np.isnan(value) else float(value)
 
         # In backtest mode, don't hit the API for missing series
         if self._backtest_mode:
@@ -406,6 +516,45 @@ class FREDClient:
 
         return data.loc[valid_dates[-1]]
 
+    def get_values_for_dates(
+        self,
+        series_id: str,
+        dates: Union[Sequence[datetime], np.ndarray],
+        lookback_days: int = 5,
+    ) -> np.ndarray:
+        """
+        Batch form of get_value_for_date for one series.
+
+        Args:
+            series_id: FRED series ID or alias
+            dates: Target dates (any order; datetimes, Timestamps or
+                a datetime64 array)
+            lookback_days: Maximum days to look back for data
+
+        Returns:
+            Float array aligned with ``dates``; NaN where
+            get_value_for_date would return None
+        """
+        targets = np.asarray(
+            pd.DatetimeIndex(dates).values, dtype="datetime64[ns]",
+        ).view("int64")
+        actual_id = self.SERIES.get(series_id, series_id)
+
+        arrays = self._get_asof_arrays(actual_id)
+        if arrays is None:
+            if self._backtest_mode or targets.size == 0:
+                return np.full(len(targets), np.nan)
+            # One API call covering the whole span
+            start = pd.Timestamp(targets.min()) - timedelta(days=lookback_days)
+            data = self.get_series(
+                series_id,
+                start.to_pydatetime(),
+                pd.Timestamp(targets.max()).to_pydatetime(),
+            )
+            arrays = self._build_asof_arrays(data)
+
+        return self._asof_lookup(*arrays, targets, lookback_days)
+
     def get_sofr_iorb_spread(self, date: Optional[datetime] = None) -> float:
         """Get SOFR-IORB spread in basis points for a specific date."""
         if date is None:
@@ -512,10 +661,10 @@ class FREDClient:
         return (ff_value - tb_value) * 100  # Convert to bps
 
     def _get_historical_provider(self):
-        """Lazy-load HistoricalDataProvider for pre-1954 data."""
+        """Shared HistoricalDataProvider for pre-1954 data."""
         if self._historical_provider is None:
-            from .historical_sources import HistoricalDataProvider
-            self._historical_provider = HistoricalDataProvider()
+            from .historical_sources import get_historical_provider
+            self._historical_provider = get_historical_provider()
         return self._historical_provider
 
     def _get_discount_tbill_spread(self, date: datetime) -> float:
@@ -863,3 +1012,30 @@ class FREDClient:
     def clear_cache(self):
         """Clear the data cache."""
         self._cache.clear()
+
+
+def load_disk_cache(cache_dir: Optional[Path] = None) -> dict[str, pd.Series]:
+    """
+    Read every series in the FRED disk cache into a plain dict.
+
+    For scripts that export the whole cache; FREDClient itself loads
+    series lazily. A legacy pickle cache is migrated first if needed.
+
+    Args:
+        cache_dir: Cache directory (default: data/fred_cache)
+
+    Returns:
+        Dict of series_id -> pd.Series (empty if nothing is cached)
+    """
+    cache_dir = Path(cache_dir) if cache_dir else CACHE_DIR
+    store = SeriesStore(cache_dir / SERIES_CACHE_DIR.name)
+    legacy = cache_dir / CACHE_FILE.name
+    if not store.ids() and legacy.exists():
+        store.migrate_pickle(legacy)
+
+    cache = {}
+    for series_id in store.ids():
+        data = store.read(series_id)
+        if data is not None:
+            cache[series_id] = data
+    return cache
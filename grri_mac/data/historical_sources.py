@@ -13,13 +13,16 @@ Run download_historical_data.py to fetch publicly available datasets.
 """
 
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Dict
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+from .series_store import asof_lookup, build_asof_arrays
+
 logger = logging.getLogger(__name__)
 
 # Base directory for historical data files
@@ -458,27 +461,57 @@ class HistoricalDataProvider:
     Loads and caches data from NBER, Shiller, Schwert, BoE, and
     MeasuringWorth sources. Provides proxy chain resolution for
     each MAC pillar indicator.
+
+    Each series is turned once into sorted, NaN-free as-of arrays, so
+    a lookup is a binary search rather than a scan.  Use
+    ``get_historical_provider()`` to share one instance (and its
+    loaded data) across the process.
     """
 
+    # Named series for get_values_for_dates: key -> loader
+    SERIES: Dict[str, Callable[[], Optional[pd.Series]]] = {
+        "call_money": lambda: load_nber_series("m13001"),
+        "cp_rate": lambda: load_nber_series("m13039"),
+        "govt_short": lambda: load_nber_series("m13041"),
+        "rr_high": lambda: load_nber_series("m13020"),
+        "govt_long": lambda: load_nber_series("m13033"),
+        "gold_stock": lambda: load_nber_series("m14076"),
+        "schwert": load_schwert_volatility,
+        "gbp_usd": load_boe_exchange_rate,
+        "boe_rate": load_boe_bank_rate,
+        "mw_gdp": load_measuringworth_gdp,
+        "margin_debt": load_margin_debt,
+    }
+
     def __init__(self):
         """Initialize and lazy-load data sources."""
         self._cache: Dict[str, pd.Series] = {}
         self._shiller_df: Optional[pd.DataFrame] = None
+        # key -> (source object, times, values); rebuilt if the source
+        # object is replaced
+        self._asof: Dict[Any, Tuple[Any, np.ndarray, np.ndarray]] = {}
+        # Backtest workers share one provider across threads
+        self._lock = threading.RLock()
 
     def _get_or_load(self, key: str, loader) -> Optional[pd.Series]:
         """Cache-aware loader."""
-        if key not in self._cache:
-            result = loader()
-            if result is not None:
-                self._cache[key] = result
-        return self._cache.get(key)
+        with self._lock:
+            if key not in self._cache:
+                result = loader()
+                if result is not None:
+                    self._cache[key] = result
+            return self._cache.get(key)
+
+    def _series(self, key: str) -> Optional[pd.Series]:
+        return self._get_or_load(key, self.SERIES[key])
 
     @property
     def shiller(self) -> Optional[pd.DataFrame]:
         """Lazy-load Shiller dataset."""
-        if self._shiller_df is None:
-            self._shiller_df = load_shiller_dataset()
-        return self._shiller_df
+        with self._lock:
+            if self._shiller_df is None:
+                self._shiller_df = load_shiller_dataset()
+            return self._shiller_df
 
     # --- Liquidity Pillar Proxies ---
 
@@ -490,17 +523,17 @@ class HistoricalDataProvider:
         functionally equivalent to the repo rate / fed funds rate.
         Available from 1890 via NBER m13001.
         """
-        series = self._get_or_load("call_money", lambda: load_nber_series("m13001"))
+        series = self._series("call_money")
         return self._lookup(series, date, lookback_days=35)
 
     def get_commercial_paper_rate(self, date: datetime) -> Optional[float]:
         """Get commercial paper rate (NBER m13039, 1890+)."""
-        series = self._get_or_load("cp_rate", lambda: load_nber_series("m13039"))
+        series = self._series("cp_rate")
         return self._lookup(series, date, lookback_days=35)
 
     def get_short_term_govt_rate(self, date: datetime) -> Optional[float]:
         """Get short-term government bond rate (NBER m13041, 1890+)."""
-        series = self._get_or_load("govt_short", lambda: load_nber_series("m13041"))
+        series = self._series("govt_short")
         return self._lookup(series, date, lookback_days=35)
 
     def get_funding_stress_spread(self, date: datetime) -> Optional[float]:
@@ -539,8 +572,8 @@ class HistoricalDataProvider:
         Railroad bonds were the dominant corporate credit instrument pre-1919.
         Per Hickman (1958), default rates comparable to modern BBB.
         """
-        rr_yield = self._get_or_load("rr_high", lambda: load_nber_series("m13020"))
-        govt_yield = self._get_or_load("govt_long", lambda: load_nber_series("m13033"))
+        rr_yield = self._series("rr_high")
+        govt_yield = self._series("govt_long")
 
         rr = self._lookup(rr_yield, date, lookback_days=35)
         govt = self._lookup(govt_yield, date, lookback_days=35)
@@ -578,7 +611,7 @@ class HistoricalDataProvider:
                 return val
 
         # Fallback to NBER
-        series = self._get_or_load("govt_long", lambda: load_nber_series("m13033"))
+        series = self._series("govt_long")
         return self._lookup(series, date, lookback_days=35)
 
     def get_equity_risk_premium(self, date: datetime) -> Optional[float]:
@@ -606,7 +639,12 @@ class HistoricalDataProvider:
         Uses Schwert (1989) monthly volatility × 1.3 VRP multiplier.
         For pre-1802 dates (before Schwert), returns None.
         """
-        return get_vix_equivalent_from_schwert(date)
+        # Latest reading at or before the date, however old, as in
+        # get_vix_equivalent_from_schwert
+        vol = self._lookup(self._series("schwert"), date, lookback_days=None)
+        if vol is None:
+            return None
+        return vol * 1.3
 
     def get_realised_vol_from_shiller(self, date: datetime, window: int = 12) -> Optional[float]:
         """
@@ -622,12 +660,12 @@ class HistoricalDataProvider:
         if self.shiller is None or "price" not in self.shiller.columns:
             return None
 
-        prices = self.shiller["price"].dropna()
-        mask = prices.index <= pd.Timestamp(date)
-        if mask.sum() < window + 1:
+        times, prices = self._shiller_arrays("price")
+        end = int(np.searchsorted(times, pd.Timestamp(date).value, side="right"))
+        if end < window + 1:
             return None
 
-        subset = prices[mask].tail(window + 1)
+        subset = pd.Series(prices[end - window - 1:end])
         returns = subset.pct_change().dropna()
         if len(returns) < window // 2:
             return None
@@ -659,14 +697,14 @@ class HistoricalDataProvider:
         Per Friedman & Schwartz (1963), the gold constraint was the
         binding policy limitation during 1907 and other pre-Fed crises.
         """
-        gold = self._get_or_load("gold_stock", lambda: load_nber_series("m14076"))
+        gold = self._series("gold_stock")
         gold_val = self._lookup(gold, date, lookback_days=35)
 
         if gold_val is None:
             return None
 
         # Estimate monetary base from GDP proxy
-        gdp_series = self._get_or_load("mw_gdp", load_measuringworth_gdp)
+        gdp_series = self._series("mw_gdp")
         if gdp_series is not None:
             gdp_val = self._lookup(gdp_series, date, lookback_days=400)  # Annual data
             if gdp_val is not None and gdp_val > 0:
@@ -689,7 +727,7 @@ class HistoricalDataProvider:
 
         Returns: Deviation from parity in percentage points
         """
-        gbp = self._get_or_load("gbp_usd", load_boe_exchange_rate)
+        gbp = self._series("gbp_usd")
         if gbp is None:
             return None
 
@@ -721,7 +759,7 @@ class HistoricalDataProvider:
 
     def get_london_bank_rate(self, date: datetime) -> Optional[float]:
         """Get Bank of England Bank Rate (1694+)."""
-        bank_rate = self._get_or_load("boe_rate", load_boe_bank_rate)
+        bank_rate = self._series("boe_rate")
         return self._lookup(bank_rate, date, lookback_days=35)
 
     # --- Positioning Pillar Proxies ---
@@ -736,8 +774,8 @@ class HistoricalDataProvider:
 
         Returns: Margin debt as % of GDP, or None
         """
-        margin = self._get_or_load("margin_debt", load_margin_debt)
-        gdp = self._get_or_load("mw_gdp", load_measuringworth_gdp)
+        margin = self._series("margin_debt")
+        gdp = self._series("mw_gdp")
 
         if margin is None or gdp is None:
             return None
@@ -750,27 +788,74 @@ class HistoricalDataProvider:
             return (margin_val / 1e6) / gdp_val * 100
         return None
 
+    # --- Batch Lookups ---
+
+    def get_values_for_dates(
+        self,
+        name: str,
+        dates: Sequence[datetime],
+        lookback_days: Optional[int] = 35,
+    ) -> np.ndarray:
+        """
+        Values of one series for many dates in a single binary search.
+
+        Args:
+            name: A key of ``SERIES`` or a Shiller column (e.g. 'gs10')
+            dates: Target dates (datetimes, Timestamps or datetime64)
+            lookback_days: Maximum age of the value used (None = any)
+
+        Returns:
+            Float array aligned with ``dates``; NaN where no value lies
+            within the lookback window or the source is unavailable
+        """
+        targets = np.asarray(
+            pd.DatetimeIndex(dates).values, dtype="datetime64[ns]",
+        ).view("int64")
+        if name in self.SERIES:
+            series = self._series(name)
+            arrays = None if series is None else self._series_arrays(series)
+        elif self.shiller is None:
+            arrays = None
+        elif name in self.shiller.columns:
+            arrays = self._shiller_arrays(name)
+        else:
+            raise ValueError(f"Unknown historical series: {name}")
+        if arrays is None:
+            return np.full(len(targets), np.nan)
+        return asof_lookup(*arrays, targets, lookback_days)
+
     # --- Helper Methods ---
 
+    def _asof_arrays(
+        self, key: Any, source: Any, build: Callable[[], pd.Series],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """As-of arrays for ``key``, rebuilt if ``source`` was replaced."""
+        with self._lock:
+            entry = self._asof.get(key)
+            if entry is None or entry[0] is not source:
+                entry = (source, *build_asof_arrays(build()))
+                self._asof[key] = entry
+            return entry[1], entry[2]
+
+    def _series_arrays(self, series: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        # Keyed by identity: callers pass the provider's cached series
+        return self._asof_arrays(id(series), series, lambda: series)
+
+    def _shiller_arrays(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        df = self.shiller
+        assert df is not None, "Shiller data not loaded"
+        return self._asof_arrays(("shiller", column), df, lambda: df[column])
+
     def _lookup(
         self,
         series: Optional[pd.Series],
         date: datetime,
-        lookback_days: int = 35,
+        lookback_days: Optional[int] = 35,
     ) -> Optional[float]:
         """Look up value for a date with forward-fill."""
         if series is None or len(series) == 0:
             return None
-
-        ts = pd.Timestamp(date)
-        start = ts - pd.Timedelta(days=lookback_days)
-        mask = (series.index >= start) & (series.index <= ts)
-        filtered = series[mask]
-
-        if filtered.empty:
-            return None
-
-        return float(filtered.iloc[-1])
+        return self._point(self._series_arrays(series), date, lookback_days)
 
     def _lookup_df(
         self,
@@ -782,9 +867,21 @@ class HistoricalDataProvider:
         """Look up value in a DataFrame column for a date."""
         if df is None or column not in df.columns:
             return None
+        if df is self.shiller:
+            arrays = self._shiller_arrays(column)
+        else:
+            arrays = build_asof_arrays(df[column])
+        return self._point(arrays, date, lookback_days)
 
-        series = df[column].dropna()
-        return self._lookup(series, date, lookback_days)
+    @staticmethod
+    def _point(
+        arrays: Tuple[np.ndarray, np.ndarray],
+        date: datetime,
+        lookback_days: Optional[int],
+    ) -> Optional[float]:
+        target = np.array([pd.Timestamp(date).value], dtype=np.int64)
+        value = asof_lookup(*arrays, target, lookback_days)[0]
+        return None if np.isnan(value) else float(value)
 
     def get_data_availability_summary(self) -> Dict[str, Dict]:
         """
@@ -845,3 +942,17 @@ class HistoricalDataProvider:
         }
 
         return summary
+
+
+# Shared by every FREDClient (and backtest worker thread) in the process
+_provider: Optional[HistoricalDataProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_historical_provider() -> HistoricalDataProvider:
+    """Return (or create) the process-wide HistoricalDataProvider."""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            _provider = HistoricalDataProvider()
+        return _provider
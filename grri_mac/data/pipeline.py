@@ -12,6 +12,10 @@ Example::
     result = pipeline.ingest_all()         # every registered source
     df     = pipeline.get_cleaned("fred", "VIXCLS")
 
+    # Incremental: fetch past the stored watermark, append a delta
+    pipeline.ingest("fred", incremental=True)
+    df     = pipeline.get_cleaned("fred", "VIXCLS")   # base + deltas
+
 Source Registry
 ---------------
 Each source entry defines:
@@ -21,6 +25,31 @@ Each source entry defines:
 - ``clean``          — callable(raw_data, series_id) → cleaned pd.DataFrame
 - ``series_ids``     — list of series identifiers this source provides
 - ``raw_ext``        — file extension for the raw tier (``.json``, ``.csv``, …)
+- ``fetch_since``    — optional callable(client, series_id, since) →
+  raw data from ``since`` onwards (incremental mode)
+- ``policy``         — :class:`SourcePolicy`: worker count, rate limit
+  and retry settings
+
+Concurrency
+-----------
+``ingest`` and ``ingest_all`` build one client per source and run each
+source's series on its own bounded thread pool; all sources run at once,
+so slow APIs overlap instead of queueing.  Fetches go through the
+source's :class:`~grri_mac.data.rate_limit.TokenBucket` (kept for the
+pipeline's lifetime) and ``call_with_retry``.  Results are appended to
+each ``BatchIngestResult`` as they complete and passed to an optional
+``on_result`` callback.
+
+Incremental mode
+----------------
+``ingest(..., incremental=True)`` reads the series' stored watermark,
+fetches only newer observations (via ``fetch_since`` where the source
+has one, otherwise a full fetch filtered past the watermark) and
+appends them to the cleaned tier as a small Parquet delta.  Deltas are
+folded into the base file every ``compact_every`` appends, and
+``get_cleaned`` returns the merged view.  Raw payloads are only stored
+when the fetch itself was incremental, so full-fetch sources do not
+re-upload their whole history every day.
 """
 
 from __future__ import annotations
@@ -28,13 +57,19 @@ from __future__ import annotations
 import io
 import logging
 import math
+import threading
+import urllib.error
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
 from .blob_store import BlobStore, DataTier, get_blob_store
+from .fred import FRED_REQUEST_BURST, FRED_REQUESTS_PER_MINUTE
+from .rate_limit import TokenBucket, call_with_retry
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +88,8 @@ class IngestResult:
     cleaned_stored: bool = False
     raw_rows: int = 0
     cleaned_rows: int = 0
+    watermark: Optional[str] = None
+    compacted: bool = False
     error: Optional[str] = None
     timestamp: str = field(
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
@@ -93,6 +130,39 @@ class BatchIngestResult:
 # Source descriptor
 # ──────────────────────────────────────────────────────────────────────────────
 
+def _http_status(exc: Exception) -> Optional[int]:
+    """HTTP status carried by a urllib or requests HTTP error, if any."""
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Default retry predicate: network / I/O errors and HTTP 5xx.
+
+    Missing files and 4xx responses (bad series ID, bad key) fail at
+    once; retrying them only burns rate-limit budget.
+    """
+    if not isinstance(exc, OSError) or isinstance(exc, FileNotFoundError):
+        return False
+    status = _http_status(exc)
+    return status is None or status >= 500
+
+
+@dataclass
+class SourcePolicy:
+    """Concurrency, rate-limit and retry settings for one source."""
+
+    max_workers: int = 4
+    requests_per_minute: Optional[float] = None  # None = unlimited
+    burst: float = 1.0
+    retries: int = 2
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 30.0
+    is_retryable: Optional[Callable[[Exception], bool]] = _is_transient
+
+
 @dataclass
 class SourceDescriptor:
     """Describes how to fetch, store, and clean a data source."""
@@ -104,6 +174,34 @@ class SourceDescriptor:
     client_factory: Callable[[], Any]
     raw_ext: str = ".json"
     description: str = ""
+    fetch_since: Optional[Callable[[Any, str, datetime], Any]] = None
+    policy: SourcePolicy = field(default_factory=SourcePolicy)
+
+
+@dataclass
+class _SourceRun:
+    """One ingest pass over a source: shared client and rate limiter."""
+
+    desc: SourceDescriptor
+    client: Any
+    limiter: Optional[TokenBucket]
+
+    def call(self, fn: Callable[[], Any]) -> Any:
+        """Run one fetch under the source's rate limit and retry policy."""
+        policy = self.desc.policy
+
+        def request() -> Any:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            return fn()
+
+        return call_with_retry(
+            request,
+            retries=policy.retries,
+            base_delay=policy.retry_base_delay,
+            max_delay=policy.retry_max_delay,
+            is_retryable=policy.is_retryable,
+        )
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -251,6 +349,10 @@ CRYPTO_SYMBOLS = ["BTC-USD", "ETH-USD"]
 CBOE_INDICES = ["VIX9D", "VIX3M", "VVIX"]
 
 
+# Incremental mode: fold deltas into the base after this many appends
+DEFAULT_COMPACT_EVERY = 20
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Pipeline
 # ──────────────────────────────────────────────────────────────────────────────
@@ -270,9 +372,17 @@ class DataPipeline:
     crypto.
     """
 
-    def __init__(self, store: Optional[BlobStore] = None) -> None:
+    def __init__(
+        self,
+        store: Optional[BlobStore] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ) -> None:
         self._store = store or get_blob_store()
+        self.compact_every = compact_every
         self._sources: Dict[str, SourceDescriptor] = {}
+        # Per-source token buckets, kept across ingest calls
+        self._limiters: Dict[str, TokenBucket] = {}
+        self._limiters_lock = threading.Lock()
         self._register_builtins()
 
     # ------------------------------------------------------------------
@@ -282,6 +392,8 @@ class DataPipeline:
     def register_source(self, desc: SourceDescriptor) -> None:
         """Register (or replace) a data source."""
         self._sources[desc.name] = desc
+        with self._limiters_lock:
+            self._limiters.pop(desc.name, None)
 
     @property
     def sources(self) -> Dict[str, SourceDescriptor]:
@@ -310,9 +422,15 @@ class DataPipeline:
             series_ids=FRED_MAC_SERIES,
             fetch=self._fetch_fred,
             clean=_clean_fred_series,
-            client_factory=lambda: None,  # uses module-level function
+            client_factory=self._fred_client,
             raw_ext=".json",
             description="FRED API — 30+ macro/financial time series",
+            fetch_since=self._fetch_fred_since,
+            policy=SourcePolicy(
+                max_workers=8,
+                requests_per_minute=FRED_REQUESTS_PER_MINUTE,
+                burst=FRED_REQUEST_BURST,
+            ),
         ))
 
         # ── NBER Macrohistory ─────────────────────────────────────────
@@ -324,6 +442,7 @@ class DataPipeline:
             client_factory=lambda: None,
             raw_ext=".csv",
             description="NBER Macrohistory Database — pre-1970 rates & bonds",
+            policy=SourcePolicy(max_workers=4, requests_per_minute=60),
         ))
 
         # ── CBOE VIX term structure ───────────────────────────────────
@@ -335,6 +454,7 @@ class DataPipeline:
             client_factory=lambda: None,
             raw_ext=".csv",
             description="CBOE CDN — VIX9D, VIX3M, VVIX term structure",
+            policy=SourcePolicy(max_workers=3),
         ))
 
         # ── Historical file series ────────────────────────────────────
@@ -346,6 +466,7 @@ class DataPipeline:
             client_factory=lambda: None,
             raw_ext=".csv",
             description="Schwert, BoE, MeasuringWorth, FINRA historical CSVs",
+            policy=SourcePolicy(max_workers=2, retries=0),
         ))
 
         # ── ETF positioning / volatility ──────────────────────────────
@@ -360,6 +481,8 @@ class DataPipeline:
                 "yfinance ETFs — leveraged,"
                 " volatility, credit, treasury"
             ),
+            fetch_since=self._fetch_yahoo_since,
+            policy=SourcePolicy(max_workers=4, requests_per_minute=60),
         ))
 
         # ── Crypto ────────────────────────────────────────────────────
@@ -371,6 +494,8 @@ class DataPipeline:
             client_factory=lambda: None,
             raw_ext=".csv",
             description="Yahoo Finance — BTC/ETH daily prices",
+            fetch_since=self._fetch_yahoo_since,
+            policy=SourcePolicy(max_workers=2, requests_per_minute=60),
         ))
 
         # ── BIS OTC Derivatives ───────────────────────────────────────
@@ -379,7 +504,7 @@ class DataPipeline:
             series_ids=["credit", "equity"],
             fetch=self._fetch_bis,
             clean=_clean_json_timeseries,
-            client_factory=lambda: None,
+            client_factory=self._http_session,
             raw_ext=".json",
             description="BIS — OTC derivatives notional outstanding",
         ))
@@ -390,7 +515,7 @@ class DataPipeline:
             series_ids=["hf_leverage"],
             fetch=self._fetch_ofr,
             clean=_clean_json_timeseries,
-            client_factory=lambda: None,
+            client_factory=self._http_session,
             raw_ext=".json",
             description="OFR — QHF aggregate leverage ratio",
         ))
@@ -420,6 +545,28 @@ class DataPipeline:
             description="Binance — BTC+ETH perpetual futures open interest",
         ))
 
+    # ------------------------------------------------------------------
+    # Client factories (one client per ingest run, shared by its workers)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _fred_client() -> Any:
+        """Build one fredapi client from ``FRED_API_KEY``."""
+        import os
+        from fredapi import Fred
+
+        api_key = os.environ.get("FRED_API_KEY")
+        if not api_key:
+            raise ValueError("FRED_API_KEY not set")
+        return Fred(api_key=api_key)
+
+    @staticmethod
+    def _http_session() -> Any:
+        """Pooled HTTP session for the keyless JSON/CSV endpoints."""
+        import requests
+
+        return requests.Session()
+
     # ------------------------------------------------------------------
     # Fetch implementations (thin wrappers delegating to existing clients)
     # ------------------------------------------------------------------
@@ -427,14 +574,20 @@ class DataPipeline:
     @staticmethod
     def _fetch_fred(_client: Any, series_id: str) -> dict:
         """Fetch a FRED series via fredapi."""
+        return DataPipeline._fetch_fred_since(_client, series_id, None)
+
+    @staticmethod
+    def _fetch_fred_since(
+        _client: Any, series_id: str, since: Optional[datetime],
+    ) -> dict:
+        """Fetch a FRED series from ``since`` onwards (all if ``None``)."""
         try:
-            from fredapi import Fred
-            import os
-            api_key = os.environ.get("FRED_API_KEY")
-            if not api_key:
-                raise ValueError("FRED_API_KEY not set")
-            fred = Fred(api_key=api_key)
-            s = fred.get_series(series_id)
+            s = _client.get_series(
+                series_id,
+                observation_start=(
+                    since.strftime("%Y-%m-%d") if since else None
+                ),
+            )
             dates = [d.strftime("%Y-%m-%d") for d in s.index]
             values = [
                 None if (
@@ -536,6 +689,18 @@ class DataPipeline:
         ticker = yf.Ticker(series_id)
         return ticker.history(period="5y")
 
+    @staticmethod
+    def _fetch_yahoo_since(
+        _client: Any, series_id: str, since: datetime,
+    ) -> pd.DataFrame:
+        """Fetch daily OHLCV from ``since`` onwards via yfinance."""
+        try:
+            import yfinance as yf
+        except ImportError:
+            raise ImportError("yfinance not installed")
+        ticker = yf.Ticker(series_id)
+        return ticker.history(start=since.strftime("%Y-%m-%d"))
+
     @staticmethod
     def _fetch_bis(_client: Any, series_id: str) -> dict:
         """Fetch BIS OTC derivatives data point."""
@@ -547,7 +712,7 @@ class DataPipeline:
         from api.shared.bis_client import (
             _fetch_bis_latest,
         )
-        val = _fetch_bis_latest(series_id)
+        val = _fetch_bis_latest(series_id, session=_client)
         return {
             "dates": [datetime.now(timezone.utc).strftime("%Y-%m-%d")],
             "values": [val],
@@ -562,7 +727,7 @@ class DataPipeline:
             os.path.dirname(__file__), "..", "..", "api"
         ))
         from api.shared.ofr_client import get_hf_leverage_ratio
-        val = get_hf_leverage_ratio()
+        val = get_hf_leverage_ratio(session=_client)
         return {
             "dates": [datetime.now(timezone.utc).strftime("%Y-%m-%d")],
             "values": [val],
@@ -605,6 +770,9 @@ class DataPipeline:
         date_str: Optional[str] = None,
         skip_existing: bool = False,
         cleaned_fmt: str = "parquet",
+        incremental: bool = False,
+        workers: Optional[int] = None,
+        on_result: Optional[Callable[[IngestResult], None]] = None,
     ) -> BatchIngestResult:
         """Ingest one or more series from a registered source.
 
@@ -615,9 +783,15 @@ class DataPipeline:
             skip_existing: If ``True``, skip series where the cleaned
                 blob already exists for *date_str*.
             cleaned_fmt: ``"parquet"`` (default) or ``"csv"``.
+            incremental: Append only observations past the stored
+                watermark as a Parquet delta (see module docstring);
+                *skip_existing* does not apply.
+            workers: Override the source policy's ``max_workers``.
+            on_result: Called with each IngestResult as it completes.
 
         Returns:
-            BatchIngestResult with per-series outcomes.
+            BatchIngestResult with per-series outcomes (in completion
+            order).
         """
         desc = self._sources.get(source)
         if desc is None:
@@ -626,28 +800,104 @@ class DataPipeline:
                 f"Registered: {', '.join(self.list_sources())}"
             )
 
-        ids = list(series_ids) if series_ids else desc.series_ids
-        batch = BatchIngestResult(source=source)
+        if incremental and cleaned_fmt != "parquet":
+            raise ValueError("incremental ingestion stores Parquet deltas")
 
-        for sid in ids:
-            result = self._ingest_one(
-                desc, sid, date_str,
-                skip_existing, cleaned_fmt,
+        ids = list(series_ids) if series_ids else desc.series_ids
+        return self._run(
+            {source: ids}, date_str, skip_existing, cleaned_fmt,
+            incremental, workers, on_result,
+        )[source]
+
+    def _limiter(self, desc: SourceDescriptor) -> Optional[TokenBucket]:
+        """The source's token bucket (created on first use)."""
+        rpm = desc.policy.requests_per_minute
+        if rpm is None:
+            return None
+        with self._limiters_lock:
+            bucket = self._limiters.get(desc.name)
+            if bucket is None:
+                bucket = TokenBucket.per_minute(rpm, burst=desc.policy.burst)
+                self._limiters[desc.name] = bucket
+            return bucket
+
+    def _run(
+        self,
+        plan: Dict[str, List[str]],
+        date_str: Optional[str],
+        skip_existing: bool,
+        cleaned_fmt: str,
+        incremental: bool,
+        workers: Optional[int],
+        on_result: Optional[Callable[[IngestResult], None]],
+    ) -> Dict[str, BatchIngestResult]:
+        """Ingest ``{source: series_ids}`` with one pool per source."""
+        batches = {name: BatchIngestResult(source=name) for name in plan}
+
+        def report(result: IngestResult) -> None:
+            batches[result.source].results.append(result)
+            if on_result is not None:
+                on_result(result)
+
+        def work(run: _SourceRun, sid: str) -> IngestResult:
+            if incremental:
+                return self._ingest_incremental(run, sid, date_str)
+            return self._ingest_one(
+                run, sid, date_str, skip_existing, cleaned_fmt,
             )
-            batch.results.append(result)
 
-        logger.info(batch.summary())
-        return batch
+        with ExitStack() as stack:
+            futures: Dict[Future, Tuple[str, str]] = {}
+            for name, ids in plan.items():
+                if not ids:
+                    continue
+                desc = self._sources[name]
+                try:
+                    client = desc.client_factory()
+                except Exception as exc:
+                    logger.warning("Client %s failed: %s", name, exc)
+                    for sid in ids:
+                        report(IngestResult(
+                            source=name, series_id=sid,
+                            error=f"Client error: {exc}",
+                        ))
+                    continue
+                run = _SourceRun(desc, client, self._limiter(desc))
+                pool = stack.enter_context(ThreadPoolExecutor(
+                    max_workers=min(
+                        len(ids), workers or desc.policy.max_workers,
+                    ),
+                    thread_name_prefix=f"ingest-{name}",
+                ))
+                for sid in ids:
+                    futures[pool.submit(work, run, sid)] = (name, sid)
+
+            for future in as_completed(futures):
+                name, sid = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:  # ingest steps catch their own
+                    result = IngestResult(
+                        source=name, series_id=sid, error=str(exc),
+                    )
+                report(result)
+
+        # One index write per touched shard rather than per blob
+        self._store.flush_index()
+        for batch in batches.values():
+            logger.info(batch.summary())
+        return batches
 
     def _ingest_one(
         self,
-        desc: SourceDescriptor,
+        run: _SourceRun,
         series_id: str,
         date_str: Optional[str],
         skip_existing: bool,
         cleaned_fmt: str,
     ) -> IngestResult:
         """Ingest a single series: fetch → raw → clean → cleaned."""
+        desc = run.desc
         res = IngestResult(source=desc.name, series_id=series_id)
 
         ext_clean = ".parquet" if cleaned_fmt == "parquet" else ".csv"
@@ -661,14 +911,47 @@ class DataPipeline:
 
         # 1) Fetch raw
         try:
-            client = desc.client_factory()
-            raw = desc.fetch(client, series_id)
+            raw = run.call(lambda: desc.fetch(run.client, series_id))
         except Exception as exc:
             res.error = f"Fetch error: {exc}"
             logger.warning("Fetch %s/%s failed: %s", desc.name, series_id, exc)
             return res
 
         # 2) Store raw
+        self._store_raw(desc, series_id, raw, date_str, res)
+
+        # 3) Clean
+        try:
+            cleaned: pd.DataFrame = desc.clean(raw, series_id)
+            res.cleaned_rows = len(cleaned)
+        except Exception as exc:
+            res.error = f"Clean error: {exc}"
+            logger.warning("Clean %s/%s failed: %s", desc.name, series_id, exc)
+            return res
+
+        # 4) Store cleaned
+        try:
+            res.cleaned_stored = self._store.upload_dataframe(
+                desc.name, series_id, cleaned,
+                fmt=cleaned_fmt, date_str=date_str,
+            )
+        except Exception as exc:
+            res.error = f"Store cleaned error: {exc}"
+            logger.warning(
+                "Cleaned store %s/%s failed: %s", desc.name, series_id, exc
+            )
+
+        return res
+
+    def _store_raw(
+        self,
+        desc: SourceDescriptor,
+        series_id: str,
+        raw: Any,
+        date_str: Optional[str],
+        res: IngestResult,
+    ) -> None:
+        """Write a fetched payload to the raw tier (errors are logged)."""
         try:
             if isinstance(raw, bytes):
                 res.raw_stored = self._store.upload_raw_bytes(
@@ -692,29 +975,93 @@ class DataPipeline:
         except Exception as exc:
             logger.warning("Raw store %s/%s: %s", desc.name, series_id, exc)
 
-        # 3) Clean
+    def _ingest_incremental(
+        self,
+        run: _SourceRun,
+        series_id: str,
+        date_str: Optional[str],
+    ) -> IngestResult:
+        """Fetch past the watermark → raw (if delta) → clean → delta."""
+        desc = run.desc
+        res = IngestResult(source=desc.name, series_id=series_id)
+
+        try:
+            state = self._store.delta_state(desc.name, series_id)
+        except Exception as exc:
+            res.error = f"State error: {exc}"
+            logger.warning("State %s/%s failed: %s", desc.name, series_id, exc)
+            return res
+        since = (
+            pd.Timestamp(state["watermark"])
+            if state and state.get("watermark") else None
+        )
+
+        # 1) Fetch — only new observations where the source supports it
+        fetch_since = desc.fetch_since
+        partial = since is not None and fetch_since is not None
+        try:
+            if since is not None and fetch_since is not None:
+                start = since.to_pydatetime()
+                raw = run.call(
+                    lambda: fetch_since(run.client, series_id, start),
+                )
+            else:
+                raw = run.call(lambda: desc.fetch(run.client, series_id))
+        except Exception as exc:
+            res.error = f"Fetch error: {exc}"
+            logger.warning("Fetch %s/%s failed: %s", desc.name, series_id, exc)
+            return res
+
+        # 2) Raw tier: the first snapshot and incremental payloads only
+        if partial or state is None:
+            self._store_raw(desc, series_id, raw, date_str, res)
+
+        # 3) Clean and keep rows past the watermark
         try:
             cleaned: pd.DataFrame = desc.clean(raw, series_id)
+            if since is not None:
+                cleaned = cleaned[cleaned.index > since]
             res.cleaned_rows = len(cleaned)
         except Exception as exc:
             res.error = f"Clean error: {exc}"
             logger.warning("Clean %s/%s failed: %s", desc.name, series_id, exc)
             return res
 
-        # 4) Store cleaned
+        # 4) Append the delta (the base on first ingest), compact if due
         try:
-            res.cleaned_stored = self._store.upload_dataframe(
-                desc.name, series_id, cleaned,
-                fmt=cleaned_fmt, date_str=date_str,
-            )
+            state = self._store.append_delta(desc.name, series_id, cleaned)
         except Exception as exc:
-            res.error = f"Store cleaned error: {exc}"
+            state = None
             logger.warning(
-                "Cleaned store %s/%s failed: %s", desc.name, series_id, exc
+                "Delta store %s/%s failed: %s", desc.name, series_id, exc
             )
+        if state is None:
+            res.error = "Store cleaned error: delta write failed"
+            return res
+        res.cleaned_stored = True
+        res.watermark = state.get("watermark")
+        if len(state["deltas"]) >= self.compact_every:
+            res.compacted = self._store.compact_deltas(desc.name, series_id)
 
         return res
 
+    def compact(
+        self,
+        source: str,
+        series_ids: Optional[Sequence[str]] = None,
+    ) -> Dict[str, bool]:
+        """Fold incremental deltas into each series' base file now.
+
+        Returns:
+            ``{series_id: compacted}``
+        """
+        ids = list(series_ids) if series_ids else self.list_series(source)
+        compacted = {
+            sid: self._store.compact_deltas(source, sid) for sid in ids
+        }
+        self._store.flush_index()
+        return compacted
+
     def ingest_all(
         self,
         *,
@@ -722,31 +1069,43 @@ class DataPipeline:
         skip_existing: bool = False,
         cleaned_fmt: str = "parquet",
         sources: Optional[Sequence[str]] = None,
+        incremental: bool = False,
+        workers: Optional[int] = None,
+        on_result: Optional[Callable[[IngestResult], None]] = None,
     ) -> Dict[str, BatchIngestResult]:
         """Ingest every series from every registered source.
 
+        All sources run concurrently, each on its own bounded pool.
+
         Args:
             date_str: ISO date override.
             skip_existing: Skip already-stored cleaned blobs.
             cleaned_fmt: Output format.
             sources: Optional subset of source names.
+            incremental: Append deltas past each watermark.
+            workers: Override every source policy's ``max_workers``.
+            on_result: Called with each IngestResult as it completes.
 
         Returns:
             ``{source_name: BatchIngestResult}``
         """
-        names = list(sources) if sources else self.list_sources()
-        all_results: Dict[str, BatchIngestResult] = {}
+        if incremental and cleaned_fmt != "parquet":
+            raise ValueError("incremental ingestion stores Parquet deltas")
 
+        names = list(sources) if sources else self.list_sources()
+        plan: Dict[str, List[str]] = {}
         for name in names:
-            try:
-                all_results[name] = self.ingest(
-                    name, date_str=date_str,
-                    skip_existing=skip_existing, cleaned_fmt=cleaned_fmt,
-                )
-            except Exception as exc:
-                logger.error("Source %s failed entirely: %s", name, exc)
-                all_results[name] = BatchIngestResult(source=name)
+            if name in self._sources:
+                plan[name] = list(self._sources[name].series_ids)
+            else:
+                logger.error("Source %s failed entirely: not registered", name)
 
+        all_results = self._run(
+            plan, date_str, skip_existing, cleaned_fmt,
+            incremental, workers, on_result,
+        )
+        for name in names:
+            all_results.setdefault(name, BatchIngestResult(source=name))
         return all_results
 
     # ------------------------------------------------------------------
@@ -763,6 +1122,10 @@ class DataPipeline:
     ) -> Optional[pd.DataFrame]:
         """Retrieve a cleaned DataFrame from the data lake.
 
+        Without *date_str*, an incrementally ingested series returns
+        its merged base + deltas; otherwise (or if the series has no
+        incremental state) the dated snapshot is read.
+
         Args:
             source: Source name.
             series_id: Series identifier.
@@ -772,6 +1135,10 @@ class DataPipeline:
         Returns:
             DataFrame, or ``None`` if not present.
         """
+        if date_str is None and fmt == "parquet":
+            merged = self._store.download_merged(source, series_id)
+            if merged is not None:
+                return merged
         return self._store.download_dataframe(
             source, series_id, fmt=fmt, date_str=date_str,
         )
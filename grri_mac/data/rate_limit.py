@@ -0,0 +1,137 @@
+"""Rate limiting and retry helpers for external data APIs.
+
+TokenBucket is shared by every worker thread that talks to one API, so
+a thread pool can overlap request latency without exceeding the
+provider's quota.  ``call_with_retry`` wraps a single request with
+exponential backoff and jitter.
+
+Usage:
+    bucket = TokenBucket(capacity=40, refill_per_second=80 / 60)
+    bucket.acquire()          # blocks until a request slot is free
+    data = call_with_retry(lambda: fetch(...), is_retryable=...)
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills continuously at
+    ``refill_per_second``.  Over any window of ``w`` seconds at most
+    ``capacity + w * refill_per_second`` tokens are granted, so choosing
+    ``capacity + 60 * refill_per_second == N`` enforces "N per minute"
+    while still allowing an initial burst.
+
+    ``acquire`` reserves tokens under the lock and sleeps outside it,
+    so waiting threads are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if capacity <= 0 or refill_per_second <= 0:
+            raise ValueError("capacity and refill rate must be positive")
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(
+        cls,
+        requests_per_minute: float,
+        burst: float = 1,
+        **kwargs,
+    ) -> "TokenBucket":
+        """Bucket that never exceeds ``requests_per_minute`` in any minute."""
+        if burst >= requests_per_minute:
+            raise ValueError("burst must be below requests_per_minute")
+        return cls(
+            capacity=burst,
+            refill_per_second=(requests_per_minute - burst) / 60.0,
+            **kwargs,
+        )
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(
+                self.capacity, self._tokens + elapsed * self.refill_per_second,
+            )
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens if available right now; never blocks."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are granted. Returns seconds waited."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            deficit = -self._tokens
+        wait = deficit / self.refill_per_second if deficit > 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    retries: int = 3,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    is_retryable: Optional[Callable[[Exception], bool]] = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """
+    Call ``fn`` with exponential backoff on failure.
+
+    Args:
+        fn: Zero-argument callable performing one request
+        retries: Retries after the first attempt
+        base_delay: Delay before the first retry (doubles each time)
+        max_delay: Upper bound on a single delay
+        is_retryable: Predicate on the exception; non-retryable errors
+            are raised immediately (default: retry everything)
+        sleep: Sleep function (injectable for tests)
+
+    Returns:
+        Result of ``fn``
+
+    Raises:
+        The last exception once retries are exhausted
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= retries or (
+                is_retryable is not None and not is_retryable(e)
+            ):
+                raise
+            delay = min(max_delay, base_delay * (2 ** attempt))
+            sleep(delay * random.uniform(0.5, 1.0))
+            attempt += 1
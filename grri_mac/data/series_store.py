@@ -0,0 +1,386 @@
+"""Per-series on-disk store for the FRED bulk cache.
+
+Each series is one NumPy file plus an entry in a small JSON manifest::
+
+    data/fred_cache/series/
+        manifest.json          — {series_id: {start, end, count, updated}}
+        VIXCLS.series.npy      — structured array of (dates, values):
+                                 int64 nanosecond timestamps and float64
+                                 values (NaN preserved)
+
+Series are opened lazily with ``np.load(mmap_mode="r")`` on first
+access, so a process that touches three series pays for three series.
+Writes go through a temp file + ``os.replace`` and only rewrite the
+series that changed.  Dates and values live in the same file, so one
+rename publishes both: a reader sees either the old series or the new
+one, never old dates paired with new values, and parallel backtest
+workers can share one cache directory.  Manifest updates are
+read-modify-write under an exclusive lock on ``manifest.lock``, so
+concurrent writers never drop each other's entries.
+
+Stores written before the single-file layout (``.dates.npy`` /
+``.values.npy`` pairs) are still read; a series is moved to the new
+layout the next time it is written.
+
+IDs outside ``[A-Za-z0-9_.-]`` are stored as ``<sanitised>~<hash>``;
+``~`` never appears in a safe ID, so distinct IDs never share files.
+
+The legacy monolithic pickle (``fred_series_cache.pkl``) is migrated
+into the store the first time a client opens an empty store next to it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+LOCK_NAME = "manifest.lock"
+
+# On-disk record layout of one series
+SERIES_DTYPE = np.dtype([("dates", "<i8"), ("values", "<f8")])
+
+# Series IDs become file names; keep them to a safe character set
+_SAFE_ID = re.compile(r"[^A-Za-z0-9_.\-]")
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+# flock() excludes other processes; threads of this one queue here
+_MANIFEST_THREAD_LOCK = threading.Lock()
+
+
+def _file_stem(series_id: str) -> str:
+    """Injective file-name stem for a series ID."""
+    stem = _SAFE_ID.sub("_", series_id)
+    if stem == series_id:
+        return stem
+    digest = hashlib.sha1(series_id.encode("utf-8")).hexdigest()[:16]
+    return f"{stem}~{digest}"
+
+
+@contextmanager
+def _exclusive_lock(path: Path):
+    """Hold an exclusive lock on ``path`` (created if missing)."""
+    with _MANIFEST_THREAD_LOCK, open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _atomic_write(path: Path, write_fn) -> None:
+    """Write via a temp file in the same directory, then rename."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write_fn(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def build_asof_arrays(data: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """NaN-free, time-sorted (int64 ns timestamps, float values)."""
+    data = data.dropna()
+    if data.index.hasnans:
+        data = data[data.index.notna()]
+    if not data.index.is_monotonic_increasing:
+        data = data.sort_index()
+    times = data.index.values.astype("datetime64[ns]").view("int64")
+    return times, data.to_numpy(dtype=np.float64)
+
+
+def asof_lookup(
+    times: np.ndarray,
+    values: np.ndarray,
+    targets: np.ndarray,
+    lookback_days: Optional[int],
+) -> np.ndarray:
+    """
+    Binary-search as-of lookup.
+
+    Returns the last value at or before each target (int64 ns) if it
+    lies within ``lookback_days`` (any age if None); NaN otherwise.
+    """
+    out = np.full(len(targets), np.nan)
+    if times.size == 0:
+        return out
+    pos = np.searchsorted(times, targets, side="right") - 1
+    found = pos >= 0
+    if lookback_days is not None:
+        window = np.int64(lookback_days) * 86_400_000_000_000
+        found[found] = times[pos[found]] >= targets[found] - window
+    out[found] = values[pos[found]]
+    return out
+
+
+class SeriesStore:
+    """Directory of per-series date/value ``.npy`` records with a manifest."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.manifest_path = self.root / MANIFEST_NAME
+
+    # ── Paths / manifest ─────────────────────────────────────────────────
+
+    def _path(self, series_id: str) -> Path:
+        return self.root / f"{_file_stem(series_id)}.series.npy"
+
+    def _legacy_paths(self, series_id: str) -> tuple[Path, Path]:
+        """Separate dates/values files of the pre-record layout."""
+        stem = _file_stem(series_id)
+        return (
+            self.root / f"{stem}.dates.npy",
+            self.root / f"{stem}.values.npy",
+        )
+
+    def _all_paths(self, series_id: str) -> tuple[Path, ...]:
+        return (self._path(series_id), *self._legacy_paths(series_id))
+
+    def read_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Return the manifest (empty if the store does not exist yet)."""
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            return json.loads(self.manifest_path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning("Unreadable series manifest %s: %s",
+                           self.manifest_path, e)
+            return {}
+
+    def _update_manifest(
+        self,
+        updates: Dict[str, Optional[Dict[str, Any]]],
+    ) -> None:
+        """Merge entries into the on-disk manifest (None = remove).
+
+        The read, merge and atomic replace run under an exclusive file
+        lock, so entries written by other threads or processes sharing
+        the directory are never lost.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        with _exclusive_lock(self.root / LOCK_NAME):
+            manifest = self.read_manifest()
+            for series_id, entry in updates.items():
+                if entry is None:
+                    manifest.pop(series_id, None)
+                else:
+                    manifest[series_id] = entry
+            payload = json.dumps(manifest, indent=2, sort_keys=True).encode()
+            _atomic_write(self.manifest_path, lambda f: f.write(payload))
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    def ids(self) -> List[str]:
+        """Series IDs recorded in the manifest."""
+        return sorted(self.read_manifest())
+
+    def __contains__(self, series_id: str) -> bool:
+        return (
+            self._path(series_id).exists()
+            or self._legacy_paths(series_id)[1].exists()
+        )
+
+    def read(self, series_id: str) -> Optional[pd.Series]:
+        """Open a stored series memory-mapped; None if absent/corrupt."""
+        path = self._path(series_id)
+        dates_path, values_path = self._legacy_paths(series_id)
+        try:
+            if path.exists():
+                record = np.load(path, mmap_mode="r")
+                if record.dtype != SERIES_DTYPE or record.ndim != 1:
+                    raise ValueError(f"unexpected layout {record.dtype}")
+                dates, values = record["dates"], record["values"]
+            elif values_path.exists() and dates_path.exists():
+                dates = np.load(dates_path, mmap_mode="r")
+                values = np.load(values_path, mmap_mode="r")
+            else:
+                return None
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read cached series %s: %s", series_id, e)
+            return None
+        if dates.shape != values.shape:
+            logger.warning("Cached series %s is inconsistent", series_id)
+            return None
+        index = pd.DatetimeIndex(np.asarray(dates).view("datetime64[ns]"))
+        return pd.Series(values, index=index, copy=False)
+
+    def write(self, series_id: str, series: pd.Series) -> bool:
+        """Persist one series (dates + values) and its manifest entry."""
+        return self.write_many({series_id: series}) == 1
+
+    def write_many(self, series: Dict[str, pd.Series]) -> int:
+        """Persist several series with a single manifest update."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        entries: Dict[str, Optional[Dict[str, Any]]] = {}
+        for series_id, data in series.items():
+            try:
+                index = pd.DatetimeIndex(data.index)
+                dates = index.values.astype("datetime64[ns]").view("int64")
+                values = pd.to_numeric(data, errors="coerce").to_numpy(
+                    dtype=np.float64,
+                )
+            except (TypeError, ValueError) as e:
+                logger.warning("Series %s not storable: %s", series_id, e)
+                continue
+            record = np.empty(len(values), dtype=SERIES_DTYPE)
+            record["dates"] = dates
+            record["values"] = values
+            # One file, one rename: dates and values change together
+            _atomic_write(self._path(series_id), lambda f: np.save(f, record))
+            for path in self._legacy_paths(series_id):
+                path.unlink(missing_ok=True)
+            entries[series_id] = self._entry(index, len(values))
+        if entries:
+            self._update_manifest(entries)
+        return len(entries)
+
+    def delete(self, series_id: str) -> None:
+        """Remove a series and its manifest entry."""
+        for path in self._all_paths(series_id):
+            path.unlink(missing_ok=True)
+        self._update_manifest({series_id: None})
+
+    def clear(self) -> int:
+        """Remove every stored series. Returns the number removed."""
+        if not self.root.exists():
+            return 0
+        with _exclusive_lock(self.root / LOCK_NAME):
+            ids = self.ids()
+            for series_id in ids:
+                for path in self._all_paths(series_id):
+                    path.unlink(missing_ok=True)
+            if self.manifest_path.exists():
+                self.manifest_path.unlink()
+        return len(ids)
+
+    def migrate_pickle(self, pickle_path: Path) -> int:
+        """Import a legacy ``{series_id: pd.Series}`` pickle.
+
+        The pickle itself is left in place.  Returns series imported.
+        """
+        try:
+            with open(pickle_path, "rb") as f:
+                legacy = pickle.load(f)
+        except Exception as e:
+            logger.warning("Could not read legacy cache %s: %s",
+                           pickle_path, e)
+            return 0
+        if not isinstance(legacy, dict):
+            return 0
+        valid = {
+            k: v for k, v in legacy.items()
+            if isinstance(v, pd.Series) and len(v) > 0
+        }
+        return self.write_many(valid)
+
+    @staticmethod
+    def _entry(index: pd.DatetimeIndex, count: int) -> Dict[str, Any]:
+        return {
+            "start": index.min().strftime("%Y-%m-%d") if count else None,
+            "end": index.max().strftime("%Y-%m-%d") if count else None,
+            "count": count,
+            "updated": datetime.now(timezone.utc).isoformat(),
+        }
+
+
+class LazySeriesCache(MutableMapping):
+    """Dict-like view over a SeriesStore that loads series on access.
+
+    Assignments are held in memory and marked dirty; ``flush()`` writes
+    only the dirty series back to the store.
+    """
+
+    def __init__(self, store: SeriesStore):
+        self.store = store
+        self._loaded: Dict[str, pd.Series] = {}
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self._known: set[str] = set(store.ids())
+
+    def __getitem__(self, series_id: str) -> pd.Series:
+        if series_id in self._loaded:
+            return self._loaded[series_id]
+        if series_id not in self._deleted:
+            data = self.store.read(series_id)
+            if data is not None:
+                self._loaded[series_id] = data
+                self._known.add(series_id)
+                return data
+        raise KeyError(series_id)
+
+    def __setitem__(self, series_id: str, data: pd.Series) -> None:
+        self._loaded[series_id] = data
+        self._known.add(series_id)
+        self._dirty.add(series_id)
+        self._deleted.discard(series_id)
+
+    def __delitem__(self, series_id: str) -> None:
+        if series_id not in self:
+            raise KeyError(series_id)
+        self._loaded.pop(series_id, None)
+        self._known.discard(series_id)
+        self._dirty.discard(series_id)
+        self._deleted.add(series_id)
+
+    def __contains__(self, series_id: object) -> bool:
+        if not isinstance(series_id, str) or series_id in self._deleted:
+            return False
+        return (
+            series_id in self._loaded
+            or series_id in self._known
+            or series_id in self.store
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(sorted(self._known))
+
+    def __len__(self) -> int:
+        return len(self._known)
+
+    @property
+    def loaded_ids(self) -> List[str]:
+        """Series currently held in memory (mapped or fetched)."""
+        return sorted(self._loaded)
+
+    def flush(self) -> int:
+        """Write dirty series and pending deletions. Returns count written."""
+        for series_id in self._deleted:
+            self.store.delete(series_id)
+        self._deleted.clear()
+        written = self.store.write_many(
+            {k: self._loaded[k] for k in sorted(self._dirty)}
+        )
+        self._dirty.clear()
+        return written
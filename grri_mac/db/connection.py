@@ -9,6 +9,8 @@ from contextlib import contextmanager
 # Default database path
 DEFAULT_DB_PATH = Path(__file__).parent.parent.parent / "data" / "mac.db"
 
+SCHEMA_VERSION = "1.1"
+
 
 class Database:
     """SQLite database connection manager."""
@@ -40,6 +42,8 @@ class Database:
             self._connection.row_factory = sqlite3.Row
             # Enable foreign keys
             self._connection.execute("PRAGMA foreign_keys = ON")
+            # Readers don't block bulk writers (no-op for :memory:)
+            self._connection.execute("PRAGMA journal_mode = WAL")
 
         return self._connection
 
@@ -105,6 +109,22 @@ class Database:
         CREATE INDEX IF NOT EXISTS idx_mac_snapshots_timestamp
         ON mac_snapshots(timestamp DESC);
 
+        -- Covers statistics and percentile queries (no table lookups)
+        CREATE INDEX IF NOT EXISTS idx_mac_snapshots_time_score
+        ON mac_snapshots(timestamp, mac_score, multiplier);
+
+        -- One row per breaching pillar per snapshot
+        CREATE TABLE IF NOT EXISTS snapshot_breaches (
+            snapshot_id INTEGER NOT NULL,
+            timestamp TIMESTAMP NOT NULL,
+            pillar TEXT NOT NULL,
+            PRIMARY KEY (snapshot_id, pillar),
+            FOREIGN KEY (snapshot_id) REFERENCES mac_snapshots(id) ON DELETE CASCADE
+        );
+
+        CREATE INDEX IF NOT EXISTS idx_snapshot_breaches_time_pillar
+        ON snapshot_breaches(timestamp, pillar);
+
         -- Pillar scores (detailed breakdown)
         CREATE TABLE IF NOT EXISTS pillar_scores (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -169,8 +189,12 @@ class Database:
             series_id TEXT
         );
 
-        CREATE INDEX IF NOT EXISTS idx_indicator_values_name_time
-        ON indicator_values(indicator_name, timestamp DESC);
+        -- Covers history/latest queries; supersedes the (name, time) index
+        DROP INDEX IF EXISTS idx_indicator_values_name_time;
+        CREATE INDEX IF NOT EXISTS idx_indicator_values_history
+        ON indicator_values(
+            indicator_name, timestamp DESC, value, source, series_id
+        );
 
         -- Metadata table for tracking
         CREATE TABLE IF NOT EXISTS metadata (
@@ -179,14 +203,37 @@ class Database:
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
 
-        -- Insert schema version
-        INSERT OR REPLACE INTO metadata (key, value, updated_at)
-        VALUES ('schema_version', '1.0', CURRENT_TIMESTAMP);
         """
 
+        previous = self.get_schema_version()
         # Execute schema creation
-        self.connect().executescript(schema)
-        self.connect().commit()
+        conn = self.connect()
+        conn.executescript(schema)
+        if previous == "1.0":
+            self._backfill_breaches(conn)
+        conn.execute(
+            "INSERT OR REPLACE INTO metadata (key, value, updated_at) "
+            "VALUES ('schema_version', ?, CURRENT_TIMESTAMP)",
+            (SCHEMA_VERSION,),
+        )
+        conn.commit()
+
+    @staticmethod
+    def _backfill_breaches(conn: sqlite3.Connection):
+        """Fill snapshot_breaches from 1.0 comma-separated breach_flags."""
+        rows = conn.execute(
+            "SELECT id, timestamp, breach_flags FROM mac_snapshots "
+            "WHERE breach_flags != ''"
+        ).fetchall()
+        conn.executemany(
+            "INSERT OR IGNORE INTO snapshot_breaches VALUES (?, ?, ?)",
+            [
+                (row["id"], row["timestamp"], flag.strip())
+                for row in rows
+                for flag in row["breach_flags"].split(",")
+                if flag.strip()
+            ],
+        )
 
     def get_schema_version(self) -> Optional[str]:
         """Get current schema version."""
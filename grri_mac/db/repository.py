@@ -1,11 +1,66 @@
 """Data access repository for MAC database operations."""
 
+import sqlite3
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
+
+import pandas as pd
 
 from .connection import Database, get_db
 from .models import MACSnapshot, PillarScore, Alert, ChinaSnapshot, IndicatorValue
 
+# Pillars reported by get_breach_frequency
+BREACH_PILLARS = ("liquidity", "valuation", "positioning", "volatility", "policy")
+
+# Pillar score columns of a backtest results frame
+BACKTEST_PILLAR_COLUMNS = BREACH_PILLARS + ("contagion", "private_credit", "sentiment")
+
+_SNAPSHOT_INSERT = """
+    INSERT INTO mac_snapshots (
+        timestamp, mac_score, mac_adjusted, multiplier,
+        is_regime_break, interpretation,
+        liquidity_score, valuation_score, positioning_score,
+        volatility_score, policy_score,
+        breach_flags, china_activation, data_source, notes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_PILLAR_SCORE_INSERT = """
+    INSERT INTO pillar_scores (
+        snapshot_id, pillar_name, score, status,
+        is_breaching, indicators_json
+    ) VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_ALERT_INSERT = """
+    INSERT INTO alerts (
+        timestamp, snapshot_id, alert_type, level, message,
+        pillar, current_value, threshold, acknowledged
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INDICATOR_INSERT = """
+    INSERT INTO indicator_values (
+        timestamp, indicator_name, value, source, series_id
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _insert_many(
+    conn: sqlite3.Connection, sql: str, rows: Sequence[tuple],
+) -> list[int]:
+    """
+    ``executemany`` an INSERT and return the new row IDs in order.
+
+    Rows inserted by one statement on one connection get consecutive
+    AUTOINCREMENT IDs, so they end at ``last_insert_rowid()``.
+    """
+    if not rows:
+        return []
+    conn.executemany(sql, rows)
+    last = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return list(range(last - len(rows) + 1, last + 1))
+
 
 class MACRepository:
     """Repository for MAC data operations."""
@@ -31,36 +86,131 @@ class MACRepository:
         Returns:
             ID of saved snapshot
         """
+        return self.save_snapshots([snapshot])[0]
+
+    def save_snapshots(self, snapshots: list[MACSnapshot]) -> list[int]:
+        """
+        Save several MAC snapshots in one transaction.
+
+        Args:
+            snapshots: MACSnapshots to save
+
+        Returns:
+            IDs of the saved snapshots, in order
+        """
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO mac_snapshots (
-                    timestamp, mac_score, mac_adjusted, multiplier,
-                    is_regime_break, interpretation,
-                    liquidity_score, valuation_score, positioning_score,
-                    volatility_score, policy_score,
-                    breach_flags, china_activation, data_source, notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    snapshot.timestamp,
-                    snapshot.mac_score,
-                    snapshot.mac_adjusted,
-                    snapshot.multiplier,
-                    1 if snapshot.is_regime_break else 0,
-                    snapshot.interpretation,
-                    snapshot.liquidity_score,
-                    snapshot.valuation_score,
-                    snapshot.positioning_score,
-                    snapshot.volatility_score,
-                    snapshot.policy_score,
-                    snapshot.breach_flags,
-                    snapshot.china_activation,
-                    snapshot.data_source,
-                    snapshot.notes,
-                ),
+            return self._insert_snapshots(
+                conn, [self._snapshot_params(s) for s in snapshots],
             )
-            return cursor.lastrowid
+
+    @staticmethod
+    def _snapshot_params(snapshot: MACSnapshot) -> tuple:
+        return (
+            snapshot.timestamp,
+            snapshot.mac_score,
+            snapshot.mac_adjusted,
+            snapshot.multiplier,
+            1 if snapshot.is_regime_break else 0,
+            snapshot.interpretation,
+            snapshot.liquidity_score,
+            snapshot.valuation_score,
+            snapshot.positioning_score,
+            snapshot.volatility_score,
+            snapshot.policy_score,
+            snapshot.breach_flags,
+            snapshot.china_activation,
+            snapshot.data_source,
+            snapshot.notes,
+        )
+
+    @staticmethod
+    def _insert_snapshots(
+        conn: sqlite3.Connection, rows: list[tuple],
+    ) -> list[int]:
+        """Insert snapshot rows and their snapshot_breaches rows."""
+        ids = _insert_many(conn, _SNAPSHOT_INSERT, rows)
+        conn.executemany(
+            "INSERT OR IGNORE INTO snapshot_breaches VALUES (?, ?, ?)",
+            [
+                (snapshot_id, row[0], flag.strip())
+                for snapshot_id, row in zip(ids, rows)
+                if row[11]
+                for flag in row[11].split(",")
+                if flag.strip()
+            ],
+        )
+        return ids
+
+    def load_backtest_frame(
+        self,
+        df: pd.DataFrame,
+        data_source: str = "backtest",
+        breach_threshold: float = 0.2,
+    ) -> int:
+        """
+        Store a whole backtest results frame as snapshots in one call.
+
+        Args:
+            df: Backtest output indexed by date (or with a 'date'
+                column), with 'mac_score' and pillar score columns.
+                Missing or NaN pillar scores are stored as 0.5, the
+                schema default
+            data_source: Value for each snapshot's data_source
+            breach_threshold: Pillars scoring below this are recorded as
+                breaching, as in calculate_mac. Ignored if the frame has
+                a 'breach_flags' column (lists or comma-separated).
+
+        Returns:
+            Number of snapshots stored
+        """
+        if "date" in df.columns:
+            df = df.set_index("date")
+        n = len(df)
+        if n == 0:
+            return 0
+
+        def column(name: str, default: Any) -> list:
+            if name not in df.columns:
+                return [default] * n
+            values = df[name].astype(object)
+            return values.where(values.notna(), default).tolist()
+
+        if "breach_flags" in df.columns:
+            flags = [
+                ",".join(f) if isinstance(f, (list, tuple)) else (f or "")
+                for f in df["breach_flags"]
+            ]
+        else:
+            breaching = [
+                (name, df[name].to_numpy(dtype=float) < breach_threshold)
+                for name in BACKTEST_PILLAR_COLUMNS
+                if name in df.columns
+            ]
+            flags = [
+                ",".join(name for name, hit in breaching if hit[i])
+                for i in range(n)
+            ]
+
+        rows = list(zip(
+            pd.DatetimeIndex(df.index).to_pydatetime().tolist(),
+            df["mac_score"].astype(float).tolist(),
+            column("mac_adjusted", None),
+            column("multiplier", None),
+            [0] * n,
+            column("interpretation", ""),
+            column("liquidity", 0.5),
+            column("valuation", 0.5),
+            column("positioning", 0.5),
+            column("volatility", 0.5),
+            column("policy", 0.5),
+            flags,
+            [None] * n,
+            [data_source] * n,
+            [""] * n,
+        ))
+        with self.db.transaction() as conn:
+            self._insert_snapshots(conn, rows)
+        return n
 
     def get_snapshot(self, snapshot_id: int) -> Optional[MACSnapshot]:
         """Get a snapshot by ID."""
@@ -163,27 +313,18 @@ class MACRepository:
         Returns:
             List of saved score IDs
         """
-        ids = []
         with self.db.transaction() as conn:
-            for score in scores:
-                cursor = conn.execute(
-                    """
-                    INSERT INTO pillar_scores (
-                        snapshot_id, pillar_name, score, status,
-                        is_breaching, indicators_json
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        snapshot_id,
-                        score.pillar_name,
-                        score.score,
-                        score.status,
-                        1 if score.is_breaching else 0,
-                        score.indicators_json,
-                    ),
+            return _insert_many(conn, _PILLAR_SCORE_INSERT, [
+                (
+                    snapshot_id,
+                    score.pillar_name,
+                    score.score,
+                    score.status,
+                    1 if score.is_breaching else 0,
+                    score.indicators_json,
                 )
-                ids.append(cursor.lastrowid)
-        return ids
+                for score in scores
+            ])
 
     def get_pillar_scores(self, snapshot_id: int) -> list[PillarScore]:
         """Get pillar scores for a snapshot."""
@@ -262,14 +403,12 @@ class MACRepository:
 
     def save_alert(self, alert: Alert) -> int:
         """Save an alert."""
+        return self.save_alerts([alert])[0]
+
+    def save_alerts(self, alerts: list[Alert]) -> list[int]:
+        """Save multiple alerts in one transaction."""
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO alerts (
-                    timestamp, snapshot_id, alert_type, level, message,
-                    pillar, current_value, threshold, acknowledged
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+            return _insert_many(conn, _ALERT_INSERT, [
                 (
                     alert.timestamp,
                     alert.snapshot_id,
@@ -280,13 +419,9 @@ class MACRepository:
                     alert.current_value,
                     alert.threshold,
                     1 if alert.acknowledged else 0,
-                ),
-            )
-            return cursor.lastrowid
-
-    def save_alerts(self, alerts: list[Alert]) -> list[int]:
-        """Save multiple alerts."""
-        return [self.save_alert(a) for a in alerts]
+                )
+                for alert in alerts
+            ])
 
     def get_alerts(
         self,
@@ -348,26 +483,21 @@ class MACRepository:
 
     def save_indicator(self, indicator: IndicatorValue) -> int:
         """Save a raw indicator value."""
-        with self.db.transaction() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO indicator_values (
-                    timestamp, indicator_name, value, source, series_id
-                ) VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    indicator.timestamp,
-                    indicator.indicator_name,
-                    indicator.value,
-                    indicator.source,
-                    indicator.series_id,
-                ),
-            )
-            return cursor.lastrowid
+        return self.save_indicators([indicator])[0]
 
     def save_indicators(self, indicators: list[IndicatorValue]) -> list[int]:
-        """Save multiple indicator values."""
-        return [self.save_indicator(i) for i in indicators]
+        """Save multiple indicator values in one transaction."""
+        with self.db.transaction() as conn:
+            return _insert_many(conn, _INDICATOR_INSERT, [
+                (
+                    i.timestamp,
+                    i.indicator_name,
+                    i.value,
+                    i.source,
+                    i.series_id,
+                )
+                for i in indicators
+            ])
 
     def get_indicator_history(
         self,
@@ -459,26 +589,17 @@ class MACRepository:
         start_date = datetime.now() - timedelta(days=days)
         rows = self.db.fetchall(
             """
-            SELECT breach_flags FROM mac_snapshots
-            WHERE timestamp >= ? AND breach_flags != ''
+            SELECT pillar, COUNT(*) AS count FROM snapshot_breaches
+            WHERE timestamp >= ?
+            GROUP BY pillar
             """,
             (start_date,),
         )
 
-        counts = {
-            "liquidity": 0,
-            "valuation": 0,
-            "positioning": 0,
-            "volatility": 0,
-            "policy": 0,
-        }
-
+        counts = {pillar: 0 for pillar in BREACH_PILLARS}
         for row in rows:
-            flags = row["breach_flags"].split(",")
-            for flag in flags:
-                flag = flag.strip()
-                if flag in counts:
-                    counts[flag] += 1
+            if row["pillar"] in counts:
+                counts[row["pillar"]] = row["count"]
 
         return counts
 
@@ -2,6 +2,7 @@
 
 from .modifier import grri_to_modifier, calculate_grri, GRRIPillars, GRRIResult
 from .historical_sources import GRRIHistoricalProvider
+from .panel_engine import GRRIPanelEngine, GRRIProvenance
 from .historical_proxies import GRRI_PROXY_CHAINS, get_proxy_coverage_table
 
 __all__ = [
@@ -10,6 +11,8 @@ __all__ = [
     "GRRIPillars",
     "GRRIResult",
     "GRRIHistoricalProvider",
+    "GRRIPanelEngine",
+    "GRRIProvenance",
     "GRRI_PROXY_CHAINS",
     "get_proxy_coverage_table",
 ]
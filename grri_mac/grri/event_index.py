@@ -0,0 +1,369 @@
+"""Per-country indexes over the GRRI event tables.
+
+``get_crisis_count``, ``get_conflict_intensity``,
+``get_disaster_severity`` and ``get_sanctions_count`` used to load their
+whole table and build an upper-cased string mask over every row for each
+(country, year) query.  Each table is now indexed once per process:
+
+- Rows are grouped by country key, normalised as the queries did
+  (``astype(str).str.upper()``).  A row that matches on several key
+  columns is counted once.
+- **YearPrefixIndex** (Reinhart-Rogoff, EM-DAT) keeps each country's
+  event years sorted with prefix sums of the per-event values (crisis
+  types, deaths, events), so a windowed total is two ``searchsorted``
+  calls and a subtraction.
+- **ConflictIndex** (COW) splits each country's timeline at every war
+  start, end and point year.  Within one segment the set of active wars
+  is fixed, so the peak battle deaths are stored per segment and a year
+  is answered by one ``searchsorted``.
+- **SpellIndex** (GSDB) keeps sorted spell starts and ends: the active
+  count in a year is ``#(start <= year) - #(end < year)``.
+
+Every index answers a whole country × year grid in one call; the scalar
+lookups are the 1 × 1 case.  ``EVENT_INDEXES`` holds one index per
+source and rebuilds it when the source file's size or mtime changes.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _numeric(df: pd.DataFrame, column: str) -> np.ndarray:
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+
+
+def group_rows(
+    df: pd.DataFrame, key_columns: Sequence[str],
+) -> Dict[str, np.ndarray]:
+    """Sorted row positions per upper-cased key, across ``key_columns``."""
+    groups: Dict[str, np.ndarray] = {}
+    for col in key_columns:
+        if col not in df.columns:
+            continue
+        keys = df[col].astype(str).str.upper().to_numpy()
+        for key, rows in pd.Series(keys).groupby(keys, sort=False).indices.items():
+            groups[key] = np.union1d(groups[key], rows) if key in groups else rows
+    return groups
+
+
+def _grid(codes: Sequence[str], years) -> Tuple[list, np.ndarray]:
+    return list(codes), np.asarray(years, dtype=float)
+
+
+class YearPrefixIndex:
+    """Per-country sorted event years with prefix sums of event values."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        key_columns: Sequence[str],
+        values: Dict[str, np.ndarray],
+        year_column: Optional[str],
+    ):
+        """
+        Args:
+            df: Event table, one row per event.
+            key_columns: Country key columns (a row matches on any).
+            values: Per-row values to sum (NaN counts as 0); a
+                ``count`` of events is always available.
+            year_column: Event year column, or None if the table has
+                none (every event then falls in every window).
+        """
+        self.names = ["count", *values]
+        per_row = np.column_stack(
+            [np.ones(len(df))]
+            + [np.nan_to_num(np.asarray(v, dtype=float)) for v in values.values()]
+        ) if len(df) else np.zeros((0, len(self.names)))
+        years = _numeric(df, year_column) if year_column else None
+
+        # key -> (sorted event years or None, prefix sums with a zero row)
+        self._groups: Dict[str, Tuple[Optional[np.ndarray], np.ndarray]] = {}
+        for key, rows in group_rows(df, key_columns).items():
+            event_years = None
+            if years is not None:
+                rows = rows[~np.isnan(years[rows])]
+                rows = rows[np.argsort(years[rows], kind="stable")]
+                event_years = years[rows]
+            prefix = np.vstack([
+                np.zeros(len(self.names)), np.cumsum(per_row[rows], axis=0),
+            ])
+            self._groups[key] = (event_years, prefix)
+
+    def window_sums(
+        self,
+        codes: Sequence[str],
+        years,
+        before: int,
+        after: int,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sums over events dated within ``[year - before, year + after]``.
+
+        Returns:
+            Name -> (country, year) array, including ``count``.
+        """
+        codes, years = _grid(codes, years)
+        out = np.zeros((len(self.names), len(codes), len(years)))
+        for i, code in enumerate(codes):
+            group = self._groups.get(code.upper())
+            if group is None:
+                continue
+            event_years, prefix = group
+            if event_years is None:
+                out[:, i, :] = prefix[-1][:, None]
+                continue
+            lo = np.searchsorted(event_years, years - before, side="left")
+            hi = np.searchsorted(event_years, years + after, side="right")
+            out[:, i, :] = (prefix[hi] - prefix[lo]).T
+        return dict(zip(self.names, out))
+
+
+class CrisisIndex(YearPrefixIndex):
+    """Reinhart-Rogoff crisis-type counts."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        key_columns: Sequence[str],
+        crisis_columns: Iterable[str],
+    ):
+        cols = [c for c in crisis_columns if c in df.columns]
+        totals = (
+            df[cols].sum(axis=1).to_numpy(dtype=float) if cols
+            else np.zeros(len(df))
+        )
+        super().__init__(
+            df, key_columns, {"crises": totals},
+            "year" if "year" in df.columns else None,
+        )
+
+    def counts(self, codes: Sequence[str], years, window: int = 5) -> np.ndarray:
+        """Crisis-type-years within ``year ± window`` (int array)."""
+        crises = self.window_sums(codes, years, window, window)["crises"]
+        return np.trunc(crises).astype(np.int64)
+
+
+class DisasterIndex(YearPrefixIndex):
+    """EM-DAT events and deaths."""
+
+    def __init__(self, df: pd.DataFrame, key_columns: Sequence[str]):
+        year_col = next(
+            (c for c in ("year", "start_year") if c in df.columns), None,
+        )
+        death_col = next(
+            (c for c in ("total_deaths", "deaths", "no_killed") if c in df.columns),
+            None,
+        )
+        self.has_deaths = death_col is not None
+        values = {}
+        if death_col is not None:
+            deaths = _numeric(df, death_col)
+            values = {"deaths": deaths, "fatal": (deaths > 0).astype(float)}
+        super().__init__(df, key_columns, values, year_col)
+
+    def severity(self, codes: Sequence[str], years, window: int = 5) -> np.ndarray:
+        """
+        0–1 severity over ``[year - window, year]``.
+
+        Log-scaled total deaths, or the event count / 50 where no
+        deaths are recorded; 0 where there were no events.
+        """
+        sums = self.window_sums(codes, years, window, 0)
+        out = np.minimum(1.0, sums["count"] / 50.0)
+        if self.has_deaths:
+            known = sums["fatal"] > 0
+            out[known] = np.minimum(1.0, np.log10(sums["deaths"][known] + 1) / 6.0)
+        return out
+
+
+class ConflictIndex:
+    """COW war participation: peak battle deaths per active year."""
+
+    POINT_COLUMNS = ("year", "startyear1")
+
+    def __init__(self, df: pd.DataFrame, key_columns: Sequence[str]):
+        # Only whole years can equal a queried year
+        points = [
+            np.where(np.floor(v) == v, v, np.nan)
+            for v in (_numeric(df, c) for c in self.POINT_COLUMNS if c in df.columns)
+        ]
+        spells = "startyear1" in df.columns and "endyear1" in df.columns
+        if spells:
+            # start <= year <= end over integer years
+            first = np.ceil(_numeric(df, "startyear1"))
+            last = np.floor(_numeric(df, "endyear1"))
+        deaths = (
+            _numeric(df, "batdeath") if "batdeath" in df.columns
+            else np.full(len(df), np.nan)
+        )
+
+        # key -> (segment starts, any war active, peak known deaths)
+        self._groups: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for key, rows in group_rows(df, key_columns).items():
+            cuts = [np.concatenate([p[rows], p[rows] + 1]) for p in points]
+            if spells:
+                ok = first[rows] <= last[rows]
+                cuts += [first[rows][ok], last[rows][ok] + 1]
+            bounds = np.concatenate(cuts) if cuts else np.empty(0)
+            bounds = np.unique(bounds[~np.isnan(bounds)])
+            if not len(bounds):
+                continue
+
+            active = np.zeros((len(rows), len(bounds)), dtype=bool)
+            for p in points:
+                active |= p[rows][:, None] == bounds[None, :]
+            if spells:
+                active |= (
+                    (first[rows][:, None] <= bounds[None, :])
+                    & (last[rows][:, None] >= bounds[None, :])
+                )
+            d = deaths[rows][:, None]
+            peak = np.where(active & ~np.isnan(d), d, -np.inf).max(axis=0)
+            self._groups[key] = (bounds, active.any(axis=0), peak)
+
+    def intensity(self, codes: Sequence[str], years) -> np.ndarray:
+        """
+        0–1 conflict intensity: 0 at peace, log-scaled peak battle
+        deaths when at war (1M deaths → 1.0), 0.3 if deaths unknown.
+        """
+        codes, years = _grid(codes, years)
+        out = np.zeros((len(codes), len(years)))
+        for i, code in enumerate(codes):
+            group = self._groups.get(code.upper())
+            if group is None:
+                continue
+            bounds, at_war, peak = group
+            seg = np.searchsorted(bounds, years, side="right") - 1
+            inside = seg >= 0
+            seg = np.where(inside, seg, 0)
+            war = inside & at_war[seg]
+            p = peak[seg]
+            with np.errstate(invalid="ignore"):
+                scaled = np.minimum(1.0, np.log10(p + 1) / 6.0)
+            out[i] = np.where(war, np.where(p > 0, scaled, 0.3), 0.0)
+        return out
+
+
+class SpellIndex:
+    """GSDB sanctions episodes per target and per sender country."""
+
+    ROLE_COLUMNS = {"target": "target_country", "sender": "sender_country"}
+
+    def __init__(self, df: pd.DataFrame):
+        if "start_year" in df.columns and "end_year" in df.columns:
+            self.mode = "spell"
+            start = _numeric(df, "start_year")
+            # Open-ended episodes are still active
+            end = np.nan_to_num(_numeric(df, "end_year"), nan=np.inf)
+        elif "year" in df.columns:
+            self.mode = "year"
+            year = _numeric(df, "year")
+        else:
+            self.mode = "all"
+
+        # role -> key -> sorted arrays (starts, ends) / (years,) / (rows,)
+        self._roles: Dict[str, Dict[str, Tuple[np.ndarray, ...]]] = {}
+        for role, col in self.ROLE_COLUMNS.items():
+            if col not in df.columns:
+                continue
+            groups: Dict[str, Tuple[np.ndarray, ...]] = {}
+            for key, rows in group_rows(df, (col,)).items():
+                if self.mode == "spell":
+                    ok = ~np.isnan(start[rows]) & (end[rows] >= start[rows])
+                    groups[key] = (np.sort(start[rows][ok]), np.sort(end[rows][ok]))
+                elif self.mode == "year":
+                    groups[key] = (np.sort(year[rows]),)
+                else:
+                    groups[key] = (rows,)
+            self._roles[role] = groups
+
+    def counts(
+        self, codes: Sequence[str], years, role: str = "target",
+    ) -> np.ndarray:
+        """Episodes active in each year (int array)."""
+        codes, years = _grid(codes, years)
+        out = np.zeros((len(codes), len(years)), dtype=np.int64)
+        groups = self._roles.get("target" if role == "target" else "sender")
+        if groups is None:
+            return out
+        for i, code in enumerate(codes):
+            group = groups.get(code.upper())
+            if group is None:
+                continue
+            if self.mode == "spell":
+                starts, ends = group
+                out[i] = (
+                    np.searchsorted(starts, years, side="right")
+                    - np.searchsorted(ends, years, side="left")
+                )
+            elif self.mode == "year":
+                (event_years,) = group
+                out[i] = (
+                    np.searchsorted(event_years, years, side="right")
+                    - np.searchsorted(event_years, years, side="left")
+                )
+            else:
+                out[i] = len(group[0])
+        return out
+
+
+class EventIndexCache:
+    """Process-wide table of event indexes, rebuilt when a source changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # name -> ((path, mtime_ns, size), index or None)
+        self._open: Dict[str, Tuple[Tuple[str, int, int], Any]] = {}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._open.clear()
+
+    def get(
+        self,
+        name: str,
+        source: Path,
+        load: Callable[[], Optional[pd.DataFrame]],
+        build: Callable[[pd.DataFrame], Any],
+    ) -> Any:
+        """
+        Index of ``source``, loading and building it if needed.
+
+        Args:
+            name: Cache key for the source
+            source: Source file
+            load: Loader returning the parsed table (None on failure)
+            build: Builds the index from the table
+
+        Returns:
+            Index, or None if the source is missing or unusable
+        """
+        if not source.exists():
+            return load()  # None; the loader reports the missing file
+        st = source.stat()
+        signature = (str(source), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._open.get(name)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            df = load()
+            try:
+                index = None if df is None else build(df)
+            except Exception as e:
+                logger.error("Event index %s from %s failed: %s", name, source, e)
+                index = None
+            self._open[name] = (signature, index)
+            return index
+
+
+# Shared by every lookup in the process
+EVENT_INDEXES = EventIndexCache()
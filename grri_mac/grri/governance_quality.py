@@ -550,6 +550,19 @@ def proxy_governance_effectiveness(
     return sum(c * w / total_w for c, w in zip(components, weights))
 
 
+# Regime-type baseline for the political stability proxy
+POLITICAL_STABILITY_BASELINES = {
+    RegimeType.FULL_DEMOCRACY: 0.80,
+    RegimeType.DEMOCRACY: 0.65,
+    RegimeType.OPEN_ANOCRACY: 0.25,
+    RegimeType.CLOSED_ANOCRACY: 0.35,
+    RegimeType.CONSOLIDATED_AUTOCRACY: 0.60,
+    RegimeType.FULL_AUTOCRACY: 0.45,
+    RegimeType.FAILED_OCCUPIED: 0.05,
+    RegimeType.UNKNOWN: 0.40,
+}
+
+
 def proxy_political_stability(
     country_code: str,
     year: int,
@@ -571,19 +584,7 @@ def proxy_political_stability(
     Returns:
         0–1 score (1 = very stable, 0 = actively destabilised).
     """
-    # Regime-type baseline for political stability
-    regime_baselines = {
-        RegimeType.FULL_DEMOCRACY: 0.80,
-        RegimeType.DEMOCRACY: 0.65,
-        RegimeType.OPEN_ANOCRACY: 0.25,
-        RegimeType.CLOSED_ANOCRACY: 0.35,
-        RegimeType.CONSOLIDATED_AUTOCRACY: 0.60,
-        RegimeType.FULL_AUTOCRACY: 0.45,
-        RegimeType.FAILED_OCCUPIED: 0.05,
-        RegimeType.UNKNOWN: 0.40,
-    }
-
-    score = regime_baselines.get(regime_type, 0.40)
+    score = POLITICAL_STABILITY_BASELINES.get(regime_type, 0.40)
 
     # Conflict penalty
     if conflict_intensity is not None and conflict_intensity > 0:
@@ -37,6 +37,22 @@ from typing import Any, Dict, List, Optional
 import numpy as np
 import pandas as pd
 
+from .event_index import (
+    EVENT_INDEXES,
+    ConflictIndex,
+    CrisisIndex,
+    DisasterIndex,
+    SpellIndex,
+)
+from .panel_cache import (
+    PANELS,
+    Panel,
+    PanelSpec,
+    integer_key,
+    upper_str,
+    upper_text,
+)
+
 logger = logging.getLogger(__name__)
 
 # Base directory for GRRI historical data files
@@ -47,6 +63,14 @@ GRRI_HISTORICAL_DIR = (
 # Also re-use data already fetched for MAC
 MAC_HISTORICAL_DIR = Path(__file__).parent.parent.parent / "data" / "historical"
 
+# Per-source (country, year) panels built by panel_cache, under the data dir
+PANEL_CACHE_DIRNAME = "_panels"
+
+
+def _panel(spec: PanelSpec, source: Optional[Path]) -> Optional[Panel]:
+    """Shared panel for a source file (built on first use)."""
+    return PANELS.get(spec, source, GRRI_HISTORICAL_DIR / PANEL_CACHE_DIRNAME)
+
 
 # =============================================================================
 # Polity5 Project — Centre for Systemic Peace
@@ -83,34 +107,17 @@ def load_polity5(country_code: Optional[str] = None) -> Optional[pd.DataFrame]:
     Returns:
         DataFrame indexed by (country, year) with polity scores.
     """
-    polity_dir = GRRI_HISTORICAL_DIR / "polity5"
-    csv_path = polity_dir / "p5v2018.csv"
-    xls_path = polity_dir / "p5v2018.xls"
-
-    if csv_path.exists():
-        filepath = csv_path
-    elif xls_path.exists():
-        filepath = xls_path
-    else:
-        logger.warning(f"Polity5 data not found in {polity_dir}")
+    filepath = _polity5_path()
+    if filepath is None:
         return None
 
     try:
-        if filepath.suffix == ".xls":
-            df = pd.read_excel(filepath)
-        else:
-            df = pd.read_csv(filepath, encoding="latin-1")
-
-        # Standardise column names
-        df.columns = [c.strip().lower() for c in df.columns]
-
-        # Filter to numeric polity2 (drop special codes: -66, -77, -88)
-        if "polity2" in df.columns:
-            df = df[~df["polity2"].isin([-66, -77, -88])]
+        df = _read_polity5(filepath)
 
         if country_code is not None:
-            # Try matching on scode (3-letter) or country name
-            mask = pd.Series([False] * len(df))
+            # Try matching on scode (3-letter) or country name.  The
+            # mask shares df's index: special-code rows are already gone
+            mask = pd.Series(False, index=df.index)
             if "scode" in df.columns:
                 mask |= df["scode"].str.upper() == country_code.upper()
             if "country" in df.columns:
@@ -128,16 +135,56 @@ def load_polity5(country_code: Optional[str] = None) -> Optional[pd.DataFrame]:
         return None
 
 
-def get_polity2_series(country_code: str) -> Optional[pd.Series]:
-    """Get annual Polity2 score for a country (−10 to +10)."""
-    df = load_polity5(country_code)
-    if df is not None and "polity2" in df.columns and "year" in df.columns:
-        dates = [datetime(int(y), 7, 1) for y in df["year"]]
-        series = pd.Series(df["polity2"].values, index=dates, dtype=float)
-        return series.dropna().sort_index()
+def _polity5_path() -> Optional[Path]:
+    polity_dir = GRRI_HISTORICAL_DIR / "polity5"
+    for filepath in (polity_dir / "p5v2018.csv", polity_dir / "p5v2018.xls"):
+        if filepath.exists():
+            return filepath
+    logger.warning(f"Polity5 data not found in {polity_dir}")
     return None
 
 
+def _read_polity5(filepath: Path) -> pd.DataFrame:
+    """Parse the Polity5 file, dropping the special polity2 codes."""
+    if filepath.suffix == ".xls":
+        df = pd.read_excel(filepath)
+    else:
+        df = pd.read_csv(filepath, encoding="latin-1")
+
+    # Standardise column names
+    df.columns = [c.strip().lower() for c in df.columns]
+
+    # Filter to numeric polity2 (drop special codes: -66, -77, -88)
+    if "polity2" in df.columns:
+        df = df[~df["polity2"].isin([-66, -77, -88])]
+    return df
+
+
+POLITY5_PANEL = PanelSpec(
+    name="polity5",
+    load=_read_polity5,
+    key_columns={"scode": upper_text, "country": upper_text,
+                 "ccode": integer_key},
+    value_columns=lambda cols: [c for c in ("polity2",) if c in cols],
+)
+
+
+def get_polity2_series(country_code: str) -> Optional[pd.Series]:
+    """Get annual Polity2 score for a country (−10 to +10).
+
+    Matches ``country_code`` against the Polity letter code, country
+    name or (if numeric) the Polity country number, like load_polity5.
+    """
+    panel = _panel(POLITY5_PANEL, _polity5_path())
+    if panel is None or "polity2" not in panel.columns:
+        return None
+    code = country_code.upper()
+    rows = np.union1d(panel.rows("scode", code), panel.rows("country", code))
+    if country_code.isdigit():
+        rows = np.union1d(rows, panel.rows("ccode", str(int(country_code))))
+    return panel.annual_series("polity2", rows)
+
+
 # =============================================================================
 # V-Dem (Varieties of Democracy) — University of Gothenburg
 # Multiple democracy indices on continuous 0–1 scales from 1789
@@ -179,19 +226,15 @@ def load_vdem(
     Returns:
         DataFrame with MultiIndex (country, year) and indicator columns.
     """
-    vdem_dir = GRRI_HISTORICAL_DIR / "vdem"
-    filepath = vdem_dir / "vdem_core.csv"
-
-    if not filepath.exists():
-        logger.warning(f"V-Dem data not found at {filepath}")
+    filepath = _vdem_path()
+    if filepath is None:
         return None
 
     try:
-        df = pd.read_csv(filepath, low_memory=False)
-        df.columns = [c.strip().lower() for c in df.columns]
+        df = _read_vdem(filepath)
 
         if country_code is not None:
-            for col in ("country_text_id", "country_id", "country_name"):
+            for col in VDEM_COUNTRY_COLUMNS:
                 if col in df.columns:
                     mask = df[col].astype(str).str.upper() == country_code.upper()
                     if mask.any():
@@ -212,17 +255,56 @@ def load_vdem(
         return None
 
 
+def _vdem_path() -> Optional[Path]:
+    filepath = GRRI_HISTORICAL_DIR / "vdem" / "vdem_core.csv"
+    if not filepath.exists():
+        logger.warning(f"V-Dem data not found at {filepath}")
+        return None
+    return filepath
+
+
+def _read_vdem(filepath: Path) -> pd.DataFrame:
+    df = pd.read_csv(filepath, low_memory=False)
+    df.columns = [c.strip().lower() for c in df.columns]
+    return df
+
+
+# Country identifiers tried in order when filtering V-Dem
+VDEM_COUNTRY_COLUMNS = ("country_text_id", "country_id", "country_name")
+
+VDEM_PANEL = PanelSpec(
+    name="vdem",
+    load=_read_vdem,
+    key_columns={col: upper_str for col in VDEM_COUNTRY_COLUMNS},
+    value_columns=lambda cols: [c for c in VDEM_INDICATORS if c in cols],
+)
+
+
 def get_vdem_series(
     country_code: str,
     indicator: str = "v2x_polyarchy",
 ) -> Optional[pd.Series]:
     """Get annual V-Dem score for a country on a specific indicator."""
-    df = load_vdem(indicators=[indicator], country_code=country_code)
-    if df is not None and indicator in df.columns and "year" in df.columns:
-        dates = [datetime(int(y), 7, 1) for y in df["year"]]
-        series = pd.Series(df[indicator].values, index=dates, dtype=float)
-        return series.dropna().sort_index()
-    return None
+    if indicator not in VDEM_INDICATORS:
+        # Not kept in the panel: read the file directly
+        df = load_vdem(indicators=[indicator], country_code=country_code)
+        if df is not None and indicator in df.columns and "year" in df.columns:
+            dates = [datetime(int(y), 7, 1) for y in df["year"]]
+            series = pd.Series(df[indicator].values, index=dates, dtype=float)
+            return series.dropna().sort_index()
+        return None
+
+    panel = _panel(VDEM_PANEL, _vdem_path())
+    if panel is None or indicator not in panel.columns:
+        return None
+    code = country_code.upper()
+    for col in VDEM_COUNTRY_COLUMNS:
+        rows = panel.rows(col, code)
+        if len(rows):
+            break
+    else:
+        rows = panel.all_rows()  # load_vdem leaves the frame unfiltered
+    return panel.annual_series(indicator, rows)
 
 
 # =============================================================================
@@ -232,6 +314,13 @@ def get_vdem_series(
 # Coverage: 1816–present
 # =============================================================================
 
+COW_KEY_COLUMNS = ("ccode", "state_participant", "statea")
+
+
+def _cow_path() -> Path:
+    return GRRI_HISTORICAL_DIR / "cow" / "wars.csv"
+
+
 def load_cow_wars() -> Optional[pd.DataFrame]:
     """
     Load Correlates of War interstate/civil war dataset.
@@ -242,8 +331,7 @@ def load_cow_wars() -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with war participation records.
     """
-    cow_dir = GRRI_HISTORICAL_DIR / "cow"
-    filepath = cow_dir / "wars.csv"
+    filepath = _cow_path()
 
     if not filepath.exists():
         logger.warning(f"COW wars data not found at {filepath}")
@@ -259,6 +347,14 @@ def load_cow_wars() -> Optional[pd.DataFrame]:
         return None
 
 
+def cow_index() -> Optional[ConflictIndex]:
+    """Shared per-country index of the COW wars table."""
+    return EVENT_INDEXES.get(
+        "cow", _cow_path(), load_cow_wars,
+        lambda df: ConflictIndex(df, COW_KEY_COLUMNS),
+    )
+
+
 def get_conflict_intensity(country_code: str, year: int) -> Optional[float]:
     """
     Get a 0–1 conflict intensity score from COW data.
@@ -269,35 +365,10 @@ def get_conflict_intensity(country_code: str, year: int) -> Optional[float]:
 
     Uses logarithmic scaling of battle deaths relative to population.
     """
-    df = load_cow_wars()
-    if df is None:
+    index = cow_index()
+    if index is None:
         return None
-
-    # Filter to country and year
-    mask = pd.Series([False] * len(df))
-    for col in ("ccode", "state_participant", "statea"):
-        if col in df.columns:
-            mask |= df[col].astype(str).str.upper() == country_code.upper()
-
-    year_mask = pd.Series([False] * len(df))
-    for col in ("year", "startyear1"):
-        if col in df.columns:
-            year_mask |= df[col] == year
-    # Also capture multi-year wars
-    if "startyear1" in df.columns and "endyear1" in df.columns:
-        year_mask |= (df["startyear1"] <= year) & (df["endyear1"] >= year)
-
-    filtered = df[mask & year_mask]
-    if filtered.empty:
-        return 0.0
-
-    # Log-scale battle deaths for intensity
-    if "batdeath" in filtered.columns:
-        max_deaths = filtered["batdeath"].max()
-        if pd.notna(max_deaths) and max_deaths > 0:
-            return min(1.0, np.log10(max_deaths + 1) / 6.0)  # 1M deaths → 1.0
-
-    return 0.3  # Default: active participation but unknown intensity
+    return float(index.intensity([country_code], [year])[0, 0])
 
 
 # =============================================================================
@@ -320,23 +391,12 @@ def load_maddison_gdp() -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with country-year GDP per capita and population.
     """
-    maddison_dir = GRRI_HISTORICAL_DIR / "maddison"
-
-    for fname in ("mpd2020.csv", "mpd2020.xlsx"):
-        filepath = maddison_dir / fname
-        if filepath.exists():
-            break
-    else:
-        logger.warning(f"Maddison data not found in {maddison_dir}")
+    filepath = _maddison_path()
+    if filepath is None:
         return None
 
     try:
-        if filepath.suffix == ".xlsx":
-            df = pd.read_excel(filepath, sheet_name="Full data")
-        else:
-            df = pd.read_csv(filepath)
-
-        df.columns = [c.strip().lower() for c in df.columns]
+        df = _read_maddison(filepath)
         logger.info(f"Loaded Maddison: {len(df)} obs, "
                      f"{df['year'].min()}-{df['year'].max()}")
         return df
@@ -345,25 +405,50 @@ def load_maddison_gdp() -> Optional[pd.DataFrame]:
         return None
 
 
+def _maddison_path() -> Optional[Path]:
+    maddison_dir = GRRI_HISTORICAL_DIR / "maddison"
+    for fname in ("mpd2020.csv", "mpd2020.xlsx"):
+        filepath = maddison_dir / fname
+        if filepath.exists():
+            return filepath
+    logger.warning(f"Maddison data not found in {maddison_dir}")
+    return None
+
+
+def _read_maddison(filepath: Path) -> pd.DataFrame:
+    if filepath.suffix == ".xlsx":
+        df = pd.read_excel(filepath, sheet_name="Full data")
+    else:
+        df = pd.read_csv(filepath)
+    df.columns = [c.strip().lower() for c in df.columns]
+    return df
+
+
+MADDISON_GDP_COLUMNS = ("gdppc", "cgdppc", "rgdpnapc")
+
+MADDISON_PANEL = PanelSpec(
+    name="maddison",
+    load=_read_maddison,
+    key_columns={"countrycode": upper_str, "country": upper_str},
+    # Only the first GDP column present is ever read
+    value_columns=lambda cols: [
+        c for c in MADDISON_GDP_COLUMNS if c in cols
+    ][:1],
+)
+
+
 def get_maddison_gdppc(country_code: str) -> Optional[pd.Series]:
     """Get annual GDP per capita series for a country (2011 int'l $)."""
-    df = load_maddison_gdp()
-    if df is None:
+    panel = _panel(MADDISON_PANEL, _maddison_path())
+    if panel is None or not panel.columns:
         return None
-
-    mask = pd.Series([False] * len(df))
-    for col in ("countrycode", "country"):
-        if col in df.columns:
-            mask |= df[col].astype(str).str.upper() == country_code.upper()
-
-    filtered = df[mask]
-    gdp_col = next((c for c in ("gdppc", "cgdppc", "rgdpnapc") if c in filtered.columns), None)
-    if gdp_col is None or filtered.empty:
+    code = country_code.upper()
+    rows = np.union1d(
+        panel.rows("countrycode", code), panel.rows("country", code),
+    )
+    if len(rows) == 0:
         return None
-
-    dates = [datetime(int(y), 7, 1) for y in filtered["year"]]
-    series = pd.Series(filtered[gdp_col].values, index=dates, dtype=float)
-    return series.dropna().sort_index()
+    return panel.annual_series(panel.columns[0], rows)
 
 
 # =============================================================================
@@ -384,6 +469,13 @@ REINHART_ROGOFF_CRISIS_TYPES = {
 }
 
 
+RR_KEY_COLUMNS = ("country", "countrycode")
+
+
+def _reinhart_rogoff_path() -> Path:
+    return GRRI_HISTORICAL_DIR / "reinhart_rogoff" / "crises.csv"
+
+
 def load_reinhart_rogoff() -> Optional[pd.DataFrame]:
     """
     Load Reinhart-Rogoff crisis indicator panel.
@@ -395,8 +487,7 @@ def load_reinhart_rogoff() -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with country-year crisis indicators (0/1 dummies).
     """
-    rr_dir = GRRI_HISTORICAL_DIR / "reinhart_rogoff"
-    filepath = rr_dir / "crises.csv"
+    filepath = _reinhart_rogoff_path()
 
     if not filepath.exists():
         logger.warning(f"Reinhart-Rogoff data not found at {filepath}")
@@ -412,6 +503,14 @@ def load_reinhart_rogoff() -> Optional[pd.DataFrame]:
         return None
 
 
+def crisis_index() -> Optional[CrisisIndex]:
+    """Shared per-country index of the Reinhart-Rogoff table."""
+    return EVENT_INDEXES.get(
+        "reinhart_rogoff", _reinhart_rogoff_path(), load_reinhart_rogoff,
+        lambda df: CrisisIndex(df, RR_KEY_COLUMNS, REINHART_ROGOFF_CRISIS_TYPES),
+    )
+
+
 def get_crisis_count(country_code: str, year: int, window: int = 5) -> int:
     """
     Count number of active crises for a country in 'year' ± 'window'.
@@ -423,24 +522,10 @@ def get_crisis_count(country_code: str, year: int, window: int = 5) -> int:
     Returns:
         Total crisis-type-years in the window. 0 = no crises.
     """
-    df = load_reinhart_rogoff()
-    if df is None:
+    index = crisis_index()
+    if index is None:
         return 0
-
-    mask = pd.Series([False] * len(df))
-    for col in ("country", "countrycode"):
-        if col in df.columns:
-            mask |= df[col].astype(str).str.upper() == country_code.upper()
-
-    if "year" in df.columns:
-        mask &= (df["year"] >= year - window) & (df["year"] <= year + window)
-
-    filtered = df[mask]
-    if filtered.empty:
-        return 0
-
-    crisis_cols = [c for c in REINHART_ROGOFF_CRISIS_TYPES if c in filtered.columns]
-    return int(filtered[crisis_cols].sum().sum())
+    return int(index.counts([country_code], [year], window)[0, 0])
 
 
 # =============================================================================
@@ -450,6 +535,13 @@ def get_crisis_count(country_code: str, year: int, window: int = 5) -> int:
 # Coverage: 1900–present, global
 # =============================================================================
 
+EMDAT_KEY_COLUMNS = ("iso", "country")
+
+
+def _emdat_path() -> Path:
+    return GRRI_HISTORICAL_DIR / "emdat" / "emdat_public.csv"
+
+
 def load_emdat() -> Optional[pd.DataFrame]:
     """
     Load EM-DAT disaster records.
@@ -461,8 +553,7 @@ def load_emdat() -> Optional[pd.DataFrame]:
     Returns:
         DataFrame of disaster events.
     """
-    emdat_dir = GRRI_HISTORICAL_DIR / "emdat"
-    filepath = emdat_dir / "emdat_public.csv"
+    filepath = _emdat_path()
 
     if not filepath.exists():
         logger.warning(f"EM-DAT data not found at {filepath}")
@@ -478,6 +569,14 @@ def load_emdat() -> Optional[pd.DataFrame]:
         return None
 
 
+def emdat_index() -> Optional[DisasterIndex]:
+    """Shared per-country index of the EM-DAT table."""
+    return EVENT_INDEXES.get(
+        "emdat", _emdat_path(), load_emdat,
+        lambda df: DisasterIndex(df, EMDAT_KEY_COLUMNS),
+    )
+
+
 def get_disaster_severity(
     country_code: str,
     year: int,
@@ -492,36 +591,10 @@ def get_disaster_severity(
     Returns:
         0.0 (no/minor disasters) to 1.0 (catastrophic).
     """
-    df = load_emdat()
-    if df is None:
+    index = emdat_index()
+    if index is None:
         return None
-
-    mask = pd.Series([False] * len(df))
-    for col in ("iso", "country"):
-        if col in df.columns:
-            mask |= df[col].astype(str).str.upper() == country_code.upper()
-
-    year_col = next((c for c in ("year", "start_year") if c in df.columns), None)
-    if year_col:
-        mask &= (df[year_col] >= year - window) & (df[year_col] <= year)
-
-    filtered = df[mask]
-    if filtered.empty:
-        return 0.0
-
-    death_col = next(
-        (c for c in ("total_deaths", "deaths", "no_killed") if c in filtered.columns),
-        None,
-    )
-    if death_col is None:
-        return min(1.0, len(filtered) / 50.0)  # Fallback: event count
-
-    total_deaths = pd.to_numeric(filtered[death_col], errors="coerce").sum()
-    if pd.isna(total_deaths) or total_deaths <= 0:
-        return min(1.0, len(filtered) / 50.0)
-
-    # Log-scale: 10 deaths → 0.17, 1000 → 0.5, 100000 → 0.83
-    return min(1.0, np.log10(total_deaths + 1) / 6.0)
+    return float(index.severity([country_code], [year], window)[0, 0])
 
 
 # =============================================================================
@@ -693,6 +766,10 @@ def get_cbi_score(country_code: str, year: int) -> Optional[float]:
 # Coverage: 1950–2022
 # =============================================================================
 
+def _gsdb_path() -> Path:
+    return GRRI_HISTORICAL_DIR / "gsdb" / "sanctions.csv"
+
+
 def load_sanctions_database() -> Optional[pd.DataFrame]:
     """
     Load GSDB sanctions episodes.
@@ -704,8 +781,7 @@ def load_sanctions_database() -> Optional[pd.DataFrame]:
     Returns:
         DataFrame of sanctions episodes.
     """
-    gsdb_dir = GRRI_HISTORICAL_DIR / "gsdb"
-    filepath = gsdb_dir / "sanctions.csv"
+    filepath = _gsdb_path()
 
     if not filepath.exists():
         logger.warning(f"GSDB sanctions data not found at {filepath}")
@@ -721,6 +797,13 @@ def load_sanctions_database() -> Optional[pd.DataFrame]:
         return None
 
 
+def sanctions_index() -> Optional[SpellIndex]:
+    """Shared per-country index of the GSDB sanctions episodes."""
+    return EVENT_INDEXES.get(
+        "gsdb", _gsdb_path(), load_sanctions_database, SpellIndex,
+    )
+
+
 def get_sanctions_count(
     country_code: str, year: int, role: str = "target"
 ) -> int:
@@ -735,23 +818,10 @@ def get_sanctions_count(
     Returns:
         Number of active sanctions episodes.
     """
-    df = load_sanctions_database()
-    if df is None:
+    index = sanctions_index()
+    if index is None:
         return 0
-
-    col = "target_country" if role == "target" else "sender_country"
-    if col not in df.columns:
-        return 0
-
-    mask = df[col].astype(str).str.upper() == country_code.upper()
-    if "start_year" in df.columns and "end_year" in df.columns:
-        mask &= (df["start_year"] <= year) & (
-            df["end_year"].fillna(year + 1) >= year
-        )
-    elif "year" in df.columns:
-        mask &= df["year"] == year
-
-    return int(mask.sum())
+    return int(index.counts([country_code], [year], role)[0, 0])
 
 
 # =============================================================================
@@ -1534,6 +1604,31 @@ class GRRIHistoricalProvider:
         )
         return df
 
+    def get_historical_grri_panel(
+        self,
+        countries: List[str],
+        start_year: int = 1870,
+        end_year: int = 2020,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> pd.DataFrame:
+        """
+        Compute GRRI for a whole country × year grid in one vectorised pass.
+
+        Same scores as ``get_historical_grri_timeseries`` run per country
+        on a fresh provider, but each source is aligned onto the grid once
+        and the pillars are computed as columns.  See
+        ``grri_mac.grri.panel_engine``.
+
+        Returns:
+            Tidy DataFrame with columns: country, year, resilience,
+            modifier, political, economic, social, environmental,
+            regime_type, momentum_status, governance_effectiveness and
+            provenance (``GRRIProvenance`` bitmask).
+        """
+        from grri_mac.grri.panel_engine import GRRIPanelEngine
+
+        return GRRIPanelEngine(self).run(countries, start_year, end_year, weights)
+
     # ── Data Availability Report ──────────────────────────────────────────
 
     def get_data_availability_summary(self) -> Dict[str, Dict[str, Any]]:
@@ -1739,7 +1834,7 @@ class GRRIHistoricalProvider:
                 sources.append("WGI (1996+)")
             # COW is loaded globally
             try:
-                if load_cow_wars() is not None:
+                if cow_index() is not None:
                     sources.append("COW wars (1816+)")
             except Exception:
                 pass
@@ -1747,7 +1842,7 @@ class GRRIHistoricalProvider:
         elif pillar == "economic":
             if f"maddison_{country_code}" in self._cache:
                 sources.append("Maddison Project GDP (1820+)")
-            if load_reinhart_rogoff() is not None:
+            if crisis_index() is not None:
                 sources.append("Reinhart-Rogoff crises (1800+)")
             if load_cbi_index() is not None:
                 sources.append("Garriga CBI (1970-2017)")
@@ -1763,7 +1858,7 @@ class GRRIHistoricalProvider:
         elif pillar == "environmental":
             if "hadcrut" in self._cache:
                 sources.append("HadCRUT5 temp anomaly (1850+)")
-            if load_emdat() is not None:
+            if emdat_index() is not None:
                 sources.append("EM-DAT disasters (1900+)")
 
         return sources
@@ -0,0 +1,299 @@
+"""Columnar (country, year) panel cache for GRRI historical sources.
+
+``get_polity2_series``, ``get_vdem_series`` and ``get_maddison_gdppc``
+used to re-read the whole CSV/Excel file for every country they were
+asked about.  Each source is now converted once into a panel directory
+holding only the columns those lookups need::
+
+    data/historical/grri/_panels/vdem/
+        manifest.json              — source signature, columns, key index
+        3f2a9c.../year.npy         — int64 observation year per row
+        3f2a9c.../v2x_rule.npy     — float64 values (NaN preserved)
+        3f2a9c.../keys.npy         — row positions grouped by lookup key
+
+Rows keep the source file's order.  For every key column (ISO code,
+country name, …) the manifest maps each normalised key to a slice of
+``keys.npy`` listing that country's rows, so a lookup is a dict hit
+plus a gather instead of a string scan over the whole file.
+
+Arrays are opened with ``np.load(mmap_mode="r")`` and kept in a
+process-wide table, so every provider in a process shares one copy and
+parallel workers share the OS page cache.  A panel is rebuilt when the
+source file's size or modification time changes *and* its SHA-256 no
+longer matches; a touched but identical file only refreshes the
+manifest.  Each build writes a new content-named directory and swaps
+the manifest last, so readers never see a half-written panel.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+# Bump when the on-disk layout changes
+PANEL_FORMAT_VERSION = 1
+
+# Maps a raw key column to normalised string keys (NaN = no key)
+KeyNormaliser = Callable[[pd.Series], pd.Series]
+
+
+def upper_str(column: pd.Series) -> pd.Series:
+    """``astype(str).str.upper()`` — the loaders' usual matching rule."""
+    return column.astype(str).str.upper()
+
+
+def upper_text(column: pd.Series) -> pd.Series:
+    """``.str.upper()`` without coercion, so missing names never match."""
+    return column.str.upper()
+
+
+def integer_key(column: pd.Series) -> pd.Series:
+    """Integral numeric codes as ``"123"``; anything else has no key."""
+    values = pd.to_numeric(column, errors="coerce")
+    integral = values.notna() & (values == values.round())
+    keys = pd.Series(np.nan, index=column.index, dtype=object)
+    keys[integral] = values[integral].astype(np.int64).astype(str)
+    return keys
+
+
+def file_sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class PanelSpec:
+    """How to turn one source file into a panel."""
+
+    name: str
+    # Parsed frame with lower-case columns (None = unusable)
+    load: Callable[[Path], Optional[pd.DataFrame]]
+    key_columns: Dict[str, KeyNormaliser]
+    # Value columns to keep, chosen from the parsed frame's columns
+    value_columns: Callable[[Sequence[str]], List[str]]
+
+
+class Panel:
+    """Memory-mapped (country, year) panel for one source file."""
+
+    def __init__(self, directory: Path, manifest: dict):
+        self.directory = directory
+        self.columns: List[str] = manifest["columns"]
+        self.key_columns: List[str] = list(manifest["keys"])
+        self._keys: Dict[str, Dict[str, List[int]]] = manifest["keys"]
+        self.year = np.load(directory / "year.npy", mmap_mode="r")
+        self._key_rows = np.load(directory / "keys.npy", mmap_mode="r")
+        self._values = {
+            col: np.load(directory / f"{col}.npy", mmap_mode="r")
+            for col in self.columns
+        }
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+    def rows(self, key_column: str, key: str) -> np.ndarray:
+        """Row positions whose ``key_column`` normalises to ``key``."""
+        span = self._keys.get(key_column, {}).get(key)
+        if span is None:
+            return np.empty(0, dtype=np.int64)
+        return np.asarray(self._key_rows[span[0]:span[1]])
+
+    def all_rows(self) -> np.ndarray:
+        return np.arange(len(self), dtype=np.int64)
+
+    def annual_series(self, column: str, rows: np.ndarray) -> pd.Series:
+        """Values at ``rows`` dated 1 July of each year, as the loaders did."""
+        dates = [datetime(int(y), 7, 1) for y in self.year[rows]]
+        series = pd.Series(self._values[column][rows], index=dates, dtype=float)
+        return series.dropna().sort_index()
+
+
+def _build(spec: PanelSpec, source: Path, directory: Path) -> Optional[dict]:
+    """Parse ``source`` and write a panel into ``directory``."""
+    df = spec.load(source)
+    if df is None or "year" not in df.columns:
+        return None
+    years = pd.to_numeric(df["year"], errors="coerce")
+    df = df[years.notna()]
+    columns = spec.value_columns(list(df.columns))
+
+    directory.mkdir(parents=True)
+    np.save(directory / "year.npy", years[years.notna()].to_numpy(np.int64))
+    for col in columns:
+        values = pd.to_numeric(df[col], errors="coerce").to_numpy(np.float64)
+        np.save(directory / f"{col}.npy", values)
+
+    positions = np.arange(len(df), dtype=np.int64)
+    keys: Dict[str, Dict[str, List[int]]] = {}
+    chunks: List[np.ndarray] = []
+    offset = 0
+    for col, normalise in spec.key_columns.items():
+        if col not in df.columns:
+            continue
+        codes = normalise(df[col]).to_numpy(dtype=object)
+        present = pd.notna(codes)
+        spans: Dict[str, List[int]] = {}
+        # Stable grouping keeps each key's rows in file order
+        groups = pd.Series(positions[present]).groupby(
+            codes[present], sort=False,
+        )
+        for key, members in groups:
+            rows = members.to_numpy(np.int64)
+            spans[str(key)] = [offset, offset + len(rows)]
+            chunks.append(rows)
+            offset += len(rows)
+        keys[col] = spans
+    np.save(
+        directory / "keys.npy",
+        np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64),
+    )
+    return {"columns": columns, "keys": keys, "rows": len(df)}
+
+
+class PanelCache:
+    """Process-wide table of panels, validated against their sources."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # name -> ((path, mtime_ns, size), panel or None)
+        self._open: Dict[str, Tuple[Tuple[str, int, int], Optional[Panel]]] = {}
+
+    def clear(self) -> None:
+        """Forget opened panels (files on disk are kept)."""
+        with self._lock:
+            self._open.clear()
+
+    def get(
+        self,
+        spec: PanelSpec,
+        source: Optional[Path],
+        cache_root: Path,
+    ) -> Optional[Panel]:
+        """
+        Panel for ``source``, building or refreshing it if needed.
+
+        Args:
+            spec: Source description
+            source: Source file (None if missing)
+            cache_root: Directory holding one sub-directory per panel
+
+        Returns:
+            Panel, or None if the source is missing or unusable
+        """
+        if source is None:
+            return None
+        st = source.stat()
+        signature = (str(source), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._open.get(spec.name)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            try:
+                panel = self._load_or_build(
+                    spec, source, signature, cache_root / spec.name,
+                )
+            except Exception as e:
+                logger.error("Panel %s from %s failed: %s", spec.name, source, e)
+                panel = None
+            self._open[spec.name] = (signature, panel)
+            return panel
+
+    def _load_or_build(
+        self,
+        spec: PanelSpec,
+        source: Path,
+        signature: Tuple[str, int, int],
+        root: Path,
+    ) -> Optional[Panel]:
+        manifest_path = root / MANIFEST_NAME
+        manifest: dict = {}
+        if manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except (OSError, ValueError):
+                manifest = {}
+        path, mtime_ns, size = signature
+
+        fresh = (
+            manifest.get("version") == PANEL_FORMAT_VERSION
+            and manifest.get("source") == path
+            and manifest.get("size") == size
+        )
+        if fresh and manifest.get("mtime_ns") != mtime_ns:
+            # Touched: only a content change forces a rebuild
+            fresh = manifest.get("sha256") == file_sha256(source)
+            if fresh:
+                manifest["mtime_ns"] = mtime_ns
+                self._write_manifest(manifest_path, manifest)
+        if fresh:
+            if manifest.get("dir") is None:
+                return None  # source known to be unusable
+            return Panel(root / manifest["dir"], manifest)
+
+        sha = file_sha256(source)
+        root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=root, prefix=".build-"))
+        shutil.rmtree(staging)
+        logger.info("Building %s panel from %s", spec.name, source)
+        built = _build(spec, source, staging)
+
+        manifest = {
+            "version": PANEL_FORMAT_VERSION,
+            "source": path,
+            "mtime_ns": mtime_ns,
+            "size": size,
+            "sha256": sha,
+            "dir": None,
+        }
+        if built is not None:
+            target = root / sha[:16]
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Another process built the same content first
+                shutil.rmtree(staging, ignore_errors=True)
+            manifest.update(built, dir=target.name)
+        old_dir = self._previous_dir(manifest_path)
+        self._write_manifest(manifest_path, manifest)
+        if old_dir and old_dir != manifest["dir"]:
+            # Open memory maps keep their (now unlinked) files alive
+            shutil.rmtree(root / old_dir, ignore_errors=True)
+        if built is None:
+            return None
+        return Panel(root / manifest["dir"], manifest)
+
+    @staticmethod
+    def _previous_dir(manifest_path: Path) -> Optional[str]:
+        try:
+            return json.loads(manifest_path.read_text()).get("dir")
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_manifest(path: Path, manifest: dict) -> None:
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, path)
+
+
+# Shared by every GRRIHistoricalProvider in the process
+PANELS = PanelCache()
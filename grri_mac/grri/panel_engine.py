@@ -0,0 +1,682 @@
+"""Vectorised GRRI computation over a whole country × year panel.
+
+``GRRIHistoricalProvider.get_historical_grri_timeseries`` scores one
+country-year at a time: every input goes through ``_lookup_annual`` (a
+boolean filter over a pandas series) and the event sources (COW,
+Reinhart-Rogoff, EM-DAT, Garriga, WGI) are re-read and re-scanned for
+every cell.  ``GRRIPanelEngine`` scores a whole grid at once:
+
+1. Each annual series is aligned onto the year grid with one
+   ``searchsorted`` (``asof_annual``) — the same "last observation no
+   more than ``max_gap`` years old" rule as ``_lookup_annual``.
+2. The COW, Reinhart-Rogoff and EM-DAT tables answer the whole grid
+   from their shared year indexes (``event_index``); Garriga and WGI
+   are loaded once per run and reduced to one array per country.
+3. The inputs are stacked into (country, year) arrays and the four
+   pillars, the resilience score and the transmission modifier are
+   computed as array arithmetic, missing components renormalised out
+   exactly as the per-cell code does.
+
+Momentum follows ``get_historical_grri_timeseries`` on a fresh provider:
+each year's history is the political scores of the earlier years of the
+same grid.  Provenance is a ``GRRIProvenance`` bitmask per row recording
+which sources supplied a value for that country-year, rather than
+per-cell lists of source names.
+
+Usage:
+    provider = GRRIHistoricalProvider()
+    df = provider.get_historical_grri_panel(["USA", "GBR"], 1870, 2020)
+"""
+
+import logging
+from enum import IntFlag
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from . import historical_sources as sources
+from .governance_quality import (
+    HISTORICAL_GE_ESTIMATES,
+    MOMENTUM_THRESHOLDS,
+    POLITICAL_STABILITY_BASELINES,
+    REGIME_STABILITY_BASELINES,
+    GeopoliticalStatus,
+    RegimeType,
+)
+
+if TYPE_CHECKING:
+    from .historical_sources import GRRIHistoricalProvider
+
+logger = logging.getLogger(__name__)
+
+PILLARS = ("political", "economic", "social", "environmental")
+
+# Key columns the Garriga and WGI lookups match on
+CBI_KEY_COLUMNS = ("country", "countrycode", "ccode")
+WGI_KEY_COLUMNS = ("countrycode", "code", "iso3", "country")
+
+# Central banks before 1914 (see GRRIHistoricalProvider.get_cbi_proxy)
+PRE_1914_CBI = {"USA": 0.0, "GBR": 0.5, "FRA": 0.4, "DEU": 0.5}
+
+_REGIMES = list(RegimeType)
+_REGIME_CODE = {r: i for i, r in enumerate(_REGIMES)}
+_STATUSES = list(GeopoliticalStatus)
+_STATUS_CODE = {s: i for i, s in enumerate(_STATUSES)}
+
+
+class GRRIProvenance(IntFlag):
+    """Sources that supplied a value for a country-year."""
+
+    POLITY5 = 1 << 0
+    VDEM_RULE = 1 << 1
+    VDEM_CIVLIB = 1 << 2
+    VDEM_SUFFRAGE = 1 << 3
+    WGI = 1 << 4
+    GE_EXPERT = 1 << 5
+    COW = 1 << 6
+    MADDISON = 1 << 7
+    REINHART_ROGOFF = 1 << 8
+    GARRIGA_CBI = 1 << 9
+    CBI_HEURISTIC = 1 << 10
+    UNEMPLOYMENT = 1 << 11
+    EMDAT = 1 << 12
+    HADCRUT = 1 << 13
+
+
+PROVENANCE_LABELS = {
+    GRRIProvenance.POLITY5: "Polity5 (1800-2018)",
+    GRRIProvenance.VDEM_RULE: "V-Dem rule_of_law (1789+)",
+    GRRIProvenance.VDEM_CIVLIB: "V-Dem civil_liberties (1789+)",
+    GRRIProvenance.VDEM_SUFFRAGE: "V-Dem suffrage (1789+)",
+    GRRIProvenance.WGI: "WGI (1996+)",
+    GRRIProvenance.GE_EXPERT: "Historical GE estimates",
+    GRRIProvenance.COW: "COW wars (1816+)",
+    GRRIProvenance.MADDISON: "Maddison Project GDP (1820+)",
+    GRRIProvenance.REINHART_ROGOFF: "Reinhart-Rogoff crises (1800+)",
+    GRRIProvenance.GARRIGA_CBI: "Garriga CBI (1970-2017)",
+    GRRIProvenance.CBI_HEURISTIC: "CBI heuristic (pre-1970)",
+    GRRIProvenance.UNEMPLOYMENT: "Historical unemployment",
+    GRRIProvenance.EMDAT: "EM-DAT disasters (1900+)",
+    GRRIProvenance.HADCRUT: "HadCRUT5 temp anomaly (1850+)",
+}
+
+
+def decode_provenance(mask: int) -> List[str]:
+    """Source labels for a provenance bitmask, in bit order."""
+    return [label for flag, label in PROVENANCE_LABELS.items() if mask & flag]
+
+
+# ── Array helpers ────────────────────────────────────────────────────────
+
+def asof_annual(
+    series: Optional[pd.Series],
+    years: np.ndarray,
+    max_gap: int = 3,
+) -> np.ndarray:
+    """
+    Align an annual series onto ``years`` (NaN where missing).
+
+    Vectorised ``GRRIHistoricalProvider._lookup_annual``: the last value
+    dated between 1 January of ``year - max_gap`` and 1 July of ``year``.
+    """
+    out = np.full(len(years), np.nan)
+    if series is None or len(series) == 0:
+        return out
+    if not series.index.is_monotonic_increasing:
+        series = series.sort_index(kind="stable")
+    dates = pd.DatetimeIndex(series.index).to_numpy().astype("datetime64[s]")
+    offset = np.asarray(years) - 1970
+    target = (
+        offset.astype("datetime64[Y]").astype("datetime64[M]") + 6
+    ).astype("datetime64[s]")
+    earliest = (offset - max_gap).astype("datetime64[Y]").astype("datetime64[s]")
+
+    pos = np.searchsorted(dates, target, side="right") - 1
+    found = pos >= 0
+    found[found] = dates[pos[found]] >= earliest[found]
+    out[found] = series.to_numpy(dtype=float)[pos[found]]
+    return out
+
+
+def _weighted(components: Sequence[Tuple[np.ndarray, float]]) -> np.ndarray:
+    """Weighted mean of the non-NaN components, weights renormalised."""
+    total: Union[float, np.ndarray] = 0.0
+    for values, weight in components:
+        total = total + np.where(np.isnan(values), 0.0, weight)
+    score: Union[float, np.ndarray] = 0.0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for values, weight in components:
+            score = score + np.where(
+                np.isnan(values), 0.0, values * weight / total,
+            )
+    return np.where(total > 0, score, np.nan)
+
+
+# Python's round() elementwise: correctly rounded, where numpy's
+# multiply-and-rint rounding can differ in the last digit near a tie
+_round = np.frompyfunc(round, 2, 1)
+
+
+def _round4(values: np.ndarray) -> np.ndarray:
+    return _round(values, 4).astype(float)
+
+
+def _clip01(values: np.ndarray) -> np.ndarray:
+    return np.clip(values, 0.0, 1.0)
+
+
+def _numeric(df: pd.DataFrame, column: str) -> np.ndarray:
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+
+
+class _EventSource:
+    """An event table with its key columns upper-cased once."""
+
+    def __init__(self, df: Optional[pd.DataFrame], key_columns: Sequence[str]):
+        self.df = df
+        self._keys = [] if df is None else [
+            df[col].astype(str).str.upper().to_numpy()
+            for col in key_columns if col in df.columns
+        ]
+
+    @property
+    def loaded(self) -> bool:
+        return self.df is not None
+
+    def match(self, code: str) -> np.ndarray:
+        """Rows whose key columns equal ``code`` (any column)."""
+        assert self.df is not None, "event table not loaded"
+        mask = np.zeros(len(self.df), dtype=bool)
+        for keys in self._keys:
+            mask |= keys == code.upper()
+        return mask
+
+    def column_match(self, code: str) -> Optional[np.ndarray]:
+        """Rows matching on the first key column with any match."""
+        for keys in self._keys:
+            mask = keys == code.upper()
+            if mask.any():
+                return mask
+        return None
+
+
+def _first_row_by_year(row_years: np.ndarray) -> pd.Series:
+    """Position of the first row for each distinct year (file order)."""
+    keep = ~np.isnan(row_years)
+    first = pd.Series(np.flatnonzero(keep), index=row_years[keep])
+    return first[~first.index.duplicated()]
+
+
+# ── Per-country event arrays ─────────────────────────────────────────────
+
+def cbi_scores(
+    cbi: _EventSource, code: str, years: np.ndarray,
+) -> np.ndarray:
+    """``get_cbi_score`` for every year (NaN where it returns None)."""
+    out = np.full(len(years), np.nan)
+    df = cbi.df
+    if df is None:
+        return out
+    matched = np.flatnonzero(cbi.match(code))
+    if "year" not in df.columns:
+        if len(matched):
+            cbi_col = next((c for c in ("cbi", "lvaw", "lvau") if c in df.columns), None)
+            if cbi_col:
+                out[:] = _numeric(df, cbi_col)[matched[0]]
+        return out
+
+    row_years = _numeric(df, "year")
+    exact = _first_row_by_year(row_years[matched]).reindex(years.astype(float))
+    has_exact = exact.notna().to_numpy()
+    cbi_col = next((c for c in ("cbi", "lvaw", "lvau") if c in df.columns), None)
+    if cbi_col and has_exact.any():
+        rows = matched[exact.to_numpy()[has_exact].astype(np.int64)]
+        out[has_exact] = _numeric(df, cbi_col)[rows]
+
+    # Otherwise the nearest year within 3, read from the "cbi" column
+    country = cbi.column_match(code)
+    if country is None or "cbi" not in df.columns or has_exact.all():
+        return out
+    rows = np.flatnonzero(country)
+    gap = np.abs(row_years[rows][:, None] - years[None, :])
+    gap = np.where(np.isnan(gap), np.inf, gap)
+    nearest = gap.argmin(axis=0)
+    close = ~has_exact & (gap[nearest, np.arange(len(years))] <= 3)
+    out[close] = _numeric(df, "cbi")[rows[nearest[close]]]
+    return out
+
+
+def wgi_scores(
+    wgi: _EventSource, code: str, years: np.ndarray,
+    dims: Sequence[str] = ("ge", "pv", "rl", "rq"),
+) -> Dict[str, np.ndarray]:
+    """``get_wgi_scores`` dimensions for every year (NaN where absent)."""
+    out = {dim: np.full(len(years), np.nan) for dim in dims}
+    df = wgi.df
+    if df is None or "year" not in df.columns:
+        return out
+    matched = np.flatnonzero(wgi.match(code))
+    if not len(matched):
+        return out
+
+    # Same year, else the nearest year within two (WGI was biennial)
+    first = _first_row_by_year(_numeric(df, "year")[matched])
+    pos = np.full(len(years), np.nan)
+    for delta in (0, 1, -1, 2, -2):
+        candidate = first.reindex((years + delta).astype(float)).to_numpy()
+        pos = np.where(np.isnan(pos), candidate, pos)
+    found = ~np.isnan(pos)
+    rows = matched[pos[found].astype(np.int64)]
+
+    for dim in dims:
+        values = np.full(found.sum(), np.nan)
+        for col in (f"{dim}_est", f"{dim}e", f"{dim}_estimate", dim):
+            if col in df.columns:
+                values = np.where(np.isnan(values), _numeric(df, col)[rows], values)
+        out[dim][found] = _clip01((values + 2.5) / 5.0)
+    return out
+
+
+def expert_ge(code: str, years: np.ndarray) -> np.ndarray:
+    """``interpolate_historical_ge`` for every year."""
+    estimates = HISTORICAL_GE_ESTIMATES.get(code.upper())
+    if not estimates:
+        return np.full(len(years), np.nan)
+    anchors = np.array(sorted(estimates), dtype=float)
+    values = np.array([estimates[y] for y in sorted(estimates)])
+    y = years.astype(float)
+
+    if len(anchors) > 1:
+        i = np.clip(np.searchsorted(anchors, y, side="right") - 1, 0, len(anchors) - 2)
+        t = (y - anchors[i]) / (anchors[i + 1] - anchors[i])
+        inside = values[i] * (1 - t) + values[i + 1] * t
+    else:
+        inside = np.full(len(years), values[0])
+    before = values[0] * np.maximum(0.5, 1.0 - (anchors[0] - y) * 0.005)
+    return np.select([y < anchors[0], y > anchors[-1]], [before, values[-1]], inside)
+
+
+# ── Engine ───────────────────────────────────────────────────────────────
+
+class GRRIPanelEngine:
+    """Score a country × year grid with array operations."""
+
+    def __init__(
+        self,
+        provider: Optional["GRRIHistoricalProvider"] = None,
+        max_gap: int = 3,
+    ):
+        """
+        Args:
+            provider: Provider whose series caches are reused (a fresh
+                one by default).
+            max_gap: Forward-fill limit in years for annual series.
+        """
+        self.provider = provider or sources.GRRIHistoricalProvider()
+        self.max_gap = max_gap
+
+    def run(
+        self,
+        countries: Sequence[str],
+        start_year: int = 1870,
+        end_year: int = 2020,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> pd.DataFrame:
+        """
+        Compute historical GRRI for every country-year in the grid.
+
+        Args:
+            countries: ISO-3 country codes.
+            start_year: First year (inclusive).
+            end_year: Last year (inclusive).
+            weights: Optional pillar weights (default equal 0.25 each).
+
+        Returns:
+            Tidy DataFrame, one row per country-year with at least two
+            pillars: country, year, resilience, modifier, the four
+            pillar scores, regime_type, momentum_status,
+            governance_effectiveness and provenance (GRRIProvenance
+            bitmask).
+        """
+        if weights is None:
+            weights = {pillar: 0.25 for pillar in PILLARS}
+        codes = list(countries)
+        years = np.arange(start_year, end_year + 1)
+        if not codes or not len(years):
+            return pd.DataFrame()
+
+        x = self._gather(codes, years)
+        provenance = x.pop("provenance")
+
+        political, regime, status, ge = self._political(x)
+        pillars = {
+            "political": political,
+            "economic": self._economic(codes, years, x),
+            "social": self._social(x),
+            "environmental": _weighted([
+                (1.0 - x["disaster"], 0.60),
+                (1.0 - x["climate"], 0.40),
+            ]),
+        }
+
+        available = (~np.isnan(np.stack(list(pillars.values())))).sum(axis=0)
+        resilience = _weighted([
+            (pillars[k], weights.get(k, 0.25)) for k in PILLARS
+        ])
+        # grri_to_modifier with its default steepness and midpoint
+        modifier = 2 / (1 + np.exp(4.0 * (resilience - 0.5)))
+
+        keep = (available >= 2).ravel()
+        n_years = len(years)
+        df = pd.DataFrame({
+            "country": np.repeat(np.array(codes, dtype=object), n_years),
+            "year": np.tile(years, len(codes)),
+            "resilience": _round4(resilience).ravel(),
+            "modifier": _round4(modifier).ravel(),
+            **{k: _round4(v).ravel() for k, v in pillars.items()},
+            "regime_type": np.array([r.value for r in _REGIMES])[regime].ravel(),
+            "momentum_status": np.array([s.value for s in _STATUSES])[status].ravel(),
+            "governance_effectiveness": _round4(ge).ravel(),
+            "provenance": provenance.ravel(),
+        })
+        df = df[keep].reset_index(drop=True)
+        logger.info(
+            f"Generated GRRI panel: {len(codes)} countries × {n_years} years, "
+            f"{len(df)} rows"
+        )
+        return df
+
+    # ── Inputs ──────────────────────────────────────────────────────────
+
+    def _series(self, key: str, loader) -> Optional[pd.Series]:
+        return self.provider._get_or_load(key, loader)
+
+    def _gather(
+        self, codes: List[str], years: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Stack every input into a (country, year) array."""
+        gap = self.max_gap
+        cbi = _EventSource(sources.load_cbi_index(), CBI_KEY_COLUMNS)
+        wgi = _EventSource(
+            self._series("wgi_data", sources.load_wgi_data_wrapper),
+            WGI_KEY_COLUMNS,
+        )
+
+        hadcrut = self._series("hadcrut", sources.load_hadcrut)
+        current = asof_annual(hadcrut, years, gap)
+        baseline = asof_annual(hadcrut, years - 30, gap)
+        climate = _clip01((current - baseline) / 2.0)
+
+        rows: Dict[str, List[np.ndarray]] = {}
+
+        def add(name: str, values: np.ndarray) -> None:
+            rows.setdefault(name, []).append(values)
+
+        for code in codes:
+            def annual(key: str, loader, shift: int = 0) -> np.ndarray:
+                return asof_annual(
+                    self._series(f"{key}_{code}", loader), years - shift, gap,
+                )
+
+            add("polity2", annual("polity5", lambda: sources.get_polity2_series(code)))
+            add("vdem_rule", annual(
+                "vdem_rule", lambda: sources.get_vdem_series(code, "v2x_rule"),
+            ))
+            add("civlib", annual(
+                "vdem_civlib", lambda: sources.get_vdem_series(code, "v2x_civlib"),
+            ))
+            add("suffrage", annual(
+                "vdem_suffrage", lambda: sources.get_vdem_series(code, "v2x_suffr"),
+            ))
+            add("gdp", annual("maddison", lambda: sources.get_maddison_gdppc(code)))
+            add("gdp_past", annual(
+                "maddison", lambda: sources.get_maddison_gdppc(code), shift=5,
+            ))
+            add("unemployment", annual(
+                "unemp", lambda: sources.load_historical_unemployment(code),
+            ))
+            add("cbi", cbi_scores(cbi, code, years))
+            for dim, values in wgi_scores(wgi, code, years).items():
+                add(f"wgi_{dim}", values)
+            add("expert_ge", expert_ge(code, years))
+
+        x = {name: np.vstack(values) for name, values in rows.items()}
+        shape = x["gdp"].shape
+
+        # Event tables answer the whole grid from their shared indexes
+        cow = sources.cow_index()
+        rr = sources.crisis_index()
+        emdat = sources.emdat_index()
+        x["conflict"] = (
+            cow.intensity(codes, years) if cow is not None
+            else np.full(shape, np.nan)
+        )
+        x["crisis_count"] = (
+            rr.counts(codes, years) if rr is not None else np.zeros(shape)
+        )
+        x["disaster"] = (
+            emdat.severity(codes, years) if emdat is not None
+            else np.full(shape, np.nan)
+        )
+        x["climate"] = np.broadcast_to(climate, shape)
+
+        flags = np.zeros(shape, dtype=np.int64)
+
+        def mark(flag: GRRIProvenance, where) -> None:
+            flags[np.broadcast_to(where, flags.shape)] |= int(flag)
+
+        has = {name: ~np.isnan(values) for name, values in x.items()}
+        mark(GRRIProvenance.POLITY5, has["polity2"])
+        mark(GRRIProvenance.VDEM_RULE, has["vdem_rule"] & ~has["wgi_rl"])
+        mark(GRRIProvenance.VDEM_CIVLIB, has["civlib"])
+        mark(GRRIProvenance.VDEM_SUFFRAGE, has["suffrage"])
+        mark(
+            GRRIProvenance.WGI,
+            has["wgi_ge"] | has["wgi_pv"] | has["wgi_rl"] | has["wgi_rq"],
+        )
+        mark(GRRIProvenance.GE_EXPERT, has["expert_ge"] & ~has["wgi_ge"])
+        mark(GRRIProvenance.COW, cow is not None)
+        mark(GRRIProvenance.MADDISON, has["gdp"])
+        mark(GRRIProvenance.REINHART_ROGOFF, rr is not None)
+        mark(GRRIProvenance.GARRIGA_CBI, has["cbi"])
+        mark(GRRIProvenance.CBI_HEURISTIC, ~has["cbi"] & (years < 1970))
+        mark(GRRIProvenance.UNEMPLOYMENT, has["unemployment"])
+        mark(GRRIProvenance.EMDAT, has["disaster"])
+        mark(GRRIProvenance.HADCRUT, has["climate"])
+        x["provenance"] = flags
+        return x
+
+    # ── Pillars ─────────────────────────────────────────────────────────
+
+    def _political(
+        self, x: Dict[str, np.ndarray],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorised ``compute_enhanced_political_score``.
+
+        Returns:
+            (political score, RegimeType codes, GeopoliticalStatus codes,
+            governance effectiveness) arrays.
+        """
+        p2 = x["polity2"]
+        has_p2 = ~np.isnan(p2)
+        wgi_ge, wgi_pv = x["wgi_ge"], x["wgi_pv"]
+        wgi_rl, wgi_rq = x["wgi_rl"], x["wgi_rq"]
+
+        # Regime type (no durability data, as in the scalar path)
+        ge_class = np.where(np.isnan(wgi_ge), x["expert_ge"], wgi_ge)
+        consolidated = ge_class >= 0.5
+        code = _REGIME_CODE
+        regime = np.select(
+            [
+                ~has_p2,
+                np.isin(p2, (-66, -77, -88)),
+                p2 >= 6,
+                p2 >= 1,
+                p2 >= -5,
+                p2 >= -9,
+            ],
+            [
+                code[RegimeType.UNKNOWN],
+                code[RegimeType.FAILED_OCCUPIED],
+                code[RegimeType.FULL_DEMOCRACY],
+                code[RegimeType.DEMOCRACY],
+                code[RegimeType.OPEN_ANOCRACY],
+                np.where(
+                    consolidated,
+                    code[RegimeType.CONSOLIDATED_AUTOCRACY],
+                    code[RegimeType.CLOSED_ANOCRACY],
+                ),
+            ],
+            np.where(
+                consolidated,
+                code[RegimeType.CONSOLIDATED_AUTOCRACY],
+                code[RegimeType.FULL_AUTOCRACY],
+            ),
+        )
+
+        # Governance effectiveness: WGI, else expert + GDP + polity proxy
+        gdp = x["gdp"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ge_from_gdp = np.where(
+                gdp > 0, _clip01((np.log(gdp) - 5.5) / 5.5), np.nan,
+            )
+        proxy_ge = _weighted([
+            (x["expert_ge"], 0.50),
+            (ge_from_gdp, 0.35),
+            (np.abs(p2) / 10.0 * 0.5 + 0.25, 0.15),
+        ])
+        ge = np.where(
+            np.isnan(wgi_ge), np.where(np.isnan(proxy_ge), 0.5, proxy_ge), wgi_ge,
+        )
+
+        # Political stability: WGI, else regime baseline less conflict
+        conflict = x["conflict"]
+        ps_base = np.array([POLITICAL_STABILITY_BASELINES[r] for r in _REGIMES])
+        penalty = np.where(conflict > 0, conflict * 0.40, 0.0)
+        ps = np.where(np.isnan(wgi_pv), _clip01(ps_base[regime] - penalty), wgi_pv)
+
+        # Institutional quality: rule of law + regulatory quality
+        from_polity = np.where(has_p2, (p2 + 10) / 20.0, 0.5)
+        rl = np.where(
+            np.isnan(wgi_rl),
+            np.where(np.isnan(x["vdem_rule"]), from_polity, x["vdem_rule"]),
+            wgi_rl,
+        )
+        rq = np.where(np.isnan(wgi_rq), from_polity, wgi_rq)
+        institutional = (rl + rq) / 2.0
+
+        conflict = np.where(np.isnan(conflict), 0.0, conflict)
+        rs_base = np.array([REGIME_STABILITY_BASELINES[r] for r in _REGIMES])
+        regime_stab = _clip01(rs_base[regime] + (ge - 0.5) * 0.30)
+
+        composite = (
+            ge * 0.25
+            + ps * 0.25
+            + institutional * 0.25
+            + (1.0 - conflict) * 0.15
+            + regime_stab * 0.10
+        )
+        score = _round4(_clip01(composite))
+        return score, regime, self._momentum(composite, score), ge
+
+    @staticmethod
+    def _momentum(composite: np.ndarray, score: np.ndarray) -> np.ndarray:
+        """
+        Vectorised ``compute_momentum`` along the year axis.
+
+        Earlier years contribute their (rounded) political score and the
+        current year its raw composite, as the provider's history does.
+        """
+        def delta(lag: int) -> np.ndarray:
+            out = np.full(composite.shape, np.nan)
+            if lag < composite.shape[1]:
+                out[:, lag:] = composite[:, lag:] - score[:, :-lag]
+            return out
+
+        d3, d5, d10 = delta(3), delta(5), delta(10)
+        t = MOMENTUM_THRESHOLDS
+        s = _STATUS_CODE
+        status = np.select(
+            [
+                d3 <= t["acute_3yr"],
+                d5 <= t["acute_5yr"],
+                d3 <= t["deteriorating_3yr"],
+                d5 <= t["deteriorating_5yr"],
+                d3 <= t["watch_3yr"],
+                d5 <= t["watch_5yr"],
+                d3 >= t["improving_3yr"],
+                d5 >= t["improving_5yr"],
+            ],
+            [
+                s[GeopoliticalStatus.ACUTE],
+                s[GeopoliticalStatus.ACUTE],
+                s[GeopoliticalStatus.DETERIORATING],
+                s[GeopoliticalStatus.DETERIORATING],
+                s[GeopoliticalStatus.WATCH],
+                s[GeopoliticalStatus.WATCH],
+                s[GeopoliticalStatus.IMPROVING],
+                s[GeopoliticalStatus.IMPROVING],
+            ],
+            s[GeopoliticalStatus.STABLE],
+        )
+        # A 10-year structural decline escalates WATCH and STABLE
+        structural = d10 <= t["structural_decline"]
+        return np.select(
+            [
+                structural & (status == s[GeopoliticalStatus.WATCH]),
+                structural & (status == s[GeopoliticalStatus.STABLE]),
+            ],
+            [s[GeopoliticalStatus.DETERIORATING], s[GeopoliticalStatus.WATCH]],
+            status,
+        )
+
+    @staticmethod
+    def _economic(
+        codes: List[str], years: np.ndarray, x: Dict[str, np.ndarray],
+    ) -> np.ndarray:
+        gdp, past = x["gdp"], x["gdp_past"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cagr = (gdp / past) ** (1.0 / 5) - 1.0
+            growth = np.where(past > 0, _clip01((cagr + 0.10) / 0.20), np.nan)
+        diversity = _clip01((np.log(np.maximum(gdp, 100)) - 5.0) / 6.0)
+
+        # Garriga, else the pre-1970 heuristics of get_cbi_proxy
+        pre_1914 = np.array([PRE_1914_CBI.get(c.upper(), 0.3) for c in codes])
+        heuristic = np.select(
+            [years < 1914, years < 1945, years < 1970],
+            [pre_1914[:, None], 0.3, 0.4],
+            np.nan,
+        )
+        cbi = np.where(np.isnan(x["cbi"]), heuristic, x["cbi"])
+
+        crisis = np.minimum(1.0, x["crisis_count"] / 5.0)
+        fiscal = np.where(
+            np.isnan(growth), 1.0 - crisis, growth * 0.6 + (1.0 - crisis) * 0.4,
+        )
+        return _weighted([
+            (growth, 0.20),
+            (diversity, 0.20),
+            (cbi, 0.20),
+            (fiscal, 0.20),
+            (1.0 - crisis, 0.20),
+        ])
+
+    @staticmethod
+    def _social(x: Dict[str, np.ndarray]) -> np.ndarray:
+        diversity = _clip01((np.log(np.maximum(x["gdp"], 100)) - 5.0) / 6.0)
+        suffrage = x["suffrage"]
+        # HDI proxy: mean of income and suffrage, whichever exist
+        hdi = np.where(
+            np.isnan(diversity),
+            suffrage,
+            np.where(np.isnan(suffrage), diversity, (diversity + suffrage) / 2),
+        )
+        unemployment = _clip01(1.0 - (x["unemployment"] - 3.0) / 17.0)
+        return _weighted([
+            (hdi, 0.30),
+            (suffrage, 0.25),
+            (unemployment, 0.25),
+            (x["civlib"], 0.20),
+        ])
@@ -27,6 +27,7 @@ from .dependence import (
     PairwiseResult,
     compute_mi,
     compute_hsic,
+    hsic_from_kernels,
     compute_mic,
     compute_total_correlation,
     compute_dual_total_correlation,
@@ -60,6 +61,7 @@ __all__ = [
     "PairwiseResult",
     "compute_mi",
     "compute_hsic",
+    "hsic_from_kernels",
     "compute_mic",
     "compute_total_correlation",
     "compute_dual_total_correlation",
@@ -9,9 +9,14 @@ Usage:
     from grri_mac.mac.confidence import bootstrap_mac_ci, conformal_band
     ci = bootstrap_mac_ci(pillar_scores, weights, n_bootstrap=1000)
     # ci.ci_80 = (0.35, 0.52), ci.ci_90 = (0.32, 0.55)
+
+    # Whole backtest at once: (n_dates × n_pillars), NaN = inactive
+    batch = bootstrap_mac_ci_batch(score_matrix, weight_matrix, pillars)
+    # batch.ci_80[:, 0], batch.ci_80[:, 1]
 """
 
 from dataclasses import dataclass, field
+from typing import Optional, Sequence, Union
 
 import numpy as np
 
@@ -74,6 +79,79 @@ class ProxyUncertainty:
         return cls.TIER_NOISE[tier]
 
 
+# Percentiles reported for every bootstrap (key → percentile)
+_PERCENTILES = {
+    2: 2.5, 5: 5, 10: 10, 25: 25, 50: 50, 75: 75, 90: 90, 95: 95, 97: 97.5,
+}
+
+
+def _draw_bootstrap_noise(
+    n_bootstrap: int,
+    n_pillars: int,
+    indicator_noise: bool,
+    seed: int,
+) -> np.ndarray:
+    """Draw all bootstrap noise as one (n_bootstrap × k) standard-normal matrix.
+
+    Each row holds [score noise (n_pillars, if indicator_noise),
+    weight noise (n_pillars), alpha noise (1)], i.e. exactly the
+    sequence a per-iteration loop over the same Generator would draw.
+    """
+    rng = np.random.default_rng(seed)
+    width = (2 if indicator_noise else 1) * n_pillars + 1
+    return rng.standard_normal((n_bootstrap, width))
+
+
+def _bootstrap_samples(
+    base_scores: np.ndarray,
+    base_weights: np.ndarray,
+    interaction_penalty: np.ndarray,
+    z: np.ndarray,
+    indicator_noise: bool,
+    weight_noise_std: float,
+    alpha_mean: float,
+    alpha_std: float,
+) -> np.ndarray:
+    """Bootstrapped MAC samples for a block of dates.
+
+    Args:
+        base_scores: (n_dates, n_pillars) pillar scores
+        base_weights: (n_dates, n_pillars) base weights
+        interaction_penalty: (n_dates,) breach interaction penalty
+        z: Standard-normal noise from _draw_bootstrap_noise
+
+    Returns:
+        (n_dates, n_bootstrap) calibrated MAC samples
+    """
+    n_pillars = base_scores.shape[1]
+
+    # 1. Perturb pillar scores (measurement error, ~3%)
+    if indicator_noise:
+        score_noise = 0.03 * z[:, :n_pillars]
+        scores = np.clip(base_scores[:, None, :] + score_noise, 0.0, 1.0)
+        weight_z = z[:, n_pillars:2 * n_pillars]
+    else:
+        scores = np.broadcast_to(
+            base_scores[:, None, :],
+            (base_scores.shape[0], z.shape[0], n_pillars),
+        )
+        weight_z = z[:, :n_pillars]
+
+    # 2. Perturb weights (ML instability), floor at 1%, re-normalise
+    weights = np.maximum(
+        base_weights[:, None, :] + weight_noise_std * weight_z, 0.01,
+    )
+    weights /= weights.sum(axis=2, keepdims=True)
+
+    # 3. Perturb calibration factor
+    alpha = np.clip(alpha_mean + alpha_std * z[:, -1], 0.5, 1.0)
+
+    raw_mac = (scores * weights).sum(axis=2)
+    # Interaction penalty stays fixed; calibration applied after
+    adjusted = np.maximum(0.0, raw_mac - interaction_penalty[:, None])
+    return np.clip(adjusted * alpha[None, :], 0.0, 1.0)
+
+
 def bootstrap_mac_ci(
     pillar_scores: dict[str, float],
     weights: dict[str, float],
@@ -92,6 +170,9 @@ def bootstrap_mac_ci(
     2. Pillar weight instability (from ML resampling)
     3. Calibration factor α (from LOOCV variance)
 
+    All noise is drawn as one (n_bootstrap × pillars) matrix; see
+    bootstrap_mac_ci_batch to compute many dates at once.
+
     Args:
         pillar_scores: Current pillar scores (0-1)
         weights: Pillar weights (sum to 1)
@@ -106,7 +187,6 @@ def bootstrap_mac_ci(
     Returns:
         ConfidenceResult with CIs and diagnostics
     """
-    rng = np.random.default_rng(seed)
     pillars = sorted(pillar_scores.keys())
     n_pillars = len(pillars)
 
@@ -118,46 +198,22 @@ def bootstrap_mac_ci(
     raw_point = float(np.dot(base_scores, base_weights))
     point_estimate = max(0.0, raw_point - interaction_penalty)
 
-    # Bootstrap
-    mac_samples = np.zeros(n_bootstrap)
-
-    for b in range(n_bootstrap):
-        # 1. Perturb pillar scores (measurement error)
-        if indicator_noise:
-            noise = rng.normal(0, 0.03, size=n_pillars)  # ~3% noise on pillar scores
-            perturbed_scores = np.clip(base_scores + noise, 0.0, 1.0)
-        else:
-            perturbed_scores = base_scores.copy()
-
-        # 2. Perturb weights (ML instability)
-        weight_noise = rng.normal(0, weight_noise_std, size=n_pillars)
-        perturbed_weights = base_weights + weight_noise
-        perturbed_weights = np.maximum(perturbed_weights, 0.01)  # Floor at 1%
-        perturbed_weights /= perturbed_weights.sum()  # Re-normalize
-
-        # 3. Perturb calibration factor
-        alpha = rng.normal(alpha_mean, alpha_std)
-        alpha = max(0.5, min(1.0, alpha))
-
-        # Calculate bootstrapped MAC
-        raw_mac = float(np.dot(perturbed_scores, perturbed_weights))
-        # Apply interaction penalty (could also be bootstrapped, but keep fixed)
-        adjusted_mac = max(0.0, raw_mac - interaction_penalty)
-        # Apply calibration factor
-        calibrated_mac = adjusted_mac * alpha
-        mac_samples[b] = max(0.0, min(1.0, calibrated_mac))
+    z = _draw_bootstrap_noise(n_bootstrap, n_pillars, indicator_noise, seed)
+    mac_samples = _bootstrap_samples(
+        base_scores[None, :],
+        base_weights[None, :],
+        np.array([interaction_penalty], dtype=float),
+        z,
+        indicator_noise,
+        weight_noise_std,
+        alpha_mean,
+        alpha_std,
+    )[0]
 
     # Calculate percentiles
+    values = np.percentile(mac_samples, list(_PERCENTILES.values()))
     percentiles = {
-        2: float(np.percentile(mac_samples, 2.5)),
-        5: float(np.percentile(mac_samples, 5)),
-        10: float(np.percentile(mac_samples, 10)),
-        25: float(np.percentile(mac_samples, 25)),
-        50: float(np.percentile(mac_samples, 50)),
-        75: float(np.percentile(mac_samples, 75)),
-        90: float(np.percentile(mac_samples, 90)),
-        95: float(np.percentile(mac_samples, 95)),
-        97: float(np.percentile(mac_samples, 97.5)),
+        key: float(v) for key, v in zip(_PERCENTILES, values)
     }
 
     return ConfidenceResult(
@@ -172,6 +228,120 @@ def bootstrap_mac_ci(
     )
 
 
+@dataclass
+class BatchConfidenceResult:
+    """Bootstrap CIs for many dates (arrays aligned to the input rows)."""
+
+    point_estimate: np.ndarray   # (n_dates,)
+    ci_80: np.ndarray            # (n_dates, 2)
+    ci_90: np.ndarray            # (n_dates, 2)
+    ci_95: np.ndarray            # (n_dates, 2)
+    bootstrap_std: np.ndarray    # (n_dates,)
+    bootstrap_mean: np.ndarray   # (n_dates,)
+    n_bootstrap: int
+    percentiles: dict[int, np.ndarray] = field(default_factory=dict)
+
+
+def bootstrap_mac_ci_batch(
+    score_matrix: np.ndarray,
+    weight_matrix: np.ndarray,
+    pillar_names: Optional[Sequence[str]] = None,
+    n_bootstrap: int = 1000,
+    indicator_noise: bool = True,
+    weight_noise_std: float = 0.03,
+    alpha_mean: float = 0.78,
+    alpha_std: float = 0.05,
+    interaction_penalty: Union[float, np.ndarray] = 0.0,
+    seed: int = 42,
+    chunk_size: int = 256,
+) -> BatchConfidenceResult:
+    """Bootstrap MAC CIs for a whole (n_dates × n_pillars) score matrix.
+
+    Row ``i`` gives the same result as ``bootstrap_mac_ci`` called with
+    that row's non-NaN pillars, its weights and ``interaction_penalty[i]``
+    under the same seed: noise is drawn once per distinct active-pillar
+    count and shared by every row with that count, as the per-date calls
+    would.  Dates are processed in chunks of ``chunk_size`` to bound the
+    (chunk × n_bootstrap × n_pillars) working set.
+
+    Args:
+        score_matrix: Pillar scores; NaN marks a pillar left out that date
+        weight_matrix: Base weights, same shape; NaN falls back to
+            1 / (active pillars), like a key missing from ``weights``
+        pillar_names: Column names; columns are ordered by name before
+            noise is assigned, matching the dict-based API. Defaults to
+            the given column order.
+        interaction_penalty: Scalar or (n_dates,) array
+        chunk_size: Dates per array block
+        (other args as in bootstrap_mac_ci)
+
+    Returns:
+        BatchConfidenceResult with per-date arrays
+    """
+    scores = np.atleast_2d(np.asarray(score_matrix, dtype=float))
+    weights = np.atleast_2d(np.asarray(weight_matrix, dtype=float))
+    if scores.shape != weights.shape:
+        raise ValueError("score_matrix and weight_matrix shapes differ")
+    n_dates = scores.shape[0]
+    penalty = np.broadcast_to(
+        np.asarray(interaction_penalty, dtype=float), (n_dates,),
+    )
+
+    if pillar_names is not None:
+        order = np.argsort(np.asarray(pillar_names, dtype=object).astype(str))
+        scores, weights = scores[:, order], weights[:, order]
+
+    active = ~np.isnan(scores)
+    n_active = active.sum(axis=1)
+    # Move each row's active pillars to the front, keeping column order
+    compact = np.argsort(~active, axis=1, kind="stable")
+    scores = np.take_along_axis(scores, compact, axis=1)
+    weights = np.take_along_axis(weights, compact, axis=1)
+
+    point = np.empty(n_dates)
+    mean = np.empty(n_dates)
+    std = np.empty(n_dates)
+    pcts = np.empty((len(_PERCENTILES), n_dates))
+
+    for k in np.unique(n_active):
+        rows = np.flatnonzero(n_active == k)
+        s_k = scores[rows, :k]
+        w_k = np.where(np.isnan(weights[rows, :k]), 1.0 / max(k, 1),
+                       weights[rows, :k])
+        point[rows] = np.maximum(0.0, (s_k * w_k).sum(axis=1) - penalty[rows])
+
+        z = _draw_bootstrap_noise(n_bootstrap, int(k), indicator_noise, seed)
+        for lo in range(0, len(rows), chunk_size):
+            block = rows[lo:lo + chunk_size]
+            samples = _bootstrap_samples(
+                s_k[lo:lo + chunk_size],
+                w_k[lo:lo + chunk_size],
+                penalty[block],
+                z,
+                indicator_noise,
+                weight_noise_std,
+                alpha_mean,
+                alpha_std,
+            )
+            pcts[:, block] = np.percentile(
+                samples, list(_PERCENTILES.values()), axis=1,
+            )
+            mean[block] = samples.mean(axis=1)
+            std[block] = samples.std(axis=1)
+
+    percentiles = dict(zip(_PERCENTILES, pcts))
+    return BatchConfidenceResult(
+        point_estimate=point,
+        ci_80=np.column_stack([percentiles[10], percentiles[90]]),
+        ci_90=np.column_stack([percentiles[5], percentiles[95]]),
+        ci_95=np.column_stack([percentiles[2], percentiles[97]]),
+        bootstrap_std=std,
+        bootstrap_mean=mean,
+        n_bootstrap=n_bootstrap,
+        percentiles=percentiles,
+    )
+
+
 def conformal_prediction_band(
     mac_score: float,
     calibration_residuals: list[float],
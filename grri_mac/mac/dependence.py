@@ -228,6 +228,155 @@ def _rbf_kernel_matrix(
     return np.exp(-dists_sq / (2.0 * sigma ** 2))
 
 
+def _center_kernel(K: np.ndarray) -> np.ndarray:
+    """H·K·H for H = I − (1/n)·11ᵀ, without forming H.
+
+    Subtracts row and column means and adds back the grand mean: O(n²)
+    instead of two O(n³) matrix products.
+    """
+    return K - K.mean(axis=0)[None, :] - K.mean(axis=1)[:, None] + K.mean()
+
+
+def hsic_from_kernels(
+    K_x_centered: np.ndarray,
+    K_y: np.ndarray,
+    n_permutations: int = 1000,
+    seed: int = 42,
+) -> tuple[float, float]:
+    """HSIC statistic and permutation p-value from precomputed kernels.
+
+    Because H is idempotent, tr(K_x H K_y H) = Σᵢⱼ (H K_x H)ᵢⱼ (K_y)ᵢⱼ,
+    so each permuted statistic is an elementwise sum against the
+    permuted K_y rather than a matrix product.  Permutations are drawn
+    exactly as compute_hsic always has (one ``rng.permutation(n)`` per
+    iteration) and evaluated in batches.
+
+    Args:
+        K_x_centered: Centered kernel matrix H·K_x·H (n × n)
+        K_y: Uncentered kernel matrix for y (n × n)
+        n_permutations: Number of permutations for p-value
+        seed: Random seed
+
+    Returns:
+        Tuple of (HSIC statistic, permutation p-value)
+    """
+    n = K_y.shape[0]
+    norm = float((n - 1) ** 2)
+    hsic_observed = _hsic_batch(K_x_centered, K_y[None])[0] / norm
+    threshold = _tie_threshold(hsic_observed)
+
+    rng = np.random.default_rng(seed)
+    batch = max(1, _HSIC_BATCH_ELEMENTS // (n * n))
+    count_greater = 0
+    done = 0
+    while done < n_permutations:
+        size = min(batch, n_permutations - done)
+        perms = np.stack([rng.permutation(n) for _ in range(size)])
+        K_y_perm = K_y[perms[:, :, None], perms[:, None, :]]
+        hsic_perm = _hsic_batch(K_x_centered, K_y_perm) / norm
+        count_greater += int(np.count_nonzero(hsic_perm >= threshold))
+        done += size
+
+    p_value = (count_greater + 1) / (n_permutations + 1)
+    return float(hsic_observed), p_value
+
+
+def _tie_threshold(observed: float) -> float:
+    """Lower bound for counting a permuted statistic as >= observed.
+
+    Permutations that leave the kernel unchanged (e.g. swapping tied
+    observations) give mathematically equal statistics; summation order
+    must not decide whether they count.
+    """
+    return observed - 1e-12 * max(abs(observed), 1e-300)
+
+
+def _hsic_batch(K_x_centered: np.ndarray, K_y_stack: np.ndarray) -> np.ndarray:
+    """Σᵢⱼ K_x_centered ∘ K_y for each matrix in a (b × n × n) stack.
+
+    The observed and permuted statistics both go through here so they
+    are reduced in the same order.
+    """
+    return np.einsum("ij,bij->b", K_x_centered, K_y_stack)
+
+
+# Permuted kernel elements materialised per batch (~64 MB of float64)
+_HSIC_BATCH_ELEMENTS = 8_000_000
+
+
+def _median_bandwidth(
+    x: np.ndarray, max_points: int = 1000, seed: int = 0,
+) -> float:
+    """Median-heuristic RBF bandwidth on at most ``max_points`` samples."""
+    x = x.reshape(-1, 1) if x.ndim == 1 else x
+    if len(x) > max_points:
+        idx = np.random.default_rng(seed).choice(
+            len(x), max_points, replace=False,
+        )
+        x = x[idx]
+    dists_sq = np.sum((x[:, None, :] - x[None, :, :]) ** 2, axis=-1)
+    dists = np.sqrt(dists_sq[np.triu_indices_from(dists_sq, k=1)])
+    sigma = float(np.median(dists)) if len(dists) > 0 else 1.0
+    return max(sigma, 1e-10)
+
+
+def _rff_features(
+    x: np.ndarray,
+    sigma: float,
+    n_features: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Random Fourier features approximating an RBF kernel (Rahimi–Recht)."""
+    x = x.reshape(-1, 1) if x.ndim == 1 else x
+    omega = rng.normal(0.0, 1.0 / sigma, (x.shape[1], n_features))
+    phase = rng.uniform(0.0, 2.0 * np.pi, n_features)
+    return np.sqrt(2.0 / n_features) * np.cos(x @ omega + phase)
+
+
+def _hsic_rff(
+    x: np.ndarray,
+    y: np.ndarray,
+    sigma_x: Optional[float],
+    sigma_y: Optional[float],
+    n_permutations: int,
+    seed: int,
+    n_features: int,
+) -> tuple[float, float]:
+    """HSIC via random Fourier features: O(n·D²) per permutation.
+
+    With centered feature maps Φ̃, K ≈ Φ̃Φ̃ᵀ and
+    tr(K̃_x K̃_y) ≈ ‖Φ̃_xᵀ Φ̃_y‖²_F.
+    """
+    n = len(x)
+    rng = np.random.default_rng(seed)
+    phi_x = _rff_features(
+        x, sigma_x or _median_bandwidth(x, seed=seed), n_features, rng,
+    )
+    phi_y = _rff_features(
+        y, sigma_y or _median_bandwidth(y, seed=seed), n_features, rng,
+    )
+    phi_x -= phi_x.mean(axis=0)
+    phi_y -= phi_y.mean(axis=0)
+    norm = float((n - 1) ** 2)
+
+    hsic_observed = float(np.sum((phi_x.T @ phi_y) ** 2)) / norm
+    threshold = _tie_threshold(hsic_observed)
+
+    batch = max(1, _HSIC_BATCH_ELEMENTS // (n * n_features))
+    count_greater = 0
+    done = 0
+    while done < n_permutations:
+        size = min(batch, n_permutations - done)
+        perms = np.stack([rng.permutation(n) for _ in range(size)])
+        cross = np.matmul(phi_x.T, phi_y[perms])  # (b × D × D)
+        hsic_perm = np.sum(cross ** 2, axis=(1, 2)) / norm
+        count_greater += int(np.count_nonzero(hsic_perm >= threshold))
+        done += size
+
+    p_value = (count_greater + 1) / (n_permutations + 1)
+    return hsic_observed, p_value
+
+
 def compute_hsic(
     x: np.ndarray,
     y: np.ndarray,
@@ -235,6 +384,8 @@ def compute_hsic(
     sigma_y: Optional[float] = None,
     n_permutations: int = 1000,
     seed: int = 42,
+    method: str = "exact",
+    n_features: int = 256,
 ) -> tuple[float, float]:
     """Compute HSIC statistic with permutation p-value.
 
@@ -249,6 +400,9 @@ def compute_hsic(
         sigma_y: RBF bandwidth for y (default: median heuristic)
         n_permutations: Number of permutations for p-value
         seed: Random seed
+        method: "exact" (n × n kernels) or "rff" (random Fourier
+            feature approximation for large n)
+        n_features: Random features per variable for method="rff"
 
     Returns:
         Tuple of (HSIC statistic, permutation p-value)
@@ -257,32 +411,20 @@ def compute_hsic(
     if n < 5:
         return 0.0, 1.0
 
+    if method == "rff":
+        return _hsic_rff(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float),
+            sigma_x, sigma_y, n_permutations, seed, n_features,
+        )
+    elif method != "exact":
+        raise ValueError(f"Unknown HSIC method: {method}")
+
     K_x = _rbf_kernel_matrix(x, sigma_x)
     K_y = _rbf_kernel_matrix(y, sigma_y)
-
-    # Centering matrix H = I - (1/n)·11ᵀ
-    H = np.eye(n) - np.ones((n, n)) / n
-
-    # HSIC = (1/(n-1)²) · tr(K_x H K_y H)
-    HK_x = H @ K_x
-    HK_y = H @ K_y
-    hsic_observed = float(np.trace(HK_x @ HK_y)) / ((n - 1) ** 2)
-
-    # Permutation test
-    rng = np.random.default_rng(seed)
-    count_greater = 0
-
-    for _ in range(n_permutations):
-        perm = rng.permutation(n)
-        K_y_perm = K_y[np.ix_(perm, perm)]
-        HK_y_perm = H @ K_y_perm
-        hsic_perm = float(np.trace(HK_x @ HK_y_perm)) / ((n - 1) ** 2)
-        if hsic_perm >= hsic_observed:
-            count_greater += 1
-
-    p_value = (count_greater + 1) / (n_permutations + 1)
-
-    return hsic_observed, p_value
+    return hsic_from_kernels(
+        _center_kernel(K_x), K_y,
+        n_permutations=n_permutations, seed=seed,
+    )
 
 
 def compute_mic(
@@ -472,6 +614,8 @@ class PillarDependenceAnalyzer:
         n_permutations: int = 1000,
         significance_level: float = 0.05,
         seed: int = 42,
+        hsic_method: str = "exact",
+        rff_features: int = 256,
     ):
         """Initialize analyzer.
 
@@ -480,11 +624,45 @@ class PillarDependenceAnalyzer:
             n_permutations: Number of HSIC permutations
             significance_level: p-value threshold for significance
             seed: Random seed for reproducibility
+            hsic_method: "exact" or "rff" (see compute_hsic)
+            rff_features: Random features per pillar when
+                hsic_method="rff"
         """
         self.pillar_names = pillar_names or PILLAR_NAMES_7
         self.n_permutations = n_permutations
         self.significance_level = significance_level
         self.seed = seed
+        self.hsic_method = hsic_method
+        self.rff_features = rff_features
+
+    def _pair_hsic(
+        self,
+        matrix: np.ndarray,
+        i: int,
+        j: int,
+        kernels: dict[int, tuple[np.ndarray, np.ndarray]],
+    ) -> tuple[float, float]:
+        """HSIC for columns i, j, reusing per-pillar kernels across pairs.
+
+        ``kernels`` maps column → (K, H·K·H) and is filled on demand.
+        """
+        if len(matrix) < 5 or self.hsic_method != "exact":
+            return compute_hsic(
+                matrix[:, i], matrix[:, j],
+                n_permutations=self.n_permutations,
+                seed=self.seed,
+                method=self.hsic_method,
+                n_features=self.rff_features,
+            )
+        for col in (i, j):
+            if col not in kernels:
+                K = _rbf_kernel_matrix(matrix[:, col])
+                kernels[col] = (K, _center_kernel(K))
+        return hsic_from_kernels(
+            kernels[i][1], kernels[j][0],
+            n_permutations=self.n_permutations,
+            seed=self.seed,
+        )
 
     def full_analysis(
         self,
@@ -526,6 +704,7 @@ class PillarDependenceAnalyzer:
         hsic_matrix: dict[tuple[str, str], float] = {}
         mic_matrix: dict[tuple[str, str], float] = {}
         pearson_matrix: dict[tuple[str, str], float] = {}
+        kernels: dict[int, tuple[np.ndarray, np.ndarray]] = {}
 
         for i, j in combinations(range(len(active_pillars)), 2):
             pa = active_pillars[i]
@@ -537,11 +716,7 @@ class PillarDependenceAnalyzer:
             mi_val, nmi_val = compute_mi(x, y)
 
             # HSIC
-            hsic_val, hsic_p = compute_hsic(
-                x, y,
-                n_permutations=self.n_permutations,
-                seed=self.seed,
-            )
+            hsic_val, hsic_p = self._pair_hsic(matrix, i, j, kernels)
 
             # MIC
             mic_val = compute_mic(x, y)
@@ -645,6 +820,55 @@ class PillarDependenceAnalyzer:
         self.n_permutations = saved_perms
         return reports
 
+    def rolling_frame(
+        self,
+        pillar_history: dict[str, list[float]],
+        window_size: int = 52,
+        step: Optional[int] = None,
+        index: Optional[list] = None,
+        workers: int = 1,
+        include_hsic: bool = True,
+        include_mic: bool = True,
+    ):
+        """Rolling pairwise metrics as one time-indexed DataFrame.
+
+        Slides the window incrementally (sorted windows and raw-score
+        moments are updated, not rebuilt; MI bins, as in compute_mi,
+        and copula ranks come from each window alone) and spreads
+        HSIC/MIC across ``workers`` processes.  See
+        grri_mac.mac.rolling_dependence for the estimators.
+
+        Args:
+            pillar_history: Pillar score time series
+            window_size: Rolling window size (observations)
+            step: Observations between windows (default: window_size // 4)
+            index: Optional label per observation (e.g. dates)
+            workers: Processes for the HSIC/MIC part
+            include_hsic: Compute HSIC and permutation p-values
+            include_mic: Compute MIC
+
+        Returns:
+            pandas DataFrame indexed by window end, one row per pair
+        """
+        from .rolling_dependence import RollingDependenceEngine
+
+        active_pillars = [
+            p for p in self.pillar_names if p in pillar_history
+        ]
+        if len(active_pillars) < 2:
+            raise ValueError(
+                f"Need at least 2 pillars, got {len(active_pillars)}"
+            )
+        matrix = np.column_stack([
+            np.asarray(pillar_history[p], dtype=float)
+            for p in active_pillars
+        ])
+        engine = RollingDependenceEngine(self, window_size, step=step)
+        return engine.run(
+            matrix, active_pillars, index=index, workers=workers,
+            include_hsic=include_hsic, include_mic=include_mic,
+        )
+
     def compare_to_hardcoded(
         self,
         pillar_history: dict[str, list[float]],
@@ -16,9 +16,12 @@ New status levels:
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Any, List, Optional, Dict, Tuple
+from typing import Any, List, Optional, Dict, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+import pandas as pd
+
 
 class MACStatus(Enum):
     """Enhanced MAC status with momentum awareness."""
@@ -67,29 +70,241 @@ def calculate_momentum(
     if current_date is None:
         current_date = datetime.now()
 
-    # Build date lookup
-    mac_lookup = {}
-    for entry in historical_macs:
-        if isinstance(entry.get("date"), str):
-            d = datetime.strptime(entry["date"], "%Y-%m-%d")
-        else:
-            d = entry["date"]
-        mac_lookup[d.strftime("%Y-%m-%d")] = entry["mac_score"]
+    tracker = MomentumTracker.from_history(historical_macs)
+    return tracker.momentum_for(current_mac, current_date)
 
-    # Find MAC scores at different lookback periods
-    def find_mac_near_date(target_date: datetime, max_diff: int = 7) -> Optional[float]:
-        for delta in range(max_diff + 1):
-            for sign in [0, -1, 1]:
-                check_date = target_date + timedelta(days=sign * delta)
-                key = check_date.strftime("%Y-%m-%d")
-                if key in mac_lookup:
-                    return mac_lookup[key]
+
+# Days either side of a lookback target searched for a MAC observation
+LOOKBACK_TOLERANCE_DAYS = 7
+
+# Lookback horizons in days
+LOOKBACKS = {"1w": 7, "2w": 14, "4w": 28}
+
+
+def _search_offsets(max_diff: int = LOOKBACK_TOLERANCE_DAYS) -> List[int]:
+    """Day offsets in search order: 0, -1, +1, -2, +2, ... (nearest first,
+    earlier date wins ties)."""
+    offsets = [0]
+    for delta in range(1, max_diff + 1):
+        offsets.extend([-delta, delta])
+    return offsets
+
+
+class MomentumTracker:
+    """
+    Incremental MAC history for momentum lookups.
+
+    Backed by a ring buffer indexed by calendar day (ordinal modulo
+    capacity), so recording a score and each lookback probe are O(1)
+    and memory stays bounded however long the backtest runs. Lookups
+    follow calculate_momentum exactly: nearest day within ±7, earlier
+    day preferred on ties, later scores for the same day overwrite.
+
+    Usage:
+        tracker = MomentumTracker()
+        for date, mac in series:
+            momentum = tracker.update(date, mac)
+    """
+
+    def __init__(self, capacity_days: int = 64):
+        # Must cover the 4-week lookback plus its ±7 day tolerance
+        min_capacity = LOOKBACKS["4w"] + LOOKBACK_TOLERANCE_DAYS + 1
+        if capacity_days < min_capacity:
+            raise ValueError(f"capacity_days must be >= {min_capacity}")
+        self.capacity_days = capacity_days
+        self._days = np.full(capacity_days, -1, dtype=np.int64)
+        self._values = np.zeros(capacity_days)
+        self._offsets = _search_offsets()
+
+    @classmethod
+    def from_history(
+        cls,
+        historical_macs: List[Dict],  # [{date: str|datetime, mac_score}]
+        capacity_days: int = 64,
+    ) -> "MomentumTracker":
+        """Build a tracker from a calculate_momentum-style history list.
+
+        Entries are recorded in list order; a later entry for the same
+        calendar day replaces an earlier one.
+        """
+        dates = [
+            datetime.strptime(d["date"], "%Y-%m-%d")
+            if isinstance(d["date"], str) else d["date"]
+            for d in historical_macs
+        ]
+        if dates:
+            # Size the buffer to the whole span so no entry is evicted,
+            # whatever order the history list is in
+            days = [d.toordinal() for d in dates]
+            capacity_days = max(capacity_days, max(days) - min(days) + 1)
+        tracker = cls(capacity_days)
+        for d, entry in zip(dates, historical_macs):
+            tracker.record(d, entry["mac_score"])
+        return tracker
+
+    def record(self, date: datetime, mac_score: float) -> None:
+        """Store a MAC score for a calendar day."""
+        day = date.toordinal()
+        slot = day % self.capacity_days
+        self._days[slot] = day
+        self._values[slot] = mac_score
+
+    def lookup(self, target_date: datetime) -> Optional[float]:
+        """MAC score nearest ``target_date`` (±7 days), or None."""
+        target = target_date.toordinal()
+        for offset in self._offsets:
+            day = target + offset
+            slot = day % self.capacity_days
+            if self._days[slot] == day:
+                return float(self._values[slot])
         return None
 
-    mac_1w_ago = find_mac_near_date(current_date - timedelta(weeks=1))
-    mac_2w_ago = find_mac_near_date(current_date - timedelta(weeks=2))
-    mac_4w_ago = find_mac_near_date(current_date - timedelta(weeks=4))
+    def momentum_for(
+        self,
+        current_mac: float,
+        current_date: datetime,
+    ) -> "MACMomentum":
+        """Momentum of ``current_mac`` against recorded history."""
+        return _build_momentum(
+            current_mac,
+            self.lookup(current_date - timedelta(weeks=1)),
+            self.lookup(current_date - timedelta(weeks=2)),
+            self.lookup(current_date - timedelta(weeks=4)),
+        )
+
+    def update(self, date: datetime, mac_score: float) -> "MACMomentum":
+        """Momentum for (date, mac_score), then record it as history."""
+        momentum = self.momentum_for(mac_score, date)
+        self.record(date, mac_score)
+        return momentum
+
+    def reset(self) -> None:
+        """Forget all recorded history."""
+        self._days.fill(-1)
+
 
+def calculate_momentum_series(
+    dates: Sequence[datetime],
+    mac_scores: Sequence[float],
+) -> pd.DataFrame:
+    """
+    Momentum columns for a whole MAC series in one pass.
+
+    Row ``i`` is scored against rows ``0..i-1`` only, exactly as if the
+    series were fed through ``MomentumTracker.update`` in order (which is
+    how BacktestRunner builds momentum point by point).
+
+    Args:
+        dates: Observation dates
+        mac_scores: MAC score per date
+
+    Returns:
+        DataFrame indexed by date with mac_{1w,2w,4w}_ago,
+        momentum_{1w,2w,4w}, trend_direction, mac_status and
+        is_deteriorating columns (missing lookbacks are NaN)
+    """
+    index = pd.DatetimeIndex(dates)
+    mac = np.asarray(mac_scores, dtype=np.float64)
+    if len(mac) != len(index):
+        raise ValueError("dates and mac_scores must have the same length")
+    days = index.values.astype("datetime64[D]").astype(np.int64)
+    n = len(days)
+
+    lagged: Dict[str, np.ndarray] = {}
+    found: Dict[str, np.ndarray] = {}
+    if n < 2 or np.all(np.diff(days) > 0):
+        # One row per day in date order: each probe is a binary search,
+        # and "earlier row" reduces to "earlier position".
+        row = np.arange(n)
+        for label, lookback in LOOKBACKS.items():
+            value = np.full(n, np.nan)
+            hit_any = np.zeros(n, dtype=bool)
+            for offset in _search_offsets():
+                probe = days - lookback + offset
+                pos = np.searchsorted(days, probe)
+                pos_c = np.minimum(pos, max(n - 1, 0))
+                hit = (
+                    ~hit_any & (pos < n) & (pos_c < row)
+                    & (days[pos_c] == probe)
+                )
+                value[hit] = mac[pos_c[hit]]
+                hit_any |= hit
+            lagged[label] = value
+            found[label] = hit_any
+    else:
+        # Same-day or out-of-order rows: replay through a tracker that
+        # spans the whole series so later rows overwrite earlier ones
+        tracker = MomentumTracker(
+            max(64, int(days.max() - days.min()) + 1)
+        )
+        for label in LOOKBACKS:
+            lagged[label] = np.full(n, np.nan)
+            found[label] = np.zeros(n, dtype=bool)
+        for i, (date, score) in enumerate(zip(index, mac)):
+            for label, lookback in LOOKBACKS.items():
+                prior = tracker.lookup(date - timedelta(days=lookback))
+                if prior is not None:
+                    lagged[label][i] = prior
+                    found[label][i] = True
+            tracker.record(date, score)
+
+    # calculate_momentum treats a lagged MAC of 0.0 as missing
+    has = {k: found[k] & (lagged[k] != 0) for k in LOOKBACKS}
+    momentum = {
+        k: np.where(has[k], mac - lagged[k], np.nan) for k in LOOKBACKS
+    }
+    m2, m4 = momentum["2w"], momentum["4w"]
+    has2, has4 = has["2w"], has["4w"]
+
+    # NaN comparisons are False, so NaN momentum falls through to
+    # "stable" just as it does in _build_momentum
+    trend_direction = np.select(
+        [
+            has4 & (m4 < -0.10), has4 & (m4 < -0.03), has4 & (m4 > 0.05),
+            has4,
+            has2 & (m2 < -0.05), has2 & (m2 < -0.02), has2 & (m2 > 0.03),
+            has2,
+        ],
+        [
+            "rapidly_declining", "declining", "improving", "stable",
+            "rapidly_declining", "declining", "improving", "stable",
+        ],
+        default="unknown",
+    ).astype(object)
+
+    falling = has4 & (m4 < -0.05)
+    mac_status = np.select(
+        [mac < 0.35, mac < 0.50, (mac < 0.65) & falling, mac < 0.65],
+        [
+            MACStatus.CRITICAL.value, MACStatus.STRETCHED.value,
+            MACStatus.DETERIORATING.value, MACStatus.CAUTIOUS.value,
+        ],
+        default=MACStatus.COMFORTABLE.value,
+    ).astype(object)
+
+    return pd.DataFrame(
+        {
+            "mac_1w_ago": lagged["1w"],
+            "mac_2w_ago": lagged["2w"],
+            "mac_4w_ago": lagged["4w"],
+            "momentum_1w": momentum["1w"],
+            "momentum_2w": m2,
+            "momentum_4w": m4,
+            "trend_direction": trend_direction,
+            "mac_status": mac_status,
+            "is_deteriorating": falling & (mac < 0.65),
+        },
+        index=index,
+    )
+
+
+def _build_momentum(
+    current_mac: float,
+    mac_1w_ago: Optional[float],
+    mac_2w_ago: Optional[float],
+    mac_4w_ago: Optional[float],
+) -> MACMomentum:
+    """Trend, status and warning from the current and lagged MAC."""
     # Calculate momentum (change over period)
     momentum_1w = current_mac - mac_1w_ago if mac_1w_ago else None
     momentum_2w = current_mac - mac_2w_ago if mac_2w_ago else None
@@ -10,6 +10,16 @@ Overlays a 2-state HMM ("normal" / "fragile") on the
 The HMM is an OVERLAY on the existing MAC — it does not
 replace the score, but provides additional regime context.
 
+hmmlearn is only used for EM fitting.  Inference runs on the fitted
+parameters in NumPy:
+
+- ``update`` — streaming forward filter: keeps the forward probability
+  vector and folds in one observation per call in O(states²), with
+  optional refits on the expanding window (``refit_interval``)
+- ``fragile_probabilities`` — P(fragile) for a whole history in one
+  forward–backward pass
+- ``predict`` — posterior and Viterbi path over a short window
+
 Dependencies (optional):
   - hmmlearn (for Gaussian HMM)
   - Falls back to a simple threshold-based classifier
@@ -20,6 +30,11 @@ Usage:
     hmm.fit(historical_pillar_scores)
     result = hmm.predict(current_pillar_scores)
     print(f"P(fragile) = {result.fragile_prob:.2f}")
+
+    # Streaming: fits itself once min_observations have arrived
+    stream = RegimeHMM(RegimeHMMConfig(refit_interval=26))
+    for scores in weekly_pillar_scores:
+        result = stream.update(scores)   # None until fitted
 """
 
 from __future__ import annotations
@@ -84,6 +99,10 @@ class RegimeHMMConfig:
     # Minimum observations for fitting
     min_observations: int = 52  # ~1 year
 
+    # Streaming filter: observations between refits on the expanding
+    # window (None = fit once, at min_observations)
+    refit_interval: Optional[int] = None
+
 
 # ── HMM model ───────────────────────────────────────────────────────────
 
@@ -111,6 +130,24 @@ class RegimeHMM:
         self._fragile_state_idx: Optional[int] = None
         self._fitted = False
 
+        # Gaussian HMM parameters (None under the threshold fallback)
+        self._startprob: Optional[np.ndarray] = None
+        self._transmat: Optional[np.ndarray] = None
+        self._means: Optional[np.ndarray] = None
+        self._chol_inv: Optional[np.ndarray] = None
+        self._log_norm: Optional[np.ndarray] = None
+        self._n_training_obs = 0
+        self._transmat_list: Optional[List[List[float]]] = None
+        self._state_means: Optional[Dict[str, List[float]]] = None
+
+        # Streaming filter state (see reset_filter); _stream_fitted marks
+        # parameters that update() fitted on the stream itself
+        self._stream: List[np.ndarray] = []
+        self._alpha: Optional[np.ndarray] = None
+        self._filter_loglik = 0.0
+        self._last_fit_n = 0
+        self._stream_fitted = False
+
     def fit(
         self,
         pillar_scores_history: List[Dict[str, float]],
@@ -124,26 +161,81 @@ class RegimeHMM:
         Returns:
             True if fitting succeeded.
         """
+        self._stream_fitted = False
+        return self._fit_matrix(self._matrix(pillar_scores_history))
+
+    def _fit_matrix(self, X: np.ndarray) -> bool:
+        """Fit on an (n_obs × n_pillars) array."""
         cfg = self.config
 
-        if len(pillar_scores_history) < cfg.min_observations:
+        if len(X) < cfg.min_observations:
             logger.warning(
                 "Insufficient data for HMM: %d < %d",
-                len(pillar_scores_history),
+                len(X),
                 cfg.min_observations,
             )
             return False
 
-        # Convert to numpy array
-        X = self._to_array(pillar_scores_history)
-        if X is None:
+        # Check for degenerate data
+        if X.std() < 1e-6:
+            logger.warning("Pillar scores have near-zero variance")
             return False
 
+        # The filter must be rebuilt under the new parameters
+        self._alpha = None
+
         if _HMM_AVAILABLE:
             return self._fit_hmmlearn(X)
         else:
             return self._fit_threshold(X)
 
+    def set_params(
+        self,
+        startprob: np.ndarray,
+        transmat: np.ndarray,
+        means: np.ndarray,
+        covars: np.ndarray,
+        n_training_obs: int = 0,
+    ) -> None:
+        """Install Gaussian HMM parameters (e.g. from a fitted model).
+
+        Args:
+            startprob: (n_states,) initial state distribution.
+            transmat: (n_states × n_states) transition matrix.
+            means: (n_states × n_pillars) state means.
+            covars: (n_states × n_pillars × n_pillars) full covariances.
+            n_training_obs: Observations the parameters were fitted on.
+        """
+        means = np.asarray(means, dtype=np.float64)
+        covars = np.asarray(covars, dtype=np.float64)
+        n_features = means.shape[1]
+        chol = np.linalg.cholesky(covars)
+
+        self._startprob = np.asarray(startprob, dtype=np.float64)
+        self._transmat = np.asarray(transmat, dtype=np.float64)
+        self._means = means
+        self._chol_inv = np.linalg.inv(chol)
+        self._log_norm = (
+            -np.log(np.diagonal(chol, axis1=1, axis2=2)).sum(axis=1)
+            - 0.5 * n_features * np.log(2.0 * np.pi)
+        )
+        self._n_training_obs = n_training_obs
+
+        # Fragile state: lower mean across pillars
+        mean_per_state = means.mean(axis=1)
+        self._fragile_state_idx = int(np.argmin(mean_per_state))
+
+        # Reported with every result; built once per fit
+        self._transmat_list = self._transmat.tolist()
+        self._state_means = {
+            ("fragile" if i == self._fragile_state_idx else "normal"):
+                means[i].tolist()
+            for i in range(len(means))
+        }
+        self._alpha = None
+        self._stream_fitted = False
+        self._fitted = True
+
     def predict(
         self,
         current_pillar_scores: Dict[str, float],
@@ -167,25 +259,226 @@ class RegimeHMM:
                 current_pillar_scores,
             )
 
-        if _HMM_AVAILABLE and self._model is not None:
-            return self._predict_hmmlearn(
+        if self._startprob is not None:
+            return self._predict_window(
                 current_pillar_scores, recent_history,
             )
 
         return self._predict_threshold(current_pillar_scores)
 
+    # ── Streaming filter ────────────────────────────────────────────────
+
+    def reset_filter(self) -> None:
+        """Forget the observation stream and forward state.
+
+        Parameters that ``update`` fitted on the old stream are dropped
+        too, so the next stream fits on its own observations; parameters
+        from ``fit`` or ``set_params`` are kept.
+        """
+        self._stream = []
+        self._alpha = None
+        self._filter_loglik = 0.0
+        self._last_fit_n = 0
+        if self._stream_fitted:
+            self._fitted = False
+            self._stream_fitted = False
+
+    def update(
+        self,
+        current_pillar_scores: Dict[str, float],
+    ) -> Optional[RegimeResult]:
+        """Fold one observation into the forward filter.
+
+        Fits on the expanding stream once ``min_observations`` have
+        arrived (and every ``refit_interval`` observations after that,
+        if set), then updates P(state | observations so far) in
+        O(states²).  A failed fit still counts as an attempt: the next
+        one waits ``refit_interval`` (or ``min_observations``) further
+        observations rather than retrying on every update.
+
+        Args:
+            current_pillar_scores: Pillar scores for the newest date.
+
+        Returns:
+            RegimeResult with the filtered fragile probability, or None
+            while the model is not yet fitted.
+        """
+        cfg = self.config
+        row = self._matrix([current_pillar_scores])[0]
+        self._stream.append(row)
+        n = len(self._stream)
+        if n < cfg.min_observations:
+            return None
+
+        since = n - self._last_fit_n
+        if self._fitted:
+            fit_due = (
+                cfg.refit_interval is not None
+                and since >= cfg.refit_interval
+            )
+        else:
+            fit_due = self._last_fit_n == 0 or since >= (
+                cfg.refit_interval or cfg.min_observations
+            )
+        if fit_due:
+            self._last_fit_n = n
+            if self._fit_matrix(np.vstack(self._stream)):
+                self._stream_fitted = True
+        if not self._fitted:
+            return None
+        if self._startprob is None:
+            return self._predict_threshold(current_pillar_scores)
+
+        if self._alpha is None:
+            # New parameters: filter the whole stream once
+            alphas, self._filter_loglik = self._forward(
+                self._log_emissions(np.vstack(self._stream)),
+            )
+        else:
+            alphas, loglik = self._forward(
+                self._log_emissions(row[None, :]), self._alpha,
+            )
+            self._filter_loglik += loglik
+        alpha = alphas[-1]
+        self._alpha = alpha
+
+        fragile_prob = float(alpha[self._fragile_state_idx])
+        return RegimeResult(
+            fragile_prob=fragile_prob,
+            regime="fragile" if fragile_prob > 0.5 else "normal",
+            transition_matrix=self._transmat_list,
+            state_means=self._state_means,
+            log_likelihood=self._filter_loglik,
+            method="hmm_filter",
+            n_training_obs=self._n_training_obs,
+        )
+
+    def fragile_probabilities(
+        self,
+        pillar_scores_history: List[Dict[str, float]],
+        smoothed: bool = True,
+    ) -> np.ndarray:
+        """P(fragile) for every observation of a history in one pass.
+
+        Fits on the history first if the model is not fitted.
+
+        Args:
+            pillar_scores_history: Pillar score dicts, oldest first.
+            smoothed: Forward–backward posteriors (uses the whole
+                history); False gives forward-filtered probabilities.
+
+        Returns:
+            Array of P(fragile), one per observation (NaN if the model
+            could not be fitted).
+        """
+        X = self._matrix(pillar_scores_history)
+        if not self._fitted:
+            self._fit_matrix(X)
+        if not self._fitted:
+            return np.full(len(X), np.nan)
+        if self._startprob is None:
+            return self._threshold_probs(X)
+
+        log_b = self._log_emissions(X)
+        if smoothed:
+            posteriors = self._forward_backward(log_b)
+        else:
+            posteriors, _ = self._forward(log_b)
+        return posteriors[:, self._fragile_state_idx]
+
+    # ── NumPy inference kernels ─────────────────────────────────────────
+
+    def _log_emissions(self, X: np.ndarray) -> np.ndarray:
+        """Gaussian log-density of each row under each state (n × k)."""
+        means, chol_inv, log_norm = self._means, self._chol_inv, self._log_norm
+        assert (
+            means is not None and chol_inv is not None and log_norm is not None
+        ), "Gaussian parameters not set"
+        diff = X[:, None, :] - means[None, :, :]
+        z = np.einsum("kij,nkj->nki", chol_inv, diff)
+        return log_norm[None, :] - 0.5 * (z ** 2).sum(axis=2)
+
+    def _forward(
+        self,
+        log_b: np.ndarray,
+        alpha: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, float]:
+        """Normalised forward pass (filtered posteriors, log-likelihood).
+
+        Starts from ``alpha`` (the previous filtered posterior) or, if
+        None, from the initial state distribution.
+        """
+        alphas = np.empty_like(log_b)
+        loglik = 0.0
+        for t in range(len(log_b)):
+            prior = (
+                self._startprob if alpha is None
+                else alpha @ self._transmat
+            )
+            peak = log_b[t].max()
+            weighted = prior * np.exp(log_b[t] - peak)
+            total = weighted.sum()
+            alpha = weighted / total
+            loglik += peak + float(np.log(total))
+            alphas[t] = alpha
+        return alphas, loglik
+
+    def _forward_backward(self, log_b: np.ndarray) -> np.ndarray:
+        """Smoothed state posteriors (n × k)."""
+        alphas, _ = self._forward(log_b)
+        transmat = self._transmat
+        assert transmat is not None, "Gaussian parameters not set"
+        b = np.exp(log_b - log_b.max(axis=1, keepdims=True))
+        beta = np.ones(log_b.shape[1])
+        gammas = np.empty_like(alphas)
+        gammas[-1] = alphas[-1]
+        for t in range(len(log_b) - 2, -1, -1):
+            beta = transmat @ (b[t + 1] * beta)
+            beta /= beta.sum()
+            gamma = alphas[t] * beta
+            gammas[t] = gamma / gamma.sum()
+        return gammas
+
+    def _viterbi(self, log_b: np.ndarray) -> np.ndarray:
+        """Most likely state path."""
+        transmat, startprob = self._transmat, self._startprob
+        assert transmat is not None and startprob is not None, (
+            "Gaussian parameters not set"
+        )
+        with np.errstate(divide="ignore"):
+            log_a = np.log(transmat)
+            delta = np.log(startprob) + log_b[0]
+        back = np.zeros(log_b.shape, dtype=np.intp)
+        for t in range(1, len(log_b)):
+            scores = delta[:, None] + log_a
+            back[t] = scores.argmax(axis=0)
+            delta = scores.max(axis=0) + log_b[t]
+        path = np.empty(len(log_b), dtype=np.intp)
+        path[-1] = int(delta.argmax())
+        for t in range(len(log_b) - 1, 0, -1):
+            path[t - 1] = back[t, path[t]]
+        return path
+
+    # ── Helpers ─────────────────────────────────────────────────────────
+
+    def _matrix(
+        self,
+        pillar_scores_list: List[Dict[str, float]],
+    ) -> np.ndarray:
+        """Pillar score dicts → (n_obs × n_pillars) array (0.5 if absent)."""
+        cfg = self.config
+        return np.array(
+            [[ps.get(p, 0.5) for p in cfg.pillar_order]
+             for ps in pillar_scores_list],
+            dtype=np.float64,
+        ).reshape(len(pillar_scores_list), len(cfg.pillar_order))
+
     def _to_array(
         self,
         pillar_scores_list: List[Dict[str, float]],
     ) -> Optional[np.ndarray]:
         """Convert list of pillar score dicts to numpy array."""
-        cfg = self.config
-        rows = []
-        for ps in pillar_scores_list:
-            row = [ps.get(p, 0.5) for p in cfg.pillar_order]
-            rows.append(row)
-
-        arr = np.array(rows, dtype=np.float64)
+        arr = self._matrix(pillar_scores_list)
 
         # Check for degenerate data
         if arr.std() < 1e-6:
@@ -207,21 +500,20 @@ class RegimeHMM:
             )
             model.fit(X)
             self._model = model
-
-            # Identify fragile state: lower mean across pillars
-            state_means = model.means_  # (n_states, n_features)
-            mean_per_state = state_means.mean(axis=1)
-            self._fragile_state_idx = int(
-                np.argmin(mean_per_state)
+            # covars_ is always (n_states, n_features, n_features)
+            self.set_params(
+                model.startprob_, model.transmat_, model.means_,
+                model.covars_, n_training_obs=len(X),
             )
 
-            self._fitted = True
+            mean_per_state = model.means_.mean(axis=1)
+            fragile = int(np.argmin(mean_per_state))
             logger.info(
                 "HMM fitted: fragile state=%d, "
                 "fragile_mean=%.3f, normal_mean=%.3f",
-                self._fragile_state_idx,
-                mean_per_state[self._fragile_state_idx],
-                mean_per_state[1 - self._fragile_state_idx],
+                fragile,
+                mean_per_state[fragile],
+                mean_per_state[1 - fragile],
             )
             return True
 
@@ -235,6 +527,9 @@ class RegimeHMM:
 
         # Compute mean MAC per observation
         mean_mac = X.mean(axis=1)
+        self._model = None
+        self._startprob = None
+        self._transmat = None
 
         # Store statistics for threshold prediction
         self._threshold_mean = float(mean_mac.mean())
@@ -244,14 +539,12 @@ class RegimeHMM:
         self._fitted = True
         return True
 
-    def _predict_hmmlearn(
+    def _predict_window(
         self,
         current: Dict[str, float],
         recent: Optional[List[Dict[str, float]]],
     ) -> RegimeResult:
-        """Predict using fitted hmmlearn model."""
-        cfg = self.config
-
+        """Posterior and Viterbi path over recent history + current."""
         # Build observation sequence
         if recent:
             obs_list = recent + [current]
@@ -263,32 +556,14 @@ class RegimeHMM:
             return self._predict_threshold(current)
 
         try:
-            # Get state posteriors
-            log_prob, posteriors = self._model.score_samples(X)
+            log_b = self._log_emissions(X)
+            posteriors = self._forward_backward(log_b)
+            _, log_prob = self._forward(log_b)
 
             # Current observation posteriors
-            current_posterior = posteriors[-1]
             fragile_prob = float(
-                current_posterior[self._fragile_state_idx]
+                posteriors[-1, self._fragile_state_idx]
             )
-
-            # Viterbi path
-            _, viterbi = self._model.decode(X)
-
-            # Get transition matrix
-            trans = self._model.transmat_.tolist()
-
-            # State means
-            state_means = {}
-            for i in range(cfg.n_states):
-                label = (
-                    "fragile" if i == self._fragile_state_idx
-                    else "normal"
-                )
-                state_means[label] = (
-                    self._model.means_[i].tolist()
-                )
-
             regime = (
                 "fragile" if fragile_prob > 0.5
                 else "normal"
@@ -297,14 +572,12 @@ class RegimeHMM:
             return RegimeResult(
                 fragile_prob=fragile_prob,
                 regime=regime,
-                transition_matrix=trans,
-                state_means=state_means,
-                viterbi_path=viterbi.tolist(),
+                transition_matrix=self._transmat_list,
+                state_means=self._state_means,
+                viterbi_path=self._viterbi(log_b).tolist(),
                 log_likelihood=float(log_prob),
                 method="hmm",
-                n_training_obs=self._model.n_features_in_
-                if hasattr(self._model, "n_features_in_")
-                else 0,
+                n_training_obs=self._n_training_obs,
             )
 
         except Exception as e:
@@ -316,13 +589,23 @@ class RegimeHMM:
         current: Dict[str, float],
     ) -> RegimeResult:
         """Simple threshold-based regime prediction."""
+        fragile_prob = float(
+            self._threshold_probs(self._matrix([current]))[0]
+        )
+        regime = "fragile" if fragile_prob > 0.5 else "normal"
+
+        return RegimeResult(
+            fragile_prob=fragile_prob,
+            regime=regime,
+            method="threshold_fallback",
+        )
+
+    def _threshold_probs(self, X: np.ndarray) -> np.ndarray:
+        """Threshold-based P(fragile) for each row of X."""
         cfg = self.config
 
         # Mean of current pillar scores
-        scores = [
-            current.get(p, 0.5) for p in cfg.pillar_order
-        ]
-        mean_score = np.mean(scores)
+        mean_score = X.mean(axis=1)
 
         # Simple sigmoid mapping
         if hasattr(self, "_threshold_mean"):
@@ -331,28 +614,18 @@ class RegimeHMM:
                 / max(self._threshold_std, 0.01)
             )
             # P(fragile) is higher when score is low
-            fragile_prob = float(
-                1.0 / (1.0 + np.exp(z))
-            )
+            with np.errstate(over="ignore"):
+                fragile_prob = 1.0 / (1.0 + np.exp(z))
         else:
             # No fitted params: use raw threshold
-            if mean_score < cfg.fragile_threshold:
-                fragile_prob = float(0.7 + 0.3 * (
-                    cfg.fragile_threshold - mean_score
-                ) / cfg.fragile_threshold)
-            else:
-                fragile_prob = float(0.3 * (
-                    1.0 - mean_score
-                ) / (1.0 - cfg.fragile_threshold))
-
-        fragile_prob = float(np.clip(fragile_prob, 0.0, 1.0))
-        regime = "fragile" if fragile_prob > 0.5 else "normal"
+            fragile_prob = np.where(
+                mean_score < cfg.fragile_threshold,
+                0.7 + 0.3 * (cfg.fragile_threshold - mean_score)
+                / cfg.fragile_threshold,
+                0.3 * (1.0 - mean_score) / (1.0 - cfg.fragile_threshold),
+            )
 
-        return RegimeResult(
-            fragile_prob=fragile_prob,
-            regime=regime,
-            method="threshold_fallback",
-        )
+        return np.clip(fragile_prob, 0.0, 1.0)
 
     @property
     def is_fitted(self) -> bool:
@@ -360,8 +633,4 @@ class RegimeHMM:
 
     @property
     def transition_matrix(self) -> Optional[np.ndarray]:
-        if self._model is not None and hasattr(
-            self._model, "transmat_"
-        ):
-            return self._model.transmat_
-        return None
+        return self._transmat
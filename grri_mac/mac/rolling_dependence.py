@@ -0,0 +1,357 @@
+"""Incremental rolling-window pillar dependence.
+
+``PillarDependenceAnalyzer.rolling_analysis`` re-runs ``full_analysis``
+from scratch for every window, rebuilding histograms and kernels for
+data that overlaps the previous window almost entirely.  This engine
+slides the window instead:
+
+- **Per-window ordering** — each pillar keeps its window values in a
+  sorted array, updated by deleting the rows that leave and inserting
+  the rows that enter.  Bin ranges and ranks are read off that array, so
+  every statistic uses only observations inside its own window (no
+  look-ahead from later history).
+- **Binned MI** — the same bins as ``compute_mi``: equal-width edges
+  spanning the window's min and max (its sorted array's ends), so the
+  ``mi``/``nmi`` columns equal ``rolling_analysis``; joint and marginal
+  counts are one bincount per window.
+- **Gaussian-copula statistics** — normal scores Φ⁻¹(rank / (w + 1))
+  from within-window average ranks give each window's copula
+  correlation matrix, from which the Gaussian MI per pair,
+  −½·log₂(1 − ρ²), and Gaussian total correlation, −½·log₂ det R,
+  follow directly.
+- **Raw-score Pearson** — running sums of x and xxᵀ, updated by the
+  rows that enter and leave and rebuilt from the window once every
+  ``window_size`` slid rows so add/subtract rounding cannot accumulate.
+- **HSIC and MIC** — not incremental; each window's pairs are computed
+  with per-pillar kernel caching, optionally across a process pool.
+
+Results come back as one long DataFrame indexed by window end, one row
+per (window, pillar pair), rather than a list of DependenceReport.
+
+Usage:
+    analyzer = PillarDependenceAnalyzer()
+    frame = analyzer.rolling_frame(pillar_history, window_size=52,
+                                   index=dates, workers=4)
+    frame[frame.pillar_a == "liquidity"]["gaussian_mi"].plot()
+"""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from typing import TYPE_CHECKING, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm, rankdata
+
+from .dependence import compute_mic
+
+if TYPE_CHECKING:
+    from .dependence import PillarDependenceAnalyzer
+
+
+def _entropy_bits(counts: np.ndarray, total: float, axes) -> np.ndarray:
+    """Shannon entropy (bits) of count arrays reduced over ``axes``."""
+    probs = counts / total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(probs > 0, probs * np.log2(probs), 0.0)
+    return -terms.sum(axis=axes)
+
+
+def _histogram_codes(
+    values: np.ndarray, lo: float, hi: float, n_bins: int,
+) -> np.ndarray:
+    """Bin index of each value on equal-width edges from ``lo`` to ``hi``.
+
+    Same assignment as np.histogram / np.histogram2d with ``bins=n_bins``
+    over data whose min and max are ``lo`` and ``hi``: half-open bins,
+    the last one closed, and a ±0.5 range for constant data.
+    """
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    edges = np.linspace(lo, hi, n_bins + 1)
+    codes = np.searchsorted(edges, values, side="right") - 1
+    return np.minimum(codes, n_bins - 1)
+
+
+def _copula_scores(matrix: np.ndarray) -> np.ndarray:
+    """Normal scores Φ⁻¹(rank / (n + 1)) per column (average ties).
+
+    Reference form of the per-window copula transform.
+    """
+    n = len(matrix)
+    ranks = np.column_stack([
+        rankdata(matrix[:, j]) for j in range(matrix.shape[1])
+    ])
+    return norm.ppf(ranks / (n + 1))
+
+
+def _remove_sorted(col: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Delete one occurrence of each of ``values`` from sorted ``col``."""
+    values = np.sort(values)
+    # The k-th copy of a repeated value sits k places after its first
+    first = np.searchsorted(values, values, side="left")
+    pos = np.searchsorted(col, values, side="left")
+    return np.delete(col, pos + np.arange(len(values)) - first)
+
+
+def _window_heavy_metrics(
+    task: tuple[np.ndarray, dict],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """HSIC, HSIC p-value and MIC for every pair in one window."""
+    from .dependence import PillarDependenceAnalyzer
+
+    window, options = task
+    analyzer = PillarDependenceAnalyzer(
+        pillar_names=[str(j) for j in range(window.shape[1])],
+        n_permutations=options["n_permutations"],
+        seed=options["seed"],
+        hsic_method=options["hsic_method"],
+        rff_features=options["rff_features"],
+    )
+    pairs = list(combinations(range(window.shape[1]), 2))
+    hsic = np.full(len(pairs), np.nan)
+    p_value = np.full(len(pairs), np.nan)
+    mic = np.full(len(pairs), np.nan)
+    kernels: dict = {}
+    for k, (i, j) in enumerate(pairs):
+        if options["include_hsic"]:
+            hsic[k], p_value[k] = analyzer._pair_hsic(window, i, j, kernels)
+        if options["include_mic"]:
+            mic[k] = compute_mic(window[:, i], window[:, j])
+    return hsic, p_value, mic
+
+
+class RollingDependenceEngine:
+    """Slide a window over pillar history, updating statistics in place."""
+
+    def __init__(
+        self,
+        analyzer: "PillarDependenceAnalyzer",
+        window_size: int = 52,
+        step: Optional[int] = None,
+        n_bins: Optional[int] = None,
+    ):
+        """
+        Args:
+            analyzer: Supplies pillar names, permutations, seed and
+                significance level for the HSIC/MIC part
+            window_size: Observations per window
+            step: Observations between window starts
+                (default: window_size // 4, as rolling_analysis)
+            n_bins: MI bins per pillar (default: ceil(window^(1/3)),
+                at least 3, as compute_mi)
+        """
+        if window_size < 5:
+            raise ValueError("window_size must be at least 5")
+        self.analyzer = analyzer
+        self.window_size = window_size
+        self.step = step or max(1, window_size // 4)
+        self.n_bins = n_bins or max(
+            3, int(math.ceil(window_size ** (1.0 / 3.0))),
+        )
+
+    def run(
+        self,
+        matrix: np.ndarray,
+        pillar_names: list[str],
+        index: Optional[Sequence] = None,
+        workers: int = 1,
+        include_hsic: bool = True,
+        include_mic: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Rolling pairwise metrics over an (n_obs × n_pillars) matrix.
+
+        Args:
+            matrix: Pillar scores, one column per pillar
+            pillar_names: Column names
+            index: Optional labels per observation (e.g. dates); each
+                window is labelled by its last observation
+            workers: Processes for HSIC/MIC (1 = in-process)
+            include_hsic: Compute HSIC and permutation p-values
+            include_mic: Compute MIC
+
+        Returns:
+            DataFrame indexed by window end with columns pillar_a,
+            pillar_b, pearson, gaussian_mi, mi, nmi, hsic, hsic_p_value,
+            mic, significant, gaussian_total_correlation
+        """
+        n_obs, n_pillars = matrix.shape
+        w = self.window_size
+        if n_obs < w:
+            raise ValueError(f"Need at least {w} obs, got {n_obs}")
+        labels: Sequence = range(n_obs) if index is None else index
+        if len(labels) != n_obs:
+            raise ValueError("index length must match observations")
+
+        pairs = list(combinations(range(n_pillars), 2))
+        pa = np.array([i for i, _ in pairs], dtype=np.intp)
+        pb = np.array([j for _, j in pairs], dtype=np.intp)
+        starts = list(range(0, n_obs - w + 1, self.step))
+
+        b = self.n_bins
+        n_pairs = len(pairs)
+        pair_offset = (np.arange(n_pairs) * b * b)[None, :]
+        pillar_offset = (np.arange(n_pillars) * b)[None, :]
+
+        ordered: list[np.ndarray] = []
+        sums = [np.zeros(n_pillars), np.zeros((n_pillars, n_pillars))]
+        slid = 0
+
+        def resum(rows: slice) -> None:
+            data = matrix[rows]
+            sums[0] = data.sum(axis=0)
+            sums[1] = data.T @ data
+
+        def apply(rows: slice, sign: float) -> None:
+            data = matrix[rows]
+            if len(data) == 0:
+                return
+            sums[0] += sign * data.sum(axis=0)
+            sums[1] += sign * (data.T @ data)
+            for j, col in enumerate(ordered):
+                if sign > 0:
+                    values = np.sort(data[:, j])
+                    ordered[j] = np.insert(
+                        col, np.searchsorted(col, values), values,
+                    )
+                else:
+                    ordered[j] = _remove_sorted(col, data[:, j])
+
+        def correlation(cov: np.ndarray) -> np.ndarray:
+            sd = np.sqrt(np.clip(np.diag(cov), 0.0, None))
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return cov / np.outer(sd, sd)
+
+        columns: dict[str, list] = {
+            k: [] for k in (
+                "pearson", "gaussian_mi", "mi", "nmi",
+                "gaussian_total_correlation",
+            )
+        }
+        prev_start = None
+        for start in starts:
+            rows = slice(start, start + w)
+            if prev_start is None or start - prev_start >= w:
+                # First or disjoint window: build from scratch
+                ordered = [np.sort(matrix[rows, j]) for j in range(n_pillars)]
+                resum(rows)
+                slid = 0
+            else:
+                apply(slice(prev_start, start), -1.0)
+                apply(slice(prev_start + w, start + w), 1.0)
+                slid += start - prev_start
+                if slid >= w:
+                    resum(rows)
+                    slid = 0
+            prev_start = start
+            window = matrix[rows]
+
+            # Within-window bin codes and average ranks
+            codes = np.empty(window.shape, dtype=np.intp)
+            ranks = np.empty(window.shape)
+            for j, col in enumerate(ordered):
+                codes[:, j] = _histogram_codes(window[:, j], col[0], col[-1], b)
+                lo = np.searchsorted(col, window[:, j], side="left")
+                hi = np.searchsorted(col, window[:, j], side="right")
+                ranks[:, j] = (lo + hi + 1) / 2.0
+
+            joint = np.bincount(
+                (pair_offset + codes[:, pa] * b + codes[:, pb]).ravel(),
+                minlength=n_pairs * b * b,
+            ).reshape(n_pairs, b, b)
+            marginal = np.bincount(
+                (pillar_offset + codes).ravel(), minlength=n_pillars * b,
+            ).reshape(n_pillars, b)
+            h_marg = _entropy_bits(marginal, w, axes=1)
+            h_joint = _entropy_bits(joint, w, axes=(1, 2))
+            hx, hy = h_marg[pa], h_marg[pb]
+            mi = np.maximum(0.0, hx + hy - h_joint)
+            denom = hx + hy
+            with np.errstate(divide="ignore", invalid="ignore"):
+                nmi = np.where(denom > 0, 2.0 * mi / denom, 0.0)
+            columns["mi"].append(mi)
+            columns["nmi"].append(np.clip(nmi, 0.0, 1.0))
+
+            s1, s2 = sums
+            raw_cov = s2 / w - np.outer(s1 / w, s1 / w)
+            columns["pearson"].append(correlation(raw_cov)[pa, pb])
+
+            z = norm.ppf(ranks / (w + 1))
+            z -= z.mean(axis=0)
+            rho = np.clip(correlation(z.T @ z / w), -1.0, 1.0)
+            r2 = np.clip(rho[pa, pb] ** 2, 0.0, 1.0 - 1e-15)
+            columns["gaussian_mi"].append(-0.5 * np.log2(1.0 - r2))
+            det_sign, logdet = np.linalg.slogdet(
+                np.nan_to_num(rho, nan=0.0) + 1e-12 * np.eye(n_pillars)
+            )
+            tc = -0.5 * logdet / math.log(2.0) if det_sign > 0 else np.inf
+            columns["gaussian_total_correlation"].append(
+                np.full(n_pairs, max(0.0, tc))
+            )
+
+        heavy = self._heavy_metrics(
+            matrix, starts, workers, include_hsic, include_mic,
+        )
+
+        n_windows = len(starts)
+        ends = [labels[s + w - 1] for s in starts]
+        frame = pd.DataFrame({
+            "pillar_a": np.tile([pillar_names[i] for i in pa], n_windows),
+            "pillar_b": np.tile([pillar_names[j] for j in pb], n_windows),
+            "pearson": np.concatenate(columns["pearson"]),
+            "gaussian_mi": np.concatenate(columns["gaussian_mi"]),
+            "mi": np.concatenate(columns["mi"]),
+            "nmi": np.concatenate(columns["nmi"]),
+            "hsic": heavy[0],
+            "hsic_p_value": heavy[1],
+            "mic": heavy[2],
+            "significant": heavy[1] < self.analyzer.significance_level,
+            "gaussian_total_correlation": np.concatenate(
+                columns["gaussian_total_correlation"]
+            ),
+        }, index=pd.Index(np.repeat(ends, len(pairs)), name="window_end"))
+        return frame
+
+    def _heavy_metrics(
+        self,
+        matrix: np.ndarray,
+        starts: list[int],
+        workers: int,
+        include_hsic: bool,
+        include_mic: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """HSIC/p/MIC per window and pair, concatenated in window order."""
+        n_pairs = matrix.shape[1] * (matrix.shape[1] - 1) // 2
+        if not (include_hsic or include_mic):
+            empty = np.full(len(starts) * n_pairs, np.nan)
+            return empty, empty.copy(), empty.copy()
+
+        analyzer = self.analyzer
+        options = {
+            # Same permutation budget rolling_analysis uses
+            "n_permutations": min(200, analyzer.n_permutations),
+            "seed": analyzer.seed,
+            "hsic_method": analyzer.hsic_method,
+            "rff_features": analyzer.rff_features,
+            "include_hsic": include_hsic,
+            "include_mic": include_mic,
+        }
+        tasks = [
+            (matrix[s:s + self.window_size], options) for s in starts
+        ]
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(
+                    _window_heavy_metrics, tasks,
+                    chunksize=max(1, len(tasks) // (workers * 4)),
+                ))
+        else:
+            results = [_window_heavy_metrics(t) for t in tasks]
+        hsic, p_value, mic = (
+            np.concatenate([r[k] for r in results]) for k in range(3)
+        )
+        return hsic, p_value, mic
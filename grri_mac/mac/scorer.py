@@ -1,7 +1,20 @@
-"""Pillar scoring logic for MAC framework."""
+"""Pillar scoring logic for MAC framework.
 
-from typing import Optional, Union
-from dataclasses import dataclass
+All threshold scoring goes through the ThresholdCurve kernel
+(``threshold_kernel.py``), which the Functions API uses too.
+Scalar helpers compile their curve once per distinct threshold set;
+the ``*_array`` helpers and ``calculate_batch`` on each pillar score
+whole indicator columns with one np.interp call.
+"""
+
+from dataclasses import astuple, dataclass
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .threshold_kernel import ThresholdCurve, score_steps  # noqa: F401
 
 
 @dataclass
@@ -16,6 +29,53 @@ class IndicatorThresholds:
     breach_high: Optional[float] = None
     invert: bool = False  # If True, lower values are better
 
+    def curve(self) -> Optional[ThresholdCurve]:
+        """Compiled score curve (None if no ample threshold is set)."""
+        return _indicator_curve(astuple(self))
+
+
+@lru_cache(maxsize=256)
+def _indicator_curve(key: tuple) -> Optional[ThresholdCurve]:
+    """Compile IndicatorThresholds fields into a ThresholdCurve."""
+    ample_low, ample_high, thin_low, thin_high, breach_low, breach_high, invert = key
+
+    # Inverted indicators are scored on negated values against negated
+    # thresholds; the curve is built in that space and mirrored back.
+    if invert:
+        ample_low, ample_high, thin_low, thin_high, breach_low, breach_high = (
+            None if v is None else -v
+            for v in (ample_low, ample_high, thin_low, thin_high,
+                      breach_low, breach_high)
+        )
+
+    if ample_high is None and ample_low is not None:
+        # Higher is better (e.g., term premium > 100 bps)
+        thin = thin_low if thin_low is not None else ample_low * 0.5
+        breach = breach_low if breach_low is not None else 0
+        curve = ThresholdCurve.one_sided(ample_low, thin, breach)
+    elif ample_low is None and ample_high is not None:
+        # Lower is better (e.g., spread < 5 bps)
+        thin = thin_high if thin_high is not None else ample_high * 2
+        breach = breach_high if breach_high is not None else thin * 2
+        curve = ThresholdCurve.one_sided(
+            ample_high, thin, breach, lower_is_better=True,
+        )
+    elif ample_low is not None and ample_high is not None:
+        # Two-sided: value should be in a range
+        thin_low = thin_low if thin_low else ample_low * 0.5
+        thin_high = thin_high if thin_high else ample_high * 1.5
+        breach_low = breach_low if breach_low else thin_low * 0.5
+        breach_high = breach_high if breach_high else thin_high * 1.5
+        curve = ThresholdCurve.two_sided(
+            (ample_low, ample_high),
+            (thin_low, thin_high),
+            (breach_low, breach_high),
+        )
+    else:
+        return None
+
+    return curve.mirrored() if invert else curve
+
 
 def score_indicator(
     value: float,
@@ -40,87 +100,33 @@ def score_indicator(
     """
     if isinstance(thresholds, dict):
         thresholds = IndicatorThresholds(**thresholds)
+    curve = thresholds.curve()
+    if curve is None:
+        return 0.5  # Default fallback
+    return curve(value)
 
-    # Handle inverted indicators (where lower is better)
-    if thresholds.invert:
-        value = -value
-        if thresholds.ample_low is not None:
-            thresholds.ample_low = -thresholds.ample_low
-        if thresholds.ample_high is not None:
-            thresholds.ample_high = -thresholds.ample_high
-        if thresholds.thin_low is not None:
-            thresholds.thin_low = -thresholds.thin_low
-        if thresholds.thin_high is not None:
-            thresholds.thin_high = -thresholds.thin_high
-        if thresholds.breach_low is not None:
-            thresholds.breach_low = -thresholds.breach_low
-        if thresholds.breach_high is not None:
-            thresholds.breach_high = -thresholds.breach_high
-
-    # Case 1: Single-sided thresholds (value should be above/below a threshold)
-    if thresholds.ample_high is None and thresholds.ample_low is not None:
-        # Higher is better (e.g., term premium > 100 bps)
-        ample = thresholds.ample_low
-        thin = thresholds.thin_low if thresholds.thin_low is not None else ample * 0.5
-        breach = thresholds.breach_low if thresholds.breach_low is not None else 0
-
-        if value >= ample:
-            return 1.0
-        elif value >= thin:
-            return 0.5 + 0.5 * (value - thin) / (ample - thin)
-        elif value >= breach:
-            return 0.5 * (value - breach) / (thin - breach)
-        else:
-            return 0.0
-
-    elif thresholds.ample_low is None and thresholds.ample_high is not None:
-        # Lower is better (e.g., spread < 5 bps)
-        ample = thresholds.ample_high
-        thin = thresholds.thin_high if thresholds.thin_high is not None else ample * 2
-        breach = thresholds.breach_high if thresholds.breach_high is not None else thin * 2
-
-        if value <= ample:
-            return 1.0
-        elif value <= thin:
-            return 0.5 + 0.5 * (thin - value) / (thin - ample)
-        elif value <= breach:
-            return 0.5 * (breach - value) / (breach - thin)
-        else:
-            return 0.0
-
-    # Case 2: Two-sided thresholds (value should be in a range)
-    elif thresholds.ample_low is not None and thresholds.ample_high is not None:
-        (thresholds.ample_low + thresholds.ample_high) / 2
-        (thresholds.ample_high - thresholds.ample_low) / 2
-
-        thin_low = thresholds.thin_low if thresholds.thin_low else thresholds.ample_low * 0.5
-        thin_high = thresholds.thin_high if thresholds.thin_high else thresholds.ample_high * 1.5
-        breach_low = thresholds.breach_low if thresholds.breach_low else thin_low * 0.5
-        breach_high = thresholds.breach_high if thresholds.breach_high else thin_high * 1.5
-
-        # In ample range
-        if thresholds.ample_low <= value <= thresholds.ample_high:
-            return 1.0
-
-        # Below ample range
-        if value < thresholds.ample_low:
-            if value >= thin_low:
-                return 0.5 + 0.5 * (value - thin_low) / (thresholds.ample_low - thin_low)
-            elif value >= breach_low:
-                return 0.5 * (value - breach_low) / (thin_low - breach_low)
-            else:
-                return 0.0
-
-        # Above ample range
-        if value > thresholds.ample_high:
-            if value <= thin_high:
-                return 0.5 + 0.5 * (thin_high - value) / (thin_high - thresholds.ample_high)
-            elif value <= breach_high:
-                return 0.5 * (breach_high - value) / (breach_high - thin_high)
-            else:
-                return 0.0
-
-    return 0.5  # Default fallback
+
+def score_indicator_array(
+    values: np.ndarray,
+    thresholds: Union[IndicatorThresholds, dict],
+) -> np.ndarray:
+    """
+    Array form of score_indicator.
+
+    Args:
+        values: Indicator values
+        thresholds: IndicatorThresholds or dict with threshold values
+
+    Returns:
+        Array of scores between 0 and 1 (NaN where input is NaN)
+    """
+    if isinstance(thresholds, dict):
+        thresholds = IndicatorThresholds(**thresholds)
+    curve = thresholds.curve()
+    values = np.asarray(values, dtype=np.float64)
+    if curve is None:
+        return np.where(np.isnan(values), np.nan, 0.5)
+    return curve.score(values)
 
 
 def score_pillar(indicators: dict[str, float]) -> tuple[float, dict[str, float]]:
@@ -142,6 +148,105 @@ def score_pillar(indicators: dict[str, float]) -> tuple[float, dict[str, float]]
     return composite, scores
 
 
+def score_pillar_batch(
+    score_columns: Sequence[np.ndarray],
+    default: float = 0.5,
+) -> np.ndarray:
+    """
+    Array form of score_pillar: mean of the available scores per row.
+
+    Args:
+        score_columns: Indicator score arrays (NaN = indicator missing)
+        default: Composite for rows with no indicator at all
+
+    Returns:
+        Composite score per row
+    """
+    stacked = np.vstack([np.asarray(c, dtype=np.float64) for c in score_columns])
+    count = (~np.isnan(stacked)).sum(axis=0)
+    total = np.nansum(stacked, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / np.maximum(count, 1), default)
+
+
+def indicator_column(source, name: str) -> np.ndarray:
+    """
+    One indicator as a float array.
+
+    ``source`` is either an indicator frame, whose column names follow
+    the pillar's indicator dataclass fields (an absent column reads as
+    all-NaN), or a single indicator dataclass, read as a one-row frame
+    (``None`` reads as NaN).  Each pillar scores both through the same
+    array code, so ``calculate`` and ``calculate_batch`` cannot drift.
+    """
+    if isinstance(source, pd.DataFrame):
+        if name in source.columns:
+            return source[name].to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.full(len(source), np.nan)
+    value = getattr(source, name, None)
+    return np.array([np.nan if value is None else value], dtype=np.float64)
+
+
+def indicator_years(source, name: str) -> np.ndarray:
+    """
+    Calendar year of a date field as a float array (NaN = no date).
+
+    Accepts the same ``source`` forms as indicator_column; dates may be
+    datetimes or ISO strings.
+    """
+    if isinstance(source, pd.DataFrame):
+        if name not in source.columns:
+            return np.full(len(source), np.nan)
+        return pd.to_datetime(source[name], errors="coerce").dt.year.to_numpy(
+            dtype=np.float64, na_value=np.nan,
+        )
+    value = getattr(source, name, None)
+    if value is None:
+        return np.array([np.nan])
+    year = value.year if hasattr(value, "year") else int(str(value)[:4])
+    return np.array([year], dtype=np.float64)
+
+
+def indicator_rows(source) -> int:
+    """Number of observations in an indicator frame or dataclass."""
+    return len(source) if isinstance(source, pd.DataFrame) else 1
+
+
+def first_row(columns: dict) -> dict[str, Any]:
+    """
+    Scalars of the first row of a dict of score arrays.
+
+    NaN becomes ``None`` so optional fields of the scores dataclasses
+    keep their "not applicable" meaning.
+    """
+    row = {}
+    for key, column in columns.items():
+        value = np.asarray(column)[0].item()
+        row[key] = None if isinstance(value, float) and np.isnan(value) else value
+    return row
+
+
+@lru_cache(maxsize=256)
+def _simple_curve(
+    ample_threshold: float,
+    thin_threshold: float,
+    breach_threshold: float,
+    lower_is_better: bool,
+) -> ThresholdCurve:
+    return ThresholdCurve.one_sided(
+        ample_threshold, thin_threshold, breach_threshold, lower_is_better,
+    )
+
+
+@lru_cache(maxsize=256)
+def _range_curve(
+    ample_range: tuple[float, float],
+    thin_range: tuple[float, float],
+    breach_range: tuple[float, float],
+) -> ThresholdCurve:
+    return ThresholdCurve.two_sided(ample_range, thin_range, breach_range)
+
+
 def score_indicator_simple(
     value: float,
     ample_threshold: float,
@@ -162,24 +267,9 @@ def score_indicator_simple(
     Returns:
         Score between 0 and 1
     """
-    if lower_is_better:
-        if value <= ample_threshold:
-            return 1.0
-        elif value <= thin_threshold:
-            return 0.5 + 0.5 * (thin_threshold - value) / (thin_threshold - ample_threshold)
-        elif value <= breach_threshold:
-            return 0.5 * (breach_threshold - value) / (breach_threshold - thin_threshold)
-        else:
-            return 0.0
-    else:
-        if value >= ample_threshold:
-            return 1.0
-        elif value >= thin_threshold:
-            return 0.5 + 0.5 * (value - thin_threshold) / (ample_threshold - thin_threshold)
-        elif value >= breach_threshold:
-            return 0.5 * (value - breach_threshold) / (thin_threshold - breach_threshold)
-        else:
-            return 0.0
+    return _simple_curve(
+        ample_threshold, thin_threshold, breach_threshold, lower_is_better,
+    )(value)
 
 
 def score_indicator_range(
@@ -200,26 +290,58 @@ def score_indicator_range(
     Returns:
         Score between 0 and 1
     """
-    ample_low, ample_high = ample_range
-    thin_low, thin_high = thin_range
-    breach_low, breach_high = breach_range
-
-    # In ample range
-    if ample_low <= value <= ample_high:
-        return 1.0
-
-    # Check which side we're on
-    if value < ample_low:
-        if value >= thin_low:
-            return 0.5 + 0.5 * (value - thin_low) / (ample_low - thin_low)
-        elif value >= breach_low:
-            return 0.5 * (value - breach_low) / (thin_low - breach_low)
-        else:
-            return 0.0
-    else:  # value > ample_high
-        if value <= thin_high:
-            return 0.5 + 0.5 * (thin_high - value) / (thin_high - ample_high)
-        elif value <= breach_high:
-            return 0.5 * (breach_high - value) / (breach_high - thin_high)
-        else:
-            return 0.0
+    return _range_curve(
+        tuple(ample_range), tuple(thin_range), tuple(breach_range),
+    )(value)
+
+
+def score_indicator_simple_array(
+    values: np.ndarray,
+    ample_threshold: float,
+    thin_threshold: float,
+    breach_threshold: float,
+    lower_is_better: bool = False,
+) -> np.ndarray:
+    """
+    Array form of score_indicator_simple.
+
+    Scores every element of ``values`` with the same piecewise-linear
+    mapping in one np.interp call.  NaN inputs stay NaN so callers can
+    mask missing observations.
+
+    Args:
+        values: Indicator values
+        ample_threshold: Threshold for ample (score 1.0)
+        thin_threshold: Threshold for thin (score 0.5)
+        breach_threshold: Threshold for breach (score 0.0)
+        lower_is_better: If True, values below ample are good
+
+    Returns:
+        Array of scores between 0 and 1
+    """
+    return _simple_curve(
+        ample_threshold, thin_threshold, breach_threshold, lower_is_better,
+    ).score(values)
+
+
+def score_indicator_range_array(
+    values: np.ndarray,
+    ample_range: tuple[float, float],
+    thin_range: tuple[float, float],
+    breach_range: tuple[float, float],
+) -> np.ndarray:
+    """
+    Array form of score_indicator_range.
+
+    Args:
+        values: Indicator values
+        ample_range: (low, high) for ample score
+        thin_range: (low, high) for thin score
+        breach_range: (low, high) for breach score
+
+    Returns:
+        Array of scores between 0 and 1 (NaN where input is NaN)
+    """
+    return _range_curve(
+        tuple(ample_range), tuple(thin_range), tuple(breach_range),
+    ).score(values)
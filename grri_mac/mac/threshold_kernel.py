@@ -0,0 +1,142 @@
+"""Vectorized threshold scoring kernel.
+
+Every calibrated MAC indicator maps a raw value to a 0-1 score with the
+same shape: flat at the ample score inside the ample zone, linear
+between the ample, thin and breach thresholds, and flat beyond the last
+threshold.  ThresholdCurve compiles that shape once into sorted
+breakpoints and evaluates it with np.interp, so a scalar, a column or a
+whole indicator history costs one call.  Step ladders ("above 40 →
+0.3, above 20 → 0.5, else 0.8") go through score_steps.
+
+This module only depends on NumPy so the Functions app can use it too:
+``api/`` deploys on its own and carries an identical copy at
+``api/shared/threshold_kernel.py``.  Edit both together; the test suite
+fails if they drift apart.
+
+Usage:
+    vix = ThresholdCurve.two_sided((15, 20), (12, 35), (10, 50))
+    vix(18.0)                       # 1.0
+    vix.score(np.array([25.0, np.nan]))   # array([0.8333..., nan])
+"""
+
+from bisect import bisect_right
+from typing import Sequence, Union
+
+import numpy as np
+
+
+class ThresholdCurve:
+    """Piecewise-linear indicator score over sorted breakpoints.
+
+    Values below the first breakpoint take the first score, values above
+    the last take the last score, NaN stays NaN.  Breakpoints that are
+    out of order collapse onto the previous one, which reproduces the
+    scalar branch ladders for thresholds whose defaults overshoot (e.g.
+    a defaulted breach level past the thin level).
+    """
+
+    def __init__(
+        self,
+        breakpoints: Union[Sequence[float], np.ndarray],
+        scores: Union[Sequence[float], np.ndarray],
+    ):
+        xp = np.asarray(breakpoints, dtype=np.float64)
+        fp = np.asarray(scores, dtype=np.float64)
+        if xp.ndim != 1 or xp.shape != fp.shape or len(xp) < 2:
+            raise ValueError(
+                "breakpoints and scores must be 1-D with matching length >= 2"
+            )
+        self.breakpoints: np.ndarray = np.maximum.accumulate(xp)
+        self.scores: np.ndarray = fp
+        # Plain-float copies for the scalar path, which skips NumPy's
+        # per-call overhead (several µs for a one-element np.interp)
+        self._xp = tuple(self.breakpoints.tolist())
+        self._fp = tuple(fp.tolist())
+
+    @classmethod
+    def one_sided(
+        cls,
+        ample: float,
+        thin: float,
+        breach: float,
+        lower_is_better: bool = False,
+    ) -> "ThresholdCurve":
+        """1.0 at ample, 0.5 at thin, 0.0 at breach (one direction)."""
+        if lower_is_better:
+            return cls([ample, thin, breach], [1.0, 0.5, 0.0])
+        return cls([breach, thin, ample], [0.0, 0.5, 1.0])
+
+    @classmethod
+    def two_sided(
+        cls,
+        ample_range: tuple[float, float],
+        thin_range: tuple[float, float],
+        breach_range: tuple[float, float],
+    ) -> "ThresholdCurve":
+        """1.0 inside ample_range, falling to 0.0 at either breach bound."""
+        return cls(
+            [breach_range[0], thin_range[0], ample_range[0],
+             ample_range[1], thin_range[1], breach_range[1]],
+            [0.0, 0.5, 1.0, 1.0, 0.5, 0.0],
+        )
+
+    def mirrored(self) -> "ThresholdCurve":
+        """Curve scoring ``-value`` (for indicators scored on negated units)."""
+        return ThresholdCurve(-self.breakpoints[::-1], self.scores[::-1])
+
+    def score(self, values) -> np.ndarray:
+        """Score an array of values (NaN in, NaN out)."""
+        return np.interp(
+            np.asarray(values, dtype=np.float64), self.breakpoints, self.scores,
+        )
+
+    def __call__(self, value: float) -> float:
+        """Score a single value (same arithmetic as np.interp)."""
+        x = float(value)
+        xp, fp = self._xp, self._fp
+        if x != x:
+            return x
+        if x > xp[-1]:
+            return fp[-1]
+        if x < xp[0]:
+            return fp[0]
+        j = bisect_right(xp, x) - 1
+        if j == len(xp) - 1 or xp[j] == x:
+            return fp[j]
+        slope = (fp[j + 1] - fp[j]) / (xp[j + 1] - xp[j])
+        return slope * (x - xp[j]) + fp[j]
+
+
+def score_steps(
+    values,
+    bounds: Sequence[float],
+    scores: Sequence[float],
+    side: str = "left",
+) -> np.ndarray:
+    """
+    Step-ladder scores for an array of values.
+
+    ``bounds`` are ascending and ``scores`` has one more entry than
+    ``bounds``: values up to ``bounds[0]`` get ``scores[0]``, values up
+    to ``bounds[1]`` get ``scores[1]``, and so on.
+
+    Args:
+        values: Indicator values
+        bounds: Ascending step boundaries
+        scores: Score for each of the len(bounds) + 1 intervals
+        side: "left" closes intervals on the right (``value <= bound``
+            stays in the lower step); "right" closes them on the left
+            (``value < bound`` stays in the lower step)
+
+    Returns:
+        Array of scores (NaN where the input is NaN)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    table = np.asarray(scores, dtype=np.float64)
+    if len(table) != len(bounds) + 1:
+        raise ValueError("scores needs one more entry than bounds")
+    idx = np.searchsorted(
+        np.asarray(bounds, dtype=np.float64), values,
+        side="right" if side == "right" else "left",
+    )
+    return np.where(np.isnan(values), np.nan, table[idx])
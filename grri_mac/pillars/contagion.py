@@ -12,7 +12,18 @@ Sub-indicators:
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from ..mac.scorer import score_indicator_simple
+import numpy as np
+import pandas as pd
+
+from ..mac.scorer import (
+    ThresholdCurve,
+    first_row,
+    indicator_column,
+    indicator_rows,
+    indicator_years,
+    score_indicator_simple,
+    score_indicator_simple_array,
+)
 
 
 @dataclass
@@ -186,29 +197,9 @@ class ContagionPillar:
         if not basis_bps_list:
             return 0.5  # Neutral if no data
 
-        # Calculate average absolute deviation from zero
+        # Average absolute deviation from zero
         avg_abs_basis = sum(abs(b) for b in basis_bps_list) / len(basis_bps_list)
-
-        t = self.THRESHOLDS["cross_currency_basis"]
-
-        if avg_abs_basis < t["ample"]:
-            # Ample: 0-15 bps → score 0.0-0.2
-            return 0.2 * (avg_abs_basis / t["ample"])
-        elif avg_abs_basis < t["thin"]:
-            # Thin: 15-30 bps → score 0.2-0.35
-            frac = (avg_abs_basis - t["ample"]) / (t["thin"] - t["ample"])
-            return 0.2 + 0.15 * frac
-        elif avg_abs_basis < t["stretched"]:
-            # Stretched: 30-60 bps → score 0.35-0.65
-            frac = (avg_abs_basis - t["thin"]) / (t["stretched"] - t["thin"])
-            return 0.35 + 0.30 * frac
-        elif avg_abs_basis < t["critical"]:
-            # Critical approach: 60-100 bps → score 0.65-1.0
-            frac = (avg_abs_basis - t["stretched"]) / (t["critical"] - t["stretched"])
-            return 0.65 + 0.35 * frac
-        else:
-            # Beyond critical: > 100 bps → score 1.0
-            return 1.0
+        return self._stress_curves()["cross_currency_basis"](avg_abs_basis)
 
     def score_target2(self, imbalance_pct_gdp: float) -> float:
         """
@@ -239,28 +230,7 @@ class ContagionPillar:
         Returns:
             Score 0-1 (higher = more vulnerable, so inverted)
         """
-        t = self.THRESHOLDS["reserve_coverage_ratio"]
-
-        # Higher coverage is better, so invert the scoring
-        if coverage_ratio >= t["ample"]:
-            # Ample: > 150% → score 0.0-0.2
-            # More reserves is better, but cap at 0.0
-            return max(0.0, 0.2 - 0.001 * (coverage_ratio - t["ample"]))
-        elif coverage_ratio >= t["thin"]:
-            # Thin: 125-150% → score 0.2-0.35
-            frac = (t["ample"] - coverage_ratio) / (t["ample"] - t["thin"])
-            return 0.2 + 0.15 * frac
-        elif coverage_ratio >= t["stretched"]:
-            # Stretched: 100-125% → score 0.35-0.65
-            frac = (t["thin"] - coverage_ratio) / (t["thin"] - t["stretched"])
-            return 0.35 + 0.30 * frac
-        elif coverage_ratio >= t["critical"]:
-            # Critical approach: 75-100% → score 0.65-1.0
-            frac = (t["stretched"] - coverage_ratio) / (t["stretched"] - t["critical"])
-            return 0.65 + 0.35 * frac
-        else:
-            # Beyond critical: < 75% → score 1.0
-            return 1.0
+        return self._stress_curves()["reserve_coverage"](coverage_ratio)
 
     def score_cross_border_flows(self, flow_pct_gdp: float) -> float:
         """
@@ -274,49 +244,7 @@ class ContagionPillar:
         Returns:
             Score 0-1 (higher = more stress)
         """
-        t = self.THRESHOLDS["cross_border_flow_pct_gdp"]
-
-        # Ample range: -0.5% to +1.5%
-        if t["ample_low"] <= flow_pct_gdp <= t["ample_high"]:
-            return 0.2  # Normal flows
-
-        # Handle outflows (negative values)
-        if flow_pct_gdp < 0:
-            if flow_pct_gdp >= t["thin_low"]:
-                # Thin: -0.5% to -1.0% → score 0.2-0.35
-                frac = (t["ample_low"] - flow_pct_gdp) / (t["ample_low"] - t["thin_low"])
-                return 0.2 + 0.15 * frac
-            elif flow_pct_gdp >= t["stretched_low"]:
-                # Stretched: -1.0% to -2.0% → score 0.35-0.65
-                frac = (t["thin_low"] - flow_pct_gdp) / (t["thin_low"] - t["stretched_low"])
-                return 0.35 + 0.30 * frac
-            elif flow_pct_gdp >= t["critical_low"]:
-                # Critical: -2.0% to -4.0% → score 0.65-1.0
-                frac = (t["stretched_low"] - flow_pct_gdp) / \
-                        (t["stretched_low"] - t["critical_low"])
-                return 0.65 + 0.35 * frac
-            else:
-                # Sudden stop: < -4.0% → score 1.0
-                return 1.0
-
-        # Handle inflows (positive values)
-        else:
-            if flow_pct_gdp <= t["thin_high"]:
-                # Thin: +1.5% to +3.0% → score 0.2-0.35
-                frac = (flow_pct_gdp - t["ample_high"]) / (t["thin_high"] - t["ample_high"])
-                return 0.2 + 0.15 * frac
-            elif flow_pct_gdp <= t["stretched_high"]:
-                # Stretched: +3.0% to +5.0% → score 0.35-0.65
-                frac = (flow_pct_gdp - t["thin_high"]) / (t["stretched_high"] - t["thin_high"])
-                return 0.35 + 0.30 * frac
-            elif flow_pct_gdp <= t["critical_high"]:
-                # Critical: +5.0% to +7.0% → score 0.65-1.0
-                frac = (flow_pct_gdp - t["stretched_high"]) / \
-                        (t["critical_high"] - t["stretched_high"])
-                return 0.65 + 0.35 * frac
-            else:
-                # Unsustainable boom: > +7.0% → score 1.0
-                return 1.0
+        return self._stress_curves()["cross_border_flows"](flow_pct_gdp)
 
     def score_crypto_correlation(self, correlation: float) -> float:
         """
@@ -331,19 +259,7 @@ class ContagionPillar:
         Returns:
             Score 0-1 (higher correlation = lower score = more risk)
         """
-        t = self.THRESHOLDS["crypto_equity_corr"]
-
-        if correlation <= t["ample"]:
-            return 1.0  # Decoupled - no contagion
-        elif correlation <= t["thin"]:
-            # Linear interpolation
-            frac = (correlation - t["ample"]) / (t["thin"] - t["ample"])
-            return 1.0 - 0.5 * frac
-        elif correlation <= t["breach"]:
-            frac = (correlation - t["thin"]) / (t["breach"] - t["thin"])
-            return 0.5 - 0.3 * frac
-        else:
-            return 0.2  # Very high correlation - contagion risk
+        return self._stress_curves()["crypto_correlation"](correlation)
 
     def score_gsib_stress(
         self,
@@ -367,41 +283,13 @@ class ContagionPillar:
         Returns:
             Score 0-1 (higher stress = lower score)
         """
-        t = self.THRESHOLDS["gsib_proxy"]
-
-        # Use BKX volatility if forced or if OAS unavailable
-        if use_bkx_fallback or financial_oas is None:
-            if bkx_volatility is None:
-                return 0.5  # No data
-            bkx_t = t["bkx_volatility"]
-            return score_indicator_simple(
-                bkx_volatility,
-                bkx_t["ample"],
-                bkx_t["thin"],
-                bkx_t["breach"],
-                lower_is_better=True,
-            )
-
-        # Select regime-specific thresholds based on date
-        if date_str:
-            year = int(date_str[:4])
-            if year < 2010:
-                oas_t = t["financial_oas_pre_2010"]
-            elif year < 2015:
-                oas_t = t["financial_oas_2010_2014"]
-            else:
-                oas_t = t["financial_oas_post_2015"]
-        else:
-            # Default to post-2015 regime
-            oas_t = t["financial_oas_post_2015"]
-
-        return score_indicator_simple(
-            financial_oas,
-            oas_t["ample"],
-            oas_t["thin"],
-            oas_t["breach"],
-            lower_is_better=True,
-        )
+        year = int(date_str[:4]) if date_str else np.nan
+        return float(self._gsib_stress_array(
+            np.array([np.nan if financial_oas is None else financial_oas]),
+            np.array([np.nan if bkx_volatility is None else bkx_volatility]),
+            np.array([year], dtype=np.float64),
+            use_bkx_fallback,
+        )[0])
 
     def calculate(
         self,
@@ -419,91 +307,185 @@ class ContagionPillar:
         if indicators is None:
             indicators = self.fetch_indicators()
 
-        scores = ContagionScores()
-        scored_count = 0
-
-        # Score cross-currency basis
-        basis_list = []
-        if indicators.eur_usd_basis_bps is not None:
-            basis_list.append(indicators.eur_usd_basis_bps)
-        if indicators.jpy_usd_basis_bps is not None:
-            basis_list.append(indicators.jpy_usd_basis_bps)
-        if indicators.gbp_usd_basis_bps is not None:
-            basis_list.append(indicators.gbp_usd_basis_bps)
-
-        if basis_list:
-            scores.cross_currency_basis = self.score_cross_currency_basis(basis_list)
-            scored_count += 1
-
-        # Score TARGET2
-        if (indicators.target2_imbalance_eur_billions is not None and
-                indicators.eurozone_gdp_eur_trillions is not None):
-            imbalance_pct = (indicators.target2_imbalance_eur_billions /
-                             (indicators.eurozone_gdp_eur_trillions * 1000) * 100)
-            scores.target2 = self.score_target2(imbalance_pct)
-            scored_count += 1
-
-        # Score reserve coverage
-        if (indicators.fx_reserves_usd_billions is not None and
-                indicators.short_term_external_debt_usd_billions is not None and
-                indicators.short_term_external_debt_usd_billions > 0):
-            coverage_ratio = (indicators.fx_reserves_usd_billions /
-                              indicators.short_term_external_debt_usd_billions * 100)
-            scores.reserve_coverage = self.score_reserve_coverage(coverage_ratio)
-            scored_count += 1
-
-        # Score cross-border flows
-        if (indicators.cross_border_flow_change_billions is not None and
-                indicators.world_gdp_trillions is not None and
-                indicators.world_gdp_trillions > 0):
-            flow_pct = (indicators.cross_border_flow_change_billions /
-                        (indicators.world_gdp_trillions * 1000) * 100)
-            scores.cross_border_flows = self.score_cross_border_flows(flow_pct)
-            scored_count += 1
-
-        # Score G-SIB stress (hybrid approach)
-        gsib_t = self.THRESHOLDS.get("gsib_proxy", {})
-        use_bkx = gsib_t.get("use_bkx_volatility", False)
-        if indicators.financial_oas_bps is not None or indicators.bkx_volatility_pct:
-            scores.gsib_stress = self.score_gsib_stress(
-                financial_oas=indicators.financial_oas_bps,
-                bkx_volatility=indicators.bkx_volatility_pct,
-                date_str=indicators.indicator_date,
-                use_bkx_fallback=use_bkx,
-            )
-            scored_count += 1
+        return ContagionScores(**first_row(self._score_arrays(indicators)))
+
+    def calculate_batch(self, indicator_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many observations at once.
+
+        Row for row the same as ``calculate`` with NaN in place of None;
+        ``indicator_date`` may hold date strings or datetimes.
+
+        Args:
+            indicator_frame: One row per observation, columns named after
+                ContagionIndicators fields (absent columns = missing)
+
+        Returns:
+            DataFrame with the ContagionScores columns, same index
+        """
+        return pd.DataFrame(
+            self._score_arrays(indicator_frame), index=indicator_frame.index,
+        )
 
-        # Score crypto-equity correlation
-        if indicators.btc_spy_correlation is not None:
-            scores.crypto_correlation = self.score_crypto_correlation(
-                indicators.btc_spy_correlation
+    def _stress_curves(self) -> dict[str, ThresholdCurve]:
+        """Curves for the 0.2/0.35/0.65/1.0 stress-band indicators."""
+        t = self.THRESHOLDS
+        basis = t["cross_currency_basis"]
+        cover = t["reserve_coverage_ratio"]
+        flows = t["cross_border_flow_pct_gdp"]
+        crypto = t["crypto_equity_corr"]
+        return {
+            "cross_currency_basis": ThresholdCurve(
+                [0.0, basis["ample"], basis["thin"], basis["stretched"],
+                 basis["critical"]],
+                [0.0, 0.2, 0.35, 0.65, 1.0],
+            ),
+            # Above ample the score keeps falling 0.001 per point to 0.0
+            "reserve_coverage": ThresholdCurve(
+                [cover["critical"], cover["stretched"], cover["thin"],
+                 cover["ample"], cover["ample"] + 200],
+                [1.0, 0.65, 0.35, 0.2, 0.0],
+            ),
+            "cross_border_flows": ThresholdCurve(
+                [flows["critical_low"], flows["stretched_low"],
+                 flows["thin_low"], flows["ample_low"], flows["ample_high"],
+                 flows["thin_high"], flows["stretched_high"],
+                 flows["critical_high"]],
+                [1.0, 0.65, 0.35, 0.2, 0.2, 0.35, 0.65, 1.0],
+            ),
+            "crypto_correlation": ThresholdCurve(
+                [crypto["ample"], crypto["thin"], crypto["breach"]],
+                [1.0, 0.5, 0.2],
+            ),
+        }
+
+    def _gsib_stress_array(
+        self,
+        oas: np.ndarray,
+        bkx: np.ndarray,
+        years: np.ndarray,
+        use_bkx_fallback: bool,
+    ) -> np.ndarray:
+        """G-SIB stress per observation (see score_gsib_stress)."""
+        gsib_t = self.THRESHOLDS["gsib_proxy"]
+
+        def oas_scores(regime: str) -> np.ndarray:
+            limits = gsib_t[regime]
+            return score_indicator_simple_array(
+                oas, limits["ample"], limits["thin"], limits["breach"],
+                lower_is_better=True,
             )
-            scored_count += 1
-
-        # Calculate composite (average of available scores)
-        if scored_count > 0:
-            total = 0.0
-            if basis_list:
-                total += scores.cross_currency_basis
-            if (indicators.target2_imbalance_eur_billions is not None and
-                    indicators.eurozone_gdp_eur_trillions is not None):
-                total += scores.target2
-            if (indicators.fx_reserves_usd_billions is not None and
-                    indicators.short_term_external_debt_usd_billions is not None):
-                total += scores.reserve_coverage
-            if (indicators.cross_border_flow_change_billions is not None and
-                    indicators.world_gdp_trillions is not None):
-                total += scores.cross_border_flows
-            if (indicators.financial_oas_bps is not None or
-                    indicators.bkx_volatility_pct is not None):
-                total += scores.gsib_stress
-            if indicators.btc_spy_correlation is not None:
-                total += scores.crypto_correlation
-            scores.composite = total / scored_count
-        else:
-            scores.composite = 0.5  # Default neutral
-
-        return scores
+
+        # Regime by date; undated observations use the post-2015 regime
+        regime_scores = np.select(
+            [years < 2010, years < 2015],
+            [oas_scores("financial_oas_pre_2010"),
+             oas_scores("financial_oas_2010_2014")],
+            default=oas_scores("financial_oas_post_2015"),
+        )
+        bkx_t = gsib_t["bkx_volatility"]
+        bkx_scores = np.where(
+            np.isnan(bkx), 0.5, score_indicator_simple_array(
+                bkx, bkx_t["ample"], bkx_t["thin"], bkx_t["breach"],
+                lower_is_better=True,
+            ),
+        )
+        use_bkx = use_bkx_fallback | np.isnan(oas)
+        return np.where(use_bkx, bkx_scores, regime_scores)
+
+    def _score_arrays(self, source) -> dict[str, np.ndarray]:
+        """ContagionScores fields per observation of a frame or dataclass."""
+        n = indicator_rows(source)
+
+        def col(name: str) -> np.ndarray:
+            return indicator_column(source, name)
+
+        t = self.THRESHOLDS
+        curves = self._stress_curves()
+        # Each entry: (score, counted in the composite's divisor, added to
+        # its total).  The two tests differ for reserve coverage, flows and
+        # G-SIB stress: a zero denominator or zero BKX vol is not counted,
+        # but its neutral 0.5 still enters the total.
+        parts: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+        basis = np.column_stack([
+            col("eur_usd_basis_bps"), col("jpy_usd_basis_bps"),
+            col("gbp_usd_basis_bps"),
+        ])
+        has_basis = ~np.isnan(basis).all(axis=1)
+        with np.errstate(invalid="ignore"):
+            avg_abs = np.nanmean(np.abs(np.where(
+                has_basis[:, None], basis, 0.0,
+            )), axis=1)
+        parts["cross_currency_basis"] = (
+            curves["cross_currency_basis"].score(avg_abs), has_basis, has_basis,
+        )
+
+        imbalance = col("target2_imbalance_eur_billions")
+        ez_gdp = col("eurozone_gdp_eur_trillions")
+        has_t2 = ~np.isnan(imbalance) & ~np.isnan(ez_gdp)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t2_pct = imbalance / (ez_gdp * 1000) * 100
+        t2 = t["target2_pct_gdp"]
+        parts["target2"] = (
+            score_indicator_simple_array(
+                t2_pct, t2["ample"], t2["thin"], t2["stretched"],
+                lower_is_better=True,
+            ),
+            has_t2, has_t2,
+        )
+
+        reserves = col("fx_reserves_usd_billions")
+        debt = col("short_term_external_debt_usd_billions")
+        has_cover = ~np.isnan(reserves) & ~np.isnan(debt)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            coverage = reserves / debt * 100
+        parts["reserve_coverage"] = (
+            curves["reserve_coverage"].score(coverage),
+            has_cover & (debt > 0), has_cover,
+        )
+
+        flow = col("cross_border_flow_change_billions")
+        world_gdp = col("world_gdp_trillions")
+        has_flow = ~np.isnan(flow) & ~np.isnan(world_gdp)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            flow_pct = flow / (world_gdp * 1000) * 100
+        parts["cross_border_flows"] = (
+            curves["cross_border_flows"].score(flow_pct),
+            has_flow & (world_gdp > 0), has_flow,
+        )
+
+        # G-SIB stress: financial OAS by regulatory regime, BKX fallback
+        oas = col("financial_oas_bps")
+        bkx = col("bkx_volatility_pct")
+        has_oas = ~np.isnan(oas)
+        parts["gsib_stress"] = (
+            self._gsib_stress_array(
+                oas, bkx, indicator_years(source, "indicator_date"),
+                t.get("gsib_proxy", {}).get("use_bkx_volatility", False),
+            ),
+            has_oas | (~np.isnan(bkx) & (bkx != 0)),
+            has_oas | ~np.isnan(bkx),
+        )
+
+        corr = col("btc_spy_correlation")
+        has_corr = ~np.isnan(corr)
+        parts["crypto_correlation"] = (
+            curves["crypto_correlation"].score(corr), has_corr, has_corr,
+        )
+
+        columns = {}
+        total = np.zeros(n)
+        count = np.zeros(n)
+        for name, (score, counted, added) in parts.items():
+            columns[name] = np.where(counted, score, 0.5)
+            total += np.where(added, columns[name], 0.0)
+            count += counted
+        with np.errstate(invalid="ignore", divide="ignore"):
+            composite = np.where(count > 0, total / np.maximum(count, 1), 0.5)
+
+        columns["composite"] = composite
+        return columns
 
     def get_score(self) -> float:
         """Get composite contagion score."""
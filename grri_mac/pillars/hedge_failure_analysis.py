@@ -23,6 +23,8 @@ from typing import Optional
 
 import numpy as np
 
+from ..mac.scorer import score_indicator_simple
+
 
 @dataclass
 class HedgeFailureEpisode:
@@ -237,18 +239,9 @@ class HedgeFailureDetector:
         NY Fed publishes this data from 2008+; proxy earlier.
         """
         t = self.DEALER_LEVERAGE_THRESHOLDS
-        if leverage <= t["ample"]:
-            return 1.0
-        elif leverage <= t["thin"]:
-            return 0.5 + 0.5 * (
-                t["thin"] - leverage
-            ) / (t["thin"] - t["ample"])
-        elif leverage <= t["breach"]:
-            return 0.5 * (
-                t["breach"] - leverage
-            ) / (t["breach"] - t["thin"])
-        else:
-            return 0.0
+        return score_indicator_simple(
+            leverage, t["ample"], t["thin"], t["breach"], lower_is_better=True,
+        )
 
     def score_herfindahl(self, hhi: float) -> float:
         """Score Treasury futures concentration (lower = better).
@@ -257,18 +250,9 @@ class HedgeFailureDetector:
         in Treasury futures. High concentration = crowding risk.
         """
         t = self.HERFINDAHL_THRESHOLDS
-        if hhi <= t["ample"]:
-            return 1.0
-        elif hhi <= t["thin"]:
-            return 0.5 + 0.5 * (
-                t["thin"] - hhi
-            ) / (t["thin"] - t["ample"])
-        elif hhi <= t["breach"]:
-            return 0.5 * (
-                t["breach"] - hhi
-            ) / (t["breach"] - t["thin"])
-        else:
-            return 0.0
+        return score_indicator_simple(
+            hhi, t["ample"], t["thin"], t["breach"], lower_is_better=True,
+        )
 
     def bayesian_posterior(
         self,
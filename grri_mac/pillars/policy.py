@@ -30,7 +30,16 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-from ..mac.scorer import score_indicator_simple
+import numpy as np
+import pandas as pd
+
+from ..mac.scorer import (
+    first_row,
+    indicator_column,
+    indicator_years,
+    score_indicator_simple,
+    score_indicator_simple_array,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -173,15 +182,12 @@ class PolicyPillar:
     def score_policy_room(self, room_bps: float) -> float:
         """Score policy room — more room to cut is better."""
         t = self.THRESHOLDS["policy_room"]
-        # Higher is better (more room to cut)
-        if room_bps >= t["ample"]:
-            return 1.0
-        elif room_bps >= t["thin"]:
-            return 0.5 + 0.5 * (room_bps - t["thin"]) / (t["ample"] - t["thin"])
-        elif room_bps >= t["breach"]:
-            return 0.5 * (room_bps - t["breach"]) / (t["thin"] - t["breach"])
-        else:
-            return 0.0
+        return score_indicator_simple(
+            room_bps,
+            t["ample"],
+            t["thin"],
+            t["breach"],
+        )
 
     def score_balance_sheet(self, bs_gdp_pct: float) -> float:
         """Score Fed balance sheet as % of GDP (lower is better)."""
@@ -291,21 +297,25 @@ class PolicyPillar:
         """
         if date is None:
             return None
-
-        year = date.year
-
-        if year < 1913:
-            base_cap = self.ERA_CAPS["pre_fed"]
-            if gold_reserve_ratio is not None:
-                sliding = 0.15 + 0.30 * gold_reserve_ratio
-                return min(base_cap, sliding)
-            return base_cap
-        elif year < 1934:
-            return self.ERA_CAPS["early_fed_gold"]
-        elif 1944 <= year <= 1971:
-            return self.ERA_CAPS["bretton_woods"]
-
-        return None
+        cap = self._era_cap_array(
+            np.array([date.year], dtype=np.float64),
+            np.array([np.nan if gold_reserve_ratio is None else gold_reserve_ratio]),
+        )[0]
+        return None if np.isnan(cap) else float(cap)
+
+    def _era_cap_array(self, years: np.ndarray, gold: np.ndarray) -> np.ndarray:
+        """Era cap per observation (NaN = no cap), as _get_era_cap."""
+        caps = self.ERA_CAPS
+        pre_fed = np.where(
+            np.isnan(gold),
+            caps["pre_fed"],
+            np.minimum(caps["pre_fed"], 0.15 + 0.30 * gold),
+        )
+        return np.select(
+            [years < 1913, years < 1934, (years >= 1944) & (years <= 1971)],
+            [pre_fed, caps["early_fed_gold"], caps["bretton_woods"]],
+            default=np.nan,
+        )
 
     def _apply_gold_constraint(
         self, score: float, gold_reserve_ratio: Optional[float],
@@ -326,16 +336,25 @@ class PolicyPillar:
         """
         if date is None or gold_reserve_ratio is None:
             return score
+        return float(self._gold_constraint_array(
+            np.array([score], dtype=np.float64),
+            np.array([gold_reserve_ratio], dtype=np.float64),
+            np.array([date.year], dtype=np.float64),
+        )[0])
 
-        if date.year < 1934 and date.year >= 1913:
-            # Required reserve ratio was 40% under Federal Reserve Act
-            # Below 45%: constrained, below 40%: severely constrained
-            if gold_reserve_ratio < 0.40:
-                return min(score, 0.15)
-            elif gold_reserve_ratio < 0.45:
-                return min(score, 0.35)
-
-        return score
+    @staticmethod
+    def _gold_constraint_array(
+        composite: np.ndarray, gold: np.ndarray, years: np.ndarray,
+    ) -> np.ndarray:
+        """Array form of _apply_gold_constraint (NaN gold = no constraint)."""
+        # Required reserve ratio was 40% under Federal Reserve Act
+        # Below 45%: constrained, below 40%: severely constrained
+        gold_era = (years >= 1913) & (years < 1934)
+        return np.select(
+            [gold_era & (gold < 0.40), gold_era & (gold < 0.45)],
+            [np.minimum(composite, 0.15), np.minimum(composite, 0.35)],
+            default=composite,
+        )
 
     @staticmethod
     def calibrate_homogeneity_threshold(
@@ -384,96 +403,119 @@ class PolicyPillar:
         if indicators is None:
             indicators = self.fetch_indicators()
 
+        return PolicyScores(**first_row(
+            self._score_arrays(indicators, homogeneity_threshold)
+        ))
+
+    def calculate_batch(
+        self,
+        indicator_frame: pd.DataFrame,
+        homogeneity_threshold: Optional[float] = None,
+    ) -> pd.DataFrame:
+        """Score many observations at once with the binding constraint rule.
+
+        Row for row the same as ``calculate`` with NaN in place of None.
+        Era caps and the gold constraint apply where an
+        ``observation_date`` column is present.
+
+        Args:
+            indicator_frame: One row per observation, columns named after
+                PolicyIndicators fields (absent columns = missing)
+            homogeneity_threshold: Dispersion above which the minimum binds
+
+        Returns:
+            DataFrame with the PolicyScores columns, same index
+            (era_cap_applied is NaN where no cap bound)
+        """
+        return pd.DataFrame(
+            self._score_arrays(indicator_frame, homogeneity_threshold),
+            index=indicator_frame.index,
+        )
+
+    def _score_arrays(
+        self,
+        source,
+        homogeneity_threshold: Optional[float] = None,
+    ) -> dict[str, np.ndarray]:
+        """PolicyScores fields per observation of a frame or dataclass."""
         threshold = (
             homogeneity_threshold
             if homogeneity_threshold is not None
             else HOMOGENEITY_THRESHOLD
         )
+        t = self.THRESHOLDS
 
-        scores = PolicyScores()
-        available_scores = {}
-
-        # ── Score individual dimensions ──────────────────────────────
-        if indicators.policy_room_bps is not None:
-            scores.policy_room = self.score_policy_room(
-                indicators.policy_room_bps,
+        def curve(values: np.ndarray, key: str, lower: bool = True) -> np.ndarray:
+            return score_indicator_simple_array(
+                values, t[key]["ample"], t[key]["thin"], t[key]["breach"],
+                lower_is_better=lower,
             )
-            available_scores["policy_room"] = scores.policy_room
 
-        if indicators.fed_balance_sheet_gdp_pct is not None:
-            scores.balance_sheet = self.score_balance_sheet(
-                indicators.fed_balance_sheet_gdp_pct,
-            )
-            available_scores["balance_sheet"] = scores.balance_sheet
-
-        if indicators.core_pce_vs_target_bps is not None:
-            scores.inflation = self.score_inflation(
-                indicators.core_pce_vs_target_bps,
-            )
-            available_scores["inflation"] = scores.inflation
-
-        if indicators.debt_to_gdp_pct is not None:
-            scores.fiscal_space = self.score_fiscal_space(
-                indicators.debt_to_gdp_pct,
-            )
-            available_scores["fiscal_space"] = scores.fiscal_space
-
-        # v7: Forward inflation expectations
-        if indicators.forward_inflation_expectations_bps is not None:
-            scores.forward_inflation = self.score_forward_inflation(
-                indicators.forward_inflation_expectations_bps,
-            )
-            available_scores["forward_inflation"] = (
-                scores.forward_inflation
-            )
+        pce = indicator_column(source, "core_pce_vs_target_bps")
+        columns = {
+            "policy_room": curve(
+                indicator_column(source, "policy_room_bps"),
+                "policy_room", lower=False,
+            ),
+            "balance_sheet": curve(
+                indicator_column(source, "fed_balance_sheet_gdp_pct"),
+                "balance_sheet_gdp",
+            ),
+            # Asymmetric: above-target deviation uses tighter thresholds
+            "inflation": np.where(
+                pce >= 0,
+                curve(pce, "inflation_above"),
+                curve(np.abs(pce), "inflation_below"),
+            ),
+            "fiscal_space": curve(
+                indicator_column(source, "debt_to_gdp_pct"),
+                "fiscal_space",
+            ),
+            "forward_inflation": curve(
+                np.abs(indicator_column(
+                    source, "forward_inflation_expectations_bps",
+                )),
+                "forward_inflation",
+            ),
+        }
 
         # ── Binding constraint composite ─────────────────────────────
-        if len(available_scores) > 0:
-            score_values = list(available_scores.values())
-            dispersion = max(score_values) - min(score_values)
-
-            if len(available_scores) == 1:
-                # Single indicator — use it directly
-                scores.composite = score_values[0]
-                scores.composite_method = "single"
-            elif dispersion > threshold:
-                # High dispersion: binding constraint → min
-                scores.composite = min(score_values)
-                scores.composite_method = "min"
-            else:
-                # Low dispersion: weighted average
-                weighted_sum = 0.0
-                weight_sum = 0.0
-                for name, val in available_scores.items():
-                    w = WEIGHTED_AVG_WEIGHTS.get(name, 0.20)
-                    weighted_sum += val * w
-                    weight_sum += w
-                if weight_sum > 0:
-                    scores.composite = weighted_sum / weight_sum
-                else:
-                    scores.composite = 0.5
-                scores.composite_method = "weighted_avg"
-        else:
-            scores.composite = 0.5
-            scores.composite_method = "default"
+        matrix = np.column_stack(list(columns.values()))
+        present = ~np.isnan(matrix)
+        count = present.sum(axis=1)
+        high = np.where(present, matrix, -np.inf).max(axis=1)
+        low = np.where(present, matrix, np.inf).min(axis=1)
+        weights = np.where(present, [
+            WEIGHTED_AVG_WEIGHTS.get(name, 0.20) for name in columns
+        ], 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weighted = (
+                np.where(present, matrix, 0.0) * weights
+            ).sum(axis=1) / weights.sum(axis=1)
+        conditions = [count == 0, count == 1, high - low > threshold]
+        composite = np.select(conditions, [0.5, high, low], default=weighted)
+        method = np.select(
+            conditions, ["default", "single", "min"], default="weighted_avg",
+        )
 
         # ── Historical era caps ──────────────────────────────────────
-        era_cap = self._get_era_cap(
-            indicators.observation_date,
-            indicators.gold_reserve_ratio,
-        )
-        if era_cap is not None and scores.composite > era_cap:
-            scores.composite = era_cap
-            scores.era_cap_applied = era_cap
+        years = indicator_years(source, "observation_date")
+        gold = indicator_column(source, "gold_reserve_ratio")
+        cap = self._era_cap_array(years, gold)
+        capped = composite > cap
+        composite = np.where(capped, cap, composite)
 
         # Gold standard constraint (1913–1934)
-        scores.composite = self._apply_gold_constraint(
-            scores.composite,
-            indicators.gold_reserve_ratio,
-            indicators.observation_date,
-        )
-
-        return scores
+        composite = self._gold_constraint_array(composite, gold, years)
+
+        columns = {
+            key: np.where(np.isnan(col), 0.5, col)
+            for key, col in columns.items()
+        }
+        columns["composite"] = composite
+        columns["composite_method"] = method
+        columns["era_cap_applied"] = np.where(capped, cap, np.nan)
+        return columns
 
     def get_score(self) -> float:
         """Get composite policy score."""
@@ -37,7 +37,18 @@ from dataclasses import dataclass
 from typing import Optional
 import logging
 
-from ..mac.scorer import score_indicator_simple, score_indicator_range
+import numpy as np
+import pandas as pd
+
+from ..mac.scorer import (
+    first_row,
+    indicator_column,
+    score_indicator_range,
+    score_indicator_range_array,
+    score_indicator_simple,
+    score_indicator_simple_array,
+    score_pillar_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -299,85 +310,85 @@ class PositioningPillar:
         if indicators is None:
             indicators = self.fetch_indicators()
 
-        scores = PositioningScores()
-        scored_count = 0
+        return PositioningScores(**first_row(self._score_arrays(indicators)))
 
-        if indicators.basis_trade_size_billions is not None:
-            # Try OI-relative scoring first (preferred)
-            if indicators.total_treasury_oi_billions is not None:
-                oi_score = self.score_basis_trade_oi_relative(
-                    indicators.basis_trade_size_billions,
-                    indicators.total_treasury_oi_billions,
-                )
-                if oi_score is not None:
-                    scores.basis_trade = oi_score
-                    scored_count += 1
-                else:
-                    # Fall back to absolute scoring
-                    scores.basis_trade = self.score_basis_trade(
-                        indicators.basis_trade_size_billions
-                    )
-                    scored_count += 1
-            else:
-                # No OI data, use absolute scoring
-                scores.basis_trade = self.score_basis_trade(
-                    indicators.basis_trade_size_billions
-                )
-                scored_count += 1
+    def calculate_batch(self, indicator_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many observations at once.
 
-        if indicators.treasury_spec_net_percentile is not None:
-            scores.spec_net = self.score_spec_net(
-                indicators.treasury_spec_net_percentile
-            )
-            scored_count += 1
+        Row for row the same as ``calculate`` with NaN in place of None.
 
-        if indicators.svxy_aum_millions is not None:
-            scores.svxy_aum = self.score_svxy_aum(indicators.svxy_aum_millions)
-            scored_count += 1
+        Args:
+            indicator_frame: One row per observation, columns named after
+                PositioningIndicators fields (absent columns = missing)
 
-        # v7: Hedge failure indicators (when available)
-        if self._hedge_detector is not None:
-            if indicators.primary_dealer_gross_leverage is not None:
-                self._hedge_detector.score_primary_dealer_leverage(
-                    indicators.primary_dealer_gross_leverage,
-                )
-                scored_count += 1
+        Returns:
+            DataFrame with the PositioningScores columns, same index
+        """
+        return pd.DataFrame(
+            self._score_arrays(indicator_frame), index=indicator_frame.index,
+        )
 
-            if indicators.treasury_futures_herfindahl is not None:
-                self._hedge_detector.score_herfindahl(
-                    indicators.treasury_futures_herfindahl,
-                )
-                scored_count += 1
-
-        # Calculate composite
-        if scored_count > 0:
-            total = 0.0
-            if indicators.basis_trade_size_billions is not None:
-                total += scores.basis_trade
-            if indicators.treasury_spec_net_percentile is not None:
-                total += scores.spec_net
-            if indicators.svxy_aum_millions is not None:
-                total += scores.svxy_aum
-            # v7: Add hedge failure indicator scores
-            if (
-                self._hedge_detector is not None
-                and indicators.primary_dealer_gross_leverage is not None
-            ):
-                total += self._hedge_detector.score_primary_dealer_leverage(
-                    indicators.primary_dealer_gross_leverage,
-                )
-            if (
-                self._hedge_detector is not None
-                and indicators.treasury_futures_herfindahl is not None
-            ):
-                total += self._hedge_detector.score_herfindahl(
-                    indicators.treasury_futures_herfindahl,
-                )
-            scores.composite = total / scored_count
-        else:
-            scores.composite = 0.5
+    def _score_arrays(self, source) -> dict[str, np.ndarray]:
+        """PositioningScores fields per observation of a frame or dataclass."""
+        t = self.THRESHOLDS
+        basis = indicator_column(source, "basis_trade_size_billions")
+        oi = indicator_column(source, "total_treasury_oi_billions")
+
+        absolute = score_indicator_simple_array(
+            basis, t["basis_trade"]["ample"], t["basis_trade"]["thin"],
+            t["basis_trade"]["breach"], lower_is_better=True,
+        )
+        rel = t.get("basis_trade_oi_relative", {})
+        if rel.get("enabled", False):
+            # OI-relative scoring preferred where OI is large enough
+            with np.errstate(invalid="ignore", divide="ignore"):
+                basis_pct = basis / oi * 100
+            relative = score_indicator_simple_array(
+                basis_pct, rel.get("ample_pct", 8), rel.get("thin_pct", 12),
+                rel.get("breach_pct", 18), lower_is_better=True,
+            )
+            absolute = np.where(
+                oi >= rel.get("min_oi_billions", 100), relative, absolute,
+            )
 
-        return scores
+        spec = t["spec_net_percentile"]
+        svxy = t["svxy_aum"]
+        columns = {
+            "basis_trade": absolute,
+            "spec_net": score_indicator_range_array(
+                indicator_column(source, "treasury_spec_net_percentile"),
+                (spec["ample_low"], spec["ample_high"]),
+                (spec["thin_low"], spec["thin_high"]),
+                (spec["breach_low"], spec["breach_high"]),
+            ),
+            "svxy_aum": score_indicator_simple_array(
+                indicator_column(source, "svxy_aum_millions"),
+                svxy["ample"], svxy["thin"], svxy["breach"],
+                lower_is_better=True,
+            ),
+        }
+
+        components = list(columns.values())
+        if self._hedge_detector is not None:
+            # v7: hedge failure indicators count toward the composite only
+            for field_name, limits in (
+                ("primary_dealer_gross_leverage",
+                 self._hedge_detector.DEALER_LEVERAGE_THRESHOLDS),
+                ("treasury_futures_herfindahl",
+                 self._hedge_detector.HERFINDAHL_THRESHOLDS),
+            ):
+                components.append(score_indicator_simple_array(
+                    indicator_column(source, field_name),
+                    limits["ample"], limits["thin"], limits["breach"],
+                    lower_is_better=True,
+                ))
+
+        columns["composite"] = score_pillar_batch(components)
+        return {
+            key: np.where(np.isnan(col), 0.5, col)
+            for key, col in columns.items()
+        }
 
     def get_score(self) -> float:
         """Get composite positioning score."""
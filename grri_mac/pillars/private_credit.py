@@ -68,6 +68,10 @@ from datetime import datetime
 from enum import Enum
 import logging
 
+import numpy as np
+import pandas as pd
+
+from ..mac.scorer import indicator_column, score_pillar_batch, score_steps
 from .private_credit_decorrelation import (
     DecorrelationResult,
     DecorrelationTimeSeries,
@@ -249,6 +253,15 @@ class PrivateCreditPillar:
         "severe": -25,
     }
 
+    # BDC weights in the sector discount (by BDCData field)
+    BDC_WEIGHTS = {
+        "arcc_discount": 0.25,
+        "main_discount": 0.20,
+        "fsk_discount": 0.20,
+        "psec_discount": 0.15,
+        "gbdc_discount": 0.20,
+    }
+
     # Leveraged loan thresholds
     LEVERAGED_LOAN_THRESHOLDS = {
         # ETF 30-day change
@@ -303,69 +316,46 @@ class PrivateCreditPillar:
             Tuple of (score 0-1, list of warning signals)
         """
         warnings = []
-        scores = []
-
-        # Score C&I standards to small firms (key private credit proxy)
-        if data.ci_standards_small is not None:
-            val = data.ci_standards_small
-            thresholds = self.SLOOS_THRESHOLDS["standards"]
+        subs = self._sloos_arrays(data)
+        standards_small, spreads_small, standards_large = (
+            float(sub[0]) for sub in subs
+        )
 
-            if val > thresholds["severe"]:
-                scores.append(0.1)
-                warnings.append(
-                    f"SEVERE: C&I lending to small firms tightening at {val:.0f}% "
-                    "(recession-level)"
-                )
-            elif val > thresholds["elevated"]:
-                scores.append(0.3)
-                warnings.append(
-                    f"ELEVATED: C&I lending to small firms tightening at {val:.0f}%"
-                )
-            elif val > thresholds["normal_high"]:
-                scores.append(0.5)
-                warnings.append(
-                    f"CAUTIOUS: C&I lending standards tightening ({val:.0f}%)"
-                )
-            else:
-                scores.append(0.8)
+        # C&I standards to small firms (key private credit proxy)
+        val = data.ci_standards_small
+        if standards_small == 0.1:
+            warnings.append(
+                f"SEVERE: C&I lending to small firms tightening at {val:.0f}% "
+                "(recession-level)"
+            )
+        elif standards_small == 0.3:
+            warnings.append(
+                f"ELEVATED: C&I lending to small firms tightening at {val:.0f}%"
+            )
+        elif standards_small == 0.5:
+            warnings.append(
+                f"CAUTIOUS: C&I lending standards tightening ({val:.0f}%)"
+            )
 
-        # Score spreads to small firms
-        if data.spreads_small is not None:
-            val = data.spreads_small
-            thresholds = self.SLOOS_THRESHOLDS["spreads"]
+        # Spreads to small firms
+        val = data.spreads_small
+        if spreads_small == 0.1:
+            warnings.append(
+                f"SEVERE: Spreads to small firms widening at {val:.0f}%"
+            )
+        elif spreads_small == 0.3:
+            warnings.append(
+                f"ELEVATED: Spreads to small firms widening at {val:.0f}%"
+            )
 
-            if val > thresholds["severe"]:
-                scores.append(0.1)
-                warnings.append(
-                    f"SEVERE: Spreads to small firms widening at {val:.0f}%"
-                )
-            elif val > thresholds["elevated"]:
-                scores.append(0.3)
-                warnings.append(
-                    f"ELEVATED: Spreads to small firms widening at {val:.0f}%"
-                )
-            elif val > thresholds["normal_high"]:
-                scores.append(0.5)
-            else:
-                scores.append(0.8)
-
-        # Also check large/mid (validates small firm signal)
-        if data.ci_standards_large is not None:
-            val = data.ci_standards_large
-            thresholds = self.SLOOS_THRESHOLDS["standards"]
-
-            if val > thresholds["elevated"]:
-                scores.append(0.3)
-                warnings.append(
-                    f"Large/mid C&I also tightening at {val:.0f}% (broad stress)"
-                )
-            elif val > thresholds["normal_high"]:
-                scores.append(0.5)
-            else:
-                scores.append(0.8)
+        # Large/mid firms (validates small firm signal)
+        if standards_large == 0.3:
+            warnings.append(
+                f"Large/mid C&I also tightening at {data.ci_standards_large:.0f}% "
+                "(broad stress)"
+            )
 
-        final_score = sum(scores) / len(scores) if scores else 0.5
-        return final_score, warnings
+        return float(score_pillar_batch(subs)[0]), warnings
 
     def score_bdc(self, data: BDCData) -> Tuple[float, List[str]]:
         """
@@ -373,54 +363,33 @@ class PrivateCreditPillar:
 
         This is the most real-time signal for private credit stress.
         """
-        warnings = []
-        discounts = []
-
-        # Collect all available discounts
-        if data.arcc_discount is not None:
-            discounts.append(("ARCC", data.arcc_discount, 0.25))
-        if data.main_discount is not None:
-            discounts.append(("MAIN", data.main_discount, 0.20))
-        if data.fsk_discount is not None:
-            discounts.append(("FSK", data.fsk_discount, 0.20))
-        if data.psec_discount is not None:
-            discounts.append(("PSEC", data.psec_discount, 0.15))
-        if data.gbdc_discount is not None:
-            discounts.append(("GBDC", data.gbdc_discount, 0.20))
-
-        if not discounts:
+        weighted, scores = self._bdc_arrays(data)
+        if np.isnan(weighted[0]):
             return 0.5, []
 
-        # Calculate weighted average discount
-        total_weight = sum(d[2] for d in discounts)
-        weighted_discount = sum(d[1] * d[2] for d in discounts) / total_weight
-
-        # Score based on discount level
-        thresholds = self.BDC_THRESHOLDS
-
-        if weighted_discount < thresholds["severe"]:
-            score = 0.1
+        warnings = []
+        weighted_discount = float(weighted[0])
+        score = float(scores[0])
+        if score == 0.1:
             warnings.append(
                 f"SEVERE: BDC sector trading at {weighted_discount:.1f}% discount - "
                 "market pricing major credit losses"
             )
-        elif weighted_discount < thresholds["stress"]:
-            score = 0.3
+        elif score == 0.3:
             warnings.append(
                 f"ELEVATED: BDC sector at {weighted_discount:.1f}% discount - "
                 "private credit stress emerging"
             )
-        elif weighted_discount < thresholds["healthy_low"]:
-            score = 0.5
+        elif score == 0.5:
             warnings.append(
                 f"CAUTIOUS: BDC sector at {weighted_discount:.1f}% discount"
             )
-        else:
-            score = 0.8
 
         # Check for extreme individual discounts
-        for name, discount, _ in discounts:
-            if discount < thresholds["severe"]:
+        for field_name in self.BDC_WEIGHTS:
+            discount = getattr(data, field_name)
+            if discount is not None and discount < self.BDC_THRESHOLDS["severe"]:
+                name = field_name.split("_")[0].upper()
                 warnings.append(
                     f"WARNING: {name} at {discount:.1f}% discount (possible distress)"
                 )
@@ -430,74 +399,142 @@ class PrivateCreditPillar:
     def score_leveraged_loans(self, data: LeveragedLoanData) -> Tuple[float, List[str]]:
         """Score leveraged loan market indicators."""
         warnings = []
-        scores = []
-
-        # ETF price changes
-        etf_changes = []
-        if data.bkln_price_change_30d is not None:
-            etf_changes.append(("BKLN", data.bkln_price_change_30d))
-        if data.srln_price_change_30d is not None:
-            etf_changes.append(("SRLN", data.srln_price_change_30d))
-
-        for name, change in etf_changes:
-            thresholds = self.LEVERAGED_LOAN_THRESHOLDS
-
-            if change < thresholds["severe"]:
-                scores.append(0.1)
+        etf_scores = self._leveraged_loan_arrays(data)
+        for name, field_name, score in zip(
+            ("BKLN", "SRLN"),
+            ("bkln_price_change_30d", "srln_price_change_30d"),
+            etf_scores,
+        ):
+            change = getattr(data, field_name)
+            if score[0] == 0.1:
                 warnings.append(
                     f"SEVERE: {name} down {abs(change):.1f}% in 30d - loan market distress"
                 )
-            elif change < thresholds["stress"]:
-                scores.append(0.3)
+            elif score[0] == 0.3:
                 warnings.append(
                     f"ELEVATED: {name} down {abs(change):.1f}% in 30d"
                 )
-            elif change < thresholds["healthy_low"]:
-                scores.append(0.5)
-            else:
-                scores.append(0.8)
 
-        return sum(scores) / len(scores) if scores else 0.5, warnings
+        return float(score_pillar_batch(etf_scores)[0]), warnings
 
     def score_pe_firms(self, data: PEFirmData) -> Tuple[float, List[str]]:
         """Score PE firm stock performance."""
-        warnings = []
-        changes = []
-
-        if data.kkr_change_30d is not None:
-            changes.append(("KKR", data.kkr_change_30d))
-        if data.bx_change_30d is not None:
-            changes.append(("BX", data.bx_change_30d))
-        if data.apo_change_30d is not None:
-            changes.append(("APO", data.apo_change_30d))
-        if data.cg_change_30d is not None:
-            changes.append(("CG", data.cg_change_30d))
-
-        if not changes:
+        avg, scores = self._pe_firm_arrays(data)
+        if np.isnan(avg[0]):
             return 0.5, []
 
-        # Average change
-        avg_change = sum(c[1] for c in changes) / len(changes)
-        thresholds = self.PE_FIRM_THRESHOLDS
-
-        if avg_change < thresholds["severe"]:
-            score = 0.2
+        warnings = []
+        avg_change = float(avg[0])
+        score = float(scores[0])
+        if score == 0.2:
             warnings.append(
                 f"SEVERE: PE sector down {abs(avg_change):.1f}% - "
                 "market pricing alt credit problems"
             )
-        elif avg_change < thresholds["stress"]:
-            score = 0.4
+        elif score == 0.4:
             warnings.append(
                 f"ELEVATED: PE sector down {abs(avg_change):.1f}%"
             )
-        elif avg_change < thresholds["healthy_low"]:
-            score = 0.6
-        else:
-            score = 0.8
 
         return score, warnings
 
+    # ── Component scores as arrays ───────────────────────────────────
+    # ``source`` is a frame with one column per component dataclass field
+    # or a single SLOOSData/BDCData/... instance (see indicator_column).
+
+    def _sloos_arrays(self, source) -> List[np.ndarray]:
+        """Small-firm standards, small-firm spreads, large/mid standards."""
+        std_t = self.SLOOS_THRESHOLDS["standards"]
+        spr_t = self.SLOOS_THRESHOLDS["spreads"]
+        return [
+            score_steps(
+                indicator_column(source, "ci_standards_small"),
+                [std_t["normal_high"], std_t["elevated"], std_t["severe"]],
+                [0.8, 0.5, 0.3, 0.1],
+            ),
+            score_steps(
+                indicator_column(source, "spreads_small"),
+                [spr_t["normal_high"], spr_t["elevated"], spr_t["severe"]],
+                [0.8, 0.5, 0.3, 0.1],
+            ),
+            score_steps(
+                indicator_column(source, "ci_standards_large"),
+                [std_t["normal_high"], std_t["elevated"]],
+                [0.8, 0.5, 0.3],
+            ),
+        ]
+
+    def _bdc_arrays(self, source) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted sector discount over the available names, and its score."""
+        discounts = np.column_stack([
+            indicator_column(source, f) for f in self.BDC_WEIGHTS
+        ])
+        present = ~np.isnan(discounts)
+        weights = np.where(present, list(self.BDC_WEIGHTS.values()), 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weighted = (
+                np.where(present, discounts, 0.0) * weights
+            ).sum(axis=1) / weights.sum(axis=1)
+        t = self.BDC_THRESHOLDS
+        return weighted, score_steps(
+            weighted,
+            [t["severe"], t["stress"], t["healthy_low"]],
+            [0.1, 0.3, 0.5, 0.8],
+            side="right",
+        )
+
+    def _leveraged_loan_arrays(self, source) -> List[np.ndarray]:
+        """BKLN and SRLN 30-day change scores."""
+        t = self.LEVERAGED_LOAN_THRESHOLDS
+        return [
+            score_steps(
+                indicator_column(source, name),
+                [t["severe"], t["stress"], t["healthy_low"]],
+                [0.1, 0.3, 0.5, 0.8],
+                side="right",
+            )
+            for name in ("bkln_price_change_30d", "srln_price_change_30d")
+        ]
+
+    def _pe_firm_arrays(self, source) -> Tuple[np.ndarray, np.ndarray]:
+        """Average 30-day change over the available PE firms, and its score."""
+        changes = np.column_stack([
+            indicator_column(source, name) for name in (
+                "kkr_change_30d", "bx_change_30d",
+                "apo_change_30d", "cg_change_30d",
+            )
+        ])
+        counts = (~np.isnan(changes)).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg_change = np.nansum(changes, axis=1) / counts
+        t = self.PE_FIRM_THRESHOLDS
+        return avg_change, score_steps(
+            avg_change,
+            [t["severe"], t["stress"], t["healthy_low"]],
+            [0.2, 0.4, 0.6, 0.8],
+            side="right",
+        )
+
+    def _fixed_weight_composite(self, sloos, bdc, loans, pe):
+        """Fixed-weight composite of the four component scores."""
+        return (
+            sloos * self.WEIGHTS["sloos"]
+            + bdc * self.WEIGHTS["bdc"]
+            + loans * self.WEIGHTS["leveraged_loans"]
+            + pe * self.WEIGHTS["pe_firms"]
+        )
+
+    @staticmethod
+    def _stress_level_array(composite: np.ndarray) -> np.ndarray:
+        """PrivateCreditStress value per composite score."""
+        return np.select(
+            [composite < 0.25, composite < 0.40, composite < 0.55],
+            [PrivateCreditStress.SEVERE.value,
+             PrivateCreditStress.ELEVATED.value,
+             PrivateCreditStress.EMERGING.value],
+            default=PrivateCreditStress.BENIGN.value,
+        )
+
     def calculate_scores(
         self,
         indicators: PrivateCreditIndicators
@@ -594,22 +631,13 @@ class PrivateCreditPillar:
 
         # Fixed-weight fallback
         if composite_method == "fixed_weight":
-            composite = (
-                sloos_score * self.WEIGHTS["sloos"] +
-                bdc_score * self.WEIGHTS["bdc"] +
-                ll_score * self.WEIGHTS["leveraged_loans"] +
-                pe_score * self.WEIGHTS["pe_firms"]
+            composite = self._fixed_weight_composite(
+                sloos_score, bdc_score, ll_score, pe_score,
             )
 
-        # Determine stress level
-        if composite < 0.25:
-            stress_level = PrivateCreditStress.SEVERE
-        elif composite < 0.40:
-            stress_level = PrivateCreditStress.ELEVATED
-        elif composite < 0.55:
-            stress_level = PrivateCreditStress.EMERGING
-        else:
-            stress_level = PrivateCreditStress.BENIGN
+        stress_level = PrivateCreditStress(
+            self._stress_level_array(np.array([composite]))[0].item()
+        )
 
         return PrivateCreditScores(
             sloos_score=sloos_score,
@@ -623,6 +651,37 @@ class PrivateCreditPillar:
             warning_signals=all_warnings,
         )
 
+    def calculate_batch(self, indicator_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many observations at once with the fixed-weight composite.
+
+        Row for row the same as ``calculate_scores`` for indicators
+        without decorrelation or PCA inputs (those need a return history
+        per row).  Columns are named after the SLOOSData, BDCData,
+        LeveragedLoanData and PEFirmData fields; absent columns and NaN
+        mean missing.
+
+        Returns:
+            DataFrame with sloos_score, bdc_score, leveraged_loan_score,
+            pe_firm_score, composite and stress_level (the
+            PrivateCreditStress value) columns, same index
+        """
+        frame = pd.DataFrame({
+            "sloos_score": score_pillar_batch(self._sloos_arrays(indicator_frame)),
+            "bdc_score": self._bdc_arrays(indicator_frame)[1],
+            "leveraged_loan_score": score_pillar_batch(
+                self._leveraged_loan_arrays(indicator_frame)
+            ),
+            "pe_firm_score": self._pe_firm_arrays(indicator_frame)[1],
+        }, index=indicator_frame.index).fillna(0.5)
+        composite = self._fixed_weight_composite(
+            frame["sloos_score"], frame["bdc_score"],
+            frame["leveraged_loan_score"], frame["pe_firm_score"],
+        ).to_numpy()
+        frame["composite"] = composite
+        frame["stress_level"] = self._stress_level_array(composite)
+        return frame
+
     async def fetch_fred_data(self) -> SLOOSData:
         """
         Fetch SLOOS data from FRED.
@@ -8,12 +8,33 @@ The residuals from regressing BDC returns on the top 3 PCs are
 the decorrelated private-credit-specific signal.
 
 Falls back to 3-factor OLS when insufficient data or numpy-only env.
+
+Everything the regression needs — factor means and standard deviations,
+the standardized Gram matrix whose eigenvectors are the principal axes,
+and the factor/BDC cross-products — follows from the window's sums and
+cross-products, so no per-window SVD is needed:
+
+- ``decorrelate`` — one window (the most recent)
+- ``RollingPCAEngine.push`` — adds the newest row and drops the oldest
+  in O(k²), then eigendecomposes the k×k Gram matrix
+- ``decorrelate_series`` — every date of a history at once, from
+  cumulative sums and one stacked eigendecomposition
+
+A window holding a non-finite value (NaN or inf) cannot be standardized
+and goes to the OLS fallback in all three paths.  The window sums skip
+such rows, so one gap does not poison the sums of every later window.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
 import numpy as np
+import pandas as pd
+
+# Retained eigenvalues below this fraction of the largest make the PC
+# regression singular (falls back to OLS)
+SINGULAR_EIGEN_RATIO = 1e-10
 
 
 @dataclass
@@ -32,6 +53,92 @@ class PCADecorrelationResult:
     data_quality: str = "good"
 
 
+@dataclass
+class _PCASolution:
+    """Vectorized PCA regression results for a batch of windows."""
+
+    score: np.ndarray             # (B,) decorrelated score
+    r_squared: np.ndarray         # (B,)
+    residual_std: np.ndarray      # (B,)
+    explained: np.ndarray         # (B, n_components) variance ratios
+    singular: np.ndarray          # (B,) bool — needs the OLS fallback
+
+
+def _pca_from_moments(
+    n: np.ndarray,
+    sx: np.ndarray,
+    sxx: np.ndarray,
+    sy: np.ndarray,
+    syy: np.ndarray,
+    sxy: np.ndarray,
+    x_last: np.ndarray,
+    y_last: np.ndarray,
+    n_components: int,
+) -> _PCASolution:
+    """PC regression of y on standardized factors from window sums.
+
+    All arguments carry a leading batch axis: n (B,), sx (B, k),
+    sxx (B, k, k), sy/syy (B,), sxy (B, k), x_last (B, k), y_last (B,).
+    Same algebra as SVD of the standardized window: Xsᵀ·Xs is the
+    scaled correlation matrix, its eigenvalues are the squared singular
+    values, and the PC scores are centered, so the regression residuals
+    have mean ȳ.
+    """
+    n = n.astype(np.float64)
+    mu = sx / n[:, None]
+    cov = sxx / n[:, None, None] - mu[:, :, None] * mu[:, None, :]
+    var = np.diagonal(cov, axis1=1, axis2=2)
+    # Constant factors standardize to zero (std treated as 1)
+    constant = var <= 1e-14 * np.diagonal(sxx, axis1=1, axis2=2) / n[:, None]
+    std = np.where(constant, 1.0, np.sqrt(np.clip(var, 0.0, None)))
+    live = ~constant
+    mask = live[:, :, None] & live[:, None, :]
+    gram = np.where(
+        mask, n[:, None, None] * cov / (std[:, :, None] * std[:, None, :]),
+        0.0,
+    )
+
+    eigvals, eigvecs = np.linalg.eigh(gram)
+    eigvals = np.clip(eigvals[:, ::-1], 0.0, None)
+    eigvecs = eigvecs[:, :, ::-1]
+    n_comp = min(n_components, eigvals.shape[1])
+    total = eigvals.sum(axis=1)
+    explained = eigvals[:, :n_comp] / np.where(total > 0, total, 1.0)[:, None]
+
+    lam = eigvals[:, :n_comp]
+    singular = lam[:, -1] <= SINGULAR_EIGEN_RATIO * lam[:, 0]
+    safe_lam = np.where(lam > 0, lam, 1.0)
+
+    # beta = (ZᵀZ)⁻¹Zᵀy with ZᵀZ = diag(λ) and Zᵀy = Vₖᵀ·Xsᵀy
+    xty = np.where(live, (sxy - mu * sy[:, None]) / std, 0.0)
+    vk = eigvecs[:, :, :n_comp]
+    c = np.einsum("bkc,bk->bc", vk, xty)
+    beta = c / safe_lam
+    x_last_std = np.where(live, (x_last - mu) / std, 0.0)
+    z_last = np.einsum("bk,bkc->bc", x_last_std, vk)
+    resid_last = y_last - (z_last * beta).sum(axis=1)
+
+    ss_res = np.clip(syy - (c * c / safe_lam).sum(axis=1), 0.0, None)
+    mean_y = sy / n
+    resid_var = ss_res / n - mean_y ** 2
+    resid_var = np.where(resid_var > 1e-14 * syy / n, resid_var, 0.0)
+    resid_std = np.sqrt(resid_var)
+    ss_tot = syy - sy * sy / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r_squared = np.where(ss_tot > 0, 1.0 - ss_res / ss_tot, 0.0)
+        z_score = np.where(resid_std > 0, resid_last / resid_std, 0.0)
+    score = np.where(
+        resid_std > 0, 1.0 / (1.0 + np.exp(-z_score)), 0.5,
+    )
+    return _PCASolution(
+        score=np.clip(score, 0.0, 1.0),
+        r_squared=r_squared,
+        residual_std=resid_std,
+        explained=explained,
+        singular=singular,
+    )
+
+
 class RollingPCADecorrelator:
     """5-factor rolling PCA decorrelator for private credit.
 
@@ -106,14 +213,7 @@ class RollingPCADecorrelator:
         min_len = min(min_len, len(bdc_returns))
 
         if min_len < self.min_observations:
-            return PCADecorrelationResult(
-                decorrelated_score=float(np.mean(bdc_returns[-20:]))
-                if len(bdc_returns) >= 20
-                else 0.5,
-                raw_score=0.5,
-                method="insufficient_data",
-                data_quality="insufficient",
-            )
+            return self._insufficient(bdc_returns)
 
         # Use rolling window
         window = min(self.window, min_len)
@@ -122,69 +222,159 @@ class RollingPCADecorrelator:
             [np.array(f[-window:]) for f in factors]
         )
 
-        # Standardize factors
-        X_mean = X.mean(axis=0)
-        X_std = X.std(axis=0)
-        X_std[X_std == 0] = 1.0  # Avoid division by zero
-        X_standardized = (X - X_mean) / X_std
+        return self._window_result(y, X)
 
-        # PCA via SVD
+    def _window_result(
+        self, y: np.ndarray, X: np.ndarray,
+    ) -> PCADecorrelationResult:
+        """PCA decorrelation of one aligned window."""
+        if not (np.isfinite(y).all() and np.isfinite(X).all()):
+            return self._ols_fallback(y, X)
         try:
-            U, S, Vt = np.linalg.svd(
-                X_standardized, full_matrices=False
+            sol = _pca_from_moments(
+                np.array([len(y)]), X.sum(axis=0)[None], (X.T @ X)[None],
+                np.array([y.sum()]), np.array([y @ y]), (X.T @ y)[None],
+                X[-1][None], y[-1:], self.n_components,
             )
-            total_var = np.sum(S ** 2)
-            explained_ratios = (S ** 2 / total_var).tolist()
-
-            # Keep top n_components
-            n_comp = min(self.n_components, len(S))
-            pc_scores = X_standardized @ Vt[:n_comp].T
-
-            # Regress BDC returns on PCs
-            # y = pc_scores @ beta + residual
-            # beta = (pc_scores.T @ pc_scores)^-1 @ pc_scores.T @ y
-            gram = pc_scores.T @ pc_scores
-            if np.linalg.det(gram) < 1e-10:
-                # Near-singular, fall back to OLS
-                return self._ols_fallback(y, X)
-
-            beta = np.linalg.solve(gram, pc_scores.T @ y)
-            y_hat = pc_scores @ beta
-            residuals = y - y_hat
+        except np.linalg.LinAlgError:
+            return self._ols_fallback(y, X)
+        if sol.singular[0]:
+            # Near-singular, fall back to OLS
+            return self._ols_fallback(y, X)
 
-            # R-squared
-            ss_res = np.sum(residuals ** 2)
-            ss_tot = np.sum((y - y.mean()) ** 2)
-            r_squared = 1.0 - ss_res / ss_tot if ss_tot > 0 else 0.0
-
-            # Decorrelated score: map residual to 0-1
-            # Positive residual = private credit doing worse
-            # than common factors explain
-            recent_residual = float(residuals[-1])
-            residual_std = float(np.std(residuals))
-
-            # Score: center at 0.5, penalise negative residuals
-            # (stress beyond what common factors explain)
-            if residual_std > 0:
-                z_score = recent_residual / residual_std
-                # Map z-score to 0-1 via sigmoid-like transform
-                score = 1.0 / (1.0 + np.exp(-z_score))
-            else:
-                score = 0.5
+        return PCADecorrelationResult(
+            decorrelated_score=float(sol.score[0]),
+            raw_score=float(np.mean(y[-5:])),
+            explained_variance_ratios=sol.explained[0].tolist(),
+            n_components_used=sol.explained.shape[1],
+            r_squared=float(sol.r_squared[0]),
+            residual_std=float(sol.residual_std[0]),
+            method="pca",
+            data_quality="good",
+        )
 
-            return PCADecorrelationResult(
-                decorrelated_score=float(np.clip(score, 0.0, 1.0)),
-                raw_score=float(np.mean(y[-5:])),
-                explained_variance_ratios=explained_ratios[:n_comp],
-                n_components_used=n_comp,
-                r_squared=float(r_squared),
-                residual_std=float(residual_std),
-                method="pca",
-                data_quality="good",
-            )
+    def _insufficient(self, bdc_returns: Sequence[float]) -> PCADecorrelationResult:
+        """Result before min_observations aligned rows are available."""
+        return PCADecorrelationResult(
+            decorrelated_score=float(np.mean(bdc_returns[-20:]))
+            if len(bdc_returns) >= 20
+            else 0.5,
+            raw_score=0.5,
+            method="insufficient_data",
+            data_quality="insufficient",
+        )
 
-        except np.linalg.LinAlgError:
-            return self._ols_fallback(y, X)
+    def decorrelate_series(
+        self,
+        bdc_returns: Sequence[float],
+        spx_returns: Sequence[float],
+        vix_changes: Sequence[float],
+        hy_oas_changes: Sequence[float],
+        move_changes: Optional[Sequence[float]] = None,
+        xccy_basis_changes: Optional[Sequence[float]] = None,
+        index: Optional[Sequence] = None,
+    ) -> pd.DataFrame:
+        """Decorrelate every date of an aligned history at once.
+
+        Row t equals ``decorrelate`` on the series truncated at t.
+        Window sums come from cumulative sums, and the k×k Gram matrices
+        of all windows are eigendecomposed in one stacked call.
+
+        Args:
+            bdc_returns, spx_returns, vix_changes, hy_oas_changes,
+            move_changes, xccy_basis_changes: Equal-length series, one
+                value per date (optional factors may be None)
+            index: Optional labels per date
+
+        Returns:
+            DataFrame with columns decorrelated_score, raw_score,
+            r_squared, residual_std, n_components_used, method,
+            data_quality
+        """
+        factors = [spx_returns, vix_changes, hy_oas_changes]
+        factors += [
+            f for f in (move_changes, xccy_basis_changes) if f is not None
+        ]
+        y = np.asarray(bdc_returns, dtype=np.float64)
+        X = np.column_stack([np.asarray(f, dtype=np.float64) for f in factors])
+        n_obs = len(y)
+        if len(X) != n_obs:
+            raise ValueError("factor series must align with bdc_returns")
+
+        frame = pd.DataFrame({
+            "decorrelated_score": 0.5,
+            "raw_score": 0.5,
+            "r_squared": 0.0,
+            "residual_std": 0.0,
+            "n_components_used": self.n_components,
+            "method": "insufficient_data",
+            "data_quality": "insufficient",
+        }, index=index if index is not None else pd.RangeIndex(n_obs))
+        if n_obs == 0:
+            return frame
+
+        # Insufficient rows: mean of the trailing 20 BDC returns
+        trailing = pd.Series(y).rolling(20).mean().to_numpy()
+        frame["decorrelated_score"] = np.where(
+            np.isnan(trailing), 0.5, trailing,
+        )
+
+        rows = np.arange(self.min_observations - 1, n_obs)
+        if len(rows) == 0:
+            return frame
+
+        def window_sums(values: np.ndarray) -> np.ndarray:
+            cum = np.concatenate([
+                np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0),
+            ])
+            lo = np.maximum(0, rows + 1 - self.window)
+            return cum[rows + 1] - cum[lo]
+
+        # Non-finite rows enter the sums as zeros; the windows holding
+        # them are counted here and take the OLS fallback below
+        bad = ~(np.isfinite(y) & np.isfinite(X).all(axis=1))
+        has_bad = window_sums(bad.astype(np.float64)) > 0
+        y0 = np.where(bad, 0.0, y)
+        X0 = np.where(bad[:, None], 0.0, X)
+
+        n = rows + 1 - np.maximum(0, rows + 1 - self.window)
+        sol = _pca_from_moments(
+            n,
+            window_sums(X0),
+            window_sums(X0[:, :, None] * X0[:, None, :]),
+            window_sums(y0),
+            window_sums(y0 * y0),
+            window_sums(X0 * y0[:, None]),
+            X0[rows], y0[rows], self.n_components,
+        )
+
+        raw = pd.Series(y).rolling(5, min_periods=1).mean().to_numpy()
+        position = frame.columns.get_loc
+        frame.iloc[rows, position("decorrelated_score")] = sol.score
+        frame.iloc[rows, position("raw_score")] = raw[rows]
+        frame.iloc[rows, position("r_squared")] = sol.r_squared
+        frame.iloc[rows, position("residual_std")] = sol.residual_std
+        frame.iloc[rows, position("n_components_used")] = sol.explained.shape[1]
+        frame.iloc[rows, position("method")] = "pca"
+        frame.iloc[rows, position("data_quality")] = "good"
+
+        # Near-singular and non-finite windows go through the OLS
+        # fallback one by one
+        for row in rows[sol.singular | has_bad]:
+            lo = max(0, row + 1 - self.window)
+            fallback = self._ols_fallback(y[lo:row + 1], X[lo:row + 1])
+            frame.iloc[row, position("decorrelated_score")] = (
+                fallback.decorrelated_score
+            )
+            frame.iloc[row, position("raw_score")] = fallback.raw_score
+            frame.iloc[row, position("r_squared")] = fallback.r_squared
+            frame.iloc[row, position("residual_std")] = fallback.residual_std
+            frame.iloc[row, position("n_components_used")] = (
+                fallback.n_components_used
+            )
+            frame.iloc[row, position("method")] = fallback.method
+            frame.iloc[row, position("data_quality")] = fallback.data_quality
+        return frame
 
     def _ols_fallback(
         self, y: np.ndarray, X: np.ndarray
@@ -230,3 +420,124 @@ class RollingPCADecorrelator:
                 method="failed",
                 data_quality="failed",
             )
+
+
+class RollingPCAEngine:
+    """Streaming PCA decorrelation with windowed sums.
+
+    Each ``push`` adds the newest (BDC return, factors) row to the
+    window sums and cross-products and subtracts the row that leaves,
+    in O(k²); only the k×k Gram matrix is eigendecomposed.  Sums are
+    rebuilt from the window once per ``window`` pushes so add/subtract
+    rounding cannot accumulate.  Non-finite rows are kept out of the
+    sums; while one is in the window, pushes take the OLS fallback,
+    exactly as ``decorrelate`` does.
+
+    Usage:
+        engine = RollingPCAEngine(RollingPCADecorrelator())
+        for bdc, factors in rows:
+            result = engine.push(bdc, factors)
+    """
+
+    def __init__(self, decorrelator: RollingPCADecorrelator):
+        self.decorrelator = decorrelator
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty the window."""
+        self._rows: deque = deque()
+        self._bdc_tail: deque = deque(maxlen=20)
+        self._sums: list = []
+        self._non_finite = 0
+        self._pushes = 0
+
+    def _add(self, y: float, x: np.ndarray, sign: float) -> None:
+        sx, sxx, sy, syy, sxy = self._sums
+        sx += sign * x
+        sxx += sign * np.outer(x, x)
+        sxy += sign * y * x
+        self._sums[2] = sy + sign * y
+        self._sums[3] = syy + sign * y * y
+
+    def _resum(self) -> None:
+        finite = [r for r in self._rows if r[2]]
+        k = len(self._sums[0])
+        y = np.array([r[0] for r in finite], dtype=np.float64)
+        X = np.array([r[1] for r in finite], dtype=np.float64).reshape(-1, k)
+        self._sums = [
+            X.sum(axis=0), X.T @ X, float(y.sum()), float(y @ y), X.T @ y,
+        ]
+
+    def _window(self) -> tuple[np.ndarray, np.ndarray]:
+        """BDC returns and factor matrix of the current window."""
+        y = np.array([r[0] for r in self._rows])
+        X = np.array([r[1] for r in self._rows])
+        return y, X
+
+    def push(
+        self,
+        bdc_return: float,
+        factors: Sequence[float],
+    ) -> PCADecorrelationResult:
+        """Add one date and decorrelate the current window.
+
+        Args:
+            bdc_return: BDC index return for the date
+            factors: SPX return, dVIX, dHY_OAS and any optional factors,
+                in the same order every call
+
+        Returns:
+            PCADecorrelationResult for the window ending at this date
+        """
+        dec = self.decorrelator
+        x = np.asarray(factors, dtype=np.float64)
+        if not self._sums:
+            k = len(x)
+            self._sums = [np.zeros(k), np.zeros((k, k)), 0.0, 0.0, np.zeros(k)]
+
+        if len(self._rows) == dec.window:
+            old_y, old_x, old_finite = self._rows.popleft()
+            if old_finite:
+                self._add(old_y, old_x, -1.0)
+            else:
+                self._non_finite -= 1
+        finite = bool(np.isfinite(bdc_return) and np.isfinite(x).all())
+        self._rows.append((float(bdc_return), x, finite))
+        self._bdc_tail.append(float(bdc_return))
+        if finite:
+            self._add(float(bdc_return), x, 1.0)
+        else:
+            self._non_finite += 1
+        self._pushes += 1
+        if self._pushes % dec.window == 0:
+            self._resum()
+
+        if len(self._rows) < dec.min_observations:
+            return dec._insufficient(list(self._bdc_tail))
+        if self._non_finite:
+            return dec._window_result(*self._window())
+
+        sx, sxx, sy, syy, sxy = self._sums
+        try:
+            sol = _pca_from_moments(
+                np.array([len(self._rows)]), sx[None], sxx[None],
+                np.array([sy]), np.array([syy]), sxy[None],
+                x[None], np.array([float(bdc_return)]), dec.n_components,
+            )
+            singular = bool(sol.singular[0])
+        except np.linalg.LinAlgError:
+            singular = True
+        if singular:
+            return dec._ols_fallback(*self._window())
+
+        tail = list(self._bdc_tail)[-5:]
+        return PCADecorrelationResult(
+            decorrelated_score=float(sol.score[0]),
+            raw_score=float(np.mean(tail)),
+            explained_variance_ratios=sol.explained[0].tolist(),
+            n_components_used=sol.explained.shape[1],
+            r_squared=float(sol.r_squared[0]),
+            residual_std=float(sol.residual_std[0]),
+            method="pca",
+            data_quality="good",
+        )
@@ -37,6 +37,9 @@ from datetime import datetime
 from typing import List, Optional
 
 import numpy as np
+import pandas as pd
+
+from ..mac.scorer import indicator_column, indicator_years
 
 logger = logging.getLogger(__name__)
 
@@ -397,36 +400,64 @@ class SentimentPillar:
         Returns:
             SentimentResult with proxy-derived composite score.
         """
-        if observation_date and observation_date.year < 1960:
-            return SentimentResult(
-                composite_score=0.5,
-                mean_sentiment=0.5,
-                std_sentiment=0.0,
-                n_sentences=0,
-                n_documents=0,
-                hawkish_pct=0.0,
-                dovish_pct=0.0,
-                neutral_pct=100.0,
-                method="pre_data",
-            )
-
-        score = float(np.clip(proxy_score, 0.0, 1.0))
-        hawk_pct = max(0.0, (0.5 - score) * 200)  # 0 at 0.5, 100 at 0.0
-        dove_pct = max(0.0, (score - 0.5) * 200)  # 0 at 0.5, 100 at 1.0
-        neut_pct = 100.0 - hawk_pct - dove_pct
-
+        year = observation_date.year if observation_date else np.nan
+        row = self._proxy_arrays(
+            np.array([proxy_score], dtype=np.float64),
+            np.array([year], dtype=np.float64),
+        )
+        method = str(row["method"][0])
         return SentimentResult(
-            composite_score=score,
-            mean_sentiment=score,
-            std_sentiment=0.12,  # Elevated uncertainty for proxy
+            composite_score=float(row["composite_score"][0]),
+            mean_sentiment=float(row["composite_score"][0]),
+            # Elevated uncertainty for proxy
+            std_sentiment=0.0 if method == "pre_data" else 0.12,
             n_sentences=0,
             n_documents=0,
-            hawkish_pct=hawk_pct,
-            dovish_pct=dove_pct,
-            neutral_pct=neut_pct,
-            method="rate_proxy",
+            hawkish_pct=float(row["hawkish_pct"][0]),
+            dovish_pct=float(row["dovish_pct"][0]),
+            neutral_pct=float(row["neutral_pct"][0]),
+            method=method,
         )
 
+    def calculate_batch(self, indicator_frame: pd.DataFrame) -> pd.DataFrame:
+        """Array form of ``score_from_proxy`` over many observations.
+
+        Args:
+            indicator_frame: ``proxy_score`` column (NaN = no texts or
+                proxy) and optional ``observation_date`` column.
+
+        Returns:
+            DataFrame with composite_score, hawkish_pct, dovish_pct,
+            neutral_pct and method columns, same index.
+        """
+        return pd.DataFrame(self._proxy_arrays(
+            indicator_column(indicator_frame, "proxy_score"),
+            indicator_years(indicator_frame, "observation_date"),
+        ), index=indicator_frame.index)
+
+    @staticmethod
+    def _proxy_arrays(
+        proxy: np.ndarray, years: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """Proxy-derived scores per observation (NaN proxy = no texts)."""
+        pre_data = years < 1960
+        missing = np.isnan(proxy) & ~pre_data
+
+        score = np.clip(proxy, 0.0, 1.0)
+        score[pre_data | missing] = 0.5
+        hawk_pct = np.maximum(0.0, (0.5 - score) * 200)  # 0 at 0.5, 100 at 0.0
+        dove_pct = np.maximum(0.0, (score - 0.5) * 200)  # 0 at 0.5, 100 at 1.0
+        return {
+            "composite_score": score,
+            "hawkish_pct": hawk_pct,
+            "dovish_pct": dove_pct,
+            "neutral_pct": 100.0 - hawk_pct - dove_pct,
+            "method": np.select(
+                [pre_data, missing], ["pre_data", "no_texts"],
+                default="rate_proxy",
+            ),
+        }
+
     def get_score(
         self,
         texts: Optional[List[str]] = None,
@@ -18,7 +18,16 @@ from dataclasses import dataclass
 from typing import Optional
 import logging
 
-from ..mac.scorer import score_indicator_range
+import numpy as np
+import pandas as pd
+
+from ..mac.scorer import (
+    first_row,
+    indicator_column,
+    score_indicator_range,
+    score_indicator_range_array,
+    score_pillar_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +90,13 @@ class ValuationPillar:
         },
     }
 
+    # (ValuationIndicators field, ValuationScores field)
+    _FIELDS = (
+        ("term_premium_10y_bps", "term_premium"),
+        ("ig_oas_bps", "ig_oas"),
+        ("hy_oas_bps", "hy_oas"),
+    )
+
     def __init__(self, fred_client=None, use_adaptive_bands=True):
         """
         Initialize valuation pillar.
@@ -98,6 +114,12 @@ class ValuationPillar:
         self._hy_oas_history: list[float] = []
         self._tp_history: list[float] = []
 
+    def reset_history(self) -> None:
+        """Forget the accumulated adaptive-scoring history."""
+        self._ig_oas_history = []
+        self._hy_oas_history = []
+        self._tp_history = []
+
     def fetch_indicators(self) -> ValuationIndicators:
         """Fetch current valuation indicators from data sources."""
         indicators = ValuationIndicators()
@@ -180,67 +202,94 @@ class ValuationPillar:
         if indicators.term_premium_10y_bps is not None:
             self._tp_history.append(indicators.term_premium_10y_bps)
 
-        scores = ValuationScores()
-        scored_count = 0
-
         # v7: Try adaptive bands if sufficient history
         use_adaptive = (
             self._adaptive_bands is not None
             and len(self._ig_oas_history) >= 52
         )
-
-        if indicators.term_premium_10y_bps is not None:
-            if use_adaptive and len(self._tp_history) >= 52:
+        adaptive = {}
+        for field_name, key, history in (
+            ("term_premium_10y_bps", "term_premium", self._tp_history),
+            ("ig_oas_bps", "ig_oas", self._ig_oas_history),
+            ("hy_oas_bps", "hy_oas", self._hy_oas_history),
+        ):
+            value = getattr(indicators, field_name)
+            if use_adaptive and value is not None and len(history) >= 52:
                 result = self._adaptive_bands.score_with_regime(
-                    indicators.term_premium_10y_bps,
-                    self._tp_history,
-                    regime,
+                    value, history, regime,
                 )
-                scores.term_premium = result.score
-            else:
-                scores.term_premium = self.score_term_premium(
-                    indicators.term_premium_10y_bps
-                )
-            scored_count += 1
+                adaptive[key] = np.array([result.score], dtype=np.float64)
 
-        if indicators.ig_oas_bps is not None:
-            if use_adaptive:
-                result = self._adaptive_bands.score_with_regime(
-                    indicators.ig_oas_bps,
-                    self._ig_oas_history,
-                    regime,
-                )
-                scores.ig_oas = result.score
-            else:
-                scores.ig_oas = self.score_ig_oas(indicators.ig_oas_bps)
-            scored_count += 1
+        return ValuationScores(**first_row(self._score_arrays(indicators, adaptive)))
 
-        if indicators.hy_oas_bps is not None:
-            if use_adaptive and len(self._hy_oas_history) >= 52:
-                result = self._adaptive_bands.score_with_regime(
-                    indicators.hy_oas_bps,
-                    self._hy_oas_history,
-                    regime,
+    def calculate_batch(
+        self,
+        indicator_frame: pd.DataFrame,
+        regime: str = "neutral",
+    ) -> pd.DataFrame:
+        """
+        Score a chronological run of observations at once.
+
+        Rows are treated as the history ``calculate`` would accumulate
+        if called once per row on a fresh pillar: adaptive bands switch
+        in once 52 IG OAS observations (and 52 of the indicator's own)
+        have been seen.  The pillar's own history is neither read nor
+        updated.
+
+        Args:
+            indicator_frame: One row per observation in time order,
+                columns named after ValuationIndicators fields
+            regime: Monetary policy regime ("qe", "tightening", "neutral")
+
+        Returns:
+            DataFrame with the ValuationScores columns, same index
+        """
+        adaptive = {}
+        if self._adaptive_bands is not None:
+            ig_seen = np.cumsum(
+                ~np.isnan(indicator_column(indicator_frame, "ig_oas_bps"))
+            )
+            for field_name, key in self._FIELDS:
+                scores = self._adaptive_bands.score_history_batch(
+                    indicator_column(indicator_frame, field_name), regime,
                 )
-                scores.hy_oas = result.score
-            else:
-                scores.hy_oas = self.score_hy_oas(indicators.hy_oas_bps)
-            scored_count += 1
-
-        # Calculate composite
-        if scored_count > 0:
-            total = 0.0
-            if indicators.term_premium_10y_bps is not None:
-                total += scores.term_premium
-            if indicators.ig_oas_bps is not None:
-                total += scores.ig_oas
-            if indicators.hy_oas_bps is not None:
-                total += scores.hy_oas
-            scores.composite = total / scored_count
-        else:
-            scores.composite = 0.5
-
-        return scores
+                adaptive[key] = np.where(ig_seen >= 52, scores, np.nan)
+
+        return pd.DataFrame(
+            self._score_arrays(indicator_frame, adaptive),
+            index=indicator_frame.index,
+        )
+
+    def _score_arrays(
+        self,
+        source,
+        adaptive: Optional[dict[str, np.ndarray]] = None,
+    ) -> dict[str, np.ndarray]:
+        """
+        ValuationScores fields per observation of a frame or dataclass.
+
+        ``adaptive`` holds adaptive-band scores by indicator; where they
+        are not NaN they replace the fixed-threshold score.
+        """
+        adaptive = adaptive or {}
+        columns = {}
+        for field_name, key in self._FIELDS:
+            t = self.THRESHOLDS[key]
+            scores = score_indicator_range_array(
+                indicator_column(source, field_name),
+                (t["ample_low"], t["ample_high"]),
+                (t["thin_low"], t["thin_high"]),
+                (t["breach_low"], t["breach_high"]),
+            )
+            if key in adaptive:
+                scores = np.where(np.isnan(adaptive[key]), scores, adaptive[key])
+            columns[key] = scores
+
+        columns["composite"] = score_pillar_batch(list(columns.values()))
+        return {
+            key: np.where(np.isnan(col), 0.5, col)
+            for key, col in columns.items()
+        }
 
     def get_score(self) -> float:
         """Get composite valuation score."""
@@ -22,6 +22,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
+import pandas as pd
 
 
 @dataclass
@@ -233,6 +234,69 @@ class AdaptiveValuationBands:
         # Outside breach range → 0.0
         return 0.0
 
+    def score_history_batch(
+        self,
+        values: np.ndarray,
+        regime: str = "neutral",
+    ) -> np.ndarray:
+        """Score a chronological series against its own trailing bands.
+
+        Equivalent to calling ``score_with_regime`` at every observation
+        with the history accumulated up to and including it, but with
+        the rolling percentiles computed in one pass.
+
+        Args:
+            values: Indicator values (NaN = not observed that period)
+            regime: "qe", "tightening", or "neutral"
+
+        Returns:
+            Scores aligned to ``values``; NaN where the value is missing
+            or fewer than 52 observations have accumulated
+        """
+        values = np.asarray(values, dtype=float)
+        out = np.full(values.shape, np.nan)
+        present = ~np.isnan(values)
+        compact = values[present]
+        if compact.size < 52:
+            return out
+
+        pcts = self.REGIME_ADJUSTMENTS.get(
+            regime, self.REGIME_ADJUSTMENTS["neutral"]
+        )
+        rolling = pd.Series(compact).rolling(
+            self.lookback_weeks, min_periods=1,
+        )
+
+        def pct(p: float) -> np.ndarray:
+            return rolling.quantile(p / 100.0).to_numpy()
+
+        al, ah = (pct(p) for p in pcts["ample_pct"])
+        tl, th = (pct(p) for p in pcts["thin_pct"])
+        bl, bh = (pct(p) for p in pcts["breach_pct"])
+        v = compact
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            scores = np.select(
+                [
+                    (al <= v) & (v <= ah),
+                    (tl <= v) & (v < al),
+                    (ah < v) & (v <= th),
+                    (bl <= v) & (v < tl),
+                    (th < v) & (v <= bh),
+                ],
+                [
+                    1.0,
+                    np.where(al > tl, 0.5 + 0.5 * (v - tl) / (al - tl), 0.5),
+                    np.where(th > ah, 0.5 + 0.5 * (th - v) / (th - ah), 0.5),
+                    np.where(tl > bl, 0.5 * (v - bl) / (tl - bl), 0.0),
+                    np.where(bh > th, 0.5 * (bh - v) / (bh - th), 0.0),
+                ],
+                default=0.0,
+            )
+        scores[:51] = np.nan
+        out[present] = scores
+        return out
+
     def detect_regime(
         self,
         fed_balance_sheet_gdp_pct: Optional[float] = None,
@@ -22,7 +22,17 @@ from typing import Any, Optional
 import math
 import logging
 
-from ..mac.scorer import score_indicator_range
+import numpy as np
+import pandas as pd
+
+from ..mac.scorer import (
+    first_row,
+    indicator_column,
+    score_indicator_range,
+    score_indicator_range_array,
+    score_indicator_simple_array,
+    score_pillar_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -171,20 +181,23 @@ class VolatilityPillar:
 
     def score_rv_iv_gap(self, realized_vol: float, implied_vol: float) -> float:
         """Score realized vs implied volatility gap."""
-        if implied_vol == 0:
-            return 0.5
-
-        gap_pct = abs(realized_vol - implied_vol) / implied_vol * 100
+        return float(self._rv_iv_gap_array(
+            np.array([realized_vol], dtype=np.float64),
+            np.array([implied_vol], dtype=np.float64),
+        )[0])
+
+    def _rv_iv_gap_array(
+        self, realized: np.ndarray, implied: np.ndarray,
+    ) -> np.ndarray:
+        """Gap score per observation (NaN where either vol is missing)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gap_pct = np.abs(realized - implied) / implied * 100
         t = self.THRESHOLDS["rv_iv_gap"]
-
-        if gap_pct <= t["ample"]:
-            return 1.0
-        elif gap_pct <= t["thin"]:
-            return 0.5 + 0.5 * (t["thin"] - gap_pct) / (t["thin"] - t["ample"])
-        elif gap_pct <= t["breach"]:
-            return 0.5 * (t["breach"] - gap_pct) / (t["breach"] - t["thin"])
-        else:
-            return 0.0
+        gap = score_indicator_simple_array(
+            gap_pct, t["ample"], t["thin"], t["breach"], lower_is_better=True,
+        )
+        # Zero implied vol carries no information: score neutral
+        return np.where((implied == 0) & ~np.isnan(realized), 0.5, gap)
 
     def calculate_vix_persistence_penalty(
         self,
@@ -371,43 +384,23 @@ class VolatilityPillar:
         if indicators is None:
             indicators = self.fetch_indicators()
 
-        scores = VolatilityScores()
-        scored_count = 0
-
-        if indicators.vix_level is not None:
-            scores.vix_level = self.score_vix_level(indicators.vix_level)
-            scored_count += 1
-
-        if indicators.vix_term_structure is not None:
-            scores.term_structure = self.score_term_structure(
-                indicators.vix_term_structure
-            )
-            scored_count += 1
-
-        if indicators.realized_vol is not None and indicators.implied_vol is not None:
-            scores.rv_iv_gap = self.score_rv_iv_gap(
-                indicators.realized_vol, indicators.implied_vol
+        row = first_row(self._score_arrays(indicators))
+        fields: dict[str, Any] = {
+            key: 0.5 if value is None else value for key, value in row.items()
+        }
+        scores = VolatilityScores(**fields)
+
+        # Base composite (without VRP)
+        base_composite = scores.composite
+        scored = any(
+            row[key] is not None
+            for key in ("vix_level", "term_structure", "rv_iv_gap")
+        )
+        if scored and apply_persistence_penalty and indicators.vix_history:
+            persistence_penalty = self.calculate_vix_persistence_penalty(
+                indicators.vix_history
             )
-            scored_count += 1
-
-        # Calculate base composite (without VRP)
-        base_composite = 0.5
-        if scored_count > 0:
-            total = 0.0
-            if indicators.vix_level is not None:
-                total += scores.vix_level
-            if indicators.vix_term_structure is not None:
-                total += scores.term_structure
-            if indicators.realized_vol is not None and indicators.implied_vol is not None:
-                total += scores.rv_iv_gap
-            base_composite = total / scored_count
-
-            # Apply VIX persistence penalty if enabled
-            if apply_persistence_penalty and indicators.vix_history:
-                persistence_penalty = self.calculate_vix_persistence_penalty(
-                    indicators.vix_history
-                )
-                base_composite = max(0.0, base_composite - persistence_penalty)
+            base_composite = max(0.0, base_composite - persistence_penalty)
 
         # ── VRP dual computation (v6 §4.4.5) ────────────────────────
         vrp_result = self.calculate_vrp(indicators.vix_history)
@@ -433,6 +426,52 @@ class VolatilityPillar:
         scores.vrp = vrp_result
         return scores
 
+    def calculate_batch(self, indicator_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score many observations at once.
+
+        Row for row the same as ``calculate`` with NaN in place of None
+        and no ``vix_history``: the persistence penalty and VRP need a
+        per-row VIX path, so the composite here is the base composite
+        (``score_without_vrp``).
+
+        Args:
+            indicator_frame: One row per observation, columns named after
+                VolatilityIndicators fields (absent columns = missing)
+
+        Returns:
+            DataFrame with vix_level, term_structure, rv_iv_gap and
+            composite columns, same index
+        """
+        frame = pd.DataFrame(
+            self._score_arrays(indicator_frame), index=indicator_frame.index,
+        )
+        return frame.fillna(0.5)
+
+    def _score_arrays(self, source) -> dict[str, np.ndarray]:
+        """
+        Indicator scores (NaN = missing) and base composite per
+        observation of a frame or dataclass.
+        """
+        columns = {}
+        for field_name, key in (
+            ("vix_level", "vix_level"),
+            ("vix_term_structure", "term_structure"),
+        ):
+            t = self.THRESHOLDS[key]
+            columns[key] = score_indicator_range_array(
+                indicator_column(source, field_name),
+                (t["ample_low"], t["ample_high"]),
+                (t["thin_low"], t["thin_high"]),
+                (t["breach_low"], t["breach_high"]),
+            )
+        columns["rv_iv_gap"] = self._rv_iv_gap_array(
+            indicator_column(source, "realized_vol"),
+            indicator_column(source, "implied_vol"),
+        )
+        columns["composite"] = score_pillar_batch(list(columns.values()))
+        return columns
+
     def get_score(self) -> float:
         """Get composite volatility score."""
         return self.calculate().composite
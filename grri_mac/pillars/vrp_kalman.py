@@ -7,13 +7,25 @@ with a state-space model that:
 3. Borrows strength from neighbouring periods for smoother estimates
 
 Falls back to the linear formula when filterpy/pykalman unavailable.
+
+``estimate`` re-derives its inputs and reruns the filter over the whole
+lookback window on every call.  For date-by-date use the estimator is
+also recursive: ``update`` folds in one VIX level (and optionally one
+return) in O(1) — rolling power sums for the moments, one predict/update
+step for the filter — and ``snapshot``/``restore`` checkpoint that
+state.  ``filter_series`` returns the same estimates for a whole VIX
+history in one vectorized pass.  The recursive paths run the scalar
+filter directly and do not need filterpy/pykalman.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
 import math
 
 import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
 
 # Try filterpy first (lighter), then pykalman
 _KALMAN_BACKEND = None
@@ -33,6 +45,13 @@ VRP_SENSITIVITY = 0.015
 VRP_FLOOR = 1.05
 VRP_CEILING = 1.55
 
+# Rolling window (VIX levels) behind each VRP proxy observation
+PROXY_WINDOW = 21
+# VIX levels needed before the filter output replaces the linear formula
+MIN_FILTER_HISTORY = 30
+# Skew/kurtosis need more than this many observations
+MIN_MOMENT_OBS = 30
+
 
 @dataclass
 class KalmanVRPResult:
@@ -48,6 +67,112 @@ class KalmanVRPResult:
     n_observations: int = 0
 
 
+@dataclass
+class VRPFilterState:
+    """Checkpoint of a KalmanVRPEstimator's recursive state.
+
+    Plain lists and floats, so it pickles cheaply to backtest workers.
+    """
+
+    vix: list[float] = field(default_factory=list)      # Trailing levels
+    returns: list[float] = field(default_factory=list)  # Trailing returns
+    n_vix: int = 0           # VIX levels seen in total
+    vrp: float = 1.10        # Filtered state mean (plain observations)
+    variance: float = 0.0025  # Filtered state variance
+    n_steps: int = 0         # Filter steps taken
+
+
+class _RollingMoments:
+    """Power sums of the last ``window`` values, updated in O(1).
+
+    The sums are rebuilt from the window every ``window`` pushes so
+    add/subtract rounding cannot accumulate.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.values: deque = deque()
+        self._sums = [0.0, 0.0, 0.0, 0.0]
+        self._pushes = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def push(self, x: float) -> None:
+        if len(self.values) == self.window:
+            old = self.values.popleft()
+            self._sums[0] -= old
+            self._sums[1] -= old * old
+            self._sums[2] -= old ** 3
+            self._sums[3] -= old ** 4
+        self.values.append(x)
+        self._sums[0] += x
+        self._sums[1] += x * x
+        self._sums[2] += x ** 3
+        self._sums[3] += x ** 4
+        self._pushes += 1
+        if self._pushes % self.window == 0:
+            arr = np.asarray(self.values, dtype=np.float64)
+            self._sums = [float((arr ** k).sum()) for k in (1, 2, 3, 4)]
+
+    def _central(self) -> tuple[float, float, float]:
+        """Population central moments m2, m3, m4."""
+        n = len(self.values)
+        mu = self._sums[0] / n
+        e2, e3, e4 = (s / n for s in self._sums[1:])
+        m2 = e2 - mu * mu
+        if m2 <= 1e-14 * max(e2, 1e-300):
+            return 0.0, 0.0, 0.0
+        m3 = e3 - 3 * mu * e2 + 2 * mu ** 3
+        m4 = e4 - 4 * mu * e3 + 6 * mu * mu * e2 - 3 * mu ** 4
+        return m2, m3, m4
+
+    def std(self) -> float:
+        return math.sqrt(self._central()[0]) if self.values else 0.0
+
+    def skew(self) -> Optional[float]:
+        m2, m3, _ = self._central()
+        return m3 / m2 ** 1.5 if m2 > 0 else None
+
+    def excess_kurtosis(self) -> Optional[float]:
+        m2, _, m4 = self._central()
+        return m4 / (m2 * m2) - 3.0 if m2 > 0 else None
+
+
+def _rolling_moments(
+    values: pd.Series, window: int,
+) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+    """Rolling count, population std, skew and excess kurtosis."""
+    roll = [
+        (values ** k).rolling(window, min_periods=1).mean()
+        for k in (1, 2, 3, 4)
+    ]
+    count = values.rolling(window, min_periods=1).count()
+    mu, e2, e3, e4 = roll
+    m2 = (e2 - mu * mu).clip(lower=0.0)
+    m2 = m2.where(m2 > 1e-14 * e2.abs(), 0.0)
+    m3 = e3 - 3 * mu * e2 + 2 * mu ** 3
+    m4 = e4 - 4 * mu * e3 + 6 * mu * mu * e2 - 3 * mu ** 4
+    positive = m2 > 0
+    skew = (m3 / m2 ** 1.5).where(positive)
+    kurt = (m4 / (m2 * m2) - 3.0).where(positive)
+    return count, np.sqrt(m2), skew, kurt
+
+
+def _proxy_adjustment(
+    skew: Optional[float], kurtosis: Optional[float],
+) -> float:
+    """VRP proxy uplift from negative skew and excess kurtosis."""
+    adj = 0.0
+    if skew is not None:
+        # Negative skew → higher VRP
+        adj += max(0, -skew) * 0.02
+    if kurtosis is not None:
+        # Excess kurtosis → higher VRP
+        adj += max(0, kurtosis) * 0.01
+    return adj
+
+
 class KalmanVRPEstimator:
     """State-space VRP estimator using Kalman filter.
 
@@ -70,6 +195,7 @@ class KalmanVRPEstimator:
         measurement_noise: float = 0.01,
         initial_vrp: float = 1.10,
         initial_uncertainty: float = 0.05,
+        lookback: int = 252,
     ):
         """Initialize Kalman VRP estimator.
 
@@ -78,11 +204,14 @@ class KalmanVRPEstimator:
             measurement_noise: R — how noisy the proxy observations are
             initial_vrp: Prior mean for VRP
             initial_uncertainty: Prior std for VRP
+            lookback: Moment window for ``update``/``filter_series``
         """
         self.Q = process_noise
         self.R = measurement_noise
         self.initial_vrp = initial_vrp
         self.initial_P = initial_uncertainty ** 2
+        self.lookback = lookback
+        self.reset()
 
     def estimate(
         self,
@@ -189,7 +318,7 @@ class KalmanVRPEstimator:
         if len(vix_history) < 30:
             return []
 
-        window = 21  # ~1 month rolling
+        window = PROXY_WINDOW  # ~1 month rolling
         observations = []
 
         for i in range(window, len(vix_history)):
@@ -203,15 +332,9 @@ class KalmanVRPEstimator:
             # Base VRP proxy
             proxy = VRP_BASE + VRP_SENSITIVITY * local_vov
 
-            # Skew adjustment (if available, apply to last obs)
-            if skew is not None and i == len(vix_history) - 1:
-                # Negative skew → higher VRP
-                proxy += max(0, -skew) * 0.02
-
-            # Kurtosis adjustment
-            if kurtosis is not None and i == len(vix_history) - 1:
-                # Excess kurtosis → higher VRP
-                proxy += max(0, kurtosis) * 0.01
+            # Skew/kurtosis adjustments (if available, apply to last obs)
+            if i == len(vix_history) - 1:
+                proxy += _proxy_adjustment(skew, kurtosis)
 
             observations.append(
                 float(max(VRP_FLOOR, min(VRP_CEILING, proxy)))
@@ -219,6 +342,255 @@ class KalmanVRPEstimator:
 
         return observations
 
+    # ── Recursive estimation ────────────────────────────────────────────
+
+    def reset(self) -> None:
+        """Clear the recursive state used by ``update``."""
+        self.restore(VRPFilterState(
+            vrp=self.initial_vrp, variance=self.initial_P,
+        ))
+
+    def snapshot(self) -> VRPFilterState:
+        """Checkpoint the recursive state (windows and filter)."""
+        return VRPFilterState(
+            vix=list(self._vix),
+            returns=list(self._returns.values),
+            n_vix=self._n_vix,
+            vrp=self._x,
+            variance=self._P,
+            n_steps=self._steps,
+        )
+
+    def restore(self, state: VRPFilterState) -> None:
+        """Resume from a checkpoint taken with ``snapshot``."""
+        self._vix: deque = deque(state.vix[-self.lookback:],
+                                 maxlen=self.lookback)
+        self._changes = _RollingMoments(self.lookback - 1)
+        self._local = _RollingMoments(PROXY_WINDOW - 1)
+        self._returns = _RollingMoments(self.lookback)
+        levels = list(self._vix)
+        for prev, cur in zip(levels, levels[1:]):
+            self._changes.push(cur - prev)
+            self._local.push(cur - prev)
+        for r in state.returns[-self.lookback:]:
+            self._returns.push(r)
+        self._n_vix = state.n_vix
+        self._x = state.vrp
+        self._P = state.variance
+        self._steps = state.n_steps
+
+    def update(
+        self,
+        vix: float,
+        ret: Optional[float] = None,
+    ) -> KalmanVRPResult:
+        """Fold one VIX level (and return) into the recursive estimate.
+
+        Equivalent to ``estimate`` on the history so far, except that
+        the filter keeps running from the first observation instead of
+        restarting at the prior for each lookback window (the prior's
+        weight decays geometrically, so the two agree once the history
+        exceeds a few dozen observations).
+
+        Args:
+            vix: Newest VIX level
+            ret: Newest daily return (optional; feeds kurtosis)
+
+        Returns:
+            KalmanVRPResult for the history including this observation
+        """
+        # Proxy for this date uses the changes before it
+        local_vov = (
+            self._local.std()
+            if len(self._local) == PROXY_WINDOW - 1 else None
+        )
+        if self._vix:
+            change = vix - self._vix[-1]
+            self._changes.push(change)
+            self._local.push(change)
+        self._vix.append(vix)
+        self._n_vix += 1
+        if ret is not None and not math.isnan(ret):
+            self._returns.push(ret)
+
+        if local_vov is None:
+            return self._recursive_fallback()
+
+        # One predict/update step on the plain proxy
+        raw = VRP_BASE + VRP_SENSITIVITY * local_vov
+        z = max(VRP_FLOOR, min(VRP_CEILING, raw))
+        x_prior = self._x
+        p_pred = self._P + self.Q
+        gain = p_pred / (p_pred + self.R)
+        self._x = x_prior + gain * (z - x_prior)
+        self._P = (1.0 - gain) * p_pred
+        self._steps += 1
+
+        if self._n_vix < MIN_FILTER_HISTORY:
+            return self._recursive_fallback()
+
+        # The newest proxy also carries the skew/kurtosis uplift
+        skew = (
+            self._changes.skew()
+            if len(self._changes) > MIN_MOMENT_OBS else None
+        )
+        kurtosis = (
+            self._returns.excess_kurtosis()
+            if len(self._returns) > MIN_MOMENT_OBS else None
+        )
+        z_adj = max(VRP_FLOOR, min(
+            VRP_CEILING, raw + _proxy_adjustment(skew, kurtosis),
+        ))
+        vrp = x_prior + gain * (z_adj - x_prior)
+
+        return KalmanVRPResult(
+            vrp_estimate=max(VRP_FLOOR, min(VRP_CEILING, vrp)),
+            vrp_std=math.sqrt(self._P),
+            smoothed=True,
+            vol_of_vol=self._changes.std(),
+            skew=skew,
+            kurtosis=kurtosis,
+            method="kalman",
+            n_observations=self._steps,
+        )
+
+    def _recursive_fallback(self) -> KalmanVRPResult:
+        """Linear-formula result while the history is too short."""
+        if self._n_vix < 20:
+            return self._linear_fallback(None)
+        vol_of_vol = self._changes.std()
+        raw_vrp = VRP_BASE + VRP_SENSITIVITY * vol_of_vol
+        return KalmanVRPResult(
+            vrp_estimate=max(VRP_FLOOR, min(VRP_CEILING, raw_vrp)),
+            vrp_std=0.05,
+            smoothed=False,
+            vol_of_vol=vol_of_vol,
+            method="linear_fallback",
+            n_observations=len(self._changes),
+        )
+
+    def filter_series(
+        self,
+        vix_history: Sequence[float],
+        returns_history: Optional[Sequence[float]] = None,
+    ) -> pd.DataFrame:
+        """Recursive VRP estimates for every date of a VIX history.
+
+        Gives the same values as calling ``update`` on a fresh
+        estimator for each observation in turn, without the loop: the
+        moments are rolling means of power sums, and because the Kalman
+        gain does not depend on the data the filter becomes a
+        constant-coefficient IIR filter once the gain has converged.
+
+        Args:
+            vix_history: VIX levels, oldest first (a Series keeps its
+                index)
+            returns_history: Daily returns aligned with vix_history
+                (optional; NaN entries are skipped)
+
+        Returns:
+            DataFrame with columns vrp_estimate, vrp_std, vol_of_vol,
+            skew, kurtosis, method, n_observations
+        """
+        index = (
+            vix_history.index if isinstance(vix_history, pd.Series)
+            else None
+        )
+        vix = np.asarray(vix_history, dtype=np.float64)
+        n = len(vix)
+        changes = pd.Series(np.concatenate([[np.nan], np.diff(vix)]))
+
+        n_changes, vol_of_vol, skew, _ = _rolling_moments(
+            changes, self.lookback - 1,
+        )
+        skew = skew.where(n_changes > MIN_MOMENT_OBS)
+        local_vov = _rolling_moments(changes, PROXY_WINDOW - 1)[1]
+        local_vov = local_vov.shift(1).to_numpy()
+        if returns_history is not None:
+            rets = pd.Series(np.asarray(returns_history, dtype=np.float64))
+            if len(rets) != n:
+                raise ValueError("returns_history must align with vix")
+            n_rets, _, _, kurt = _rolling_moments(rets, self.lookback)
+            kurt = kurt.where(n_rets > MIN_MOMENT_OBS).to_numpy()
+        else:
+            kurt = np.full(n, np.nan)
+        skew = skew.to_numpy()
+
+        # Filter steps start once a full proxy window precedes the date
+        first = PROXY_WINDOW
+        steps = max(0, n - first)
+        raw = VRP_BASE + VRP_SENSITIVITY * local_vov[first:]
+        z = np.clip(raw, VRP_FLOOR, VRP_CEILING)
+        uplift = (
+            np.fmax(0.0, -np.nan_to_num(skew[first:])) * 0.02
+            + np.fmax(0.0, np.nan_to_num(kurt[first:])) * 0.01
+        )
+        z_adj = np.clip(raw + uplift, VRP_FLOOR, VRP_CEILING)
+
+        # Gain and variance are data-independent; iterate to convergence
+        gains = np.empty(steps)
+        variances = np.empty(steps)
+        p = self.initial_P
+        converged = steps
+        for t in range(steps):
+            p_pred = p + self.Q
+            gains[t] = p_pred / (p_pred + self.R)
+            p = (1.0 - gains[t]) * p_pred
+            variances[t] = p
+            if t and abs(gains[t] - gains[t - 1]) < 1e-15:
+                converged = t + 1
+                gains[converged:] = gains[t]
+                variances[converged:] = p
+                break
+
+        x = np.empty(steps)
+        state = self.initial_vrp
+        for t in range(converged):
+            state += gains[t] * (z[t] - state)
+            x[t] = state
+        if converged < steps:
+            k = gains[-1]
+            x[converged:] = lfilter(
+                [k], [1.0, -(1.0 - k)], z[converged:],
+                zi=[(1.0 - k) * state],
+            )[0]
+
+        x_prior = np.concatenate([[self.initial_vrp], x[:-1]])[:steps]
+        vrp = np.clip(
+            x_prior + gains * (z_adj - x_prior), VRP_FLOOR, VRP_CEILING,
+        )
+
+        # Linear formula before MIN_FILTER_HISTORY levels
+        pos = np.arange(n)
+        linear = np.clip(
+            VRP_BASE + VRP_SENSITIVITY * vol_of_vol.to_numpy(),
+            VRP_FLOOR, VRP_CEILING,
+        )
+        is_kalman = pos >= MIN_FILTER_HISTORY - 1
+        estimate = np.where(pos < 19, VRP_BASE, linear)
+        std = np.where(pos < 19, 0.10, 0.05)
+        n_obs = np.where(pos < 19, 0, n_changes.to_numpy())
+        estimate[first:] = np.where(
+            is_kalman[first:], vrp, estimate[first:],
+        )
+        std[first:] = np.where(
+            is_kalman[first:], np.sqrt(variances), std[first:],
+        )
+        n_obs = n_obs.astype(np.int64)
+        n_obs[first:] = np.where(
+            is_kalman[first:], np.arange(1, steps + 1), n_obs[first:],
+        )
+
+        return pd.DataFrame({
+            "vrp_estimate": estimate,
+            "vrp_std": std,
+            "vol_of_vol": np.where(pos < 19, np.nan, vol_of_vol),
+            "skew": np.where(is_kalman, skew, np.nan),
+            "kurtosis": np.where(is_kalman, kurt, np.nan),
+            "method": np.where(is_kalman, "kalman", "linear_fallback"),
+            "n_observations": n_obs,
+        }, index=index)
+
     def _run_filterpy(
         self, observations: list[float]
     ) -> tuple[float, float]:
@@ -18,6 +18,14 @@ Usage:
 
     # Compare impact across regimes
     comparison = run_regime_comparison(shock_magnitude=2.0)
+
+``engine="vectorized"`` simulates paths as NumPy arrays (paths x
+pillars) in chunks of ``chunk_size``, so path counts beyond memory
+stream through fixed-size buffers.  Percentiles are exact order
+statistics up to ``EXACT_PERCENTILE_PATHS`` paths; beyond that they
+come from fixed-bin histograms, so memory stays bounded whatever the
+path count.  The default ``engine="iterative"`` is the original
+one-path-at-a-time loop and keeps seeded results unchanged.
 """
 
 import random
@@ -26,6 +34,8 @@ from dataclasses import dataclass, field
 from typing import Optional
 from enum import Enum
 
+import numpy as np
+
 
 class ShockType(Enum):
     """Types of exogenous shocks."""
@@ -125,6 +135,192 @@ TRANSMISSION_COEFFICIENTS = {
 }
 
 
+# Regime multipliers on drawdown and recovery time (by final regime)
+DRAWDOWN_MULTIPLIERS = {
+    MACRegime.AMPLE: 1.0,
+    MACRegime.THIN: 1.5,
+    MACRegime.STRETCHED: 2.5,
+    MACRegime.BREACH: 4.0,
+}
+
+RECOVERY_MULTIPLIERS = {
+    MACRegime.AMPLE: 1.0,
+    MACRegime.THIN: 1.5,
+    MACRegime.STRETCHED: 3.0,
+    MACRegime.BREACH: 6.0,
+}
+
+# Regime order used for integer regime codes in the vectorized engine
+_REGIMES = list(MACRegime)
+
+# Paths simulated per NumPy batch (bounds peak memory)
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Paths whose mac_change / drawdown values are kept for exact
+# percentiles (16 MB); larger runs switch to PERCENTILE_BINS histograms
+EXACT_PERCENTILE_PATHS = 1_000_000
+PERCENTILE_BINS = 1 << 16
+
+
+def _regime_codes(mac: np.ndarray) -> np.ndarray:
+    """Vectorized MonteCarloSimulator._get_regime as indices into _REGIMES."""
+    return np.select([mac > 0.65, mac > 0.50, mac > 0.35], [0, 1, 2], 3)
+
+
+class _RunningMoments:
+    """Streaming count/mean/variance (Chan et al. pairwise merge)."""
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: np.ndarray) -> None:
+        n_b = len(values)
+        if n_b == 0:
+            return
+        mean_b = float(values.mean())
+        m2_b = float(((values - mean_b) ** 2).sum())
+        n = self.n + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta * delta * self.n * n_b / n
+        self.n = n
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0.0 below two values)."""
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.n - 1))
+
+
+class _QuantileSketch:
+    """Order statistics of a value stream in bounded memory.
+
+    Values are kept until ``exact_limit`` have been seen, giving
+    ``sorted(values)[int(n * q)]`` exactly.  After that they are folded
+    into ``bins`` equal bins over [lo, hi] (values outside clamp to the
+    edge bins) and a quantile is the midpoint of the bin holding that
+    order statistic, i.e. within (hi - lo) / (2 * bins) of it.
+    """
+
+    def __init__(
+        self,
+        lo: float,
+        hi: float,
+        exact_limit: int = EXACT_PERCENTILE_PATHS,
+        bins: int = PERCENTILE_BINS,
+    ) -> None:
+        self.lo = lo
+        self.hi = hi if hi > lo else lo + 1.0
+        self.n = 0
+        self._exact_limit = exact_limit
+        self._bins = bins
+        self._chunks: list[np.ndarray] = []
+        self._counts: Optional[np.ndarray] = None
+
+    def update(self, values: np.ndarray) -> None:
+        self.n += len(values)
+        if self._counts is None:
+            self._chunks.append(values)
+            if self.n <= self._exact_limit:
+                return
+            values = np.concatenate(self._chunks)
+            self._chunks = []
+            self._counts = np.zeros(self._bins, dtype=np.int64)
+        scaled = (values - self.lo) / (self.hi - self.lo) * self._bins
+        idx = np.clip(scaled, 0, self._bins - 1).astype(np.int64)
+        self._counts += np.bincount(idx, minlength=self._bins)
+
+    def quantile(self, q: float) -> float:
+        k = int(self.n * q)
+        if self._counts is None:
+            values = np.concatenate(self._chunks)
+            return float(np.partition(values, k)[k])
+        b = int(np.searchsorted(np.cumsum(self._counts), k, side="right"))
+        return self.lo + (b + 0.5) * (self.hi - self.lo) / self._bins
+
+
+class _PathStatistics:
+    """Accumulates run_simulation statistics over batches of paths."""
+
+    def __init__(
+        self,
+        transition_sample: int = 10,
+        drawdown_range: tuple[float, float] = (0.0, 100.0),
+        exact_limit: int = EXACT_PERCENTILE_PATHS,
+    ) -> None:
+        self.moments = {
+            key: _RunningMoments()
+            for key in (
+                "mac_change", "final_mac", "hedge_failure_prob",
+                "max_drawdown", "recovery_days",
+            )
+        }
+        self.mac_change_min = math.inf
+        self.mac_change_max = -math.inf
+        self.n_breach = 0
+        self.n_transitions = 0
+        self.transition_sample: list[str] = []
+        self._sample_size = transition_sample
+        # MAC scores lie in [0, 1], so changes lie in [-1, 1]
+        self._mac_changes = _QuantileSketch(-1.0, 1.0, exact_limit)
+        self._drawdowns = _QuantileSketch(*drawdown_range, exact_limit)
+
+    def update(self, batch: dict) -> None:
+        for key, moments in self.moments.items():
+            moments.update(batch[key].astype(np.float64))
+        mac_change = batch["mac_change"]
+        self.mac_change_min = min(self.mac_change_min, float(mac_change.min()))
+        self.mac_change_max = max(self.mac_change_max, float(mac_change.max()))
+        self.n_breach += int((batch["final_mac"] < 0.35).sum())
+
+        start = batch["regime"]
+        moved = np.flatnonzero(batch["final_regime"] != start)
+        self.n_transitions += len(moved)
+        need = self._sample_size - len(self.transition_sample)
+        for code in batch["final_regime"][moved[:max(need, 0)]]:
+            self.transition_sample.append(
+                f"{_REGIMES[start].value} -> {_REGIMES[code].value}"
+            )
+
+        self._mac_changes.update(mac_change)
+        self._drawdowns.update(batch["max_drawdown"])
+
+    def statistics(self) -> dict:
+        m = self.moments
+        n = m["mac_change"].n
+        return {
+            "mac_change": {
+                "mean": m["mac_change"].mean,
+                "std": m["mac_change"].std,
+                "min": self.mac_change_min,
+                "max": self.mac_change_max,
+                "percentile_5": self._mac_changes.quantile(0.05),
+                "percentile_95": self._mac_changes.quantile(0.95),
+            },
+            "final_mac": {
+                "mean": m["final_mac"].mean,
+                "std": m["final_mac"].std,
+                "prob_breach": self.n_breach / n,
+            },
+            "hedge_failure_prob": {
+                "mean": m["hedge_failure_prob"].mean,
+                "std": m["hedge_failure_prob"].std,
+            },
+            "max_drawdown_pct": {
+                "mean": m["max_drawdown"].mean,
+                "std": m["max_drawdown"].std,
+                "percentile_95": self._drawdowns.quantile(0.95),
+            },
+            "recovery_days": {
+                "mean": m["recovery_days"].mean,
+                "std": m["recovery_days"].std,
+            },
+        }
+
+
 class MonteCarloSimulator:
     """Monte Carlo simulator for MAC shock analysis.
 
@@ -141,6 +337,8 @@ class MonteCarloSimulator:
         """
         if seed is not None:
             random.seed(seed)
+        # Vectorized engine stream (the iterative engine uses `random`)
+        self._rng = np.random.default_rng(seed)
 
         # Base volatility parameters (from historical data)
         self.pillar_volatilities = {
@@ -264,23 +462,13 @@ class MonteCarloSimulator:
 
         # Estimate drawdown based on MAC level and shock
         base_drawdown = shock_scenario.magnitude_std * 5  # 5% per std dev
-        drawdown_multiplier = {
-            MACRegime.AMPLE: 1.0,
-            MACRegime.THIN: 1.5,
-            MACRegime.STRETCHED: 2.5,
-            MACRegime.BREACH: 4.0,
-        }[final_regime]
+        drawdown_multiplier = DRAWDOWN_MULTIPLIERS[final_regime]
         max_drawdown = base_drawdown * drawdown_multiplier
         max_drawdown += random.gauss(0, base_drawdown * 0.3)
 
         # Estimate recovery time
         base_recovery = shock_scenario.duration_days * 3
-        recovery_multiplier = {
-            MACRegime.AMPLE: 1.0,
-            MACRegime.THIN: 1.5,
-            MACRegime.STRETCHED: 3.0,
-            MACRegime.BREACH: 6.0,
-        }[final_regime]
+        recovery_multiplier = RECOVERY_MULTIPLIERS[final_regime]
         recovery_days = int(base_recovery * recovery_multiplier)
         recovery_days += random.randint(-5, 10)
 
@@ -295,12 +483,112 @@ class MonteCarloSimulator:
             recovery_days_estimate=max(1, recovery_days),
         )
 
+    def _simulate_paths(
+        self,
+        initial_pillars: dict[str, float],
+        shock_scenario: ShockScenario,
+        n_paths: int,
+    ) -> dict:
+        """Simulate ``n_paths`` shock paths at once.
+
+        Same transmission, spillover, hedge-failure, drawdown and
+        recovery rules as _simulate_single_path, evaluated on
+        (paths x pillars) arrays drawn from ``self._rng``.
+
+        Returns:
+            Dict of per-path arrays (final_mac, mac_change,
+            hedge_failure_prob, max_drawdown, recovery_days,
+            final_regime) plus scalar initial_mac and regime code
+        """
+        rng = self._rng
+        pillars = list(initial_pillars)
+        initial = np.array([initial_pillars[p] for p in pillars])
+        vols = np.array([self.pillar_volatilities[p] for p in pillars])
+
+        initial_mac = sum(initial_pillars.values()) / len(initial_pillars)
+        regime = self._get_regime(initial_mac)
+        coeffs = TRANSMISSION_COEFFICIENTS[regime]
+        magnitude = shock_scenario.magnitude_std
+
+        # Deterministic part of each pillar's impact, and its noise scale
+        affected_pillars = self.shock_pillar_map[shock_scenario.shock_type]
+        is_affected = np.array([p in affected_pillars for p in pillars])
+        spillover = np.array([
+            max(
+                (
+                    abs(magnitude * self.pillar_volatilities[p]
+                        * self._get_correlation(p, a) * coeffs["spillover"])
+                    for a in affected_pillars
+                ),
+                default=0.0,
+            )
+            for p in pillars
+        ])
+        direct = (
+            magnitude * vols * coeffs["direct_impact"]
+            * coeffs["amplification"]
+        )
+        shift = np.where(is_affected, -direct, -spillover)
+        noise_scale = vols * np.where(is_affected, 0.3, 0.2)
+
+        impacts = shift + rng.standard_normal((n_paths, len(pillars))) \
+            * noise_scale
+        final_pillars = np.clip(initial + impacts, 0.0, 1.0)
+        final_mac = np.clip(final_pillars.mean(axis=1), 0.0, 1.0)
+        final_regime = _regime_codes(final_mac)
+
+        # Hedge failure probability based on positioning
+        if "positioning" in initial_pillars:
+            pos_score = final_pillars[:, pillars.index("positioning")]
+        else:
+            pos_score = np.full(n_paths, 0.5)
+        hedge_mean = np.select(
+            [pos_score < 0.2, pos_score < 0.35], [0.8, 0.4], 0.05,
+        )
+        hedge_std = np.select(
+            [pos_score < 0.2, pos_score < 0.35], [0.1, 0.15], 0.03,
+        )
+        hedge_failure_prob = np.clip(
+            hedge_mean + rng.standard_normal(n_paths) * hedge_std, 0.0, 1.0,
+        )
+
+        # Drawdown and recovery scale with the final regime
+        drawdown_mult = np.array(
+            [DRAWDOWN_MULTIPLIERS[r] for r in _REGIMES],
+        )[final_regime]
+        recovery_mult = np.array(
+            [RECOVERY_MULTIPLIERS[r] for r in _REGIMES],
+        )[final_regime]
+        base_drawdown = magnitude * 5  # 5% per std dev
+        max_drawdown = (
+            base_drawdown * drawdown_mult
+            + rng.standard_normal(n_paths) * (base_drawdown * 0.3)
+        )
+        base_recovery = shock_scenario.duration_days * 3
+        recovery_days = (
+            np.trunc(base_recovery * recovery_mult).astype(np.int64)
+            + rng.integers(-5, 11, n_paths)
+        )
+
+        return {
+            "initial_mac": initial_mac,
+            "regime": _REGIMES.index(regime),
+            "final_mac": final_mac,
+            "mac_change": final_mac - initial_mac,
+            "final_regime": final_regime,
+            "hedge_failure_prob": hedge_failure_prob,
+            "max_drawdown": np.maximum(max_drawdown, 0.0),
+            "recovery_days": np.maximum(recovery_days, 1),
+        }
+
     def run_simulation(
         self,
         initial_pillars: Optional[dict[str, float]] = None,
         shock_type: ShockType = ShockType.VOLATILITY,
         shock_magnitude: float = 2.0,
         n_simulations: int = 1000,
+        engine: str = "iterative",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> dict:
         """Run Monte Carlo simulation.
 
@@ -309,6 +597,10 @@ class MonteCarloSimulator:
             shock_type: Type of shock to simulate
             shock_magnitude: Shock size in standard deviations
             n_simulations: Number of simulation paths
+            engine: "iterative" (default) runs _simulate_single_path per
+                path; "vectorized" simulates paths as NumPy arrays in
+                chunks, drawing from a different random stream
+            chunk_size: Paths per NumPy batch (vectorized engine)
 
         Returns:
             Dictionary with simulation statistics
@@ -331,6 +623,38 @@ class MonteCarloSimulator:
             description=f"{shock_magnitude}std {shock_type.value} shock",
         )
 
+        if engine == "vectorized":
+            if n_simulations < 1:
+                raise ValueError("n_simulations must be positive")
+            if chunk_size < 1:
+                raise ValueError("chunk_size must be positive")
+            # max_drawdown is base * regime multiplier + N(0, 0.3 * base)
+            base_drawdown = shock_magnitude * 5
+            stats = _PathStatistics(drawdown_range=(
+                0.0,
+                base_drawdown * max(DRAWDOWN_MULTIPLIERS.values())
+                + 10 * 0.3 * abs(base_drawdown),
+            ))
+            initial_mac = None
+            remaining = n_simulations
+            while remaining > 0:
+                batch = self._simulate_paths(
+                    initial_pillars, shock, min(chunk_size, remaining),
+                )
+                initial_mac = batch["initial_mac"]
+                stats.update(batch)
+                remaining -= len(batch["final_mac"])
+            return {
+                "shock_scenario": shock,
+                "n_simulations": n_simulations,
+                "initial_mac": initial_mac,
+                "statistics": stats.statistics(),
+                "regime_transition_rate": stats.n_transitions / n_simulations,
+                "regime_transitions": stats.transition_sample,
+            }
+        elif engine != "iterative":
+            raise ValueError(f"Unknown engine: {engine}")
+
         results = []
         for _ in range(n_simulations):
             result = self._simulate_single_path(initial_pillars, shock)
@@ -394,6 +718,8 @@ class MonteCarloSimulator:
         shock_type: ShockType = ShockType.VOLATILITY,
         shock_magnitude: float = 2.0,
         n_simulations: int = 1000,
+        engine: str = "iterative",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
     ) -> RegimeImpactAnalysis:
         """Compare shock impact across different MAC regimes.
 
@@ -405,6 +731,8 @@ class MonteCarloSimulator:
             shock_type: Type of shock to simulate
             shock_magnitude: Shock size in standard deviations
             n_simulations: Simulations per regime
+            engine: "vectorized" or "iterative" (see run_simulation)
+            chunk_size: Paths per NumPy batch (vectorized engine)
 
         Returns:
             RegimeImpactAnalysis with comparison across regimes
@@ -447,6 +775,8 @@ class MonteCarloSimulator:
                 shock_type=shock_type,
                 shock_magnitude=shock_magnitude,
                 n_simulations=n_simulations,
+                engine=engine,
+                chunk_size=chunk_size,
             )
 
             regime_results = {
@@ -493,6 +823,7 @@ def run_regime_comparison(
     shock_magnitude: float = 2.0,
     shock_type: ShockType = ShockType.VOLATILITY,
     n_simulations: int = 1000,
+    engine: str = "iterative",
 ) -> RegimeImpactAnalysis:
     """Convenience function to run regime comparison analysis."""
     simulator = MonteCarloSimulator(seed=42)
@@ -500,6 +831,7 @@ def run_regime_comparison(
         shock_type=shock_type,
         shock_magnitude=shock_magnitude,
         n_simulations=n_simulations,
+        engine=engine,
     )
 
 
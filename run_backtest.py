@@ -86,6 +86,23 @@ def main():
         choices=["daily", "weekly", "monthly"],
         help="Backtest frequency"
     )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default="iterative",
+        choices=["iterative", "vectorized", "parallel"],
+        help=(
+            "Scoring engine: per-date loop, columnar whole-history "
+            "pass, or per-date loop sharded across processes "
+            "(same output schema)"
+        )
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --engine parallel (default: CPU count)"
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -149,26 +166,28 @@ def main():
 
     # Handle --fresh flag to clear cache
     if args.fresh:
-        from grri_mac.data.fred import CACHE_FILE
+        from grri_mac.data.fred import CACHE_FILE, SERIES_CACHE_DIR
+        from grri_mac.data.series_store import SeriesStore
+        cleared = SeriesStore(SERIES_CACHE_DIR).clear()
         if CACHE_FILE.exists():
             CACHE_FILE.unlink()
+            cleared += 1
+        if cleared:
             print("Cleared FRED data cache. Will fetch fresh data.")
         else:
             print("Cache already clear.")
 
     # Handle --validate flag to check data integrity
     if args.validate:
-        from grri_mac.data.fred import FREDClient, CACHE_FILE
+        from grri_mac.data.fred import SERIES_CACHE_DIR, load_disk_cache
         print("\nVALIDATING CACHED DATA INTEGRITY\n")
-        print(f"Cache file: {CACHE_FILE}")
+        print(f"Cache directory: {SERIES_CACHE_DIR}")
 
-        if not CACHE_FILE.exists():
-            print("[ERROR] No cache file found. Run without --validate to build cache.")
+        cache = load_disk_cache()
+        if not cache:
+            print("[ERROR] No cached series found. Run without --validate to build cache.")
             return 1
 
-        fred = FREDClient()
-        cache = fred._bulk_cache
-
         # Historical proxy information
         PROXY_INFO = {
             "VIXCLS": "Proxy: NASDAQCOM realized vol (1971+) with 1.2x VRP",
@@ -266,7 +285,9 @@ def main():
         df = runner.run_backtest(
             start_date=start_date,
             end_date=end_date,
-            frequency=args.frequency
+            frequency=args.frequency,
+            engine=args.engine,
+            workers=args.workers,
         )
 
         print()
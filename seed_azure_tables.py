@@ -18,7 +18,6 @@ Usage:
 import os
 import sys
 import argparse
-import pickle
 import pandas as pd
 from pathlib import Path
 from dotenv import load_dotenv
@@ -33,7 +32,7 @@ from shared.database import get_database
 
 
 # Paths to local data
-FRED_CACHE_FILE = Path(__file__).parent / "data" / "fred_cache" / "fred_series_cache.pkl"
+FRED_CACHE_DIR = Path(__file__).parent / "data" / "fred_cache"
 BACKTEST_RESULTS_FILE = Path(__file__).parent / "data" / \
                              "backtest_results" / "backtest_full_1971_2025.csv"
 BACKTEST_VALIDATION_FILE = Path(__file__).parent / "data" / \
@@ -41,14 +40,12 @@ BACKTEST_VALIDATION_FILE = Path(__file__).parent / "data" / \
 
 
 def load_fred_cache() -> dict:
-    """Load the local FRED cache from pickle file."""
-    if not FRED_CACHE_FILE.exists():
-        print(f"ERROR: FRED cache file not found at {FRED_CACHE_FILE}")
-        return {}
-
-    with open(FRED_CACHE_FILE, "rb") as f:
-        cache = pickle.load(f)
+    """Load the local FRED disk cache (per-series store)."""
+    from grri_mac.data.fred import load_disk_cache
 
+    cache = load_disk_cache(FRED_CACHE_DIR)
+    if not cache:
+        print(f"ERROR: FRED cache not found at {FRED_CACHE_DIR}")
     return cache
 
 
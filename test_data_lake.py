@@ -22,6 +22,7 @@ from grri_mac.data.blob_store import (
     DataTier,
     RAW_CONTAINER,
     CLEANED_CONTAINER,
+    LATEST,
     get_blob_store,
 )
 from grri_mac.data.pipeline import (
@@ -29,6 +30,7 @@ from grri_mac.data.pipeline import (
     DataPipeline,
     IngestResult,
     SourceDescriptor,
+    SourcePolicy,
     FRED_MAC_SERIES,
     NBER_SERIES_IDS,
     ETF_TICKERS,
@@ -286,6 +288,253 @@ class TestBlobStoreListBlobs(_TempDirMixin, unittest.TestCase):
         self.assertIn("VIX", manifest)
 
 
+class TestBlobStoreDedup(_TempDirMixin, unittest.TestCase):
+    """Content-addressed uploads and the latest pointer."""
+
+    def _store(self, **kw) -> BlobStore:
+        return BlobStore(connection_string=None, local_root=self._tmppath, **kw)
+
+    def test_identical_upload_is_aliased(self):
+        store = self._store()
+        df = _make_sample_df(5)
+        store.upload_dataframe("fred", "DFF", df, date_str="2026-01-01")
+        self.assertTrue(
+            store.upload_dataframe("fred", "DFF", df, date_str="2026-01-02")
+        )
+        base = self._tmppath / "cleaned" / "fred" / "DFF"
+        self.assertFalse((base / "2026-01-02.parquet").exists())
+
+        latest = store.latest("fred", "DFF")
+        self.assertEqual(latest["date"], "2026-01-01")
+        self.assertEqual(latest["aliases"], {"2026-01-02": "2026-01-01"})
+        sidecar = json.loads(
+            (base / "2026-01-01.parquet.meta.json").read_text()
+        )
+        self.assertEqual(sidecar["content_sha256"], latest["sha256"])
+
+        # Alias dates still read, exist and show in the manifest
+        back = store.download_dataframe("fred", "DFF", date_str="2026-01-02")
+        pd.testing.assert_frame_equal(back, df, check_freq=False)
+        self.assertTrue(store.exists(
+            "fred", "DFF", DataTier.CLEANED, ".parquet", "2026-01-02",
+        ))
+        self.assertEqual(
+            store.get_source_manifest("fred")["DFF"],
+            ["2026-01-01", "2026-01-02"],
+        )
+
+    def test_changed_upload_moves_pointer(self):
+        store = self._store()
+        store.upload_raw_json("fred", "X", {"v": 1}, date_str="2026-01-01")
+        store.upload_raw_json("fred", "X", {"v": 1}, date_str="2026-01-02")
+        store.upload_raw_json("fred", "X", {"v": 2}, date_str="2026-01-03")
+
+        latest = store.latest("fred", "X", DataTier.RAW, ".json")
+        self.assertEqual(latest["blob"], "fred/X/2026-01-03.json")
+        self.assertEqual(store.download_raw_json("fred", "X", LATEST), {"v": 2})
+        # Earlier alias keeps resolving to the earlier version
+        self.assertEqual(
+            store.download_raw_json("fred", "X", "2026-01-02"), {"v": 1},
+        )
+
+    def test_backfill_keeps_pointer(self):
+        store = self._store()
+        store.upload_raw_json("fred", "X", {"v": 2}, date_str="2026-01-05")
+        store.upload_raw_json("fred", "X", {"v": 2}, date_str="2026-01-01")
+        self.assertTrue(store.exists(
+            "fred", "X", DataTier.RAW, ".json", "2026-01-01",
+        ))
+        latest = store.latest("fred", "X", DataTier.RAW, ".json")
+        self.assertEqual(latest["date"], "2026-01-05")
+
+    def test_dedup_disabled(self):
+        store = self._store(dedup=False)
+        store.upload_raw_json("fred", "X", {"v": 1}, date_str="2026-01-01")
+        store.upload_raw_json("fred", "X", {"v": 1}, date_str="2026-01-02")
+        names = [b["name"] for b in store.list_blobs(DataTier.RAW, "fred/")]
+        self.assertEqual(
+            names, ["fred/X/2026-01-01.json", "fred/X/2026-01-02.json"],
+        )
+
+    def test_delete_alias_and_latest(self):
+        store = self._store()
+        store.upload_raw_json("x", "y", {"a": 1}, date_str="2026-01-01")
+        store.upload_raw_json("x", "y", {"a": 1}, date_str="2026-01-02")
+        self.assertTrue(
+            store.delete("x", "y", DataTier.RAW, ".json", "2026-01-02")
+        )
+        self.assertIsNone(store.download_raw_json("x", "y", "2026-01-02"))
+        self.assertTrue(
+            store.delete("x", "y", DataTier.RAW, ".json", "2026-01-01")
+        )
+        self.assertIsNone(store.latest("x", "y", DataTier.RAW, ".json"))
+        self.assertIsNone(store.download_raw_json("x", "y", LATEST))
+
+
+class TestBlobStoreIndex(_TempDirMixin, unittest.TestCase):
+    """Listing and existence checks served from the SQLite index."""
+
+    def _store(self) -> BlobStore:
+        return BlobStore(connection_string=None, local_root=self._tmppath)
+
+    def test_listing_does_not_read_sidecars(self):
+        store = self._store()
+        store.upload_raw_json(
+            "fred", "A", {"v": 1}, date_str="2026-01-01",
+            extra_metadata={"origin": "test"},
+        )
+        for sidecar in (self._tmppath / "raw").rglob("*.meta.json"):
+            sidecar.unlink()
+        (blob,) = store.list_blobs(DataTier.RAW, "fred/")
+        self.assertEqual(blob["name"], "fred/A/2026-01-01.json")
+        self.assertEqual(blob["metadata"]["origin"], "test")
+        self.assertIn("content_sha256", blob["metadata"])
+
+    def test_prefix_is_a_range_not_a_substring(self):
+        store = self._store()
+        store.upload_raw_json("fred", "A", {"v": 1}, date_str="2026-01-01")
+        store.upload_raw_json("fredx", "A", {"v": 1}, date_str="2026-01-01")
+        store.upload_raw_json("ecb", "A", {"v": 1}, date_str="2026-01-01")
+        names = [b["name"] for b in store.list_blobs(DataTier.RAW, "fred/")]
+        self.assertEqual(names, ["fred/A/2026-01-01.json"])
+        self.assertEqual(len(store.list_blobs(DataTier.RAW)), 3)
+
+    def test_existing_lake_is_indexed_on_first_use(self):
+        store = self._store()
+        store.upload_raw_json("fred", "A", {"v": 1}, date_str="2026-01-01")
+        store.close()
+        (self._tmppath / "_index.sqlite").unlink()
+
+        reopened = self._store()
+        self.assertTrue(reopened.exists(
+            "fred", "A", DataTier.RAW, ".json", "2026-01-01",
+        ))
+        self.assertEqual(
+            reopened.get_source_manifest("fred", DataTier.RAW),
+            {"A": ["2026-01-01"]},
+        )
+
+    def test_reindex_picks_up_external_changes(self):
+        store = self._store()
+        store.upload_raw_json("fred", "A", {"v": 1}, date_str="2026-01-01")
+        external = self._tmppath / "raw" / "fred" / "B" / "2026-01-01.json"
+        external.parent.mkdir(parents=True)
+        external.write_text("{}")
+        self.assertFalse(store.exists(
+            "fred", "B", DataTier.RAW, ".json", "2026-01-01",
+        ))
+        self.assertEqual(store.reindex(DataTier.RAW), 3)  # + pointer
+        self.assertTrue(store.exists(
+            "fred", "B", DataTier.RAW, ".json", "2026-01-01",
+        ))
+
+    def test_delete_and_threaded_uploads_keep_index_in_step(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = self._store()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda i: store.upload_raw_json(
+                    "src", f"S{i:02d}", {"i": i}, date_str="2026-01-01",
+                ),
+                range(40),
+            ))
+        self.assertEqual(len(store.list_blobs(DataTier.RAW, "src/")), 40)
+        store.delete("src", "S00", DataTier.RAW, ".json", "2026-01-01")
+        names = {b["name"] for b in store.list_blobs(DataTier.RAW, "src/")}
+        self.assertEqual(len(names), 39)
+        self.assertNotIn("src/S00/2026-01-01.json", names)
+
+
+class _FakeContainer:
+    """In-memory ContainerClient honouring ETag conditions."""
+
+    def __init__(self):
+        self.blobs = {}
+        self.bodies_served = 0
+        self._version = 0
+
+    def _etag(self):
+        self._version += 1
+        return f'"{self._version}"'
+
+    def download_blob(self, name, etag=None, match_condition=None):
+        from azure.core.exceptions import (
+            ResourceNotFoundError, ResourceNotModifiedError,
+        )
+
+        if name not in self.blobs:
+            raise ResourceNotFoundError(name)
+        data, current = self.blobs[name]
+        if etag is not None and etag == current:
+            raise ResourceNotModifiedError(name)
+        self.bodies_served += 1
+        return MagicMock(
+            readall=lambda: data, properties=MagicMock(etag=current),
+        )
+
+    def upload_blob(self, name, data, overwrite=False, etag=None,
+                    match_condition=None):
+        from azure.core.exceptions import (
+            ResourceExistsError, ResourceModifiedError,
+        )
+
+        if name in self.blobs and not overwrite:
+            raise ResourceExistsError(name)
+        if etag is not None and self.blobs[name][1] != etag:
+            raise ResourceModifiedError(name)
+        self.blobs[name] = (data, self._etag())
+        return {"etag": self.blobs[name][1]}
+
+    def list_blobs(self, name_starts_with=""):
+        from types import SimpleNamespace
+
+        return [SimpleNamespace(name=n) for n in self.blobs
+                if n.startswith(name_starts_with)]
+
+
+class TestAzureBlobIndex(unittest.TestCase):
+    """Shard durability and revalidation against a fake container."""
+
+    def setUp(self):
+        from grri_mac.data.blob_index import AzureBlobIndex
+
+        self.container = _FakeContainer()
+        self.make = lambda: AzureBlobIndex(lambda tier: self.container)
+        self.when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    def test_writes_are_saved_without_flush(self):
+        index = self.make()
+        index.put("raw", "fred/A/1.json", 1, self.when, {})
+        index.put("raw", "fred/B/1.json", 1, self.when, {})
+        index.delete("raw", "fred/A/1.json")
+        # A process that crashed before flush() still left its entries
+        names = [e["name"] for e in self.make().list("raw", "fred/")]
+        self.assertEqual(names, ["fred/B/1.json"])
+
+    def test_reads_revalidate_cached_shards(self):
+        reader, writer = self.make(), self.make()
+        self.assertIsNone(reader.get("raw", "fred/A/1.json"))
+        writer.put("raw", "fred/A/1.json", 1, self.when, {"k": "v"})
+        entry = reader.get("raw", "fred/A/1.json")
+        self.assertEqual(entry["metadata"], {"k": "v"})
+
+        served = self.container.bodies_served
+        reader.get("raw", "fred/A/1.json")
+        reader.list("raw", "fred/")
+        self.assertEqual(self.container.bodies_served, served)
+
+    def test_concurrent_writers_merge(self):
+        a, b = self.make(), self.make()
+        a.put("raw", "fred/A/1.json", 1, self.when, {})
+        b.put("raw", "fred/B/1.json", 1, self.when, {})
+        a.put("raw", "fred/C/1.json", 1, self.when, {})
+        names = [e["name"] for e in self.make().list("raw")]
+        self.assertEqual(
+            names, ["fred/A/1.json", "fred/B/1.json", "fred/C/1.json"],
+        )
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Cleaning helpers
 # ══════════════════════════════════════════════════════════════════════════════
@@ -609,6 +858,312 @@ class TestPipelineManifest(_TempDirMixin, unittest.TestCase):
         self.assertIn("A", manifest["m"])
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# DataPipeline — incremental (delta) ingestion
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestPipelineIncremental(_TempDirMixin, unittest.TestCase):
+    """Watermarked delta ingestion, compaction and merged reads."""
+
+    def setUp(self):
+        super().setUp()
+        self.dates = [
+            d.strftime("%Y-%m-%d")
+            for d in pd.date_range("2025-01-01", periods=10, freq="D")
+        ]
+        self.available = 4          # observations published so far
+        self.since_calls = []
+
+    def _payload(self, since=None):
+        dates = self.dates[:self.available]
+        values = [float(i) for i in range(self.available)]
+        if since is not None:
+            keep = [i for i, d in enumerate(dates) if d >= f"{since:%Y-%m-%d}"]
+            dates = [dates[i] for i in keep]
+            values = [values[i] for i in keep]
+        return {"dates": dates, "values": values}
+
+    def _pipeline(self, with_since=True, compact_every=20) -> DataPipeline:
+        store = BlobStore(connection_string=None, local_root=self._tmppath)
+        p = DataPipeline(store=store, compact_every=compact_every)
+
+        def fetch_since(_c, _sid, since):
+            self.since_calls.append(since)
+            return self._payload(since)
+
+        p.register_source(SourceDescriptor(
+            name="inc", series_ids=["S"],
+            fetch=lambda _c, _sid: self._payload(),
+            clean=_clean_fred_series,
+            client_factory=lambda: None,
+            fetch_since=fetch_since if with_since else None,
+        ))
+        return p
+
+    def test_first_ingest_writes_base(self):
+        p = self._pipeline()
+        result = p.ingest("inc", incremental=True, date_str="2026-02-18")
+        r = result.results[0]
+        self.assertTrue(r.ok)
+        self.assertEqual(r.cleaned_rows, 4)
+        self.assertEqual(r.watermark, "2025-01-04 00:00:00")
+        self.assertEqual(self.since_calls, [])
+
+        state = p._store.delta_state("inc", "S")
+        self.assertEqual(state["base_rows"], 4)
+        self.assertEqual(state["deltas"], [])
+        self.assertEqual(len(p.get_cleaned("inc", "S")), 4)
+
+    def test_appends_only_new_rows(self):
+        p = self._pipeline()
+        p.ingest("inc", incremental=True, date_str="2026-02-18")
+        self.available = 7
+        r = p.ingest("inc", incremental=True, date_str="2026-02-19").results[0]
+
+        self.assertEqual(self.since_calls, [datetime(2025, 1, 4)])
+        self.assertEqual(r.cleaned_rows, 3)
+        state = p._store.delta_state("inc", "S")
+        self.assertEqual(state["deltas"], ["_delta/000001.parquet"])
+        delta = p._store._get_parquet("inc", "S", state["deltas"][0])
+        self.assertEqual(len(delta), 3)
+
+        merged = p.get_cleaned("inc", "S")
+        self.assertEqual(merged["value"].tolist(), [float(i) for i in range(7)])
+        self.assertTrue(merged.index.is_monotonic_increasing)
+
+        # Nothing new: no delta written
+        r = p.ingest("inc", incremental=True, date_str="2026-02-20").results[0]
+        self.assertTrue(r.ok)
+        self.assertEqual(r.cleaned_rows, 0)
+        self.assertEqual(len(p._store.delta_state("inc", "S")["deltas"]), 1)
+
+    def test_full_fetch_source_filters_past_watermark(self):
+        p = self._pipeline(with_since=False)
+        p.ingest("inc", incremental=True, date_str="2026-02-18")
+        self.available = 6
+        r = p.ingest("inc", incremental=True, date_str="2026-02-19").results[0]
+        self.assertEqual(r.cleaned_rows, 2)
+        self.assertFalse(r.raw_stored)  # full payload not re-uploaded
+        self.assertEqual(len(p.get_cleaned("inc", "S")), 6)
+
+    def test_compaction(self):
+        p = self._pipeline(compact_every=3)
+        p.ingest("inc", incremental=True, date_str="2026-02-18")
+        results = []
+        for n in (5, 6, 8):
+            self.available = n
+            results.append(p.ingest("inc", incremental=True).results[0])
+
+        self.assertEqual([r.compacted for r in results], [False, False, True])
+        state = p._store.delta_state("inc", "S")
+        self.assertEqual(state["deltas"], [])
+        self.assertEqual(state["base_rows"], 8)
+        delta_dir = self._tmppath / "cleaned" / "inc" / "S" / "_delta"
+        self.assertEqual(list(delta_dir.glob("*.parquet")), [])
+        self.assertEqual(len(p.get_cleaned("inc", "S")), 8)
+
+        # Numbering continues after compaction
+        self.available = 10
+        p.ingest("inc", incremental=True)
+        self.assertEqual(
+            p._store.delta_state("inc", "S")["deltas"],
+            ["_delta/000004.parquet"],
+        )
+        self.assertEqual(p.compact("inc"), {"S": True})
+
+    def test_manifest_and_snapshots_coexist(self):
+        p = self._pipeline()
+        p.ingest("inc", date_str="2026-02-17")       # dated snapshot
+        p.ingest("inc", incremental=True)
+        self.assertEqual(p.get_manifest("inc")["inc"], {"S": ["2026-02-17"]})
+        snapshot = p.get_cleaned("inc", "S", date_str="2026-02-17")
+        self.assertEqual(len(snapshot), 4)
+
+    def test_incremental_requires_parquet(self):
+        p = self._pipeline()
+        with self.assertRaises(ValueError):
+            p.ingest("inc", incremental=True, cleaned_fmt="csv")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# DataPipeline — concurrent scheduler
+# ══════════════════════════════════════════════════════════════════════════════
+
+class TestPipelineConcurrency(_TempDirMixin, unittest.TestCase):
+    """Per-source pools, shared clients, retries and rate limits."""
+
+    def _pipeline(self) -> DataPipeline:
+        store = BlobStore(connection_string=None, local_root=self._tmppath)
+        p = DataPipeline(store=store)
+        for name in p.list_sources():
+            p._sources.pop(name)
+        return p
+
+    @staticmethod
+    def _payload(_client=None, sid="x"):
+        return {"dates": ["2025-01-01"], "values": [1.0]}
+
+    def test_one_client_per_source_and_bounded_pool(self):
+        import threading
+        import time
+
+        p = self._pipeline()
+        clients = []
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def fetch(client, sid):
+            self.assertIs(client, clients[0])
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return self._payload()
+
+        def factory():
+            clients.append(object())
+            return clients[-1]
+
+        p.register_source(SourceDescriptor(
+            name="s", series_ids=[f"S{i}" for i in range(12)],
+            fetch=fetch, clean=_clean_fred_series, client_factory=factory,
+            policy=SourcePolicy(max_workers=3),
+        ))
+        streamed = []
+        batch = p.ingest("s", cleaned_fmt="csv", on_result=streamed.append)
+
+        self.assertEqual(len(clients), 1)
+        self.assertEqual(batch.succeeded, 12)
+        self.assertEqual(state["peak"], 3)
+        self.assertEqual(streamed, batch.results)
+
+    def test_sources_overlap(self):
+        import threading
+
+        p = self._pipeline()
+        # Completes only if both sources are fetching at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(_c, sid):
+            barrier.wait()
+            return self._payload()
+
+        for name in ("a", "b"):
+            p.register_source(SourceDescriptor(
+                name=name, series_ids=["x"], fetch=fetch,
+                clean=_clean_fred_series, client_factory=lambda: None,
+                policy=SourcePolicy(max_workers=1, retries=0),
+            ))
+        results = p.ingest_all(cleaned_fmt="csv", sources=["a", "b", "zz"])
+        self.assertEqual(results["a"].succeeded, 1)
+        self.assertEqual(results["b"].succeeded, 1)
+        self.assertEqual(results["zz"].total, 0)
+
+    def test_retry_policy(self):
+        p = self._pipeline()
+        attempts = {"flaky": 0, "bad": 0}
+
+        def fetch(_c, sid):
+            attempts[sid] += 1
+            if sid == "bad":
+                raise ValueError("bad request")
+            if attempts[sid] < 3:
+                raise ConnectionError("reset")
+            return self._payload()
+
+        p.register_source(SourceDescriptor(
+            name="r", series_ids=["flaky", "bad"], fetch=fetch,
+            clean=_clean_fred_series, client_factory=lambda: None,
+            policy=SourcePolicy(retries=2, retry_base_delay=0.0),
+        ))
+        batch = p.ingest("r", cleaned_fmt="csv")
+        by_id = {r.series_id: r for r in batch.results}
+        self.assertTrue(by_id["flaky"].ok)
+        self.assertEqual(attempts["flaky"], 3)
+        self.assertIn("Fetch error", by_id["bad"].error)
+        self.assertEqual(attempts["bad"], 1)  # not retryable
+
+    def test_http_client_errors_not_retried(self):
+        import urllib.error
+
+        import requests
+
+        from grri_mac.data.pipeline import _is_transient
+
+        def requests_error(status):
+            response = requests.Response()
+            response.status_code = status
+            return requests.HTTPError(response=response)
+
+        def urllib_error(status):
+            return urllib.error.HTTPError("u", status, "x", {}, None)
+
+        for make in (requests_error, urllib_error):
+            self.assertFalse(_is_transient(make(400)))
+            self.assertFalse(_is_transient(make(404)))
+            self.assertTrue(_is_transient(make(503)))
+        self.assertTrue(_is_transient(requests.ConnectionError("reset")))
+        self.assertFalse(_is_transient(FileNotFoundError("gone")))
+
+    def test_fred_client_factory_and_fetch(self):
+        from fredapi import Fred
+
+        p = DataPipeline(store=BlobStore(
+            connection_string=None, local_root=self._tmppath,
+        ))
+        desc = p._sources["fred"]
+        with patch.dict("os.environ", {"FRED_API_KEY": "k" * 32}):
+            client = desc.client_factory()
+        self.assertIsInstance(client, Fred)
+        with patch.dict("os.environ", {}, clear=True):
+            with self.assertRaises(ValueError):
+                desc.client_factory()
+
+        client = MagicMock()
+        client.get_series.return_value = pd.Series(
+            [1.0, float("nan")],
+            index=pd.to_datetime(["2025-01-01", "2025-01-02"]),
+        )
+        raw = desc.fetch_since(client, "VIXCLS", datetime(2025, 1, 1))
+        client.get_series.assert_called_once_with(
+            "VIXCLS", observation_start="2025-01-01",
+        )
+        self.assertEqual(raw["values"], [1.0, None])
+
+    def test_rate_limiter_shared_across_calls(self):
+        p = self._pipeline()
+        p.register_source(SourceDescriptor(
+            name="q", series_ids=["a", "b", "c"], fetch=self._payload,
+            clean=_clean_fred_series, client_factory=lambda: None,
+            policy=SourcePolicy(requests_per_minute=6000, burst=10),
+        ))
+        p.ingest("q", cleaned_fmt="csv")
+        bucket = p._limiters["q"]
+        p.ingest("q", series_ids=["a"], cleaned_fmt="csv")
+        self.assertIs(p._limiters["q"], bucket)
+
+        calls = []
+        p._limiters["q"] = MagicMock(acquire=lambda: calls.append(1))
+        p.ingest("q", cleaned_fmt="csv")
+        self.assertEqual(len(calls), 3)
+
+    def test_client_error_fails_every_series(self):
+        p = self._pipeline()
+
+        def factory():
+            raise RuntimeError("no credentials")
+
+        p.register_source(SourceDescriptor(
+            name="c", series_ids=["a", "b"], fetch=self._payload,
+            clean=_clean_fred_series, client_factory=factory,
+        ))
+        batch = p.ingest("c")
+        self.assertEqual(batch.failed, 2)
+        self.assertIn("Client error", batch.results[0].error)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # Constants / registry checks
 # ══════════════════════════════════════════════════════════════════════════════
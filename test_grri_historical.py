@@ -482,5 +482,424 @@ class TestSanctionsCount(unittest.TestCase):
         self.assertGreaterEqual(count, 0)
 
 
+class TestGRRIPanelCache(unittest.TestCase):
+    """Per-source panels: parsed once, shared, invalidated on change."""
+
+    def setUp(self):
+        import tempfile
+        from grri_mac.grri.panel_cache import PANELS
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._patch = patch(
+            "grri_mac.grri.historical_sources.GRRI_HISTORICAL_DIR", self.root,
+        )
+        self._patch.start()
+        PANELS.clear()
+
+        rng = np.random.default_rng(3)
+        rows = []
+        for i, code in enumerate(("USA", "GBR", "FRA")):
+            for year in range(1800, 1900):
+                rows.append({
+                    "country_text_id": code,
+                    "country_id": i + 1,
+                    "country_name": f"Name {code}",
+                    "year": year,
+                    "v2x_rule": rng.random(),
+                    "v2x_polyarchy": np.nan if year % 7 == 0 else rng.random(),
+                })
+        (self.root / "vdem").mkdir()
+        self.vdem_path = self.root / "vdem" / "vdem_core.csv"
+        pd.DataFrame(rows).to_csv(self.vdem_path, index=False)
+
+    def tearDown(self):
+        from grri_mac.grri.panel_cache import PANELS
+
+        PANELS.clear()
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _direct(self, code, indicator):
+        from grri_mac.grri.historical_sources import load_vdem
+
+        df = load_vdem(indicators=[indicator], country_code=code)
+        dates = [datetime(int(y), 7, 1) for y in df["year"]]
+        return pd.Series(
+            df[indicator].values, index=dates, dtype=float,
+        ).dropna().sort_index()
+
+    def test_matches_direct_load(self):
+        from grri_mac.grri.historical_sources import get_vdem_series
+
+        for code in ("USA", "gbr", "3", "Name FRA"):
+            for indicator in ("v2x_rule", "v2x_polyarchy"):
+                pd.testing.assert_series_equal(
+                    get_vdem_series(code, indicator),
+                    self._direct(code, indicator),
+                )
+
+    def test_source_parsed_once_across_countries_and_processes(self):
+        from grri_mac.grri.historical_sources import get_vdem_series
+        from grri_mac.grri.panel_cache import PANELS
+
+        with patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            for code in ("USA", "GBR", "FRA", "USA"):
+                get_vdem_series(code, "v2x_rule")
+            self.assertEqual(read_csv.call_count, 1)
+            # A fresh process opens the panel from disk without parsing
+            PANELS.clear()
+            self.assertEqual(len(get_vdem_series("GBR", "v2x_rule")), 100)
+            self.assertEqual(read_csv.call_count, 1)
+
+    def test_invalidation_on_content_not_mtime(self):
+        import os
+        from grri_mac.grri.historical_sources import get_vdem_series
+
+        before = get_vdem_series("USA", "v2x_rule")
+        st = self.vdem_path.stat()
+        os.utime(self.vdem_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        with patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            pd.testing.assert_series_equal(
+                get_vdem_series("USA", "v2x_rule"), before,
+            )
+            self.assertEqual(read_csv.call_count, 0)
+
+        df = pd.read_csv(self.vdem_path)
+        df["v2x_rule"] = 0.5
+        df.to_csv(self.vdem_path, index=False)
+        self.assertTrue(
+            (get_vdem_series("USA", "v2x_rule") == 0.5).all()
+        )
+
+    def test_polity_special_codes_dropped(self):
+        from grri_mac.grri.historical_sources import (
+            get_polity2_series, load_polity5,
+        )
+
+        (self.root / "polity5").mkdir()
+        pd.DataFrame({
+            "scode": ["USA"] * 4 + ["GBR"] * 2,
+            "country": ["United States"] * 4 + ["United Kingdom"] * 2,
+            "ccode": [2] * 4 + [200] * 2,
+            "year": [1800, 1801, 1802, 1803, 1800, 1801],
+            "polity2": [10, -66, 9, -88, 7, 8],
+        }).to_csv(self.root / "polity5" / "p5v2018.csv", index=False)
+
+        self.assertEqual(len(load_polity5("USA")), 2)
+        for code in ("USA", "united states", "2"):
+            series = get_polity2_series(code)
+            self.assertEqual(series.tolist(), [10.0, 9.0])
+        self.assertEqual(len(get_polity2_series("XYZ")), 0)
+
+
+class TestGRRIPanelEngine(unittest.TestCase):
+    """Whole-panel GRRI matches the per-year path."""
+
+    def setUp(self):
+        import tempfile
+        from grri_mac.grri.event_index import EVENT_INDEXES
+        from grri_mac.grri.panel_cache import PANELS
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._patches = [
+            patch(f"grri_mac.grri.{mod}.GRRI_HISTORICAL_DIR", self.root)
+            for mod in ("historical_sources", "governance_quality")
+        ]
+        for p in self._patches:
+            p.start()
+        PANELS.clear()
+        EVENT_INDEXES.clear()
+
+        rng = np.random.default_rng(11)
+        codes = ("GBR", "CHN", "ARG")
+
+        def write(sub, name, rows):
+            (self.root / sub).mkdir(exist_ok=True)
+            pd.DataFrame(rows).to_csv(self.root / sub / name, index=False)
+
+        write("polity5", "p5v2018.csv", [
+            {"scode": c, "country": c, "ccode": i, "year": y,
+             "polity2": int(rng.integers(-10, 11))}
+            for i, c in enumerate(codes) for y in range(1900, 2019)
+            if rng.random() > 0.1
+        ])
+        write("vdem", "vdem_core.csv", [
+            {"country_text_id": c, "country_id": i, "country_name": c,
+             "year": y, "v2x_rule": rng.random(), "v2x_civlib": rng.random(),
+             "v2x_suffr": rng.random(), "v2x_polyarchy": rng.random()}
+            for i, c in enumerate(codes[:2]) for y in range(1900, 2019)
+            if rng.random() > 0.1
+        ])
+        write("maddison", "mpd2020.csv", [
+            {"countrycode": c, "country": c, "year": y,
+             "gdppc": 1000 + rng.random() * 9000}
+            for c in codes for y in range(1900, 2019) if rng.random() > 0.1
+        ])
+        write("cow", "wars.csv", [
+            {"state_participant": "GBR", "startyear1": 1939, "endyear1": 1945,
+             "batdeath": 380000},
+            {"state_participant": "CHN", "startyear1": 1950, "endyear1": 1953,
+             "batdeath": np.nan},
+        ])
+        write("reinhart_rogoff", "crises.csv", [
+            {"country": c, "year": y, "banking": int(rng.random() < 0.1),
+             "currency": int(rng.random() < 0.1)}
+            for c in codes[:2] for y in range(1900, 2016)
+        ])
+        write("emdat", "emdat_public.csv", [
+            {"iso": rng.choice(codes), "year": int(rng.integers(1900, 2020)),
+             "total_deaths": rng.choice([np.nan, 0, 50, 20000])}
+            for _ in range(60)
+        ])
+        write("hadcrut", "hadcrut5_annual.csv", {
+            "year": range(1850, 2021), "anomaly": np.linspace(-0.4, 1.0, 171),
+        })
+        write("garriga", "cbi_index.csv", [
+            {"country": "CHN", "year": y, "cbi": rng.random()}
+            for y in range(1970, 2018, 4)
+        ])
+        write("wgi", "wgi_data.csv", [
+            {"countrycode": c, "year": y, "ge_est": rng.normal(),
+             "pv_est": rng.normal(), "rl_est": rng.normal(),
+             "rq_est": np.nan}
+            for c in codes[1:] for y in list(range(1996, 2002, 2)) + list(range(2002, 2019))
+        ])
+        write("unemployment", "gbr.csv", {
+            "year": range(1919, 2019), "unemployment_rate": rng.random(100) * 20,
+        })
+        self.codes = list(codes) + ["ZZZ"]
+
+    def tearDown(self):
+        from grri_mac.grri.panel_cache import PANELS
+
+        PANELS.clear()
+        for p in self._patches:
+            p.stop()
+        self._tmp.cleanup()
+
+    def test_matches_timeseries(self):
+        from grri_mac.grri.historical_sources import GRRIHistoricalProvider
+
+        expected = []
+        for code in self.codes:
+            df = GRRIHistoricalProvider().get_historical_grri_timeseries(
+                code, 1935, 2005,
+            )
+            if not df.empty:
+                df.insert(0, "country", code)
+                expected.append(df)
+        expected = pd.concat(expected, ignore_index=True)
+
+        panel = GRRIHistoricalProvider().get_historical_grri_panel(
+            self.codes, 1935, 2005,
+        )
+        pd.testing.assert_frame_equal(
+            panel[expected.columns], expected, check_dtype=False,
+        )
+
+    def test_provenance_bitmask(self):
+        from grri_mac.grri.historical_sources import GRRIHistoricalProvider
+        from grri_mac.grri.panel_engine import GRRIProvenance, decode_provenance
+
+        panel = GRRIHistoricalProvider().get_historical_grri_panel(
+            ["GBR", "ARG"], 1960, 2000,
+        ).set_index(["country", "year"])
+        gbr = GRRIProvenance(int(panel.loc[("GBR", 1960), "provenance"]))
+        self.assertIn(GRRIProvenance.UNEMPLOYMENT, gbr)
+        self.assertIn(GRRIProvenance.CBI_HEURISTIC, gbr)
+        self.assertNotIn(GRRIProvenance.WGI, gbr)
+        arg = int(panel.loc[("ARG", 2000), "provenance"])
+        self.assertTrue(arg & GRRIProvenance.WGI)
+        self.assertFalse(arg & GRRIProvenance.UNEMPLOYMENT)
+        self.assertIn("WGI (1996+)", decode_provenance(arg))
+
+    def test_asof_annual_matches_lookup(self):
+        from grri_mac.grri.historical_sources import GRRIHistoricalProvider
+        from grri_mac.grri.panel_engine import asof_annual
+
+        provider = GRRIHistoricalProvider()
+        years = np.arange(1895, 1960)
+        kept = [y for y in range(1900, 1950) if y % 6]
+        series = pd.Series(
+            np.arange(len(kept), dtype=float),
+            index=[datetime(y, 7, 1) for y in kept],
+        )
+        for gap in (0, 3):
+            expected = [provider._lookup_annual(series, y, gap) for y in years]
+            np.testing.assert_array_equal(
+                asof_annual(series, years, gap),
+                [np.nan if v is None else v for v in expected],
+            )
+
+
+class TestGRRIEventIndex(unittest.TestCase):
+    """Indexed event lookups match a scan of the raw table."""
+
+    def setUp(self):
+        import tempfile
+        from grri_mac.grri.event_index import EVENT_INDEXES
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._patch = patch(
+            "grri_mac.grri.historical_sources.GRRI_HISTORICAL_DIR", self.root,
+        )
+        self._patch.start()
+        EVENT_INDEXES.clear()
+
+        rng = np.random.default_rng(5)
+        self.codes = ["USA", "GBR", "FRA", "2", "ZZZ"]
+        keys = self.codes[:4]
+
+        self.cow = pd.DataFrame({
+            "state_participant": rng.choice(keys, 40),
+            "startyear1": rng.integers(1900, 1990, 40).astype(float),
+            "batdeath": rng.choice([np.nan, 0, 900, 250000], 40),
+        })
+        self.cow["endyear1"] = self.cow["startyear1"] + rng.integers(0, 6, 40)
+        self.cow.loc[::7, "endyear1"] = np.nan
+        self.rr = pd.DataFrame([
+            {"country": c, "year": y, "banking": int(rng.random() < 0.2),
+             "currency": int(rng.random() < 0.1), "inflation": rng.random()}
+            for c in keys[:3] for y in range(1900, 2000)
+        ])
+        self.emdat = pd.DataFrame({
+            "iso": rng.choice(keys, 80),
+            "year": rng.integers(1900, 2000, 80).astype(float),
+            "total_deaths": rng.choice([np.nan, 0, 12, 30000], 80),
+        })
+        self.emdat.loc[::9, "year"] = np.nan
+        self.gsdb = pd.DataFrame({
+            "target_country": rng.choice(keys, 30),
+            "sender_country": rng.choice(keys, 30),
+            "start_year": rng.integers(1950, 2000, 30),
+            "end_year": rng.choice([np.nan, 1960, 1985, 2010], 30),
+        })
+        for sub, name, df in (
+            ("cow", "wars.csv", self.cow),
+            ("reinhart_rogoff", "crises.csv", self.rr),
+            ("emdat", "emdat_public.csv", self.emdat),
+            ("gsdb", "sanctions.csv", self.gsdb),
+        ):
+            (self.root / sub).mkdir()
+            df.to_csv(self.root / sub / name, index=False)
+
+    def tearDown(self):
+        from grri_mac.grri.event_index import EVENT_INDEXES
+
+        EVENT_INDEXES.clear()
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _keyed(df, columns, code):
+        mask = pd.Series(False, index=df.index)
+        for col in columns:
+            if col in df.columns:
+                mask |= df[col].astype(str).str.upper() == code
+        return mask
+
+    def _scan(self, code, year):
+        """Reference values from boolean masks over the raw tables."""
+        cow = self.cow[
+            self._keyed(self.cow, ("state_participant",), code)
+            & ((self.cow["startyear1"] == year)
+               | ((self.cow["startyear1"] <= year)
+                  & (self.cow["endyear1"] >= year)))
+        ]
+        if cow.empty:
+            conflict = 0.0
+        elif cow["batdeath"].max() > 0:
+            conflict = min(1.0, np.log10(cow["batdeath"].max() + 1) / 6.0)
+        else:
+            conflict = 0.3
+
+        rr = self.rr[
+            self._keyed(self.rr, ("country",), code)
+            & self.rr["year"].between(year - 5, year + 5)
+        ]
+        crises = int(rr[["banking", "currency", "inflation"]].sum().sum())
+
+        em = self.emdat[
+            self._keyed(self.emdat, ("iso",), code)
+            & self.emdat["year"].between(year - 5, year)
+        ]
+        deaths = em["total_deaths"].sum()
+        if deaths > 0:
+            disaster = min(1.0, np.log10(deaths + 1) / 6.0)
+        else:
+            disaster = min(1.0, len(em) / 50.0)
+
+        sanctions = int((
+            self._keyed(self.gsdb, ("target_country",), code)
+            & (self.gsdb["start_year"] <= year)
+            & (self.gsdb["end_year"].fillna(year + 1) >= year)
+        ).sum())
+        return conflict, crises, disaster, sanctions
+
+    def test_lookups_match_scan(self):
+        from grri_mac.grri import historical_sources as hs
+
+        for code in self.codes:
+            for year in range(1895, 2005, 3):
+                conflict, crises, disaster, sanctions = self._scan(code, year)
+                self.assertAlmostEqual(
+                    hs.get_conflict_intensity(code, year), conflict,
+                )
+                self.assertEqual(hs.get_crisis_count(code, year), crises)
+                self.assertAlmostEqual(
+                    hs.get_disaster_severity(code, year), disaster,
+                )
+                self.assertEqual(hs.get_sanctions_count(code, year), sanctions)
+
+    def test_batch_matches_scalar(self):
+        from grri_mac.grri import historical_sources as hs
+
+        years = np.arange(1900, 2001)
+        grids = {
+            hs.get_conflict_intensity: hs.cow_index().intensity(
+                self.codes, years,
+            ),
+            hs.get_crisis_count: hs.crisis_index().counts(self.codes, years),
+            hs.get_disaster_severity: hs.emdat_index().severity(
+                self.codes, years,
+            ),
+            hs.get_sanctions_count: hs.sanctions_index().counts(
+                self.codes, years,
+            ),
+        }
+        for lookup, grid in grids.items():
+            self.assertEqual(grid.shape, (len(self.codes), len(years)))
+            for i, code in enumerate(self.codes):
+                for j in range(0, len(years), 7):
+                    self.assertAlmostEqual(
+                        grid[i, j], lookup(code, int(years[j])),
+                    )
+
+    def test_parsed_once_and_rebuilt_on_change(self):
+        import os
+        from grri_mac.grri import historical_sources as hs
+
+        read_csv = pd.read_csv
+        with patch.object(
+            hs.pd, "read_csv", side_effect=read_csv,
+        ) as spy:
+            for year in range(1900, 1950):
+                hs.get_crisis_count("USA", year)
+                hs.get_conflict_intensity("GBR", year)
+            self.assertEqual(spy.call_count, 2)
+
+            path = self.root / "reinhart_rogoff" / "crises.csv"
+            pd.DataFrame(
+                {"country": ["USA"], "year": [1920], "banking": [4]},
+            ).to_csv(path, index=False)
+            st = path.stat()
+            os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+            self.assertEqual(hs.get_crisis_count("USA", 1920), 4)
+            self.assertEqual(spy.call_count, 3)
+
+
 if __name__ == "__main__":
     unittest.main()
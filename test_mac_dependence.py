@@ -2,11 +2,11 @@
 
 Tests cover:
 - MI computation with known distributions
-- HSIC with independent and dependent data
+- HSIC with independent and dependent data (exact and RFF paths)
 - MIC with functional and random relationships
 - Total correlation and dual total correlation
 - Full PillarDependenceAnalyzer pipeline
-- Rolling window analysis
+- Rolling window analysis (full recompute and incremental engine)
 - Edge cases
 """
 
@@ -20,9 +20,11 @@ from grri_mac.mac.dependence import (
     PairwiseResult,
     compute_mi,
     compute_hsic,
+    hsic_from_kernels,
     compute_mic,
     compute_total_correlation,
     compute_dual_total_correlation,
+    _center_kernel,
     _entropy_discrete,
     _joint_entropy_discrete,
     _rbf_kernel_matrix,
@@ -253,6 +255,53 @@ class TestHSIC:
                                 n_permutations=50, seed=42)
         assert hsic > 0
 
+    def test_matches_dense_trace_formula(self, rng):
+        """Centered elementwise sums reproduce tr(HK_xHK_y) p-values."""
+        for n, decimals in [(6, 1), (25, 1), (40, 6)]:
+            x = np.round(rng.uniform(size=n), decimals)
+            y = np.round(x ** 2 + rng.normal(0, 0.2, n), decimals)
+            K_x, K_y = _rbf_kernel_matrix(x), _rbf_kernel_matrix(y)
+            H = np.eye(n) - np.ones((n, n)) / n
+            HK_x = H @ K_x
+            norm = (n - 1) ** 2
+            observed = np.trace(HK_x @ H @ K_y) / norm
+            perm_rng = np.random.default_rng(7)
+            count = 0
+            for _ in range(150):
+                perm = perm_rng.permutation(n)
+                value = np.trace(HK_x @ H @ K_y[np.ix_(perm, perm)]) / norm
+                count += value >= observed - 1e-12 * abs(observed)
+            hsic, p = compute_hsic(x, y, n_permutations=150, seed=7)
+            assert hsic == pytest.approx(observed, rel=1e-10)
+            assert p == (count + 1) / 151
+
+    def test_center_kernel(self, rng):
+        K = _rbf_kernel_matrix(rng.uniform(size=12))
+        H = np.eye(12) - np.ones((12, 12)) / 12
+        np.testing.assert_allclose(_center_kernel(K), H @ K @ H, atol=1e-12)
+
+    def test_from_kernels_matches_compute_hsic(self, nonlinear_dependent_data):
+        x, y = nonlinear_dependent_data
+        K_x, K_y = _rbf_kernel_matrix(x), _rbf_kernel_matrix(y)
+        assert hsic_from_kernels(
+            _center_kernel(K_x), K_y, n_permutations=100, seed=3,
+        ) == compute_hsic(x, y, n_permutations=100, seed=3)
+
+    def test_rff_approximation(self, nonlinear_dependent_data,
+                               independent_data):
+        """Random-feature HSIC tracks the exact statistic."""
+        x, y = nonlinear_dependent_data
+        exact, _ = compute_hsic(x, y, n_permutations=10)
+        approx, p = compute_hsic(x, y, n_permutations=100, method="rff",
+                                 n_features=512)
+        assert approx == pytest.approx(exact, rel=0.3)
+        assert p < 0.05
+        x, y = independent_data
+        _, p = compute_hsic(x, y, n_permutations=100, method="rff")
+        assert p > 0.01
+        with pytest.raises(ValueError):
+            compute_hsic(x, y, method="nystrom")
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # MIC tests
@@ -399,6 +448,22 @@ class TestPillarDependenceAnalyzer:
         report = analyzer.full_analysis(seven_pillar_history)
         assert len(report.pairs) == 21
 
+    def test_cached_kernels_match_per_pair_hsic(self, three_pillar_history):
+        """Per-pillar kernel reuse must not change HSIC or p-values."""
+        names = ["liquidity", "valuation", "positioning"]
+        analyzer = PillarDependenceAnalyzer(
+            pillar_names=names, n_permutations=60,
+        )
+        report = analyzer.full_analysis(three_pillar_history)
+        for pair in report.pairs:
+            hsic, p = compute_hsic(
+                np.asarray(three_pillar_history[pair.pillar_a]),
+                np.asarray(three_pillar_history[pair.pillar_b]),
+                n_permutations=60, seed=42,
+            )
+            assert pair.hsic == hsic
+            assert pair.hsic_p_value == p
+
     def test_three_pillar_pair_count(self, three_pillar_history):
         """3 pillars → C(3,2) = 3 pairs."""
         analyzer = PillarDependenceAnalyzer(
@@ -531,6 +596,145 @@ class TestRollingAnalysis:
             )
 
 
+class TestRollingFrame:
+    """Tests for the incremental rolling engine (rolling_frame)."""
+
+    @staticmethod
+    def _window(history, names, end, size):
+        return np.column_stack(
+            [history[p][end - size + 1:end + 1] for p in names]
+        )
+
+    @pytest.mark.parametrize("step", [1, 7, 60])
+    def test_incremental_matches_recompute(self, seven_pillar_history, step):
+        """Slid statistics equal a from-scratch pass over each window."""
+        from grri_mac.mac.rolling_dependence import _copula_scores
+
+        analyzer = PillarDependenceAnalyzer()
+        frame = analyzer.rolling_frame(
+            seven_pillar_history, window_size=40, step=step,
+            include_hsic=False, include_mic=False,
+        )
+        full = np.column_stack(
+            [seven_pillar_history[p] for p in PILLAR_NAMES_7]
+        )
+        for end in sorted(set(frame.index))[::5]:
+            rows = frame.loc[[end]]
+            win = slice(end - 39, end + 1)
+            # Bins and ranks from this window only
+            z = np.full(full.shape, np.nan)
+            z[win] = _copula_scores(full[win])
+            for _, r in rows.iterrows():
+                i = PILLAR_NAMES_7.index(r.pillar_a)
+                j = PILLAR_NAMES_7.index(r.pillar_b)
+                assert r.pearson == pytest.approx(
+                    np.corrcoef(full[win, i], full[win, j])[0, 1], abs=1e-10)
+                rho = np.corrcoef(z[win, i], z[win, j])[0, 1]
+                assert r.gaussian_mi == pytest.approx(
+                    -0.5 * math.log2(1 - rho ** 2), abs=1e-10)
+                mi, nmi = compute_mi(full[win, i], full[win, j])
+                assert r.mi == pytest.approx(mi, abs=1e-10)
+                assert r.nmi == pytest.approx(nmi, abs=1e-10)
+
+    def test_mi_matches_compute_mi(self, seven_pillar_history):
+        """mi/nmi use compute_mi's bins, as rolling_analysis reports."""
+        analyzer = PillarDependenceAnalyzer()
+        frame = analyzer.rolling_frame(
+            seven_pillar_history, window_size=52,
+            include_hsic=False, include_mic=False,
+        )
+        rows = frame.loc[[51]]
+        window = self._window(seven_pillar_history, PILLAR_NAMES_7, 51, 52)
+        for _, r in rows.iterrows():
+            i = PILLAR_NAMES_7.index(r.pillar_a)
+            j = PILLAR_NAMES_7.index(r.pillar_b)
+            mi, nmi = compute_mi(window[:, i], window[:, j])
+            assert r.mi == pytest.approx(mi, abs=1e-12)
+            assert r.nmi == pytest.approx(nmi, abs=1e-12)
+
+        # Constant and tied columns bin like np.histogram too
+        flat = {p: list(v) for p, v in seven_pillar_history.items()}
+        flat["liquidity"] = [0.5] * len(flat["liquidity"])
+        flat["valuation"] = [round(x, 1) for x in flat["valuation"]]
+        frame = analyzer.rolling_frame(
+            flat, window_size=40, step=13,
+            include_hsic=False, include_mic=False,
+        )
+        for end, r in frame.iterrows():
+            i = PILLAR_NAMES_7.index(r.pillar_a)
+            j = PILLAR_NAMES_7.index(r.pillar_b)
+            window = self._window(flat, PILLAR_NAMES_7, end, 40)
+            mi, nmi = compute_mi(window[:, i], window[:, j])
+            assert r.mi == pytest.approx(mi, abs=1e-12)
+            assert r.nmi == pytest.approx(nmi, abs=1e-12)
+
+    def test_no_look_ahead(self, seven_pillar_history):
+        """Later observations never change an earlier window's row."""
+        analyzer = PillarDependenceAnalyzer()
+        kwargs = dict(window_size=40, step=3,
+                      include_hsic=False, include_mic=False)
+        frame = analyzer.rolling_frame(seven_pillar_history, **kwargs)
+        cut = 120
+        shocked = {
+            p: list(v[:cut]) + [10.0 * x for x in v[cut:]]
+            for p, v in seven_pillar_history.items()
+        }
+        other = analyzer.rolling_frame(shocked, **kwargs)
+        before = frame.index < cut
+        assert frame[before].equals(other[before])
+
+    def test_resum_bounds_pearson_drift(self):
+        """Raw moments stay exact over many slides of large values."""
+        rng = np.random.default_rng(3)
+        history = {
+            p: list(1e3 + rng.standard_normal(5000))
+            for p in PILLAR_NAMES_7[:3]
+        }
+        analyzer = PillarDependenceAnalyzer(pillar_names=PILLAR_NAMES_7[:3])
+        frame = analyzer.rolling_frame(
+            history, window_size=30, step=1,
+            include_hsic=False, include_mic=False,
+        )
+        last = frame.loc[[4999]].iloc[0]
+        x = np.asarray(history[last.pillar_a][-30:])
+        y = np.asarray(history[last.pillar_b][-30:])
+        assert last.pearson == pytest.approx(
+            np.corrcoef(x, y)[0, 1], abs=1e-9)
+
+    def test_frame_layout_and_heavy_metrics(self, three_pillar_history):
+        """One row per (window, pair); HSIC/MIC match direct calls."""
+        names = ["liquidity", "valuation", "positioning"]
+        analyzer = PillarDependenceAnalyzer(
+            pillar_names=names, n_permutations=40,
+        )
+        dates = list(range(1000, 1100))
+        frame = analyzer.rolling_frame(
+            three_pillar_history, window_size=50, index=dates,
+        )
+        n_windows = len(range(0, 100 - 50 + 1, 12))
+        assert len(frame) == n_windows * 3
+        assert frame.index.name == "window_end"
+        assert frame.index[0] == dates[49]
+
+        first = frame.loc[[dates[49]]].iloc[0]
+        x = np.asarray(three_pillar_history["liquidity"][:50])
+        y = np.asarray(three_pillar_history["valuation"][:50])
+        assert (first.hsic, first.hsic_p_value) == compute_hsic(
+            x, y, n_permutations=40, seed=42)
+        assert first.mic == compute_mic(x, y)
+
+    def test_workers_match_in_process(self, three_pillar_history):
+        names = ["liquidity", "valuation", "positioning"]
+        analyzer = PillarDependenceAnalyzer(
+            pillar_names=names, n_permutations=20,
+        )
+        serial = analyzer.rolling_frame(three_pillar_history, 40, step=20)
+        pooled = analyzer.rolling_frame(
+            three_pillar_history, 40, step=20, workers=2,
+        )
+        assert serial.equals(pooled)
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # PairwiseResult tests
 # ═══════════════════════════════════════════════════════════════════════
@@ -0,0 +1,2257 @@
+#!/usr/bin/env python
+"""Tests for the vectorized / incremental execution paths.
+
+Each fast path is checked against the reference implementation it
+replaces, on synthetic data so no network or FRED cache is needed.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def _synthetic_fred_cache(
+    start: str = "1980-01-01",
+    end: str = "2012-12-31",
+    seed: int = 0,
+) -> dict:
+    """Random-walk stand-ins for the FRED series the backtest reads."""
+    rng = np.random.default_rng(seed)
+    daily = pd.bdate_range(start, end)
+    monthly = pd.date_range(start, end, freq="MS")
+    quarterly = pd.date_range(start, end, freq="QS")
+
+    spec = {
+        # series: (index, level, step, first date)
+        "TEDRATE": (daily, 0.4, 0.02, "1986-01-02"),
+        "DFF": (daily, 4.0, 0.05, None),
+        "DTB3": (daily, 3.8, 0.05, None),
+        "TB3MS": (monthly, 3.8, 0.1, None),
+        "FEDFUNDS": (monthly, 4.0, 0.1, None),
+        "BAMLC0A0CM": (daily, 1.3, 0.03, "1996-12-31"),
+        "BAMLH0A0HYM2": (daily, 4.5, 0.08, "1996-12-31"),
+        "AAA": (monthly, 6.0, 0.1, None),
+        "BAA": (monthly, 7.0, 0.1, None),
+        "DGS10": (daily, 5.0, 0.04, None),
+        "DGS2": (daily, 4.0, 0.04, None),
+        "BAA10Y": (daily, 2.0, 0.03, "1986-01-02"),
+        "VIXCLS": (daily, 18.0, 0.8, "1990-01-02"),
+        "VXOCLS": (daily, 19.0, 0.8, "1986-01-02"),
+        "INTDSRUSM193N": (monthly, 4.5, 0.1, None),
+        "DRTSCIS": (quarterly, 10.0, 20.0, "1990-04-01"),
+        "DRISCFS": (quarterly, 10.0, 20.0, "1990-04-01"),
+    }
+    cache = {}
+    for series_id, (index, level, step, first) in spec.items():
+        if first:
+            index = index[index >= first]
+        if series_id.startswith("DR"):
+            values = rng.normal(level, step, len(index))
+        else:
+            values = np.abs(
+                level + np.cumsum(rng.normal(0, step, len(index)))
+            )
+        series = pd.Series(values, index=index)
+        series.iloc[rng.choice(len(series), len(series) // 50)] = np.nan
+        cache[series_id] = series
+
+    nasdaq_index = daily[daily >= "1971-02-05"]
+    cache["NASDAQCOM"] = pd.Series(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.012, len(nasdaq_index)))),
+        index=nasdaq_index,
+    )
+    return cache
+
+
+def _offline_runner(cache: dict, **kwargs):
+    """BacktestRunner reading only from a pre-filled bulk cache."""
+    from grri_mac.backtest.runner import BacktestRunner
+
+    runner = BacktestRunner(fred_api_key="test", **kwargs)
+    runner.fred._bulk_cache = dict(cache)
+    runner.fred.set_backtest_mode(True)
+    runner._prefetch_fred_data = lambda start, end: None
+    return runner
+
+
+def _assert_frames_match(expected: pd.DataFrame, actual: pd.DataFrame):
+    assert list(expected.columns) == list(actual.columns)
+    assert expected.index.equals(actual.index)
+    for col in expected.columns:
+        exp, act = expected[col], actual[col]
+        assert (exp.isna() == act.isna()).all(), col
+        mask = exp.notna()
+        if pd.api.types.is_numeric_dtype(exp):
+            np.testing.assert_allclose(
+                exp[mask].astype(float), act[mask].astype(float),
+                atol=1e-9, err_msg=col,
+            )
+        else:
+            assert (exp[mask] == act[mask]).all(), col
+
+
+@pytest.fixture(scope="module")
+def fred_cache():
+    return _synthetic_fred_cache()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Columnar backtest engine
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestVectorizedBacktest:
+    """Columnar engine must reproduce the per-date loop exactly."""
+
+    def test_matches_iterative_modern(self, fred_cache):
+        start, end = datetime(2003, 1, 1), datetime(2009, 12, 31)
+        expected = _offline_runner(fred_cache).run_backtest(
+            start, end, "monthly",
+        )
+        actual = _offline_runner(fred_cache).run_backtest(
+            start, end, "monthly", engine="vectorized",
+        )
+        assert len(expected) > 52  # HMM overlay kicks in
+        _assert_frames_match(expected, actual)
+
+    def test_matches_iterative_with_era_weights(self, fred_cache):
+        start, end = datetime(1981, 1, 1), datetime(1992, 12, 31)
+        expected = _offline_runner(
+            fred_cache, use_era_weights=True,
+        ).run_backtest(start, end, "monthly")
+        actual = _offline_runner(
+            fred_cache, use_era_weights=True,
+        ).run_backtest(start, end, "monthly", engine="vectorized")
+        _assert_frames_match(expected, actual)
+
+    def test_asof_honours_lookback(self, fred_cache):
+        from grri_mac.backtest.vectorized import VectorizedBacktestEngine
+
+        runner = _offline_runner(fred_cache)
+        engine = VectorizedBacktestEngine(runner)
+        dates = pd.date_range("1999-01-01", "1999-03-01", freq="7D")
+        values = engine.asof("BAA", dates.values, lookback_days=35)
+        for dt, value in zip(dates.to_pydatetime(), values):
+            scalar = runner.fred.get_value_for_date("BAA", dt, 35)
+            assert (scalar is None) == np.isnan(value)
+            if scalar is not None:
+                assert value == pytest.approx(scalar)
+
+    def test_rescore_reuses_indicator_frame(self, fred_cache):
+        from grri_mac.backtest.vectorized import VectorizedBacktestEngine
+
+        engine = VectorizedBacktestEngine(_offline_runner(fred_cache))
+        start, end = datetime(2005, 1, 1), datetime(2006, 12, 31)
+        engine.run(start, end, "monthly", compute_ci=False)
+        frame = next(iter(engine._indicator_cache.values()))
+
+        engine.runner.volatility.THRESHOLDS = {
+            **engine.runner.volatility.THRESHOLDS,
+            "vix_level": {
+                "ample_low": 1000, "ample_high": 1001,
+                "thin_low": 999, "thin_high": 1002,
+                "breach_low": 998, "breach_high": 1003,
+            },
+        }
+        rescored = engine.run(start, end, "monthly", compute_ci=False)
+        assert next(iter(engine._indicator_cache.values())) is frame
+        assert (rescored["volatility"] == 0.0).all()
+
+    def test_run_backtest_reuses_indicator_frame(self, fred_cache):
+        runner = _offline_runner(fred_cache)
+        start, end = datetime(2005, 1, 1), datetime(2006, 12, 31)
+        runner.run_backtest(start, end, "monthly", engine="vectorized")
+        engine = runner._vectorized_engine
+        frame = next(iter(engine._indicator_cache.values()))
+
+        runner.volatility.THRESHOLDS = {
+            **runner.volatility.THRESHOLDS,
+            "vix_level": {
+                "ample_low": 1000, "ample_high": 1001,
+                "thin_low": 999, "thin_high": 1002,
+                "breach_low": 998, "breach_high": 1003,
+            },
+        }
+        rescored = runner.run_backtest(start, end, "monthly",
+                                       engine="vectorized")
+        assert runner._vectorized_engine is engine
+        assert next(iter(engine._indicator_cache.values())) is frame
+        assert (rescored["volatility"] == 0.0).all()
+
+        # New FRED data invalidates the cached frame
+        runner.fred._bulk_version += 1
+        runner.run_backtest(start, end, "monthly", engine="vectorized")
+        assert len(engine._indicator_cache) == 1
+        assert next(iter(engine._indicator_cache.values())) is not frame
+
+    @pytest.mark.parametrize("engine", ["iterative", "vectorized"])
+    def test_repeat_runs_start_fresh(self, fred_cache, engine):
+        runner = _offline_runner(fred_cache)
+        start, end = datetime(2003, 1, 1), datetime(2009, 12, 31)
+        # An earlier, different run must not leak HMM or valuation state
+        runner.run_backtest(datetime(1995, 1, 1), end, "monthly",
+                            engine=engine)
+        first = runner.run_backtest(start, end, "monthly", engine=engine)
+        second = runner.run_backtest(start, end, "monthly", engine=engine)
+        fresh = _offline_runner(fred_cache).run_backtest(
+            start, end, "monthly", engine=engine,
+        )
+        assert first["hmm_fragile_prob"].notna().any()
+        _assert_frames_match(fresh, first)
+        _assert_frames_match(first, second)
+
+    def test_unknown_engine_rejected(self, fred_cache):
+        runner = _offline_runner(fred_cache)
+        with pytest.raises(ValueError):
+            runner.run_backtest(
+                datetime(2005, 1, 1), datetime(2005, 2, 1), engine="gpu",
+            )
+
+
+class TestAdaptiveBandsBatch:
+    """Batch adaptive-band scoring matches the incremental scorer."""
+
+    def test_matches_score_with_regime(self):
+        from grri_mac.pillars.valuation_adaptive import (
+            AdaptiveValuationBands,
+        )
+
+        bands = AdaptiveValuationBands(lookback_weeks=80)
+        rng = np.random.default_rng(3)
+        values = 100 + np.cumsum(rng.normal(0, 5, 200))
+        values[rng.choice(200, 20, replace=False)] = np.nan
+
+        batch = bands.score_history_batch(values)
+        history = []
+        for v, b in zip(values, batch):
+            if np.isnan(v):
+                assert np.isnan(b)
+                continue
+            history.append(v)
+            if len(history) < 52:
+                assert np.isnan(b)
+            else:
+                expected = bands.score_with_regime(v, history).score
+                assert b == pytest.approx(expected, abs=1e-9)
+
+
+class TestArrayScorers:
+    """Array threshold scorers agree with the scalar scorers."""
+
+    def test_simple_and_range(self):
+        from grri_mac.mac.scorer import (
+            score_indicator_range,
+            score_indicator_range_array,
+            score_indicator_simple,
+            score_indicator_simple_array,
+        )
+
+        values = np.linspace(-50, 450, 101)
+        for thresholds, lower in (((60, 120, 200), True),
+                                  ((200, 120, 60), False)):
+            batch = score_indicator_simple_array(
+                values, *thresholds, lower_is_better=lower,
+            )
+            for v, b in zip(values, batch):
+                assert b == pytest.approx(score_indicator_simple(
+                    v, *thresholds, lower_is_better=lower,
+                ))
+
+        batch = score_indicator_range_array(
+            values, (60, 100), (40, 180), (20, 400),
+        )
+        for v, b in zip(values, batch):
+            assert b == pytest.approx(score_indicator_range(
+                v, (60, 100), (40, 180), (20, 400),
+            ))
+        assert np.isnan(score_indicator_simple_array(
+            np.array([np.nan]), 1, 2, 3,
+        )[0])
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# FRED as-of index
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _reference_value_for_date(series, date, lookback_days):
+    """The original dropna + mask scan."""
+    data = series.dropna()
+    start = date - pd.Timedelta(days=lookback_days)
+    window = data[(data.index >= start) & (data.index <= date)]
+    return None if window.empty else float(window.iloc[-1])
+
+
+class TestFREDAsOfIndex:
+    """Binary-search lookups match the linear scan they replace."""
+
+    @pytest.fixture
+    def client(self, fred_cache):
+        from grri_mac.data.fred import FREDClient
+
+        client = FREDClient(api_key="test")
+        client._bulk_cache = {
+            "BAA": fred_cache["BAA"], "DGS10": fred_cache["DGS10"],
+        }
+        client.set_backtest_mode(True)
+        return client
+
+    def test_scalar_matches_scan(self, client, fred_cache):
+        dates = pd.date_range("1979-12-01", "1985-06-30", freq="6D")
+        for lookback in (5, 35):
+            for dt in dates.to_pydatetime():
+                expected = _reference_value_for_date(
+                    fred_cache["BAA"], dt, lookback,
+                )
+                assert client.get_value_for_date("BAA", dt, lookback) == expected
+
+    def test_batch_matches_scalar(self, client):
+        dates = pd.date_range("1990-01-01", "1995-01-01", freq="3D")
+        batch = client.get_values_for_dates("DGS10", dates, lookback_days=5)
+        assert batch.shape == (len(dates),)
+        for dt, value in zip(dates.to_pydatetime(), batch):
+            scalar = client.get_value_for_date("DGS10", dt, 5)
+            assert (scalar is None) == np.isnan(value)
+            if scalar is not None:
+                assert value == scalar
+
+    def test_uncached_series_is_nan_in_backtest_mode(self, client):
+        dates = [datetime(2000, 1, 3), datetime(2000, 1, 4)]
+        assert np.isnan(client.get_values_for_dates("VIXCLS", dates)).all()
+        assert client.get_value_for_date("VIXCLS", dates[0]) is None
+
+    def test_index_rebuilt_when_series_replaced(self, client):
+        dt = datetime(2001, 6, 1)
+        client.get_value_for_date("BAA", dt, 35)
+        client._bulk_cache["BAA"] = pd.Series(
+            [42.0], index=pd.DatetimeIndex([datetime(2001, 5, 31)]),
+        )
+        assert client.get_value_for_date("BAA", dt, 35) == 42.0
+        earlier = dt - pd.Timedelta(days=2)
+        assert client.get_value_for_date("BAA", earlier) is None
+
+
+class TestHistoricalAsOfIndex:
+    """Pre-1954 provider lookups match the scans they replace."""
+
+    @pytest.fixture
+    def hs(self, tmp_path, monkeypatch):
+        from grri_mac.data import historical_sources as hs
+
+        monkeypatch.setattr(hs, "HISTORICAL_DATA_DIR", tmp_path)
+        rng = np.random.default_rng(9)
+        monthly = pd.date_range("1890-01-01", "1950-12-01", freq="MS")
+
+        def write(sub, name, frame):
+            (tmp_path / sub).mkdir(exist_ok=True)
+            frame.to_csv(tmp_path / sub / name, index=False)
+
+        for series_id in ("m13001", "m13041"):
+            keep = rng.random(len(monthly)) > 0.3
+            write("nber", f"{series_id}.csv", pd.DataFrame({
+                "date": monthly[keep], "value": rng.uniform(1, 8, keep.sum()),
+            }))
+        write("schwert", "schwert_volatility.csv", pd.DataFrame({
+            "date": monthly[::2], "volatility": rng.uniform(8, 50, 366),
+        }))
+        gs10 = rng.uniform(2, 6, len(monthly))
+        gs10[rng.random(len(monthly)) < 0.2] = np.nan
+        write("shiller", "ie_data.csv", pd.DataFrame({
+            "Date": monthly.year + (monthly.month - 1) / 12 + 0.001,
+            "P": 10 * np.exp(np.cumsum(rng.normal(0, 0.04, len(monthly)))),
+            "GS10": gs10,
+            "CAPE": rng.uniform(5, 30, len(monthly)),
+        }))
+        return hs
+
+    def test_scalar_matches_scan(self, hs):
+        provider = hs.HistoricalDataProvider()
+        call = hs.load_nber_series("m13001")
+        shiller = hs.load_shiller_dataset()
+        dates = pd.date_range("1889-06-01", "1951-06-01", freq="17D")
+        for dt in dates.to_pydatetime():
+            assert provider.get_call_money_rate(dt) == (
+                _reference_value_for_date(call, dt, 35)
+            )
+            assert provider.get_vix_proxy(dt) == (
+                hs.get_vix_equivalent_from_schwert(dt)
+            )
+            cape = _reference_value_for_date(shiller["cape"], dt, 35)
+            gs10 = _reference_value_for_date(shiller["gs10"], dt, 35)
+            erp = provider.get_equity_risk_premium(dt)
+            if cape is None or gs10 is None:
+                assert erp is None
+            else:
+                assert erp == pytest.approx((1.0 / cape) - gs10 / 100)
+
+            prices = shiller["price"].dropna()
+            past = prices[prices.index <= dt].tail(13)
+            vol = provider.get_realised_vol_from_shiller(dt)
+            if len(past) < 13:
+                assert vol is None
+            else:
+                expected = past.pct_change().dropna().std() * np.sqrt(12) * 100
+                assert vol == pytest.approx(expected)
+
+    def test_batch_matches_scalar(self, hs):
+        provider = hs.HistoricalDataProvider()
+        dates = pd.date_range("1900-01-01", "1940-01-01", freq="11D")
+        batch = provider.get_values_for_dates("govt_short", dates)
+        gs10 = provider.get_values_for_dates("gs10", dates, lookback_days=60)
+        for i, dt in enumerate(dates.to_pydatetime()):
+            scalar = provider.get_short_term_govt_rate(dt)
+            assert (scalar is None) == np.isnan(batch[i])
+            if scalar is not None:
+                assert batch[i] == scalar
+            expected = provider._lookup_df(provider.shiller, "gs10", dt, 60)
+            assert (expected is None) == np.isnan(gs10[i])
+        assert np.isnan(provider.get_values_for_dates("boe_rate", dates)).all()
+        with pytest.raises(ValueError):
+            provider.get_values_for_dates("no_such_series", dates)
+
+    def test_one_provider_per_process(self, hs, monkeypatch):
+        from grri_mac.data.fred import FREDClient
+
+        monkeypatch.setattr(hs, "_provider", None)
+        shared = hs.get_historical_provider()
+        assert FREDClient(api_key="test")._get_historical_provider() is shared
+        assert FREDClient(api_key="test")._get_historical_provider() is shared
+
+        loads = []
+        original = hs.load_nber_series
+        monkeypatch.setattr(
+            hs, "load_nber_series",
+            lambda series_id: loads.append(series_id) or original(series_id),
+        )
+        for dt in pd.date_range("1910-01-01", "1920-01-01", freq="MS"):
+            shared.get_funding_stress_spread(dt.to_pydatetime())
+        assert sorted(loads) == ["m13001", "m13041"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Per-series FRED disk cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestSeriesStore:
+    """Lazy, memory-mapped per-series cache replacing the pickle."""
+
+    def test_round_trip_is_lazy_and_mapped(self, tmp_path, fred_cache):
+        from grri_mac.data.fred import FREDClient
+
+        writer = FREDClient(api_key="test", cache_dir=tmp_path)
+        for sid in ("BAA", "AAA", "DGS10"):
+            writer._bulk_cache[sid] = fred_cache[sid]
+        writer._save_cache_to_disk()
+
+        reader = FREDClient(api_key="test", cache_dir=tmp_path)
+        assert len(reader._bulk_cache) == 3
+        assert reader._bulk_cache.loaded_ids == []
+
+        baa = reader._bulk_cache["BAA"]
+        assert reader._bulk_cache.loaded_ids == ["BAA"]
+        assert isinstance(baa.values.base, np.memmap) or isinstance(
+            baa.values, np.memmap
+        )
+        assert baa.index.equals(fred_cache["BAA"].index)
+        np.testing.assert_array_equal(baa.values, fred_cache["BAA"].values)
+
+    def test_only_dirty_series_rewritten(self, tmp_path, fred_cache):
+        from grri_mac.data.fred import FREDClient
+
+        client = FREDClient(api_key="test", cache_dir=tmp_path)
+        client._bulk_cache["BAA"] = fred_cache["BAA"]
+        client._bulk_cache["AAA"] = fred_cache["AAA"]
+        client._save_cache_to_disk()
+
+        store = client._store
+        aaa_file = store._path("AAA")
+        before = aaa_file.stat().st_mtime_ns
+
+        client = FREDClient(api_key="test", cache_dir=tmp_path)
+        client._bulk_cache["BAA"] = fred_cache["BAA"].iloc[:10]
+        assert client._bulk_cache.flush() == 1
+        assert aaa_file.stat().st_mtime_ns == before
+        assert store.read_manifest()["BAA"]["count"] == 10
+        assert store.read_manifest()["AAA"]["count"] == len(fred_cache["AAA"])
+
+    def test_legacy_pickle_migrated(self, tmp_path, fred_cache):
+        import pickle
+
+        from grri_mac.data.fred import FREDClient, load_disk_cache
+
+        with open(tmp_path / "fred_series_cache.pkl", "wb") as f:
+            pickle.dump({"BAA": fred_cache["BAA"], "bad": [1, 2]}, f)
+
+        client = FREDClient(api_key="test", cache_dir=tmp_path)
+        assert list(client._bulk_cache) == ["BAA"]
+        assert client._store.ids() == ["BAA"]
+        assert set(load_disk_cache(tmp_path)) == {"BAA"}
+
+    def test_concurrent_manifest_updates_kept(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from grri_mac.data.series_store import SeriesStore
+
+        series = pd.Series([1.0, 2.0], index=pd.date_range("2000-01-01", periods=2))
+        ids = [f"S{i}" for i in range(40)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(
+                lambda sid: SeriesStore(tmp_path).write(sid, series), ids,
+            ))
+        assert SeriesStore(tmp_path).ids() == sorted(ids)
+
+    def test_sanitised_ids_do_not_collide(self, tmp_path):
+        from grri_mac.data.series_store import SeriesStore
+
+        store = SeriesStore(tmp_path)
+        index = pd.date_range("2000-01-01", periods=1)
+        for sid, value in (("A/B", 1.0), ("A_B", 2.0), ("A:B", 3.0)):
+            store.write(sid, pd.Series([value], index=index))
+        assert len({store._path(s) for s in ("A/B", "A_B", "A:B")}) == 3
+        assert store.read("A/B").iloc[0] == 1.0
+        assert store.read("A_B").iloc[0] == 2.0
+        assert store.read("A:B").iloc[0] == 3.0
+        assert store._path("VIXCLS").name == "VIXCLS.series.npy"
+
+    def test_series_written_as_one_file(self, tmp_path):
+        from grri_mac.data.series_store import SeriesStore
+
+        store = SeriesStore(tmp_path)
+        index = pd.date_range("2000-01-01", periods=3)
+        dates_path, values_path = store._legacy_paths("X")
+        np.save(dates_path, index.values.view("int64"))
+        np.save(values_path, np.array([1.0, 2.0, 3.0]))
+        assert store.read("X").tolist() == [1.0, 2.0, 3.0]  # legacy pair
+
+        store.write("X", pd.Series([4.0, np.nan], index=index[:2]))
+        assert sorted(p.name for p in tmp_path.glob("*.npy")) == ["X.series.npy"]
+        stored = store.read("X")
+        assert stored.index.equals(index[:2])
+        assert stored.iloc[0] == 4.0 and np.isnan(stored.iloc[1])
+
+    def test_reader_never_sees_mixed_versions(self, tmp_path, monkeypatch):
+        from grri_mac.data import series_store
+        from grri_mac.data.series_store import SeriesStore
+
+        # Same length, different dates: a torn dates/values pair would
+        # pass the shape check but break value == day-of-month
+        old = pd.date_range("2000-01-01", periods=20, freq="D")
+        new = pd.date_range("2001-03-05", periods=20, freq="D")
+        store = SeriesStore(tmp_path)
+        store.write("S", pd.Series(old.day.astype(float), index=old))
+
+        # Read the series after every file the writer publishes
+        seen = []
+        atomic_write = series_store._atomic_write
+
+        def write_then_read(path, write_fn):
+            atomic_write(path, write_fn)
+            if path.suffix == ".npy":
+                seen.append(store.read("S"))
+
+        monkeypatch.setattr(series_store, "_atomic_write", write_then_read)
+        store.write("S", pd.Series(new.day.astype(float), index=new))
+
+        assert seen
+        for data in seen:
+            np.testing.assert_array_equal(data.values, data.index.day)
+        assert seen[-1].index.equals(new)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Concurrent FRED prefetch
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class _StubFRED:
+    """Local stand-in for the FRED series/observations endpoint.
+
+    Serves daily observations for any series ID, returns 429 on the
+    first request for IDs starting with "FLAKY", and 400 for "MISSING".
+    """
+
+    def __init__(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qs, urlparse
+
+        self.requests = []
+        self._seen = set()
+        lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/xml")
+                self.end_headers()
+                self.wfile.write(body.encode())
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                sid = query["series_id"][0]
+                start = query.get("observation_start", ["2000-01-01"])[0]
+                end = query.get("observation_end", ["2000-12-31"])[0]
+                with lock:
+                    stub.requests.append((sid, start, end))
+                    first = sid not in stub._seen
+                    stub._seen.add(sid)
+                if sid == "MISSING":
+                    return self._reply(400, '<error code="400" message='
+                                       '"Bad Request. The series does '
+                                       'not exist."/>')
+                if sid.startswith("FLAKY") and first:
+                    return self._reply(429, '<error code="429" message='
+                                       '"Too Many Requests."/>')
+                rows = "".join(
+                    f'<observation date="{d:%Y-%m-%d}" value="{i}"/>'
+                    for i, d in enumerate(pd.bdate_range(start, end))
+                )
+                self._reply(200, f"<observations>{rows}</observations>")
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/fred"
+        self._thread = threading.Thread(
+            target=self.server.serve_forever, daemon=True,
+        )
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestConcurrentPrefetch:
+    """Thread-pool prefetch with token bucket, retries and gap fetch."""
+
+    @pytest.fixture
+    def stub(self):
+        server = _StubFRED()
+        yield server
+        server.close()
+
+    @pytest.fixture
+    def client(self, stub, tmp_path):
+        from grri_mac.data.fred import FREDClient
+
+        client = FREDClient(
+            api_key="test", cache_dir=tmp_path, api_root=stub.url,
+        )
+        client._retry_base_delay = 0.01
+        return client
+
+    def test_fetches_concurrently_with_retry(self, client, stub):
+        ids = ["AAA", "BAA", "FLAKY1", "FLAKY2", "MISSING"]
+        client.prefetch_series(
+            ids, datetime(2010, 1, 1), datetime(2010, 3, 31), max_workers=4,
+        )
+        for sid in ("AAA", "BAA", "FLAKY1", "FLAKY2"):
+            assert len(client._bulk_cache[sid]) == len(
+                pd.bdate_range("2010-01-01", "2010-03-31")
+            )
+        assert "MISSING" not in client._bulk_cache
+        # 429 retried once; 400 is permanent
+        assert sum(r[0] == "FLAKY1" for r in stub.requests) == 2
+        assert sum(r[0] == "MISSING" for r in stub.requests) == 1
+
+    def test_only_missing_ranges_requested(self, client, stub):
+        client.prefetch_series(
+            ["AAA"], datetime(2010, 3, 1), datetime(2010, 3, 31),
+        )
+        stub.requests.clear()
+        client.prefetch_series(
+            ["AAA"], datetime(2010, 2, 1), datetime(2010, 4, 30),
+        )
+        assert sorted(stub.requests) == [
+            ("AAA", "2010-02-01", "2010-02-28"),
+            ("AAA", "2010-04-01", "2010-04-30"),
+        ]
+        cached = client._bulk_cache["AAA"]
+        assert cached.index.is_monotonic_increasing
+        assert cached.index.min() == pd.Timestamp("2010-02-01")
+        assert cached.index.max() == pd.Timestamp("2010-04-30")
+
+        # Fully covered: no requests, and the merged series hit disk
+        stub.requests.clear()
+        client.prefetch_series(
+            ["AAA"], datetime(2010, 2, 1), datetime(2010, 4, 30),
+        )
+        assert stub.requests == []
+        assert client._store.read_manifest()["AAA"]["count"] == len(cached)
+
+
+class TestTokenBucket:
+    """Token bucket grants bursts, then meters at the refill rate."""
+
+    def test_burst_then_refill(self):
+        from grri_mac.data.rate_limit import TokenBucket
+
+        now = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket.per_minute(
+            120, burst=40, clock=lambda: now[0], sleep=sleep,
+        )
+        waits = [bucket.acquire() for _ in range(120)]
+        assert waits[:40] == [0.0] * 40
+        assert all(w > 0 for w in waits[40:])
+        # 80 refilled tokens at 80/minute take one minute
+        assert now[0] == pytest.approx(60.0)
+        assert not bucket.try_acquire()
+
+    def test_retry_gives_up_on_permanent_error(self):
+        from grri_mac.data.rate_limit import call_with_retry
+
+        calls = []
+
+        def fail():
+            calls.append(1)
+            raise ValueError("Bad Request")
+
+        with pytest.raises(ValueError):
+            call_with_retry(
+                fail, retries=3, sleep=lambda s: None,
+                is_retryable=lambda e: "Bad Request" not in str(e),
+            )
+        assert len(calls) == 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Vectorized bootstrap CIs
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _loop_bootstrap_samples(scores, weights, n_bootstrap, penalty, seed=42):
+    """The original per-iteration bootstrap loop (reference)."""
+    rng = np.random.default_rng(seed)
+    pillars = sorted(scores)
+    base_s = np.array([scores[p] for p in pillars])
+    base_w = np.array([weights.get(p, 1.0 / len(pillars)) for p in pillars])
+    out = np.zeros(n_bootstrap)
+    for b in range(n_bootstrap):
+        s = np.clip(base_s + rng.normal(0, 0.03, len(pillars)), 0.0, 1.0)
+        w = np.maximum(base_w + rng.normal(0, 0.03, len(pillars)), 0.01)
+        w /= w.sum()
+        alpha = max(0.5, min(1.0, rng.normal(0.78, 0.05)))
+        out[b] = max(0.0, min(1.0, max(0.0, float(np.dot(s, w)) - penalty)
+                              * alpha))
+    return out
+
+
+class TestBootstrapBatch:
+    """Matrix bootstrap reproduces the seeded per-iteration loop."""
+
+    SCORES = {
+        "liquidity": 0.6, "valuation": 0.25, "volatility": 0.4,
+        "policy": 0.9, "contagion": 0.5, "private_credit": 0.55,
+    }
+    WEIGHTS = {"liquidity": 0.3, "valuation": 0.2, "volatility": 0.2,
+               "policy": 0.1, "contagion": 0.1}
+
+    def test_scalar_matches_loop(self):
+        from grri_mac.mac.confidence import bootstrap_mac_ci
+
+        result = bootstrap_mac_ci(
+            self.SCORES, self.WEIGHTS, n_bootstrap=500,
+            interaction_penalty=0.03,
+        )
+        samples = _loop_bootstrap_samples(
+            self.SCORES, self.WEIGHTS, 500, 0.03,
+        )
+        assert result.ci_90[0] == pytest.approx(
+            np.percentile(samples, 5), abs=1e-12,
+        )
+        assert result.ci_80[1] == pytest.approx(
+            np.percentile(samples, 90), abs=1e-12,
+        )
+        assert result.bootstrap_std == pytest.approx(
+            np.std(samples), abs=1e-12,
+        )
+
+    def test_batch_rows_match_scalar_calls(self):
+        from grri_mac.mac.confidence import (
+            bootstrap_mac_ci,
+            bootstrap_mac_ci_batch,
+        )
+
+        names = ["volatility", "liquidity", "policy", "valuation",
+                 "contagion", "private_credit"]
+        rng = np.random.default_rng(7)
+        scores = rng.uniform(0, 1, (40, len(names)))
+        scores[rng.uniform(size=scores.shape) < 0.2] = np.nan
+        weights = np.tile([self.WEIGHTS.get(n, np.nan) for n in names],
+                          (40, 1))
+        penalty = rng.choice([0.0, 0.03, 0.08], 40)
+
+        batch = bootstrap_mac_ci_batch(
+            scores, weights, pillar_names=names, n_bootstrap=300,
+            interaction_penalty=penalty, chunk_size=7,
+        )
+        for i in range(40):
+            row = {n: scores[i, j] for j, n in enumerate(names)
+                   if not np.isnan(scores[i, j])}
+            ref = bootstrap_mac_ci(
+                row, self.WEIGHTS, n_bootstrap=300,
+                interaction_penalty=penalty[i],
+            )
+            assert batch.point_estimate[i] == pytest.approx(
+                ref.point_estimate, abs=1e-12,
+            )
+            np.testing.assert_allclose(batch.ci_80[i], ref.ci_80, atol=1e-12)
+            np.testing.assert_allclose(batch.ci_95[i], ref.ci_95, atol=1e-12)
+            assert batch.bootstrap_std[i] == pytest.approx(
+                ref.bootstrap_std, abs=1e-12,
+            )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Momentum tracker
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _reference_lags(history, current_date):
+    """The original dict-based nearest-date search in calculate_momentum."""
+    from datetime import timedelta
+
+    lookup = {d["date"]: d["mac_score"] for d in history}
+
+    def near(target):
+        for delta in range(8):
+            for sign in [0, -1, 1]:
+                key = (target + timedelta(days=delta * sign)).strftime(
+                    "%Y-%m-%d")
+                if key in lookup:
+                    return lookup[key]
+        return None
+
+    return tuple(near(current_date - timedelta(weeks=w)) for w in (1, 2, 4))
+
+
+def _irregular_mac_series(n=300, seed=3):
+    rng = np.random.default_rng(seed)
+    gaps = rng.choice([1, 3, 5, 7, 9, 12], n)
+    dates = pd.Timestamp("2001-01-01") + pd.to_timedelta(
+        np.cumsum(gaps), unit="D")
+    mac = np.clip(0.6 + np.cumsum(rng.normal(0, 0.03, n)), 0, 1)
+    mac[rng.uniform(size=n) < 0.05] = 0.0  # exercise the falsy-lag rule
+    return dates, mac
+
+
+class TestMomentumTracker:
+    def test_tracker_matches_dict_lookup(self):
+        from grri_mac.mac.momentum import MomentumTracker, calculate_momentum
+
+        dates, mac = _irregular_mac_series()
+        tracker = MomentumTracker()
+        history = []
+        for dt, m in zip(dates.to_pydatetime(), mac):
+            got = tracker.update(dt, float(m))
+            ref = calculate_momentum(float(m), history, dt)
+            assert (got.mac_1w_ago, got.mac_2w_ago, got.mac_4w_ago) == \
+                _reference_lags(history, dt)
+            assert got == ref
+            history.append({"date": dt.strftime("%Y-%m-%d"),
+                            "mac_score": float(m)})
+
+    def test_nearest_day_prefers_earlier_and_last_write_wins(self):
+        from grri_mac.mac.momentum import MomentumTracker
+
+        tracker = MomentumTracker()
+        tracker.record(datetime(2020, 1, 6), 0.4)
+        tracker.record(datetime(2020, 1, 8), 0.6)
+        assert tracker.lookup(datetime(2020, 1, 7)) == 0.4
+        tracker.record(datetime(2020, 1, 6, 15), 0.5)
+        assert tracker.lookup(datetime(2020, 1, 7)) == 0.5
+        assert tracker.lookup(datetime(2019, 12, 1)) is None
+
+    def test_from_history_keeps_unordered_entries(self):
+        from grri_mac.mac.momentum import calculate_momentum
+
+        history = [
+            {"date": "2020-03-02", "mac_score": 0.7},
+            {"date": "1995-06-01", "mac_score": 0.2},
+            {"date": "2020-03-16", "mac_score": 0.6},
+        ]
+        result = calculate_momentum(0.5, history, datetime(2020, 3, 30))
+        assert result.mac_4w_ago == 0.7
+        assert result.mac_2w_ago == 0.6
+
+    def test_series_matches_tracker(self):
+        from grri_mac.mac.momentum import (
+            MomentumTracker,
+            calculate_momentum_series,
+        )
+
+        dates, mac = _irregular_mac_series()
+        frame = calculate_momentum_series(dates, mac)
+        tracker = MomentumTracker()
+        for i, (dt, m) in enumerate(zip(dates.to_pydatetime(), mac)):
+            ref = tracker.update(dt, float(m))
+            row = frame.iloc[i]
+            for col, val in [("momentum_1w", ref.momentum_1w),
+                             ("momentum_2w", ref.momentum_2w),
+                             ("momentum_4w", ref.momentum_4w)]:
+                if val is None:
+                    assert np.isnan(row[col])
+                else:
+                    assert row[col] == pytest.approx(val, abs=1e-15)
+            assert row["trend_direction"] == ref.trend_direction
+            assert row["mac_status"] == ref.status.value
+            assert row["is_deteriorating"] == ref.is_deteriorating
+
+    def test_series_same_day_rows_fall_back_to_replay(self):
+        from grri_mac.mac.momentum import (
+            MomentumTracker,
+            calculate_momentum_series,
+        )
+
+        dates = pd.to_datetime([
+            "2020-01-01", "2020-01-08", "2020-01-08", "2020-01-15",
+            "2020-01-29",
+        ])
+        mac = np.array([0.7, 0.6, 0.55, 0.5, 0.45])
+        frame = calculate_momentum_series(dates, mac)
+        tracker = MomentumTracker()
+        expected = [tracker.update(d, m).momentum_1w
+                    for d, m in zip(dates.to_pydatetime(), mac)]
+        got = frame["momentum_1w"].tolist()
+        for e, g in zip(expected, got):
+            assert (np.isnan(g) if e is None else g == pytest.approx(e))
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Parallel date-sharded backtest
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _disk_runner(cache: dict, cache_dir, **kwargs):
+    """BacktestRunner on a per-series disk cache (as workers see it)."""
+    from grri_mac.backtest.runner import BacktestRunner
+    from grri_mac.data.fred import SERIES_CACHE_DIR
+    from grri_mac.data.series_store import SeriesStore
+
+    SeriesStore(cache_dir / SERIES_CACHE_DIR.name).write_many(cache)
+    runner = BacktestRunner(
+        fred_api_key="test", fred_cache_dir=cache_dir, **kwargs,
+    )
+    runner.fred.set_backtest_mode(True)
+    runner._prefetch_fred_data = lambda start, end: None
+    return runner
+
+
+class TestParallelBacktest:
+    def test_shard_dates_contiguous(self):
+        from grri_mac.backtest.parallel import shard_dates
+
+        dates = list(range(10))
+        shards = shard_dates(dates, 3)
+        assert [len(s) for s in shards] == [4, 3, 3]
+        assert sum(shards, []) == dates
+        assert shard_dates(dates[:2], 8) == [[0], [1]]
+
+    def test_matches_iterative(self, fred_cache, tmp_path):
+        start, end = datetime(2003, 1, 1), datetime(2009, 12, 31)
+        expected = _offline_runner(fred_cache).run_backtest(
+            start, end, "monthly",
+        )
+        actual = _disk_runner(fred_cache, tmp_path).run_backtest(
+            start, end, "monthly", engine="parallel", workers=2,
+        )
+        assert len(expected) > 52  # HMM overlay kicks in
+        _assert_frames_match(expected, actual)
+
+    def test_workers_use_parent_thresholds(self, fred_cache, tmp_path):
+        runner = _disk_runner(fred_cache, tmp_path)
+        runner.volatility.THRESHOLDS = {
+            **runner.volatility.THRESHOLDS,
+            "vix_level": {
+                "ample_low": 1000, "ample_high": 1001,
+                "thin_low": 999, "thin_high": 1002,
+                "breach_low": 998, "breach_high": 1003,
+            },
+        }
+        df = runner.run_backtest(
+            datetime(2005, 1, 1), datetime(2006, 12, 31), "monthly",
+            engine="parallel", workers=2,
+        )
+        assert len(df) > 0
+        assert (df["volatility"] == 0.0).all()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Vectorized Monte Carlo
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestMonteCarloEngine:
+    PILLARS = {
+        "liquidity": 0.55, "valuation": 0.58, "positioning": 0.36,
+        "volatility": 0.55, "policy": 0.65, "contagion": 0.60,
+    }
+
+    def test_matches_iterative_distribution(self):
+        from grri_mac.predictive.monte_carlo import (
+            MonteCarloSimulator, ShockType,
+        )
+
+        n = 20000
+        loop = MonteCarloSimulator(seed=3).run_simulation(
+            self.PILLARS, ShockType.POSITIONING, 2.0, n, engine="iterative",
+        )
+        vec = MonteCarloSimulator(seed=3).run_simulation(
+            self.PILLARS, ShockType.POSITIONING, 2.0, n, engine="vectorized",
+        )
+        assert vec["initial_mac"] == loop["initial_mac"]
+        for group, key in [
+            ("mac_change", "mean"), ("final_mac", "mean"),
+            ("hedge_failure_prob", "mean"), ("max_drawdown_pct", "mean"),
+            ("recovery_days", "mean"),
+        ]:
+            a = loop["statistics"][group]
+            b = vec["statistics"][group]
+            # Within ~5 standard errors of the loop's estimate
+            assert abs(a[key] - b[key]) < 5 * a["std"] / np.sqrt(n) + 1e-12
+            assert b["std"] == pytest.approx(a["std"], rel=0.05)
+        assert vec["regime_transition_rate"] == pytest.approx(
+            loop["regime_transition_rate"], abs=0.02,
+        )
+
+    def test_chunked_statistics_match_single_batch(self):
+        from grri_mac.predictive.monte_carlo import (
+            MonteCarloSimulator, ShockScenario, ShockType, _PathStatistics,
+        )
+
+        sim = MonteCarloSimulator(seed=5)
+        batch = sim._simulate_paths(
+            self.PILLARS, ShockScenario(ShockType.COMBINED, 1.5), 5000,
+        )
+        whole = _PathStatistics()
+        whole.update(batch)
+        chunked = _PathStatistics()
+        for lo in range(0, 5000, 1234):
+            chunked.update({
+                k: v[lo:lo + 1234] if isinstance(v, np.ndarray) else v
+                for k, v in batch.items()
+            })
+        a, b = whole.statistics(), chunked.statistics()
+        for group in a:
+            for key in a[group]:
+                assert b[group][key] == pytest.approx(a[group][key],
+                                                      rel=1e-10, abs=1e-12)
+        assert chunked.transition_sample == whole.transition_sample
+
+        # Order statistics follow sorted(values)[int(n * q)]
+        values = sorted(batch["mac_change"])
+        assert a["mac_change"]["percentile_5"] == values[int(5000 * 0.05)]
+
+    def test_seeded_runs_reproducible(self):
+        from grri_mac.predictive.monte_carlo import MonteCarloSimulator
+
+        a = MonteCarloSimulator(seed=9).run_simulation(
+            n_simulations=3000, engine="vectorized", chunk_size=700)
+        b = MonteCarloSimulator(seed=9).run_simulation(
+            n_simulations=3000, engine="vectorized", chunk_size=700)
+        assert a["statistics"] == b["statistics"]
+        assert a["n_simulations"] == 3000
+        with pytest.raises(ValueError):
+            MonteCarloSimulator().run_simulation(engine="gpu")
+
+    def test_percentiles_bounded_memory(self):
+        from grri_mac.predictive.monte_carlo import _QuantileSketch
+
+        rng = np.random.default_rng(2)
+        values = rng.normal(0, 0.2, 60000)
+        sketch = _QuantileSketch(-1.0, 1.0, exact_limit=10000, bins=4096)
+        for lo in range(0, len(values), 7000):
+            sketch.update(values[lo:lo + 7000])
+        assert sketch._chunks == []
+        assert sketch._counts.sum() == len(values)
+        for q in (0.05, 0.5, 0.95):
+            exact = sorted(values)[int(len(values) * q)]
+            assert abs(sketch.quantile(q) - exact) <= 2.0 / 4096
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Shared threshold kernel
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _ladder_simple(value, ample, thin, breach, lower_is_better=True):
+    """The branch ladder the threshold kernel replaced."""
+    if lower_is_better:
+        if value <= ample:
+            return 1.0
+        if value <= thin:
+            return 1.0 - (value - ample) / (thin - ample) * 0.5
+        if value <= breach:
+            return 0.5 - (value - thin) / (breach - thin) * 0.5
+        return 0.0
+    if value >= ample:
+        return 1.0
+    if value >= thin:
+        return 1.0 - (ample - value) / (ample - thin) * 0.5
+    if value >= breach:
+        return 0.5 - (thin - value) / (thin - breach) * 0.5
+    return 0.0
+
+
+def _random_frame(columns, n=120, seed=11, nan_frac=0.3):
+    """Random indicator frame: {column: (low, high)}, some cells NaN."""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for name, (low, high) in columns.items():
+        values = rng.uniform(low, high, n)
+        values[rng.random(n) < nan_frac] = np.nan
+        data[name] = values
+    return pd.DataFrame(data)
+
+
+def _as_kwargs(row):
+    return {k: (None if pd.isna(v) else v) for k, v in row.items()}
+
+
+class TestThresholdKernel:
+    """Compiled curves reproduce the scalar ladders."""
+
+    def test_one_sided_matches_ladder(self):
+        from grri_mac.mac.threshold_kernel import ThresholdCurve
+
+        values = np.linspace(-100, 400, 251)
+        for thresholds, lower in (((20, 50, 100), True),
+                                  ((150, 50, 25), False)):
+            curve = ThresholdCurve.one_sided(*thresholds, lower_is_better=lower)
+            batch = curve.score(values)
+            for v, b in zip(values, batch):
+                expected = _ladder_simple(v, *thresholds, lower_is_better=lower)
+                assert b == pytest.approx(expected)
+                assert curve(v) == pytest.approx(expected)
+        assert np.isnan(curve.score(np.array([np.nan]))[0])
+
+    def test_out_of_order_breakpoints_collapse(self):
+        from grri_mac.mac.threshold_kernel import ThresholdCurve
+
+        # Breach defaulted below thin: the thin step goes straight to 0
+        curve = ThresholdCurve([10, 40, 30], [1.0, 0.5, 0.0])
+        assert curve(10) == 1.0
+        assert curve(25) == pytest.approx(0.75)
+        assert curve(40) == 0.0
+        with pytest.raises(ValueError):
+            ThresholdCurve([1.0], [1.0])
+
+    def test_scalar_call_matches_interp(self):
+        from grri_mac.mac.threshold_kernel import ThresholdCurve
+
+        rng = np.random.default_rng(5)
+        grid = np.array([-50, -10, 0, 5, 10, 25, 40, 100], dtype=float)
+        for _ in range(500):
+            k = int(rng.integers(2, 8))
+            curve = ThresholdCurve(rng.choice(grid, size=k), rng.random(k))
+            values = np.concatenate([
+                rng.uniform(-80, 120, 10), grid, [np.inf, -np.inf, np.nan],
+            ])
+            np.testing.assert_array_equal(
+                [curve(v) for v in values], curve.score(values),
+            )
+
+    def test_api_copy_matches(self):
+        root = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(root, "grri_mac", "mac",
+                               "threshold_kernel.py"), "rb") as f:
+            source = f.read()
+        with open(os.path.join(root, "api", "shared",
+                               "threshold_kernel.py"), "rb") as f:
+            copy = f.read()
+        assert copy == source, (
+            "api/shared/threshold_kernel.py drifted from "
+            "grri_mac/mac/threshold_kernel.py"
+        )
+
+    def test_score_steps_sides(self):
+        from grri_mac.mac.threshold_kernel import score_steps
+
+        values = np.array([-1.0, 0.0, 5.0, 10.0, 11.0, np.nan])
+        left = score_steps(values, [0, 10], [1.0, 0.5, 0.0])
+        right = score_steps(values, [0, 10], [1.0, 0.5, 0.0], side="right")
+        np.testing.assert_array_equal(left[:5], [1.0, 1.0, 0.5, 0.5, 0.0])
+        np.testing.assert_array_equal(right[:5], [1.0, 0.5, 0.5, 0.0, 0.0])
+        assert np.isnan(left[5]) and np.isnan(right[5])
+        with pytest.raises(ValueError):
+            score_steps(values, [0, 10], [1.0, 0.5])
+
+    def test_inverted_indicator_thresholds(self):
+        from grri_mac.mac.scorer import IndicatorThresholds, score_indicator
+
+        t = IndicatorThresholds(
+            ample_low=-100, thin_low=-50, breach_low=0, invert=True,
+        )
+        for v in np.linspace(-150, 50, 101):
+            assert score_indicator(v, t) == pytest.approx(
+                _ladder_simple(-v, 100, 50, 0, lower_is_better=False),
+            )
+        # Scoring must not mutate the thresholds any more
+        assert (t.ample_low, t.thin_low, t.breach_low) == (-100, -50, 0)
+        assert score_indicator(1.0, IndicatorThresholds()) == 0.5
+
+    def test_api_scorer_matches_ladders(self):
+        from api.shared.mac_scorer import (
+            score_contagion,
+            score_indicator_range,
+            score_indicator_simple,
+            score_private_credit,
+            score_volatility,
+        )
+
+        for v in np.linspace(0, 120, 61):
+            assert score_indicator_simple(v, 15, 40, 80) == pytest.approx(
+                _ladder_simple(v, 15, 40, 80),
+            )
+            expected = (
+                1.0 if 12 <= v <= 18
+                else max(0.5, 1.0 - (12 - v) / 12) if v < 12
+                else _ladder_simple(v, 18, 28, 40)
+            )
+            assert score_indicator_range(v, 12, 18, 28, 40) == pytest.approx(
+                expected,
+            )
+
+        # Floor-at-0.2 curve and step ladders
+        assert score_volatility({"vvix": 110})[0] == pytest.approx(0.35)
+        assert score_volatility({"vvix": 200})[0] == pytest.approx(0.2)
+        assert score_contagion({"ig_oas_bps": 120})[0] == 0.75
+        assert score_contagion({"ig_oas_bps": 121})[0] == 0.5
+        assert score_private_credit({"hy_oas_bps": 650})[0] == 0.25
+        assert score_private_credit({"hf_leverage_ratio": 21.5})[0] == (
+            pytest.approx(0.35)
+        )
+
+
+class TestPillarBatchScoring:
+    """Each pillar's calculate_batch equals calculate row by row."""
+
+    def _check(self, batch, scalars, columns):
+        for i, scores in enumerate(scalars):
+            for column in columns:
+                assert batch[column].iloc[i] == pytest.approx(
+                    getattr(scores, column)
+                ), (i, column)
+
+    def test_liquidity_volatility_positioning(self):
+        from grri_mac.pillars.liquidity import (
+            LiquidityIndicators,
+            LiquidityPillar,
+        )
+        from grri_mac.pillars.positioning import (
+            PositioningIndicators,
+            PositioningPillar,
+        )
+        from grri_mac.pillars.volatility import (
+            VolatilityIndicators,
+            VolatilityPillar,
+        )
+
+        cases = (
+            (LiquidityPillar(), LiquidityIndicators, {
+                "sofr_iorb_spread_bps": (-10, 80),
+                "cp_treasury_spread_bps": (0, 150),
+                "cross_currency_basis_bps": (-80, 10),
+                "treasury_bid_ask_32nds": (0, 4),
+            }),
+            (VolatilityPillar(), VolatilityIndicators, {
+                "vix_level": (8, 70),
+                "vix_term_structure": (0.7, 1.3),
+                "realized_vol": (5, 60),
+                "implied_vol": (0, 60),
+            }),
+            (PositioningPillar(), PositioningIndicators, {
+                "basis_trade_size_billions": (100, 1200),
+                "treasury_spec_net_percentile": (0, 100),
+                "svxy_aum_millions": (100, 2000),
+                "total_treasury_oi_billions": (500, 3000),
+            }),
+        )
+        for pillar, indicators_cls, columns in cases:
+            frame = _random_frame(columns)
+            batch = pillar.calculate_batch(frame)
+            scalars = [
+                pillar.calculate(indicators_cls(**_as_kwargs(row)))
+                for _, row in frame.iterrows()
+            ]
+            self._check(batch, scalars, ["composite"])
+
+    def test_valuation_sequential_history(self):
+        from grri_mac.pillars.valuation import (
+            ValuationIndicators,
+            ValuationPillar,
+        )
+
+        frame = _random_frame({
+            "term_premium_10y_bps": (-50, 250),
+            "ig_oas_bps": (50, 300),
+            "hy_oas_bps": (250, 900),
+        }, n=90, nan_frac=0.1)
+        batch = ValuationPillar().calculate_batch(frame)
+        pillar = ValuationPillar()
+        scalars = [
+            pillar.calculate(ValuationIndicators(**_as_kwargs(row)))
+            for _, row in frame.iterrows()
+        ]
+        self._check(batch, scalars, ["composite"])
+
+    def test_policy_with_era_caps(self):
+        from grri_mac.pillars.policy import PolicyIndicators, PolicyPillar
+
+        frame = _random_frame({
+            "policy_room_bps": (0, 600),
+            "fed_balance_sheet_gdp_pct": (5, 45),
+            "core_pce_vs_target_bps": (-150, 250),
+            "debt_to_gdp_pct": (20, 140),
+            "gold_reserve_ratio": (0.2, 0.6),
+            "forward_inflation_expectations_bps": (100, 350),
+        })
+        rng = np.random.default_rng(5)
+        frame["observation_date"] = pd.to_datetime("1900-01-01") + pd.to_timedelta(
+            rng.integers(0, 45000, len(frame)), unit="D",
+        )
+        pillar = PolicyPillar()
+        batch = pillar.calculate_batch(frame)
+        scalars = []
+        for _, row in frame.iterrows():
+            kwargs = _as_kwargs(row)
+            kwargs["observation_date"] = row["observation_date"].to_pydatetime()
+            scalars.append(pillar.calculate(PolicyIndicators(**kwargs)))
+        self._check(batch, scalars, ["policy_room", "composite"])
+        assert (batch["composite_method"] == [
+            s.composite_method for s in scalars
+        ]).all()
+
+    def test_contagion_regimes(self):
+        from grri_mac.pillars.contagion import (
+            ContagionIndicators,
+            ContagionPillar,
+        )
+
+        frame = _random_frame({
+            "eur_usd_basis_bps": (-90, 5),
+            "jpy_usd_basis_bps": (-90, 5),
+            "fx_reserves_usd_billions": (0, 500),
+            "short_term_external_debt_usd_billions": (0, 300),
+            "cross_border_flow_change_billions": (-3000, 3000),
+            "world_gdp_trillions": (0, 110),
+            "financial_oas_bps": (50, 600),
+            "bkx_volatility_pct": (0, 80),
+            "btc_spy_correlation": (-0.2, 0.9),
+        })
+        years = np.random.default_rng(2).integers(2000, 2025, len(frame))
+        frame["indicator_date"] = [f"{y}-06-30" for y in years]
+        pillar = ContagionPillar()
+        batch = pillar.calculate_batch(frame)
+        scalars = [
+            pillar.calculate(ContagionIndicators(**_as_kwargs(row)))
+            for _, row in frame.iterrows()
+        ]
+        self._check(batch, scalars, ["gsib_stress", "composite"])
+
+    def test_private_credit_fixed_weight(self):
+        from grri_mac.pillars.private_credit import (
+            BDCData,
+            LeveragedLoanData,
+            PEFirmData,
+            PrivateCreditIndicators,
+            PrivateCreditPillar,
+            SLOOSData,
+        )
+
+        groups = {
+            SLOOSData: {
+                "ci_standards_small": (-20, 70),
+                "spreads_small": (-20, 70),
+                "ci_standards_large": (-20, 70),
+            },
+            BDCData: {
+                f"{t}_discount": (-40, 10)
+                for t in ("arcc", "main", "fsk", "psec", "gbdc")
+            },
+            LeveragedLoanData: {
+                "bkln_price_change_30d": (-15, 3),
+                "srln_price_change_30d": (-15, 3),
+            },
+            PEFirmData: {
+                f"{t}_change_30d": (-40, 10)
+                for t in ("kkr", "bx", "apo", "cg")
+            },
+        }
+        frame = _random_frame(
+            {k: v for cols in groups.values() for k, v in cols.items()},
+            nan_frac=0.4,
+        )
+        pillar = PrivateCreditPillar()
+        batch = pillar.calculate_batch(frame)
+        fields = ("sloos", "bdc", "leveraged_loans", "pe_firms")
+        for i, (_, row) in enumerate(frame.iterrows()):
+            kwargs = _as_kwargs(row)
+            indicators = PrivateCreditIndicators(**{
+                field: cls(**{k: kwargs[k] for k in cols})
+                for field, (cls, cols) in zip(fields, groups.items())
+            })
+            scores = pillar.calculate_scores(indicators)
+            for column in ("sloos_score", "bdc_score",
+                           "leveraged_loan_score", "pe_firm_score",
+                           "composite"):
+                assert batch[column].iloc[i] == pytest.approx(
+                    getattr(scores, column)
+                ), (i, column)
+            assert batch["stress_level"].iloc[i] == scores.stress_level.value
+
+    def test_sentiment_proxy(self):
+        from grri_mac.pillars.sentiment import SentimentPillar
+
+        pillar = SentimentPillar()
+        dates = pd.to_datetime(["1950-01-01", "1999-01-01", "2008-01-01"])
+        frame = pd.DataFrame({
+            "proxy_score": [0.9, 1.3, np.nan], "observation_date": dates,
+        })
+        batch = pillar.calculate_batch(frame)
+        assert batch["method"].tolist() == ["pre_data", "rate_proxy", "no_texts"]
+        assert batch["composite_score"].tolist() == [0.5, 1.0, 0.5]
+        expected = pillar.score_from_proxy(1.3, dates[1].to_pydatetime())
+        assert batch["dovish_pct"].iloc[1] == pytest.approx(
+            expected.dovish_pct,
+        )
+
+    def test_scalar_helpers_keep_ladder_values(self):
+        from grri_mac.pillars.contagion import ContagionPillar
+        from grri_mac.pillars.policy import PolicyPillar
+        from grri_mac.pillars.volatility import VolatilityPillar
+
+        contagion = ContagionPillar()
+        assert contagion.score_cross_currency_basis([-20, 25]) == (
+            pytest.approx(0.275)
+        )
+        assert contagion.score_cross_currency_basis([]) == 0.5
+        assert contagion.score_reserve_coverage(250) == pytest.approx(0.1)
+        assert contagion.score_reserve_coverage(112.5) == pytest.approx(0.5)
+        assert contagion.score_reserve_coverage(50) == 1.0
+        assert contagion.score_cross_border_flows(0.0) == pytest.approx(0.2)
+        assert contagion.score_cross_border_flows(-1.5) == pytest.approx(0.5)
+        assert contagion.score_cross_border_flows(6.0) == pytest.approx(0.825)
+        assert contagion.score_crypto_correlation(0.6) == pytest.approx(0.35)
+        assert contagion.score_crypto_correlation(0.9) == pytest.approx(0.2)
+        assert contagion.score_gsib_stress(150, date_str="2005-01-01") == (
+            pytest.approx(0.75)
+        )
+        assert contagion.score_gsib_stress(bkx_volatility=None) == 0.5
+
+        assert PolicyPillar().score_policy_room(100) == pytest.approx(0.75)
+        volatility = VolatilityPillar()
+        assert volatility.score_rv_iv_gap(30, 20) == pytest.approx(0.25)
+        assert volatility.score_rv_iv_gap(30, 0) == 0.5
+
+    def test_nan_input_is_missing_in_calculate(self):
+        from grri_mac.pillars.liquidity import (
+            LiquidityIndicators,
+            LiquidityPillar,
+        )
+
+        pillar = LiquidityPillar()
+        with_nan = pillar.calculate(LiquidityIndicators(
+            sofr_iorb_spread_bps=float("nan"), cp_treasury_spread_bps=35,
+        ))
+        without = pillar.calculate(LiquidityIndicators(cp_treasury_spread_bps=35))
+        assert with_nan.sofr_iorb == 0.5
+        assert with_nan.composite == without.composite == pytest.approx(0.75)
+
+    def test_private_credit_warnings_follow_scores(self):
+        from grri_mac.pillars.private_credit import (
+            BDCData,
+            PEFirmData,
+            PrivateCreditPillar,
+            SLOOSData,
+        )
+
+        pillar = PrivateCreditPillar()
+        score, warnings = pillar.score_sloos(SLOOSData(
+            ci_standards_small=65, spreads_small=35, ci_standards_large=10,
+        ))
+        assert score == pytest.approx((0.1 + 0.3 + 0.8) / 3)
+        assert [w.split(":")[0] for w in warnings] == ["SEVERE", "ELEVATED"]
+        score, warnings = pillar.score_bdc(BDCData(
+            arcc_discount=-30, main_discount=-10,
+        ))
+        assert score == 0.3
+        assert warnings[0].startswith("ELEVATED")
+        assert warnings[1].startswith("WARNING: ARCC")
+        assert pillar.score_pe_firms(PEFirmData()) == (0.5, [])
+        assert pillar.score_pe_firms(PEFirmData(kkr_change_30d=-30))[0] == 0.2
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Single-pass precision-recall sweep
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _loop_pr_counts(weekly_data, windows, tau):
+    """The original per-τ signal rebuild and window × week scan."""
+    from grri_mac.backtest.precision_recall import _is_in_any_window
+
+    signals = [
+        d["mac_score"] < tau or d.get("is_deteriorating", False)
+        or d.get("mac_status", "") in ("DETERIORATING", "STRETCHED", "CRITICAL")
+        for d in weekly_data
+    ]
+    tp = sum(
+        any(s and w.lead_start <= d["date"] <= w.window_end
+            for d, s in zip(weekly_data, signals))
+        for w in windows
+    )
+    fp = sum(
+        s and not _is_in_any_window(d["date"], windows)
+        for d, s in zip(weekly_data, signals)
+    )
+    return tp, fp, sum(signals)
+
+
+def _random_weekly_data(n=400, seed=8):
+    from datetime import timedelta
+
+    rng = np.random.default_rng(seed)
+    base = datetime(1995, 1, 6)
+    rows = []
+    for i in rng.permutation(n):  # deliberately unsorted
+        mac = float(np.round(rng.uniform(0.1, 0.9), 2))
+        rows.append({
+            "date": base + timedelta(weeks=int(i)),
+            "mac_score": mac,
+            "mac_status": rng.choice(["COMFORTABLE", "CAUTIOUS", "STRETCHED"],
+                                     p=[0.6, 0.35, 0.05]),
+            "is_deteriorating": bool(rng.random() < 0.03),
+        })
+    events = [
+        (f"E{k}", base + timedelta(weeks=int(w)))
+        for k, w in enumerate(rng.integers(-5, n + 5, 12))
+    ]
+    return rows, events
+
+
+class TestPrecisionRecallSweep:
+    """Cumulative sweep matches the per-τ loop it replaces."""
+
+    def test_matches_loop(self):
+        from grri_mac.backtest.precision_recall import (
+            build_crisis_windows,
+            compute_precision_recall_curve,
+        )
+
+        rows, events = _random_weekly_data()
+        report = compute_precision_recall_curve(rows, events)
+        windows = build_crisis_windows(events)
+        assert len(report.curve) == 71
+        for pt in report.curve:
+            assert (pt.tp, pt.fp, pt.signal_weeks) == _loop_pr_counts(
+                rows, windows, pt.tau,
+            ), pt.tau
+        flags = [
+            any(w.lead_start <= d["date"] <= w.window_end for w in windows)
+            for d in rows
+        ]
+        assert report.crisis_weeks == sum(flags)
+
+    def test_continuous_grid_and_bands(self):
+        from grri_mac.backtest.precision_recall import (
+            compute_precision_recall_curve,
+            export_precision_recall_json,
+        )
+
+        rows, events = _random_weekly_data(seed=9)
+        taus = np.linspace(0.1, 0.8, 1401)
+        report = compute_precision_recall_curve(
+            rows, events, taus=taus, n_bootstrap=300,
+        )
+        assert len(report.curve) == 1401
+        recalls = [pt.recall for pt in report.curve]
+        assert recalls == sorted(recalls)
+
+        bands = report.bands
+        assert bands is not None and len(bands.taus) == 1401
+        for lo, hi in zip(bands.recall_low, bands.recall_high):
+            assert lo <= hi
+        assert np.all(np.diff(bands.fp_per_year_high) >= -1e-9)
+        assert "bands" in export_precision_recall_json(report)
+
+        again = compute_precision_recall_curve(
+            rows, events, taus=taus, n_bootstrap=300,
+        )
+        assert again.bands.precision_low == bands.precision_low
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Crisis calendar index
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestCrisisCalendar:
+    """Interval index agrees with the linear catalogue scans."""
+
+    def test_point_and_range_match_scan(self):
+        from grri_mac.backtest.crisis_events import (
+            CRISIS_EVENTS,
+            get_crises_for_dates,
+            get_crises_in_range,
+            get_crisis_for_date,
+        )
+
+        dates = pd.date_range("1905-01-01", "2026-01-01", freq="5D")
+        batch = get_crises_for_dates(dates.values)
+        for date, from_batch in zip(dates.to_pydatetime(), batch):
+            expected = next(
+                (c for c in CRISIS_EVENTS
+                 if c.start_date <= date <= c.end_date), None,
+            )
+            assert get_crisis_for_date(date) is expected
+            assert from_batch is expected
+
+        # End dates are inclusive
+        last = CRISIS_EVENTS[-1]
+        assert get_crisis_for_date(last.end_date) is not None
+
+        rng = np.random.default_rng(4)
+        for _ in range(200):
+            a, b = sorted(rng.choice(dates.to_pydatetime(), 2))
+            expected = [
+                c for c in CRISIS_EVENTS
+                if c.start_date <= b and c.end_date >= a
+            ]
+            assert get_crises_in_range(a, b) == expected
+
+    def test_lead_windows_and_labels(self):
+        from datetime import timedelta
+
+        from grri_mac.backtest.crisis_events import CrisisCalendar
+
+        calendar = CrisisCalendar([
+            (datetime(2020, 3, 1), datetime(2020, 3, 31), "A"),
+            (datetime(2020, 3, 15), datetime(2020, 5, 1), "B"),
+        ], lead_time=timedelta(days=10))
+        assert calendar.window_at(datetime(2020, 3, 20)) == 0
+        assert calendar.window_at(datetime(2020, 4, 5)) == 1
+        assert calendar.window_at(datetime(2020, 2, 25)) is None
+        assert calendar.contains(datetime(2020, 2, 25), include_lead=True)
+        assert not calendar.contains(datetime(2020, 2, 19), include_lead=True)
+        assert calendar.overlapping(
+            datetime(2020, 4, 1), datetime(2020, 4, 2),
+        ) == [1]
+
+        labels = calendar.label(pd.to_datetime([
+            "2020-01-01", "2020-02-25", "2020-03-31", "2020-05-02",
+        ]))
+        assert labels["crisis"].tolist() == [None, None, "A", None]
+        assert labels["in_lead"].tolist() == [False, True, False, False]
+        assert labels["in_window"].tolist() == [False, False, True, False]
+
+        empty = CrisisCalendar([])
+        assert not empty.mask([datetime(2020, 1, 1)]).any()
+        assert empty.overlapping(datetime(2020, 1, 1), datetime(2021, 1, 1)) == []
+
+    def test_nested_windows_match_brute_force(self):
+        from datetime import timedelta
+
+        from grri_mac.backtest.crisis_events import CrisisCalendar
+
+        rng = np.random.default_rng(11)
+        base = datetime(2000, 1, 1)
+        windows = []
+        for i in range(60):
+            start = base + timedelta(days=int(rng.integers(0, 3000)))
+            length = int(rng.choice([0, 5, 40, 900]))  # long windows nest
+            windows.append((start, start + timedelta(days=length), f"W{i}"))
+        lead = timedelta(days=30)
+        calendar = CrisisCalendar(windows, lead_time=lead)
+
+        dates = [base + timedelta(days=int(d)) for d in range(-60, 4000, 7)]
+        labels = calendar.label(dates)
+        for row, date in zip(labels.itertuples(), dates):
+            covering = [i for i, (s, e, _) in enumerate(windows) if s <= date <= e]
+            assert row.window == (covering[0] if covering else -1)
+            assert row.in_window == bool(covering)
+            assert row.in_lead == any(s - lead <= date < s for s, _, _ in windows)
+
+        for _ in range(200):
+            a, b = sorted(rng.choice(dates, 2))
+            assert calendar.overlapping(a, b) == [
+                i for i, (s, e, _) in enumerate(windows) if s <= b and e >= a
+            ]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Regime HMM forward filter
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _two_state_hmm(**config):
+    """RegimeHMM with fixed 2-state parameters over the 7 pillars."""
+    from grri_mac.mac.regime_hmm import RegimeHMM, RegimeHMMConfig
+
+    hmm = RegimeHMM(RegimeHMMConfig(**config))
+    d = len(hmm.config.pillar_order)
+    hmm.set_params(
+        startprob=[0.5, 0.5],
+        transmat=[[0.95, 0.05], [0.10, 0.90]],
+        means=np.vstack([np.full(d, 0.7), np.full(d, 0.3)]),
+        covars=np.stack([0.02 * np.eye(d), 0.03 * np.eye(d)]),
+    )
+    return hmm
+
+
+def _regime_switching_scores(n, seed=0):
+    """Pillar score dicts alternating between calm and fragile spells."""
+    from grri_mac.mac.regime_hmm import RegimeHMMConfig
+
+    rng = np.random.default_rng(seed)
+    pillars = RegimeHMMConfig().pillar_order
+    level = np.where((np.arange(n) // 20) % 2 == 0, 0.7, 0.3)
+    values = level[:, None] + rng.normal(0, 0.12, (n, len(pillars)))
+    return [dict(zip(pillars, row)) for row in values]
+
+
+class TestRegimeHMMFilter:
+    """NumPy forward filter, forward–backward and streaming updates."""
+
+    def test_forward_matches_brute_force(self):
+        from scipy.stats import multivariate_normal
+
+        hmm = _two_state_hmm()
+        history = _regime_switching_scores(30)
+        X = hmm._matrix(history)
+
+        # Unnormalised forward recursion with scipy densities
+        b = np.column_stack([
+            multivariate_normal(hmm._means[k], cov).pdf(X)
+            for k, cov in enumerate([
+                0.02 * np.eye(7), 0.03 * np.eye(7),
+            ])
+        ])
+        alpha = hmm._startprob * b[0]
+        expected = [alpha / alpha.sum()]
+        loglik = np.log(alpha.sum())
+        for t in range(1, len(X)):
+            alpha = (expected[-1] @ hmm._transmat) * b[t]
+            loglik += np.log(alpha.sum())
+            expected.append(alpha / alpha.sum())
+
+        alphas, ll = hmm._forward(hmm._log_emissions(X))
+        np.testing.assert_allclose(alphas, np.array(expected), atol=1e-10)
+        assert ll == pytest.approx(loglik, rel=1e-9)
+
+    def test_smoothed_posteriors(self):
+        hmm = _two_state_hmm()
+        history = _regime_switching_scores(120, seed=1)
+        log_b = hmm._log_emissions(hmm._matrix(history))
+        gammas = hmm._forward_backward(log_b)
+        np.testing.assert_allclose(gammas.sum(axis=1), 1.0)
+
+        # Last smoothed posterior is the last filtered one
+        alphas, _ = hmm._forward(log_b)
+        np.testing.assert_allclose(gammas[-1], alphas[-1])
+
+        probs = hmm.fragile_probabilities(history)
+        fragile_spell = (np.arange(120) // 20) % 2 == 1
+        assert probs[fragile_spell].mean() > 0.9
+        assert probs[~fragile_spell].mean() < 0.1
+        path = hmm._viterbi(log_b) == hmm._fragile_state_idx
+        assert (path == fragile_spell).mean() > 0.9
+
+    def test_streaming_update_matches_batch_filter(self):
+        hmm = _two_state_hmm(min_observations=1)
+        history = _regime_switching_scores(80, seed=2)
+        streamed = [hmm.update(s).fragile_prob for s in history]
+        batch = hmm.fragile_probabilities(history, smoothed=False)
+        np.testing.assert_allclose(streamed, batch, atol=1e-12)
+
+        last = hmm.update(history[0])
+        assert last.method == "hmm_filter"
+        assert last.regime in ("fragile", "normal")
+
+    def test_refit_schedule(self, monkeypatch):
+        from grri_mac.mac.regime_hmm import RegimeHMM
+
+        fits = []
+
+        def fake_fit(self, X):
+            fits.append(len(X))
+            return self._fit_threshold(X)
+
+        monkeypatch.setattr(RegimeHMM, "_fit_hmmlearn", fake_fit)
+        monkeypatch.setattr("grri_mac.mac.regime_hmm._HMM_AVAILABLE", True)
+
+        from grri_mac.mac.regime_hmm import RegimeHMMConfig
+
+        hmm = RegimeHMM(RegimeHMMConfig(min_observations=20,
+                                        refit_interval=10))
+        results = [hmm.update(s) for s in _regime_switching_scores(45)]
+        assert results[18] is None and results[19] is not None
+        assert fits == [20, 30, 40]
+
+        # A fit made on the old stream goes with it; an explicit fit stays
+        hmm.reset_filter()
+        assert not hmm.is_fitted
+        assert hmm.update(_regime_switching_scores(1)[0]) is None
+        hmm.fit(_regime_switching_scores(30))
+        hmm.reset_filter()
+        assert hmm.is_fitted
+
+    def test_failed_fits_advance_schedule(self, monkeypatch):
+        from grri_mac.mac.regime_hmm import RegimeHMM, RegimeHMMConfig
+
+        attempts = []
+
+        def failing_fit(self, X):
+            attempts.append(len(X))
+            return len(attempts) == 2
+
+        monkeypatch.setattr(RegimeHMM, "_fit_hmmlearn", failing_fit)
+        monkeypatch.setattr("grri_mac.mac.regime_hmm._HMM_AVAILABLE", True)
+
+        # Never fitted: retry every min_observations, not every update
+        hmm = RegimeHMM(RegimeHMMConfig(min_observations=20))
+        for s in _regime_switching_scores(50):
+            hmm.update(s)
+        assert attempts == [20, 40]
+
+        # Fitted, refit fails: the next refit still waits refit_interval
+        def first_fit_only(self, X):
+            attempts.append(len(X))
+            return len(attempts) == 1 and self._fit_threshold(X)
+
+        attempts.clear()
+        monkeypatch.setattr(RegimeHMM, "_fit_hmmlearn", first_fit_only)
+        hmm = RegimeHMM(RegimeHMMConfig(min_observations=20,
+                                        refit_interval=10))
+        for s in _regime_switching_scores(45):
+            hmm.update(s)
+        assert attempts == [20, 30, 40]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Recursive Kalman VRP
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _vix_path(n, seed=0):
+    """Synthetic VIX levels and fat-tailed daily returns."""
+    rng = np.random.default_rng(seed)
+    vix = np.abs(20 + np.cumsum(rng.normal(0, 1, n)) * 0.3) + 5
+    return vix, rng.standard_t(4, n) * 0.01
+
+
+def _recompute_vrp(estimator, vix, rets, lookback=252):
+    """Old per-date path: window moments, scalar filter from the prior."""
+    window = list(vix[-lookback:])
+    changes = np.diff(window)
+    skew = None
+    if len(changes) > 30:
+        skew = float(np.mean(((changes - changes.mean()) / changes.std()) ** 3))
+    ret = np.asarray(rets[-lookback:])
+    kurt = None
+    if len(ret) > 30:
+        kurt = float(np.mean(((ret - ret.mean()) / ret.std()) ** 4) - 3.0)
+    x, p = estimator.initial_vrp, estimator.initial_P
+    for z in estimator._construct_observations(window, skew, kurt):
+        p += estimator.Q
+        gain = p / (p + estimator.R)
+        x += gain * (z - x)
+        p *= 1.0 - gain
+    return min(max(x, 1.05), 1.55), np.sqrt(p)
+
+
+class TestRecursiveKalmanVRP:
+    """update / filter_series / snapshot against the recompute path."""
+
+    def test_update_matches_recompute(self):
+        from grri_mac.pillars.vrp_kalman import KalmanVRPEstimator
+
+        vix, rets = _vix_path(600)
+        estimator = KalmanVRPEstimator()
+        results = [estimator.update(v, r) for v, r in zip(vix, rets)]
+
+        assert results[10].method == "linear_fallback"
+        assert results[28].method == "linear_fallback"
+        for i in (29, 45, 251, 252, 599):
+            expected, expected_std = _recompute_vrp(
+                estimator, vix[:i + 1], rets[:i + 1],
+            )
+            assert results[i].method == "kalman"
+            assert results[i].vrp_estimate == pytest.approx(expected, abs=1e-12)
+            assert results[i].vrp_std == pytest.approx(expected_std, abs=1e-12)
+
+    def test_filter_series_matches_update(self):
+        from grri_mac.pillars.vrp_kalman import KalmanVRPEstimator
+
+        vix, rets = _vix_path(1500, seed=1)
+        estimator = KalmanVRPEstimator()
+        results = [estimator.update(v, r) for v, r in zip(vix, rets)]
+        frame = KalmanVRPEstimator().filter_series(
+            pd.Series(vix, index=pd.bdate_range("2000-01-03", periods=1500)),
+            rets,
+        )
+
+        assert isinstance(frame.index, pd.DatetimeIndex)
+        np.testing.assert_allclose(
+            frame["vrp_estimate"], [r.vrp_estimate for r in results],
+            atol=1e-12,
+        )
+        np.testing.assert_allclose(
+            frame["vrp_std"], [r.vrp_std for r in results], atol=1e-12,
+        )
+        for column in ("skew", "kurtosis", "vol_of_vol"):
+            expected = [
+                np.nan if getattr(r, column) is None else getattr(r, column)
+                for r in results
+            ]
+            np.testing.assert_allclose(
+                frame[column], expected, atol=1e-10, equal_nan=True,
+            )
+        assert frame["method"].tolist() == [r.method for r in results]
+        assert frame["n_observations"].tolist() == [
+            r.n_observations for r in results
+        ]
+
+    def test_snapshot_restore_resumes(self):
+        import pickle
+
+        from grri_mac.pillars.vrp_kalman import KalmanVRPEstimator
+
+        vix, rets = _vix_path(800, seed=2)
+        full = KalmanVRPEstimator()
+        expected = [full.update(v, r) for v, r in zip(vix, rets)][500:]
+
+        head = KalmanVRPEstimator()
+        for v, r in zip(vix[:500], rets[:500]):
+            head.update(v, r)
+        state = pickle.loads(pickle.dumps(head.snapshot()))
+        resumed = KalmanVRPEstimator()
+        resumed.restore(state)
+        got = [resumed.update(v, r) for v, r in zip(vix[500:], rets[500:])]
+
+        np.testing.assert_allclose(
+            [r.vrp_estimate for r in got],
+            [r.vrp_estimate for r in expected], atol=1e-12,
+        )
+        assert got[-1].n_observations == expected[-1].n_observations
+
+        resumed.reset()
+        assert resumed.update(20.0).method == "linear_fallback"
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Incremental rolling PCA decorrelation
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _pca_factor_history(n, seed=0):
+    """BDC returns and 5 correlated factor series."""
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(size=(n, 5)) * [0.01, 1.0, 5.0, 2.0, 0.5]
+    factors[:, 2] += 3.0 * factors[:, 1]
+    bdc = 0.3 * factors[:, 0] + 0.001 * factors[:, 1] + rng.normal(0, 0.01, n)
+    return bdc, factors
+
+
+def _svd_pca_score(y, X, n_components=3):
+    """Reference: standardize, SVD, regress on top PCs, sigmoid z."""
+    std = X.std(axis=0)
+    std[std == 0] = 1.0
+    Xs = (X - X.mean(axis=0)) / std
+    _, _, Vt = np.linalg.svd(Xs, full_matrices=False)
+    pcs = Xs @ Vt[:n_components].T
+    beta = np.linalg.solve(pcs.T @ pcs, pcs.T @ y)
+    resid = y - pcs @ beta
+    return 1.0 / (1.0 + np.exp(-resid[-1] / resid.std()))
+
+
+class TestRollingPCADecorrelation:
+    """Window-sum PCA against the per-window SVD."""
+
+    def test_series_matches_svd_per_window(self):
+        from grri_mac.pillars.private_credit_pca import RollingPCADecorrelator
+
+        bdc, factors = _pca_factor_history(400)
+        dec = RollingPCADecorrelator(window=120, min_observations=60)
+        frame = dec.decorrelate_series(bdc, *factors.T)
+
+        assert (frame["method"].iloc[:59] == "insufficient_data").all()
+        assert frame["decorrelated_score"].iloc[58] == pytest.approx(
+            bdc[39:59].mean()
+        )
+        assert (frame["method"].iloc[59:] == "pca").all()
+        for t in (59, 119, 120, 250, 399):
+            lo = max(0, t + 1 - 120)
+            expected = _svd_pca_score(bdc[lo:t + 1], factors[lo:t + 1])
+            assert frame["decorrelated_score"].iloc[t] == pytest.approx(
+                expected, abs=1e-10,
+            )
+            single = dec.decorrelate(
+                list(bdc[:t + 1]), *[list(c) for c in factors[:t + 1].T],
+            )
+            assert single.decorrelated_score == pytest.approx(
+                expected, abs=1e-10,
+            )
+            assert single.r_squared == pytest.approx(
+                frame["r_squared"].iloc[t], abs=1e-10,
+            )
+
+    def test_engine_matches_series(self):
+        from grri_mac.pillars.private_credit_pca import (
+            RollingPCADecorrelator,
+            RollingPCAEngine,
+        )
+
+        bdc, factors = _pca_factor_history(500, seed=1)
+        dec = RollingPCADecorrelator(window=100, min_observations=60)
+        frame = dec.decorrelate_series(bdc, *factors.T)
+        engine = RollingPCAEngine(dec)
+        results = [engine.push(y, x) for y, x in zip(bdc, factors)]
+
+        np.testing.assert_allclose(
+            [r.decorrelated_score for r in results],
+            frame["decorrelated_score"], atol=1e-10,
+        )
+        np.testing.assert_allclose(
+            [r.residual_std for r in results], frame["residual_std"],
+            atol=1e-12,
+        )
+        assert [r.method for r in results] == frame["method"].tolist()
+        assert len(results[-1].explained_variance_ratios) == 3
+
+    def test_non_finite_rows_only_affect_their_windows(self):
+        from grri_mac.pillars.private_credit_pca import (
+            RollingPCADecorrelator,
+            RollingPCAEngine,
+        )
+
+        bdc, factors = _pca_factor_history(400, seed=4)
+        factors[150, 1] = np.nan
+        dec = RollingPCADecorrelator(window=100, min_observations=60)
+        frame = dec.decorrelate_series(bdc, *factors.T)
+        engine = RollingPCAEngine(dec)
+        results = [engine.push(y, x) for y, x in zip(bdc, factors)]
+
+        for t in (149, 150, 249, 250, 320, 399):
+            single = dec.decorrelate(
+                list(bdc[:t + 1]), *[list(c) for c in factors[:t + 1].T],
+            )
+            assert frame["method"].iloc[t] == single.method
+            assert results[t].method == single.method
+            assert frame["decorrelated_score"].iloc[t] == pytest.approx(
+                single.decorrelated_score, abs=1e-10,
+            )
+            assert results[t].decorrelated_score == pytest.approx(
+                single.decorrelated_score, abs=1e-10,
+            )
+
+        # Windows holding the NaN fall back; the rest are plain PCA
+        assert (frame["method"].iloc[150:250] != "pca").all()
+        assert (frame["method"].iloc[250:] == "pca").all()
+        assert [r.method for r in results] == frame["method"].tolist()
+        lo = 300
+        assert frame["decorrelated_score"].iloc[399] == pytest.approx(
+            _svd_pca_score(bdc[lo:], factors[lo:]), abs=1e-10,
+        )
+
+    def test_collinear_factors_fall_back_to_ols(self):
+        from grri_mac.pillars.private_credit_pca import RollingPCADecorrelator
+
+        bdc, factors = _pca_factor_history(150, seed=2)
+        spx = factors[:, 0]
+        dec = RollingPCADecorrelator(window=100, min_observations=60)
+        # dVIX and dHY_OAS both duplicate SPX: one non-zero eigenvalue
+        frame = dec.decorrelate_series(bdc, spx, 2 * spx, -spx)
+        assert (frame["method"].iloc[59:] == "ols_fallback").all()
+        single = dec.decorrelate(
+            list(bdc), list(spx), list(2 * spx), list(-spx),
+        )
+        assert single.method == "ols_fallback"
+        assert single.decorrelated_score == pytest.approx(
+            frame["decorrelated_score"].iloc[-1]
+        )
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# SQLite repository batch writes
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestRepositoryBatchWrites:
+    """Bulk inserts and the breach table agree with the per-row path."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        from grri_mac.db.connection import Database
+        from grri_mac.db.repository import MACRepository
+
+        db = Database(str(tmp_path / "mac.db"))
+        db.init_schema()
+        yield MACRepository(db)
+        db.close()
+
+    @staticmethod
+    def _snapshots(n, seed=0):
+        from grri_mac.db.models import MACSnapshot
+
+        rng = np.random.default_rng(seed)
+        pillars = ["liquidity", "valuation", "positioning", "volatility",
+                   "policy", "contagion"]
+        now = datetime.now()
+        return [
+            MACSnapshot(
+                timestamp=now - pd.Timedelta(hours=int(h)),
+                mac_score=float(rng.random()),
+                breach_flags=", ".join(
+                    p for p in pillars if rng.random() < 0.25
+                ),
+            )
+            for h in rng.integers(1, 24 * 60, n)
+        ]
+
+    def test_batch_ids_and_wal(self, repo):
+        from grri_mac.db.models import IndicatorValue
+
+        values = [
+            IndicatorValue(
+                timestamp=datetime(2020, 1, 1) + pd.Timedelta(days=i),
+                indicator_name="VIX", value=float(i), source="FRED",
+            )
+            for i in range(500)
+        ]
+        first = repo.save_indicator(values[0])
+        ids = repo.save_indicators(values[1:])
+        assert ids == list(range(first + 1, first + 500))
+        row = repo.db.fetchone(
+            "SELECT value FROM indicator_values WHERE id = ?", (ids[-1],),
+        )
+        assert row["value"] == 499.0
+        mode = repo.db.fetchone("PRAGMA journal_mode")[0]
+        assert mode == "wal"
+
+    def test_breach_frequency_matches_flag_parse(self, repo):
+        snapshots = self._snapshots(300)
+        repo.save_snapshot(snapshots[0])
+        repo.save_snapshots(snapshots[1:])
+
+        for days in (7, 30, 90):
+            start = datetime.now() - pd.Timedelta(days=days)
+            expected = dict.fromkeys(
+                ["liquidity", "valuation", "positioning", "volatility",
+                 "policy"], 0,
+            )
+            for snap in snapshots:
+                if snap.timestamp >= start:
+                    for flag in snap.get_breach_list():
+                        if flag in expected:
+                            expected[flag] += 1
+            assert repo.get_breach_frequency(days) == expected
+
+    def test_backtest_frame_loader(self, repo):
+        from grri_mac.mac.composite import calculate_mac
+
+        rng = np.random.default_rng(4)
+        dates = pd.date_range("1990-01-05", periods=400, freq="W-FRI")
+        pillars = ["liquidity", "valuation", "positioning", "volatility",
+                   "policy", "contagion", "private_credit", "sentiment"]
+        frame = pd.DataFrame(
+            rng.uniform(0, 1, (len(dates), len(pillars))),
+            index=pd.Index(dates, name="date"), columns=pillars,
+        )
+        frame["mac_score"] = frame.mean(axis=1)
+        frame["interpretation"] = "test"
+
+        assert repo.load_backtest_frame(frame) == len(frame)
+        stored = repo.get_snapshots(limit=len(frame))
+        assert len(stored) == len(frame)
+        by_date = {s.timestamp: s for s in stored}
+        for dt, row in frame.iterrows():
+            snap = by_date[dt.to_pydatetime()]
+            assert snap.data_source == "backtest"
+            assert snap.mac_score == pytest.approx(row["mac_score"])
+            assert snap.get_breach_list() == calculate_mac(
+                row[pillars].to_dict(),
+            ).breach_flags
+
+        days = (datetime.now() - dates[0].to_pydatetime()).days + 1
+        counts = repo.get_breach_frequency(days)
+        for pillar, count in counts.items():
+            assert count == int((frame[pillar] < 0.2).sum())
+
+    def test_backtest_frame_nan_pillars_use_default(self, repo):
+        dates = pd.date_range("2020-01-03", periods=3, freq="W-FRI")
+        frame = pd.DataFrame({
+            "mac_score": [0.6, 0.5, 0.4],
+            "liquidity": [0.7, np.nan, 0.1],
+            "policy": [np.nan, np.nan, np.nan],
+            "multiplier": [1.0, np.nan, 1.5],
+        }, index=pd.Index(dates, name="date"))
+
+        assert repo.load_backtest_frame(frame) == 3
+        stored = sorted(repo.get_snapshots(limit=3), key=lambda s: s.timestamp)
+        assert [s.liquidity_score for s in stored] == [0.7, 0.5, 0.1]
+        assert [s.policy_score for s in stored] == [0.5, 0.5, 0.5]
+        assert [s.multiplier for s in stored] == [1.0, None, 1.5]
+        assert stored[2].get_breach_list() == ["liquidity"]
+
+    def test_upgrade_backfills_breach_table(self, repo):
+        ids = repo.save_snapshots(self._snapshots(50, seed=1))
+        expected = repo.get_breach_frequency(90)
+        repo.db.execute("DELETE FROM snapshot_breaches")
+        repo.db.execute(
+            "UPDATE metadata SET value = '1.0' WHERE key = 'schema_version'"
+        )
+        repo.db.connect().commit()
+
+        repo.db.init_schema()
+        assert repo.db.get_schema_version() == "1.1"
+        assert repo.get_breach_frequency(90) == expected
+        repo.db.execute("DELETE FROM mac_snapshots WHERE id = ?", (ids[0],))
+        orphans = repo.db.fetchone(
+            "SELECT COUNT(*) FROM snapshot_breaches WHERE snapshot_id = ?",
+            (ids[0],),
+        )[0]
+        assert orphans == 0
+
+    def test_queries_use_covering_indexes(self, repo):
+        start = datetime(2020, 1, 1)
+        for sql, params in (
+            (
+                "SELECT COUNT(*) as total, "
+                "SUM(CASE WHEN mac_score <= ? THEN 1 ELSE 0 END) as below "
+                "FROM mac_snapshots WHERE timestamp >= ?",
+                (0.5, start),
+            ),
+            (
+                "SELECT * FROM indicator_values "
+                "WHERE indicator_name = ? AND timestamp >= ? "
+                "ORDER BY timestamp DESC",
+                ("VIX", start),
+            ),
+            (
+                "SELECT pillar, COUNT(*) AS count FROM snapshot_breaches "
+                "WHERE timestamp >= ? GROUP BY pillar",
+                (start,),
+            ),
+        ):
+            plan = " ".join(
+                row[-1] for row in
+                repo.db.fetchall(f"EXPLAIN QUERY PLAN {sql}", params)
+            )
+            assert "COVERING INDEX" in plan, plan
@@ -2,7 +2,7 @@
 Upload all local data to Azure Table Storage.
 
 Uploads:
-  1. FRED cache (29 series from pickle) → fredseries table
+  1. FRED cache (per-series disk store) → fredseries table
   2. NBER historical series (13 series from CSVs) → fredseries table (prefixed NBER_)
   3. Schwert volatility → fredseries table (SCHWERT_VOL)
   4. BoE GBP/USD + Bank Rate → fredseries table (BOE_GBPUSD, BOE_BANKRATE)
@@ -13,7 +13,7 @@ Uploads:
 
 Usage:
     python upload_all_to_azure.py                     # Upload everything
-    python upload_all_to_azure.py --fred-only         # Only FRED pickle
+    python upload_all_to_azure.py --fred-only         # Only FRED cache
     python upload_all_to_azure.py --historical-only   # Only historical CSVs
     python upload_all_to_azure.py --backtest-only     # Only backtest results
     python upload_all_to_azure.py --dry-run            # Preview only
@@ -23,7 +23,6 @@ Usage:
 import os
 import sys
 import argparse
-import pickle
 import json
 import pandas as pd
 import numpy as np
@@ -34,9 +33,10 @@ load_dotenv()
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "api"))
 
 from shared.database import get_database
+from grri_mac.data.fred import load_disk_cache
 
 PROJECT_ROOT = Path(__file__).parent
-FRED_CACHE = PROJECT_ROOT / "data" / "fred_cache" / "fred_series_cache.pkl"
+FRED_CACHE_DIR = PROJECT_ROOT / "data" / "fred_cache"
 HISTORICAL_DIR = PROJECT_ROOT / "data" / "historical"
 BACKTEST_CSV = PROJECT_ROOT / "data" / "backtest_results" / "backtest_full_1971_2025.csv"
 BACKTEST_VALIDATION = PROJECT_ROOT / "data" / \
@@ -59,20 +59,18 @@ def series_to_upload_dict(dates, values):
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 1. FRED Pickle Cache
+# 1. FRED Disk Cache
 # ─────────────────────────────────────────────────────────────────────────────
 
 def upload_fred_cache(db, dry_run=False):
-    """Upload FRED pickle cache to fredseries table."""
-    if not FRED_CACHE.exists():
-        print("  ✗ FRED cache not found")
+    """Upload the FRED disk cache to fredseries table."""
+    cache = load_disk_cache(FRED_CACHE_DIR)
+    if not cache:
+        print(f"  ✗ FRED cache not found at {FRED_CACHE_DIR}")
         return 0
 
-    with open(FRED_CACHE, "rb") as f:
-        cache = pickle.load(f)
-
     print(f"\n{'=' * 60}")
-    print("FRED SERIES (from pickle cache)")
+    print("FRED SERIES (from disk cache)")
     print(f"{'=' * 60}")
     print(f"  {len(cache)} series in cache")
 
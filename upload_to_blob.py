@@ -30,7 +30,6 @@ import argparse
 import json
 import logging
 import os
-import pickle
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -46,6 +45,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "api"))
 from grri_mac.data.blob_store import (  # noqa: E402
     BlobStore, DataTier,
 )
+from grri_mac.data.fred import load_disk_cache  # noqa: E402
 
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
@@ -55,7 +55,7 @@ logger = logging.getLogger(__name__)
 # ─────────────────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).parent
 DATA_DIR = PROJECT_ROOT / "data"
-FRED_CACHE = DATA_DIR / "fred_cache" / "fred_series_cache.pkl"
+FRED_CACHE = DATA_DIR / "fred_cache" / "fred_series_cache.pkl"  # legacy
 HISTORICAL_DIR = DATA_DIR / "historical"
 BACKTEST_DIR = DATA_DIR / "backtest_results"
 
@@ -234,13 +234,12 @@ def upload_raw(store: BlobStore, dry_run: bool = False) -> int:
     """Upload every local data file to the raw Blob Storage tier."""
     total = 0
 
-    # ── 1a. FRED series (from pickle → individual JSON blobs) ──
+    # ── 1a. FRED series (from disk cache → individual JSON blobs) ──
     print(f"\n{'=' * 60}")
-    print("RAW TIER: FRED series (pickle → JSON)")
+    print("RAW TIER: FRED series (disk cache → JSON)")
     print(f"{'=' * 60}")
-    if FRED_CACHE.exists():
-        with open(FRED_CACHE, "rb") as f:
-            cache = pickle.load(f)
+    cache = load_disk_cache()
+    if cache:
         for sid, data in sorted(cache.items()):
             if not isinstance(data, pd.Series) or len(data) == 0:
                 continue
@@ -266,17 +265,18 @@ def upload_raw(store: BlobStore, dry_run: bool = False) -> int:
                 ok = store.upload_raw_json("fred", sid, obj, date_str=TODAY)
                 (_ok if ok else _fail)(f"fred/{sid}: {len(data)} pts")
             total += 1
-        # Also upload the raw pickle itself
-        if not dry_run:
-            ok = store.upload_raw_bytes(
-                "fred", "_cache_pickle",
-                FRED_CACHE.read_bytes(),
-                ".pkl", date_str=TODAY,
-            )
-            (_ok if ok else _fail)("fred/_cache_pickle (raw pickle)")
-        else:
-            _dry("fred/_cache_pickle (raw pickle)")
-        total += 1
+        # Also upload the legacy raw pickle itself, if still present
+        if FRED_CACHE.exists():
+            if not dry_run:
+                ok = store.upload_raw_bytes(
+                    "fred", "_cache_pickle",
+                    FRED_CACHE.read_bytes(),
+                    ".pkl", date_str=TODAY,
+                )
+                (_ok if ok else _fail)("fred/_cache_pickle (raw pickle)")
+            else:
+                _dry("fred/_cache_pickle (raw pickle)")
+            total += 1
     else:
         _skip("FRED cache not found")
 
@@ -417,9 +417,8 @@ def upload_cleaned(store: BlobStore, dry_run: bool = False) -> int:
     print(f"\n{'=' * 60}")
     print("CLEANED TIER: FRED series (Parquet)")
     print(f"{'=' * 60}")
-    if FRED_CACHE.exists():
-        with open(FRED_CACHE, "rb") as f:
-            cache = pickle.load(f)
+    cache = load_disk_cache()
+    if cache:
         for sid, data in sorted(cache.items()):
             if not isinstance(data, pd.Series) or len(data) == 0:
                 continue
@@ -601,9 +600,8 @@ def upload_table_storage(dry_run: bool = False) -> int:
     print(f"\n{'=' * 60}")
     print("TABLE STORAGE: FRED series → fredseries table")
     print(f"{'=' * 60}")
-    if FRED_CACHE.exists():
-        with open(FRED_CACHE, "rb") as f:
-            cache = pickle.load(f)
+    cache = load_disk_cache()
+    if cache:
         for sid, data in sorted(cache.items()):
             if not isinstance(data, pd.Series) or len(data) == 0:
                 continue
@@ -901,6 +899,7 @@ def main() -> int:
         grand_total += upload_table_storage(args.dry_run)
 
     if not args.dry_run:
+        store.flush_index()
         verify_blob(store)
 
     print(f"\n{'=' * 60}")